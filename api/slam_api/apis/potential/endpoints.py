@@ -7,7 +7,9 @@ from flask_smorest import Blueprint
 
 from common_utils.constants import SIMULATION_TYPE, USER_ROLE
 from common_utils.exceptions import MissingTargetPotentialException
-from handlers.db import PotentialSimulationDBHandler
+from handlers.simulations.potential_location_index import (
+    PotentialSimulationLocationIndex,
+)
 from slam_api.apis.potential.openapi.documentation import (
     bearer_security_scheme,
     potential_simulation_request_args,
@@ -36,7 +38,7 @@ class GetPotentialSimulation(MethodView):
         self, lat: float, lon: float, floor_number: int, sim_type: str
     ) -> Tuple[dict, int]:
         """Get the potential simulation results"""
-        simulation = PotentialSimulationDBHandler.get_by_location(
+        simulation = PotentialSimulationLocationIndex.get_instance().get_by_location(
             lat=lat,
             lon=lon,
             floor_number=floor_number,
@@ -661,6 +661,7 @@ class SiteTaskView(MethodView):
 class CopySiteView(MethodView):
     class JsonArgsSchema(Schema):
         client_target_id = fields.Int(required=True, allow_none=False)
+        copy_simulation_results = fields.Bool(required=False, load_default=False)
 
     @role_access_control(roles={USER_ROLE.ADMIN, USER_ROLE.ARCHILYSE_ONE_ADMIN})
     @site_app.response(schema=MsgSchema, status_code=HTTPStatus.OK)
@@ -670,10 +671,11 @@ class CopySiteView(MethodView):
         location="json",
         as_kwargs=True,
     )
-    def post(self, site_id: int, client_target_id: int):
+    def post(self, site_id: int, client_target_id: int, copy_simulation_results: bool):
         copy_site_task.delay(
             target_client_id=client_target_id,
             site_id_to_copy=site_id,
             copy_area_types=True,
+            copy_simulation_results=copy_simulation_results,
         )
         return jsonify(msg=f"Site {site_id} is being copied")
@@ -25,7 +25,7 @@ from handlers.db.unit_handler import UnitDBSchema
 from slam_api.dms_views.entity_view import dms_limited_entity_view
 from slam_api.entity_ownership_validation import validate_entity_ownership
 from slam_api.serialization import GCSLinkArgs
-from slam_api.utils import ensure_site_consistency, role_access_control
+from slam_api.utils import ensure_site_consistency, role_access_control, stream_results
 
 unit_app = Blueprint("unit", __name__)
 
@@ -64,8 +64,12 @@ def simulation_results(
     simulation_type: TASK_TYPE,
     georeferenced: Optional[bool] = False,
 ):
-    return SlamSimulationHandler.get_simulation_results_formatted(
-        unit_id=unit_id, simulation_type=simulation_type, georeferenced=georeferenced
+    return stream_results(
+        SlamSimulationHandler.get_simulation_results_chunked(
+            unit_id=unit_id,
+            simulation_type=simulation_type,
+            georeferenced=georeferenced,
+        )
     )
 
 
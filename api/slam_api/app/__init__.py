@@ -15,14 +15,21 @@ from alembic_utils.utils import (
     generate_migration_script,
 )
 from common_utils.constants import (
+    USER_ROLE,
     get_security_password_salt,
     get_slam_secret_key,
     get_slam_version,
 )
 from common_utils.logger import logger
 from common_utils.logging_config import configure_logging
-from connectors.db_connector import create_db_if_not_exists, db_url, get_alembic_version
+from connectors.db_connector import (
+    create_db_if_not_exists,
+    db_url,
+    get_alembic_version,
+    get_db_stats,
+)
 from slam_api.app.apm import setup_apm
+from slam_api.utils import role_access_control
 
 from .apis import setup_apis
 from .cors import setup_cors
@@ -98,6 +105,12 @@ def flask_api_check():
     return jsonify({"slam_version": get_slam_version(), **get_alembic_version()})
 
 
+@app.route("/api/_internal_/db_stats")
+@role_access_control(roles={USER_ROLE.ADMIN})
+def flask_api_db_stats():
+    return jsonify(get_db_stats())
+
+
 @app.cli.command()
 def alembic_autogenerate_revision():
     generate_migration_script()
@@ -1,7 +1,14 @@
+import zlib
 from enum import Enum
+from typing import Any, Iterator
 
+import msgpack
 from flask.json import JSONEncoder
 
+from common_utils.chunker import ChunkedList
+
+RESULTS_CHUNK_SIZE = 1000
+
 
 class SlamJSONEncoder(JSONEncoder):
     """
@@ -20,3 +27,78 @@ class SlamJSONEncoder(JSONEncoder):
             return list(iterable)
 
         return JSONEncoder.default(self, obj)
+
+
+def _msgpack_default(obj):
+    if isinstance(obj, Enum):
+        return obj.name
+    return list(obj)
+
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, (list, tuple, ChunkedList))
+
+
+def _iter_list_chunks(value: Any, chunk_size: int) -> Iterator[list]:
+    """Chunks of at most `chunk_size` items of a list or of a ChunkedList"""
+    for chunk in value.iter_chunks() if isinstance(value, ChunkedList) else (value,):
+        for start in range(0, len(chunk), chunk_size):
+            yield chunk[start : start + chunk_size]
+
+
+def iter_json(results: dict, chunk_size: int = RESULTS_CHUNK_SIZE) -> Iterator[str]:
+    """Encodes the results as the same JSON document returned by jsonify, yielding
+    the lists values in chunks of `chunk_size` items instead of a single string.
+    """
+    encoder = SlamJSONEncoder(separators=(",", ":"))
+    yield "{"
+    for i, key in enumerate(sorted(results)):
+        value = results[key]
+        prefix = f"{',' if i else ''}{encoder.encode(key)}:"
+        if _is_list(value):
+            yield f"{prefix}["
+            for j, chunk in enumerate(_iter_list_chunks(value, chunk_size)):
+                yield f"{',' if j else ''}{encoder.encode(chunk)[1:-1]}"
+            yield "]"
+        else:
+            yield f"{prefix}{encoder.encode(value)}"
+    yield "}"
+
+
+def iter_ndjson(results: dict) -> Iterator[str]:
+    """Encodes the results as one JSON object per line, each line containing the
+    i-th item of all the lists values (e.g. an observation point and its dimension
+    values) and the rest of the values unchanged.
+    """
+    encoder = SlamJSONEncoder(separators=(",", ":"))
+    list_keys = [key for key, value in results.items() if _is_list(value)]
+    row = {key: value for key, value in results.items() if key not in list_keys}
+    for values in zip(*(results[key] for key in list_keys)):
+        row.update(zip(list_keys, values))
+        yield f"{encoder.encode(row)}\n"
+
+
+def iter_msgpack(
+    results: dict, chunk_size: int = RESULTS_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Encodes the results as the same msgpack document as `msgpack.dumps`"""
+    packer = msgpack.Packer(default=_msgpack_default)
+    yield packer.pack_map_header(len(results))
+    for key, value in results.items():
+        yield packer.pack(key)
+        if _is_list(value):
+            yield packer.pack_array_header(len(value))
+            for chunk in _iter_list_chunks(value, chunk_size):
+                yield b"".join(packer.pack(item) for item in chunk)
+        else:
+            yield packer.pack(value)
+
+
+def iter_gzip(chunks: Iterator[Any]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        if compressed := compressor.compress(chunk):
+            yield compressed
+    yield compressor.flush()
@@ -30,6 +30,9 @@ from handlers.db import (
 )
 from handlers.utils import get_site_id_from_any_level
 
+NDJSON_MIMETYPE = "application/x-ndjson"
+MSGPACK_MIMETYPE = "application/msgpack"
+
 
 class Entities:
     keys = ["unit_id", "floor_id", "building_id", "site_id", "client_id"]
@@ -350,6 +353,33 @@ def eventstream(iterator: Iterator[Dict]):
     )
 
 
+def stream_results(results: dict):
+    """Streams the results in the format accepted by the client, JSON by default,
+    NDJSON or msgpack, gzipped if the client accepts it.
+    """
+    from slam_api.app import app
+    from slam_api.app.json_utils import iter_gzip, iter_json, iter_msgpack, iter_ndjson
+
+    encoders = {
+        mimetypes.types_map[".json"]: iter_json,
+        NDJSON_MIMETYPE: iter_ndjson,
+        MSGPACK_MIMETYPE: iter_msgpack,
+    }
+    mimetype = request.accept_mimetypes.best_match(
+        encoders, default=mimetypes.types_map[".json"]
+    )
+    chunks = encoders[mimetype](results)
+
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if request.accept_encodings.quality("gzip"):
+        chunks = iter_gzip(chunks)
+        headers["Content-Encoding"] = "gzip"
+
+    return app.response_class(
+        stream_with_context(chunks), mimetype=mimetype, headers=headers
+    )
+
+
 def get_user_authorized() -> Dict:
     if user_authorized := request.authorization:  # type: ignore
         return dict(user_authorized)
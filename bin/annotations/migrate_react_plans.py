@@ -1,22 +1,40 @@
-from typing import Dict
+"""Migrates the stored react annotations to the current version, batch by batch.
+
+    python bin/annotations/migrate_react_plans.py --dry-run
+    python bin/annotations/migrate_react_plans.py --after-id 12345
+"""
+import click
 
 from common_utils.logger import logger
-from handlers.db import ReactPlannerProjectsDBHandler
 from handlers.editor_v2 import ReactPlannerHandler
-from handlers.editor_v2.schema import ReactPlannerData
 
-if __name__ == "__main__":
 
-    def migration_callable(project: Dict):
-        logger.info(f"migrating plan {project['plan_id']}")
-        migrated_data = ReactPlannerHandler.migrate_data_if_old_version(project["data"])
-        ReactPlannerData(**migrated_data)
-        if project["data"]["version"] != migrated_data["version"]:
-            ReactPlannerProjectsDBHandler.update(
-                item_pks={"id": project["id"]}, new_values={"data": migrated_data}
-            )
+@click.command()
+@click.option("--after-id", default=0, type=int, help="Resume after this project id")
+@click.option(
+    "--batch-size", default=ReactPlannerHandler.ANNOTATIONS_MIGRATION_BATCH_SIZE
+)
+@click.option("--dry-run", is_flag=True, help="Migrate and check without writing")
+def migrate_react_plans(after_id: int, batch_size: int, dry_run: bool):
+    number_of_migrated = number_of_failed = 0
+    while True:
+        batch = ReactPlannerHandler.migrate_stored_annotations(
+            after_id=after_id, batch_size=batch_size, dry_run=dry_run
+        )
+        if batch.last_id is None:
+            break
+        for project_id, error in batch.failed.items():
+            logger.error(f"Could not migrate react annotation {project_id}: {error}")
+        number_of_migrated += len(batch.migrated)
+        number_of_failed += len(batch.failed)
+        after_id = batch.last_id
+        logger.info(f"Migrated react annotations up to id {after_id}")
 
-    all_projects = ReactPlannerProjectsDBHandler.find()
-    from tqdm.contrib.concurrent import process_map
+    logger.info(
+        f"{'Checked' if dry_run else 'Migrated'} {number_of_migrated} react annotations, "
+        f"{number_of_failed} failed"
+    )
 
-    process_map(migration_callable, all_projects, max_workers=8)
+
+if __name__ == "__main__":
+    migrate_react_plans()
@@ -30,4 +30,4 @@ compute_percentiles(
         dataframe=handler._unprocessed_reference_dataframe
     )
 )
-compute_percentiles(reference_dataframe=handler.reference_dataframe)
+compute_percentiles(reference_dataframe=handler.compute_reference_dataframe())
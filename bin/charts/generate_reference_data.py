@@ -0,0 +1,46 @@
+"""Generates the memory mapped benchmark reference data loaded by the chart workers.
+
+Needs to run after generate_dimension_percentiles.py, as the reference dataframe
+contains room features based on the dimension percentiles.
+"""
+import numpy as np
+import pandas as pd
+
+from common_utils.constants import BENCHMARK_REFERENCE_DATA_DIR
+from common_utils.logger import logger
+from handlers.charts.chart_data_handler import ChartDataHandler
+from handlers.charts.reference_data import (
+    load_manifest,
+    load_percentile_tables,
+    load_reference_dataframe,
+    write_reference_data,
+)
+
+handler = ChartDataHandler(site_id=1)
+reference_dataframe = handler.compute_reference_dataframe()
+percentile_tables = handler.reference_percentile_tables
+write_reference_data(
+    reference_dataframe=reference_dataframe,
+    percentile_tables=percentile_tables,
+    directory=BENCHMARK_REFERENCE_DATA_DIR,
+)
+
+# Consistency check of the stored data against the data computed from the sources
+load_manifest.cache_clear()
+stored_reference_dataframe = load_reference_dataframe(
+    directory=BENCHMARK_REFERENCE_DATA_DIR
+)
+pd.testing.assert_frame_equal(
+    stored_reference_dataframe[reference_dataframe.columns], reference_dataframe
+)
+stored_percentile_tables = load_percentile_tables(
+    directory=BENCHMARK_REFERENCE_DATA_DIR
+)
+assert stored_percentile_tables.keys() == percentile_tables.keys()
+for cluster, (levels, reference_values) in percentile_tables.items():
+    stored_levels, stored_reference_values = stored_percentile_tables[cluster]
+    assert (stored_levels == levels).all()
+    for column, values in reference_values.items():
+        np.testing.assert_array_equal(stored_reference_values[column], values)
+
+logger.info(f"Benchmark reference data written to {BENCHMARK_REFERENCE_DATA_DIR}")
@@ -0,0 +1,340 @@
+"""Benchmarks of the simulation and geometry pipelines, prepared from the test fixtures.
+
+Everything runs offline: the remote file providers are redirected to the fixture
+files and nothing is read from or written to the DB.
+"""
+import json
+import math
+from functools import lru_cache
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import List
+from unittest import mock
+from zipfile import ZipFile
+
+from shapely.geometry import Point
+
+from bin.profiling.benchmark_suite.runner import register_benchmark
+from brooks.classifications import UnifiedClassificationScheme
+from brooks.models import SimLayout
+from brooks.unit_layout_factory import UnitLayoutFactory
+from brooks.visualization.brooks_plotter import BrooksPlotter
+from common_utils.constants import (
+    NOISE_TIME_TYPE,
+    REGION,
+    SIMULATION_TYPE,
+    SIMULATION_VERSION,
+    SUPPORTED_LANGUAGES,
+    SUPPORTED_OUTPUT_FILES,
+)
+from common_utils.exceptions import ConnectivityEigenFailedConvergenceException
+from handlers.editor_v2.editor_v2_element_mapper import ReactPlannerToBrooksMapper
+from handlers.editor_v2.schema import ReactPlannerData
+from handlers.ph_vector.ph2022.area_vector import LayoutFeatures
+from handlers.simulations.potential_tile_exporter import (
+    SIMULATION_TYPE_SCHEMA,
+    PotentialEntityProvider,
+    PotentialTileExporter,
+)
+from handlers.simulations.stats_handler import StatsHandler
+from simulations.connectivity import ConnectivitySimulator
+from simulations.hexagonizer import HexagonizerGraph
+from simulations.noise import NoiseRayTracerSimulator
+from simulations.noise.utils import sample_locations_by_area
+from simulations.view import ViewWrapper
+from simulations.view.meshes import GeoreferencingTransformation, LayoutTriangulator
+from surroundings.srtm.grounds_surrounding_handler import SRTMGroundSurroundingHandler
+from surroundings.srtm.srtm_files_handler import SrtmFilesHandler
+
+FIXTURES_PATH = Path(__file__).parents[3] / "tests" / "fixtures"
+PLAN_FIXTURE = FIXTURES_PATH / "annotations" / "plan_5825.json"
+POTENTIAL_RESULTS_FIXTURE = (
+    FIXTURES_PATH
+    / "potential_simulations"
+    / "potential_view_results_test_potential_view_task.json"
+)
+QUAVIS_OUTPUT_FIXTURE = (
+    FIXTURES_PATH
+    / "quavis_outputs"
+    / "quavis_output_test_simulation_chain_quavis_potential.json.zip"
+)
+# Location in Georgia covered by the SRTM fixture tile
+SRTM_FIXTURE = FIXTURES_PATH / "surroundings" / "srtm" / "n33_w085_1arc_v3.tif"
+SRTM_FIXTURE_LOCATION = Point(685509, 424279)
+
+NUMBER_OF_NOISE_SOURCES = 500
+NUMBER_OF_UNITS_FOR_STATS = 100
+NUMBER_OF_POTENTIAL_SIMULATIONS = 50
+NUMBER_OF_QUAVIS_OBSERVATION_POINTS = 5000
+
+
+@lru_cache()
+def _read_annotation() -> str:
+    return PLAN_FIXTURE.read_text()
+
+
+def _load_annotation() -> dict:
+    """A new dict on every call, as ReactPlannerData replaces the layers of the dict
+    it is created from with their models"""
+    return json.loads(_read_annotation())
+
+
+def _map_plan_layout() -> SimLayout:
+    return ReactPlannerToBrooksMapper.get_layout(
+        planner_elements=ReactPlannerData(**_load_annotation()), scaled=True
+    )
+
+
+def _sorted_spaces_ids(plan_layout: SimLayout) -> List[str]:
+    """Spaces ids in a deterministic order, the ids themselves are random"""
+    return [
+        space.id
+        for space in sorted(
+            plan_layout.spaces,
+            key=lambda space: (
+                space.footprint.centroid.x,
+                space.footprint.centroid.y,
+            ),
+        )
+    ]
+
+
+def _create_space_layouts(plan_layout: SimLayout) -> List[SimLayout]:
+    spaces_ids = _sorted_spaces_ids(plan_layout=plan_layout)
+    return UnitLayoutFactory(plan_layout=plan_layout).create_sub_layouts(
+        spaces_ids_by_unit=[{space_id} for space_id in spaces_ids],
+        area_db_ids_by_unit=[None] * len(spaces_ids),
+    )
+
+
+@register_benchmark("layout_mapping")
+def layout_mapping():
+    _read_annotation()
+    return _map_plan_layout
+
+
+@register_benchmark("unit_sub_layouts")
+def unit_sub_layouts():
+    plan_layout = _map_plan_layout()
+    return lambda: _create_space_layouts(plan_layout=plan_layout)
+
+
+@register_benchmark("layout_triangulation")
+def layout_triangulation():
+    plan_layout = _map_plan_layout()
+    return lambda: LayoutTriangulator(
+        layout=plan_layout,
+        georeferencing_parameters=GeoreferencingTransformation(),
+    ).create_layout_triangles(layouts_upper_floor=[], level_baseline=0.0)
+
+
+@register_benchmark("surroundings_ground_generation")
+def surroundings_ground_generation():
+    handler = SRTMGroundSurroundingHandler(
+        location=SRTM_FIXTURE_LOCATION,
+        region=REGION.US_GEORGIA,
+        bounding_box_extension=500,
+        simulation_version=SIMULATION_VERSION.PH_2022_H1,
+    )
+
+    def _generate():
+        with mock.patch.object(
+            SrtmFilesHandler, "get_srtm_files", return_value=[SRTM_FIXTURE]
+        ):
+            return list(handler.get_triangles())
+
+    return _generate
+
+
+@register_benchmark("noise_ray_tracing")
+def noise_ray_tracing():
+    plan_layout = _map_plan_layout()
+    locations = [
+        location
+        for area_locations in sample_locations_by_area(
+            plan_layout=plan_layout, target_layout=plan_layout
+        ).values()
+        for location in area_locations
+    ]
+    centroid = plan_layout.footprint.centroid
+    # Sources on a golden angle spiral around the plan, from 20 to 520m away
+    golden_angle = math.pi * (3 - math.sqrt(5))
+    noise_sources = [
+        (
+            Point(
+                centroid.x + (20 + i) * math.cos(i * golden_angle),
+                centroid.y + (20 + i) * math.sin(i * golden_angle),
+            ),
+            {NOISE_TIME_TYPE.DAY: 60.0 + i % 10, NOISE_TIME_TYPE.NIGHT: 50.0},
+        )
+        for i in range(NUMBER_OF_NOISE_SOURCES)
+    ]
+    simulator = NoiseRayTracerSimulator(noise_sources=noise_sources)
+    blocking_elements = plan_layout.footprint_facade
+
+    def _simulate():
+        return [
+            NoiseRayTracerSimulator.calculate_noise_3d(
+                noises=simulator.get_noises_2d_distances_at(
+                    location=Point(location[:2]), blocking_elements=blocking_elements
+                ),
+                height=location[2],
+                noise_time=NOISE_TIME_TYPE.DAY,
+            )
+            for location in locations
+        ]
+
+    return _simulate
+
+
+@register_benchmark("connectivity")
+def connectivity():
+    # The largest space of the plan, as the unit layouts are simulated one by one
+    unit_layout = max(
+        _create_space_layouts(plan_layout=_map_plan_layout()),
+        key=lambda layout: layout.footprint.area,
+    )
+    area_type_filter = UnifiedClassificationScheme().CONNECTIVITY_UNWANTED_AREA_TYPES
+
+    def _simulate():
+        hex_graph = HexagonizerGraph(
+            polygon=unit_layout.get_footprint_no_features(), resolution=0.25
+        )
+        simulator = ConnectivitySimulator(
+            graph=hex_graph.connected_graph, area_type_filter=area_type_filter
+        )
+        results = {}
+        for sim_name, sim in simulator.all_simulations(layout=unit_layout):
+            try:
+                results[sim_name] = sim()
+            except ConnectivityEigenFailedConvergenceException:
+                pass
+        return results
+
+    return _simulate
+
+
+@register_benchmark("hexagonization")
+def hexagonization():
+    area_footprints = [area.footprint for area in _map_plan_layout().areas]
+    return lambda: [
+        HexagonizerGraph(polygon=footprint, resolution=0.25).connected_graph
+        for footprint in area_footprints
+    ]
+
+
+@register_benchmark("simulation_stats")
+def simulation_stats():
+    with POTENTIAL_RESULTS_FIXTURE.open() as f:
+        potential_results = json.load(f)
+    area_results = {
+        dimension: values
+        for dimension, values in potential_results.items()
+        if dimension != "observation_points"
+    }
+    results = {
+        unit_id: {area_id: area_results for area_id in range(10)}
+        for unit_id in range(NUMBER_OF_UNITS_FOR_STATS)
+    }
+
+    def _compute_stats():
+        handler = StatsHandler(run_id="benchmark", results=results)
+        return (
+            list(handler._compute_unit_area_stats()),
+            list(handler._compute_unit_stats(area_ids_to_exclude=set())),
+        )
+
+    return _compute_stats
+
+
+@register_benchmark("area_vectors")
+def area_vectors():
+    space_layouts = _create_space_layouts(plan_layout=_map_plan_layout())
+    return lambda: LayoutFeatures(layouts=space_layouts).get_area_features()
+
+
+@register_benchmark("deliverable_rendering")
+def deliverable_rendering():
+    plan_layout = _map_plan_layout()
+    space_layouts = _create_space_layouts(plan_layout=plan_layout)
+    metadata = dict(street="Street", housenumber="1", level=1, zipcode=8000, city="Z")
+
+    def _render():
+        return [
+            io_image.getvalue()
+            for _, _, io_image in BrooksPlotter().generate_floor_plots(
+                floor_plan_layout=plan_layout,
+                unit_layouts=space_layouts,
+                unit_ids=[str(i) for i in range(len(space_layouts))],
+                metadata=metadata,
+                languages=[SUPPORTED_LANGUAGES.EN],
+                file_formats=[SUPPORTED_OUTPUT_FILES.PNG, SUPPORTED_OUTPUT_FILES.PDF],
+            )
+        ]
+
+    return _render
+
+
+@register_benchmark("potential_tile_export")
+def potential_tile_export():
+    with POTENTIAL_RESULTS_FIXTURE.open() as f:
+        potential_results = json.load(f)
+    simulations_info = [
+        {
+            "type": SIMULATION_TYPE.SUN.value,
+            "floor_number": floor_number,
+            "building_footprint": Point(8.5, 47.3).buffer(0.001).wkt,
+            "result": {
+                **potential_results,
+                "observation_points": [
+                    {**obs_point, "height": obs_point["height"] + 3 * floor_number}
+                    for obs_point in potential_results["observation_points"]
+                ],
+            },
+        }
+        for floor_number in range(NUMBER_OF_POTENTIAL_SIMULATIONS)
+    ]
+
+    def _export():
+        with TemporaryDirectory() as directory:
+            PotentialTileExporter._dump_to_shapefile(
+                filename=Path(directory).joinpath("sun_tile.fgb"),
+                schema=SIMULATION_TYPE_SCHEMA[SIMULATION_TYPE.SUN],
+                entities=(
+                    entity
+                    for simulation_info in simulations_info
+                    for entity in PotentialEntityProvider.make_entities(
+                        simulation_info=simulation_info
+                    )
+                ),
+            )
+
+    return _export
+
+
+@register_benchmark("quavis_output_parsing")
+def quavis_output_parsing():
+    with ZipFile(QUAVIS_OUTPUT_FIXTURE) as zip_file:
+        with zip_file.open(zip_file.namelist()[0]) as f:
+            fixture_results = json.load(f)["results"]
+
+    wrapper = ViewWrapper(resolution=16)
+    for group in range(len(fixture_results[0]["groups"]["values"]) - 1):
+        wrapper.add_triangles([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]], group=str(group))
+    number_of_sun_positions = len(fixture_results[0]["sun"]["values"])
+    for i in range(NUMBER_OF_QUAVIS_OBSERVATION_POINTS):
+        wrapper.add_observation_point(
+            pos=(i % 100, i // 100, 1.5),
+            solar_pos=[(0.0, 1.0)] * number_of_sun_positions,
+            solar_zenith_luminance=[1.0] * number_of_sun_positions,
+        )
+    wrapper = ViewWrapper.load_wrapper_from_input_no_geometries(
+        input_data=wrapper.generate_input(run_area=True, run_volume=True, run_sun=True)
+    )
+    output = {
+        "results": [
+            fixture_results[i % len(fixture_results)]
+            for i in range(NUMBER_OF_QUAVIS_OBSERVATION_POINTS)
+        ]
+    }
+    return lambda: wrapper.parse_quavis_output_arrays(output_data=output)
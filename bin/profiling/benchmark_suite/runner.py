@@ -0,0 +1,250 @@
+"""Runs the registered benchmarks and compares their results with a baseline.
+
+A benchmark is registered with `register_benchmark` on a function preparing its input
+from the test fixtures and returning the callable to measure, so that only the
+pipeline itself is timed. The random generators are seeded before the preparation
+and before every repetition to make the runs reproducible.
+"""
+import cProfile
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy
+
+RANDOM_SEED = 42
+DEFAULT_REGRESSION_THRESHOLD = 0.1  # 10% slower median than the baseline
+DEFAULT_SAMPLING_INTERVAL = 0.001  # seconds between stack samples
+
+
+class Benchmark(NamedTuple):
+    name: str
+    prepare: Callable[[], Callable[[], Any]]
+    regression_threshold: float
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def register_benchmark(
+    name: str, regression_threshold: float = DEFAULT_REGRESSION_THRESHOLD
+):
+    def decorator(prepare: Callable[[], Callable[[], Any]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name} is already registered")
+        BENCHMARKS[name] = Benchmark(
+            name=name, prepare=prepare, regression_threshold=regression_threshold
+        )
+        return prepare
+
+    return decorator
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    times: List[float]
+    regression_threshold: float
+    allocated_bytes: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "repetitions": len(self.times),
+            "min": min(self.times),
+            "median": statistics.median(self.times),
+            "mean": statistics.mean(self.times),
+            "stddev": statistics.pstdev(self.times),
+            "times": self.times,
+            "allocated_bytes": self.allocated_bytes,
+            "regression_threshold": self.regression_threshold,
+        }
+
+
+class BenchmarkComparison(NamedTuple):
+    name: str
+    baseline_median: float
+    median: float
+    regression_threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.median / self.baseline_median
+
+    @property
+    def is_regression(self) -> bool:
+        return self.ratio > 1 + self.regression_threshold
+
+
+def _reset_random_state():
+    random.seed(RANDOM_SEED)
+    numpy.random.seed(RANDOM_SEED)
+
+
+def _prepare(benchmark: Benchmark) -> Callable[[], Any]:
+    _reset_random_state()
+    return benchmark.prepare()
+
+
+def run_benchmark(
+    benchmark: Benchmark,
+    repetitions: int,
+    warmup: int = 1,
+    measure_memory: bool = True,
+) -> BenchmarkResult:
+    function = _prepare(benchmark)
+    for _ in range(warmup):
+        _reset_random_state()
+        function()
+
+    times = []
+    for _ in range(repetitions):
+        _reset_random_state()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    allocated_bytes = None
+    if measure_memory:
+        # In its own run, as tracing the allocations slows down the execution
+        _reset_random_state()
+        tracemalloc.start()
+        try:
+            function()
+            _, allocated_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        name=benchmark.name,
+        times=times,
+        regression_threshold=benchmark.regression_threshold,
+        allocated_bytes=allocated_bytes,
+    )
+
+
+def get_environment() -> Dict[str, Any]:
+    import pygeos
+    import shapely
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": numpy.__version__,
+        "shapely": shapely.__version__,
+        "pygeos": pygeos.__version__,
+    }
+
+
+def make_report(
+    results: Iterable[BenchmarkResult], errors: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """The errors are the ones of the benchmarks which could not be run, by name"""
+    return {
+        "created": datetime.utcnow().isoformat(),
+        "environment": get_environment(),
+        "benchmarks": {result.name: result.to_dict() for result in results},
+        "errors": errors or {},
+    }
+
+
+def save_report(report: Dict[str, Any], path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(path: Path) -> Dict[str, Any]:
+    with path.open() as f:
+        return json.load(f)
+
+
+def compare_with_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any]
+) -> List[BenchmarkComparison]:
+    """Compares the median time of the benchmarks present in both reports, using the
+    regression threshold of the current report"""
+    return [
+        BenchmarkComparison(
+            name=name,
+            baseline_median=baseline["benchmarks"][name]["median"],
+            median=result["median"],
+            regression_threshold=result["regression_threshold"],
+        )
+        for name, result in report["benchmarks"].items()
+        if name in baseline["benchmarks"]
+    ]
+
+
+class StackSampler:
+    """Samples the stack of the thread creating it from a background thread and
+    aggregates the samples in the folded format read by flamegraph.pl, speedscope
+    and the py-spy tooling."""
+
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._thread_id = threading.get_ident()
+        self._stopped = threading.Event()
+        self._sampling_thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> "StackSampler":
+        self._sampling_thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stopped.set()
+        self._sampling_thread.join()
+
+    def write_folded(self, path: Path):
+        with path.open("w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def profile_benchmark(
+    benchmark: Benchmark,
+    directory: Path,
+    sampling_interval: float = DEFAULT_SAMPLING_INTERVAL,
+) -> Tuple[Path, Path]:
+    """Writes the per function cProfile stats and the sampled stacks of one
+    execution of the benchmark, returning the paths of both files"""
+    directory.mkdir(parents=True, exist_ok=True)
+    function = _prepare(benchmark)
+    _reset_random_state()
+    function()
+
+    stats_path = directory.joinpath(f"{benchmark.name}.prof")
+    profiler = cProfile.Profile()
+    _reset_random_state()
+    profiler.runcall(function)
+    profiler.dump_stats(stats_path)
+
+    folded_path = directory.joinpath(f"{benchmark.name}.folded")
+    _reset_random_state()
+    with StackSampler(interval=sampling_interval) as sampler:
+        function()
+    sampler.write_folded(folded_path)
+    return stats_path, folded_path
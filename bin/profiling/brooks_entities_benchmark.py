@@ -0,0 +1,82 @@
+"""Measures the construction time and memory footprint of the brooks entities.
+
+Maps the largest annotation fixture to a layout several times and creates a big
+batch of standalone areas, reporting the time and the memory allocated per entity.
+
+    python bin/profiling/brooks_entities_benchmark.py --repetitions 5
+"""
+import json
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import click
+from shapely.geometry import box
+
+from brooks.models import SimArea
+from common_utils.logger import logger
+from handlers.editor_v2.editor_v2_element_mapper import ReactPlannerToBrooksMapper
+from handlers.editor_v2.schema import ReactPlannerData
+
+FIXTURE_PLAN = (
+    Path(__file__).parents[2] / "tests" / "fixtures" / "annotations" / "plan_12288.json"
+)
+
+
+def _map_layout(annotation: dict):
+    return ReactPlannerToBrooksMapper.get_layout(
+        planner_elements=ReactPlannerData(**annotation),
+        scaled=True,
+    )
+
+
+def _create_areas(number_of_areas: int):
+    footprint = box(0, 0, 4, 3)
+    return [SimArea(footprint=footprint) for _ in range(number_of_areas)]
+
+
+def _measure_memory(function, *args):
+    tracemalloc.start()
+    result = function(*args)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, allocated
+
+
+@click.command()
+@click.option("--repetitions", default=5, type=int)
+@click.option("--number-of-areas", default=100_000, type=int)
+def benchmark(repetitions: int, number_of_areas: int):
+    with FIXTURE_PLAN.open() as f:
+        annotation = json.load(f)
+
+    layout, layout_bytes = _measure_memory(_map_layout, annotation)
+    number_of_entities = sum(
+        len(entities)
+        for entities in (
+            layout.spaces,
+            layout.areas,
+            layout.separators,
+            layout.openings,
+            layout.features,
+        )
+    )
+    layout_time = timeit.timeit(lambda: _map_layout(annotation), number=repetitions)
+    logger.info(
+        f"Layout of {FIXTURE_PLAN.name} with {number_of_entities} entities: "
+        f"{layout_time / repetitions:.3f}s per mapping, "
+        f"{layout_bytes / 2**20:.1f}MiB allocated"
+    )
+
+    _, areas_bytes = _measure_memory(_create_areas, number_of_areas)
+    areas_time = timeit.timeit(
+        lambda: _create_areas(number_of_areas), number=repetitions
+    )
+    logger.info(
+        f"{number_of_areas} areas: {areas_time / repetitions:.3f}s per batch, "
+        f"{areas_bytes / number_of_areas:.0f} bytes allocated per area"
+    )
+
+
+if __name__ == "__main__":
+    benchmark()
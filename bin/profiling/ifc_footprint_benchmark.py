@@ -0,0 +1,99 @@
+"""Compares the face by face projection of the IFC meshes with the vectorized one.
+
+Tessellates the elements of the IFC fixtures once and projects every mesh with
+both implementations, reporting the time spent and the largest difference between
+the footprints.
+
+    python bin/profiling/ifc_footprint_benchmark.py --repetitions 3
+"""
+import timeit
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from zipfile import ZipFile
+
+import click
+import numpy
+from shapely.ops import unary_union
+
+from common_utils.logger import logger
+from ifc_reader.constants import IFC_SPACE, SUPPORTED_IFC_TYPES
+from ifc_reader.reader import IfcReader
+
+IFC_FIXTURES = Path(__file__).parents[2] / "tests" / "fixtures" / "ifc" / "files"
+
+
+def _get_meshes(reader: IfcReader):
+    ifc_elements = [
+        element
+        for ifc_type in SUPPORTED_IFC_TYPES | {IFC_SPACE}
+        for element in reader.wrapper.by_type(ifc_type)
+        if element.is_a("IfcProduct")
+    ]
+    return [
+        (
+            numpy.array(ifc_shape.geometry.verts, dtype=float).reshape(-1, 3),
+            numpy.array(ifc_shape.geometry.faces, dtype=int).reshape(-1, 3),
+        )
+        for ifc_shape in reader.ifc_mapper.iter_ifc_shapes(
+            ifc_elements=ifc_elements, num_threads=1
+        )
+    ]
+
+
+def _face_by_face(reader: IfcReader, meshes):
+    return [
+        unary_union(
+            reader.ifc_mapper.get_polygons_from_vertices_and_faces(
+                faces=faces.tolist(), vertices=vertices.tolist()
+            )
+        )
+        for vertices, faces in meshes
+    ]
+
+
+def _vectorized(reader: IfcReader, meshes):
+    return [
+        reader.ifc_mapper.get_footprint_from_vertices_and_faces(
+            faces=faces, vertices=vertices
+        )
+        for vertices, faces in meshes
+    ]
+
+
+@click.command()
+@click.option("--repetitions", default=3, type=int)
+def benchmark(repetitions: int):
+    for fixture in sorted(IFC_FIXTURES.glob("*.zip")):
+        with TemporaryDirectory() as directory:
+            with ZipFile(fixture) as zip_file:
+                zip_file.extractall(directory)
+            reader = IfcReader(filepath=Path(directory).joinpath(f"{fixture.stem}.ifc"))
+            meshes = _get_meshes(reader=reader)
+
+            max_difference = max(
+                face_by_face.symmetric_difference(vectorized).area
+                for face_by_face, vectorized in zip(
+                    _face_by_face(reader=reader, meshes=meshes),
+                    _vectorized(reader=reader, meshes=meshes),
+                )
+            )
+            number_of_faces = sum(len(faces) for _, faces in meshes)
+            for name, projection in (
+                ("face by face", _face_by_face),
+                ("vectorized", _vectorized),
+            ):
+                projection_time = timeit.timeit(
+                    lambda: projection(reader=reader, meshes=meshes),
+                    number=repetitions,
+                )
+                logger.info(
+                    f"{fixture.stem}, {len(meshes)} meshes with {number_of_faces} faces, "
+                    f"{name}: {projection_time / repetitions:.3f}s"
+                )
+            logger.info(
+                f"{fixture.stem}: largest footprint difference {max_difference:.2e}m2"
+            )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,110 @@
+"""Runs the offline benchmarks of the simulation and geometry pipelines.
+
+The results are written as JSON and, when a baseline report is given, the median time
+of every benchmark is compared with it, failing if any of them regressed over its
+threshold. A baseline is just the report of a previous run on the same machine:
+
+    python bin/profiling/run_benchmark_suite.py --output baseline.json
+    python bin/profiling/run_benchmark_suite.py --baseline baseline.json \
+        --output results.json
+
+A benchmark failing does not stop the others, its error is recorded in the report and
+the run fails once all the benchmarks ran.
+
+With --profile-dir the cProfile stats (.prof) and the sampled stacks in folded format
+(.folded, for flamegraph.pl or speedscope) of every benchmark are written as well.
+"""
+from pathlib import Path
+
+import click
+
+from bin.profiling.benchmark_suite import cases  # noqa: F401 registers the benchmarks
+from bin.profiling.benchmark_suite.runner import (
+    BENCHMARKS,
+    compare_with_baseline,
+    load_report,
+    make_report,
+    profile_benchmark,
+    run_benchmark,
+    save_report,
+)
+from common_utils.logger import logger
+
+
+@click.command()
+@click.option(
+    "--benchmark",
+    "benchmark_names",
+    multiple=True,
+    type=click.Choice(sorted(BENCHMARKS)),
+    help="Benchmarks to run, all of them by default",
+)
+@click.option("--repetitions", default=5, type=int)
+@click.option("--warmup", default=1, type=int)
+@click.option("--memory/--no-memory", default=True)
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "--baseline", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option("--profile-dir", type=click.Path(file_okay=False, path_type=Path))
+def run_benchmark_suite(
+    benchmark_names,
+    repetitions: int,
+    warmup: int,
+    memory: bool,
+    output: Path,
+    baseline: Path,
+    profile_dir: Path,
+):
+    benchmarks = [BENCHMARKS[name] for name in benchmark_names or sorted(BENCHMARKS)]
+
+    results = []
+    errors = {}
+    for benchmark in benchmarks:
+        try:
+            result = run_benchmark(
+                benchmark=benchmark,
+                repetitions=repetitions,
+                warmup=warmup,
+                measure_memory=memory,
+            )
+        except Exception as e:
+            logger.exception(f"{benchmark.name} failed")
+            errors[benchmark.name] = f"{type(e).__name__}: {e}"
+            continue
+
+        results.append(result)
+        logger.info(
+            f"{benchmark.name}: {result.to_dict()['median']:.3f}s median of "
+            f"{repetitions} repetitions"
+        )
+        if profile_dir:
+            stats_path, folded_path = profile_benchmark(
+                benchmark=benchmark, directory=profile_dir
+            )
+            logger.info(f"{benchmark.name} profiled in {stats_path}, {folded_path}")
+
+    report = make_report(results=results, errors=errors)
+    if output:
+        save_report(report=report, path=output)
+
+    if baseline:
+        comparisons = compare_with_baseline(
+            report=report, baseline=load_report(path=baseline)
+        )
+        for comparison in comparisons:
+            logger.info(
+                f"{comparison.name}: {comparison.ratio:.2f}x the baseline median "
+                f"({comparison.median:.3f}s vs {comparison.baseline_median:.3f}s)"
+            )
+        if regressions := [c.name for c in comparisons if c.is_regression]:
+            raise click.ClickException(
+                f"Benchmarks slower than their baseline: {', '.join(regressions)}"
+            )
+
+    if errors:
+        raise click.ClickException(f"Benchmarks failed: {', '.join(errors)}")
+
+
+if __name__ == "__main__":
+    run_benchmark_suite()
@@ -1,8 +1,10 @@
 import pickle
 from collections import Counter
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pkg_resources
 from joblib import Parallel, delayed
 from sklearn.metrics import accuracy_score, make_scorer
@@ -63,23 +65,47 @@ class AreaClassifier:
         classification_scheme_path = CLASSIFIER_DIR.joinpath(
             "CLASSIFICATIONS.UNIFIED.pickle"
         )
-        try:
-            with classification_scheme_path.open("rb") as fh:
-                self._classifier = pickle.load(fh)
-        except FileNotFoundError:
-            raise NoClassifierAvailableException(
-                f"No classifier found for classification scheme {self._classification_scheme}"
-                f" at {classification_scheme_path}"
-            )
+        self._classifier = _load_shared_classifier(
+            path=classification_scheme_path,
+            classification_scheme=self._classification_scheme,
+        )
 
     # Classification
 
     def classify(self, plan_layout: SimLayout, area: SimArea) -> AreaType:
-        return self._decode_labels(
-            self._classifier.predict(
-                [self._compute_feature_vector(plan_layout=plan_layout, area=area)]
+        return self.classify_areas(layout_areas=[(plan_layout, area)])[0]
+
+    def classify_layout_areas(
+        self, plan_layout: SimLayout, areas: Iterable[SimArea]
+    ) -> Dict[int, AreaType]:
+        """Classifies the given areas of the layout with a single model call.
+        Returns the predicted area type by area id."""
+        areas = list(areas)
+        return {
+            area.id: area_type
+            for area, area_type in zip(
+                areas,
+                self.classify_areas(
+                    layout_areas=[(plan_layout, area) for area in areas]
+                ),
             )
-        )[0]
+        }
+
+    def classify_areas(
+        self, layout_areas: Iterable[Tuple[SimLayout, SimArea]]
+    ) -> List[AreaType]:
+        """Classifies areas of one or several layouts building the feature matrix
+        of all of them and running a single prediction."""
+        feature_matrix = np.array(
+            [
+                self._compute_feature_vector(plan_layout=plan_layout, area=area)
+                for plan_layout, area in layout_areas
+            ],
+            dtype=float,
+        )
+        if not len(feature_matrix):
+            return []
+        return self._decode_labels(self._classifier.predict(feature_matrix))
 
     def _encode_labels(self, area_types: List[AreaType]) -> List[int]:
         return self._label_encoder.transform(
@@ -302,3 +328,22 @@ class AreaClassifier:
 
 
 CLASSIFIER_DIR = Path(pkg_resources.resource_filename("brooks", "data/classifiers/"))
+
+# The unpickled models are read-only at prediction time, so a single instance per
+# process is shared by all the classifiers and threads.
+_LOADED_CLASSIFIERS: Dict[Path, Any] = {}
+_LOADED_CLASSIFIERS_LOCK = Lock()
+
+
+def _load_shared_classifier(path: Path, classification_scheme) -> Any:
+    with _LOADED_CLASSIFIERS_LOCK:
+        if path not in _LOADED_CLASSIFIERS:
+            try:
+                with path.open("rb") as fh:
+                    _LOADED_CLASSIFIERS[path] = pickle.load(fh)
+            except FileNotFoundError:
+                raise NoClassifierAvailableException(
+                    f"No classifier found for classification scheme {classification_scheme}"
+                    f" at {path}"
+                )
+        return _LOADED_CLASSIFIERS[path]
@@ -1,8 +1,10 @@
-from typing import Dict, Iterator
+import hashlib
+from typing import Callable, Dict, Iterator, List, Optional
 
 import numpy
+from pygeos import STRtree
 from pygeos import area as pygeos_areas
-from pygeos import from_shapely, intersection, intersects
+from pygeos import from_shapely, intersection, to_wkb
 
 from brooks import SpaceConnector
 from brooks.models import SimLayout, SimOpening
@@ -10,18 +12,62 @@ from brooks.models.violation import SpatialEntityViolation, Violation, Violation
 from brooks.types import FeatureType, OpeningType
 
 
+class OpeningChecksCache:
+    """Results of the checks of each opening by a digest of its footprint and the
+    footprints of its neighbours, so that validating a slightly modified layout only
+    checks again the openings whose neighbourhood changed. `checks` only keeps the
+    results used by the latest validation, to be passed as `previous_checks` of the
+    next one.
+    """
+
+    def __init__(self, previous_checks: Optional[Dict[str, bool]] = None):
+        self.previous_checks = previous_checks or {}
+        self.checks: Dict[str, bool] = {}
+
+    def get(self, key: str, check: Callable[[], bool]) -> bool:
+        if key not in self.checks:
+            self.checks[key] = (
+                self.previous_checks[key] if key in self.previous_checks else check()
+            )
+        return self.checks[key]
+
+    @staticmethod
+    def key(check_name: str, wkb: bytes, neighbours_wkb: List[bytes]) -> str:
+        digest = hashlib.sha256(check_name.encode())
+        for geometry_wkb in [wkb, *sorted(neighbours_wkb)]:
+            digest.update(geometry_wkb)
+        return digest.hexdigest()
+
+
+def _neighbours_by_index(
+    input_indexes: numpy.ndarray, tree_indexes: numpy.ndarray, size: int
+) -> List[numpy.ndarray]:
+    """Splits the result of STRtree.query_bulk in the tree indexes of each input"""
+    order = numpy.argsort(input_indexes, kind="stable")
+    return numpy.split(
+        tree_indexes[order],
+        numpy.searchsorted(input_indexes[order], numpy.arange(1, size)),
+    )
+
+
 class SimLayoutValidations:
     @classmethod
-    def validate(cls, layout: SimLayout) -> Iterator[Violation]:
-        for method in (
-            cls.validate_door_connects_areas,
-            cls.validate_accessible_spaces,
-            cls.check_areas_not_overlap_with_multiple_spaces,
-            cls.check_features_belong_to_area,
-            cls.validate_opening_overlaps_only_one_separator,
-            cls.validate_openings_overlap_openings,
+    def validate(
+        cls, layout: SimLayout, opening_checks: Optional[OpeningChecksCache] = None
+    ) -> Iterator[Violation]:
+        opening_checks = opening_checks or OpeningChecksCache()
+        for violations in (
+            cls.validate_door_connects_areas(layout=layout),
+            cls.validate_accessible_spaces(layout=layout),
+            cls.check_areas_not_overlap_with_multiple_spaces(layout=layout),
+            cls.check_features_belong_to_area(layout=layout),
+            cls.validate_opening_overlaps_only_one_separator(
+                layout=layout, opening_checks=opening_checks
+            ),
+            cls.validate_openings_overlap_openings(
+                layout=layout, opening_checks=opening_checks
+            ),
         ):
-            violations = list(method(layout=layout))
             yield from sorted(violations, key=lambda x: x.entity.footprint.area)
 
     @staticmethod
@@ -91,13 +137,14 @@ class SimLayoutValidations:
         layout: SimLayout,
     ) -> Iterator[SpatialEntityViolation]:
         all_areas = {area for space in layout.spaces for area in space.areas}
-        pygeos_spaces = from_shapely([space.footprint for space in layout.spaces])
+        spaces_tree = STRtree(
+            from_shapely([space.footprint for space in layout.spaces])
+        )
         for area in all_areas:
-            intersecting_spaces = intersects(
-                from_shapely(area.footprint),
-                pygeos_spaces,
+            intersecting_spaces = spaces_tree.query(
+                from_shapely(area.footprint), predicate="intersects"
             )
-            if intersecting_spaces.sum() > 1:
+            if len(intersecting_spaces) > 1:
                 yield SpatialEntityViolation(
                     violation_type=ViolationType.AREA_OVERLAPS_MULTIPLE_SPACES,
                     entity=area,
@@ -107,40 +154,51 @@ class SimLayoutValidations:
     def check_features_belong_to_area(
         layout: SimLayout,
     ) -> Iterator[SpatialEntityViolation]:
-        pygeos_geometry_areas = from_shapely(
-            [area.footprint for space in layout.spaces for area in space.areas]
+        areas_tree = STRtree(
+            from_shapely(
+                [area.footprint for space in layout.spaces for area in space.areas]
+            )
         )
         for feature in layout.all_processed_features:
-            intersecting_areas = intersects(
-                from_shapely(feature.footprint),
-                pygeos_geometry_areas,
+            intersecting_areas = areas_tree.query(
+                from_shapely(feature.footprint), predicate="intersects"
             )
-            if intersecting_areas.sum() != 1:
+            if len(intersecting_areas) != 1:
                 yield SpatialEntityViolation(
                     violation_type=ViolationType.FEATURE_NOT_ASSIGNED, entity=feature
                 )
 
     @staticmethod
     def validate_opening_overlaps_only_one_separator(
-        layout: SimLayout,
+        layout: SimLayout, opening_checks: Optional[OpeningChecksCache] = None
     ) -> Iterator[SpatialEntityViolation]:
         """Meant to be used for the migrated plans from the old editor where this was not controlled"""
+        opening_checks = opening_checks or OpeningChecksCache()
+        openings = sorted(layout.openings, key=lambda x: x.footprint.area)
+        all_openings = from_shapely([opening.footprint for opening in openings])
         all_separators = from_shapely([sep.footprint for sep in layout.separators])
-        for opening in sorted(layout.openings, key=lambda x: x.footprint.area):
-            opening_footprint_pygeos = from_shapely(opening.footprint)
-            separators_intersecting = intersects(
-                opening_footprint_pygeos,
-                all_separators,
+        openings_wkb, separators_wkb = to_wkb(all_openings), to_wkb(all_separators)
+        separators_by_opening = _neighbours_by_index(
+            *STRtree(all_separators).query_bulk(all_openings), size=len(openings)
+        )
+
+        def _overlaps_multiple_separators(index: int) -> bool:
+            area_intersections = pygeos_areas(
+                intersection(
+                    all_separators[separators_by_opening[index]], all_openings[index]
+                )
             )
-            separators_intersections = intersection(
-                [
-                    all_separators[index]
-                    for index in separators_intersecting.nonzero()[0]
-                ],
-                opening_footprint_pygeos,
+            return len(numpy.where(area_intersections > 0.01)[0]) > 1
+
+        for index, opening in enumerate(openings):
+            key = opening_checks.key(
+                check_name=ViolationType.OPENING_OVERLAPS_MULTIPLE_WALLS.name,
+                wkb=openings_wkb[index],
+                neighbours_wkb=separators_wkb[separators_by_opening[index]].tolist(),
             )
-            area_intersections = pygeos_areas(separators_intersections)
-            if len(numpy.where(area_intersections > 0.01)[0]) > 1:
+            if opening_checks.get(
+                key=key, check=lambda: _overlaps_multiple_separators(index)
+            ):
                 yield SpatialEntityViolation(
                     violation_type=ViolationType.OPENING_OVERLAPS_MULTIPLE_WALLS,
                     entity=opening,
@@ -148,29 +206,41 @@ class SimLayoutValidations:
 
     @staticmethod
     def validate_openings_overlap_openings(
-        layout: SimLayout,
+        layout: SimLayout, opening_checks: Optional[OpeningChecksCache] = None
     ) -> Iterator[SpatialEntityViolation]:
+        opening_checks = opening_checks or OpeningChecksCache()
         openings_list = list(layout.openings)
         all_openings_pygeos = from_shapely([x.footprint for x in openings_list])
-        for current_index, opening in enumerate(openings_list):
-            current_opening = all_openings_pygeos[current_index]
-            openings_intersecting = intersects(
-                current_opening,
-                all_openings_pygeos,
-            )
+        openings_wkb = to_wkb(all_openings_pygeos)
+        # Only the pairs of openings close to each other, excluding the self pairs
+        openings_indexes, other_indexes = STRtree(all_openings_pygeos).query_bulk(
+            all_openings_pygeos
+        )
+        different = openings_indexes != other_indexes
+        others_by_opening = _neighbours_by_index(
+            openings_indexes[different],
+            other_indexes[different],
+            size=len(openings_list),
+        )
+
+        def _overlaps_other_openings(index: int) -> bool:
             area_intersections = pygeos_areas(
                 intersection(
-                    [
-                        all_openings_pygeos[index]
-                        for index in openings_intersecting.nonzero()[0]
-                        if index != current_index
-                    ],
-                    current_opening,
+                    all_openings_pygeos[others_by_opening[index]],
+                    all_openings_pygeos[index],
                 )
             )
-            # We have to discard the self intersection, for optimization purposes all the openings are always compared
-            indexes_intersecting = numpy.where(area_intersections > 0.01)[0]
-            if len(indexes_intersecting):
+            return bool((area_intersections > 0.01).any())
+
+        for current_index, opening in enumerate(openings_list):
+            key = opening_checks.key(
+                check_name=ViolationType.OPENING_OVERLAPS_ANOTHER_OPENING.name,
+                wkb=openings_wkb[current_index],
+                neighbours_wkb=openings_wkb[others_by_opening[current_index]].tolist(),
+            )
+            if opening_checks.get(
+                key=key, check=lambda: _overlaps_other_openings(current_index)
+            ):
                 yield SpatialEntityViolation(
                     violation_type=ViolationType.OPENING_OVERLAPS_ANOTHER_OPENING,
                     entity=opening,
@@ -17,6 +17,8 @@ if TYPE_CHECKING:
 
 
 class SimArea(SpatialEntity, BrooksSerializable):
+    __slots__ = ("features", "db_area_id")
+
     __serializable_fields__ = (
         "type",
         "id",
@@ -24,6 +24,16 @@ if TYPE_CHECKING:
 class SimFeature(SpatialEntity, BrooksSerializable):
     """A Feature is a thing describing relevant things for an analyse."""
 
+    __slots__ = (
+        "dim",
+        "tags",
+        "parametrical_geometry",
+        "name",
+        "dx",
+        "dy",
+        "feature_type_properties",
+    )
+
     __serializable_fields__ = (
         "type",
         "id",
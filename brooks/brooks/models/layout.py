@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 from collections import defaultdict
-from copy import deepcopy
 from enum import Enum
 from functools import cached_property
 from itertools import chain
@@ -17,9 +16,9 @@ from typing import (
     Tuple,
     Union,
 )
-from uuid import uuid1, uuid4
+from uuid import uuid1
 
-from pygeos import buffer, from_shapely, intersects, to_geojson
+from pygeos import STRtree, buffer, from_shapely, intersects, to_geojson
 from shapely import wkt
 from shapely.geometry import (
     CAP_STYLE,
@@ -39,7 +38,7 @@ from brooks.models.feature import SimFeature
 from brooks.models.opening import SimOpening
 from brooks.models.separator import SimSeparator
 from brooks.models.space import SimSpace
-from brooks.models.spatial_entity import SpatialEntity
+from brooks.models.spatial_entity import SpatialEntity, new_entity_id
 from brooks.models.violation import Violation
 from brooks.types import AreaType, FeatureType, LayoutType, OpeningType, SeparatorType
 from brooks.util.geometry_ops import (
@@ -114,6 +113,11 @@ class SimLayout(BrooksSerializable):
         self.spaces: Set[SimSpace] = spaces or set()
         self.floor_number = floor_number
         self.default_element_heights = default_element_heights
+        SpatialEntity.ensure_footprints_validity(
+            chain(
+                self.separators, self.openings, self.spaces, self.areas, self.features
+            )
+        )
 
     @property
     def default_element_heights(self):
@@ -220,38 +224,84 @@ class SimLayout(BrooksSerializable):
 
     @cached_property
     def non_overlapping_separators(self) -> Set[SimSeparator]:
-        sorted_separators = list(
-            sorted(
-                [deepcopy(s) for s in self.separators],
-                key=lambda z: (z.width, z.footprint.area),
-                reverse=True,
-            )
+        sorted_separators = sorted(
+            self.separators,
+            key=lambda z: (z.width, z.footprint.area),
+            reverse=True,
         )
-        for i, separator1 in enumerate(sorted_separators):
-            for separator2 in sorted_separators[i + 1 :]:
-                if separator1.footprint.intersects(separator2.footprint):
-                    separator2.footprint = ensure_geometry_validity(
-                        separator2.footprint.difference(separator1.footprint)
+        footprints = [separator.footprint for separator in sorted_separators]
+
+        # Footprints only shrink when removing the overlaps, so only the pairs with
+        # overlapping bounding boxes in the original footprints have to be checked
+        separators_tree = STRtree(from_shapely(footprints))
+        candidate_pairs = separators_tree.query_bulk(separators_tree.geometries)
+        candidates_by_separator = defaultdict(list)
+        for i, j in candidate_pairs.T[candidate_pairs[0] < candidate_pairs[1]]:
+            candidates_by_separator[i].append(j)
+
+        for i in range(len(footprints)):
+            for j in sorted(candidates_by_separator[i]):
+                if footprints[i].intersects(footprints[j]):
+                    footprints[j] = ensure_geometry_validity(
+                        footprints[j].difference(footprints[i])
                     )
 
         polygonal_separators = set()
-        for separator in sorted_separators:
-            for geom in get_polygons(separator.footprint):
-                new_separator = deepcopy(separator)
-                new_separator.id = uuid4().hex
-                new_separator.footprint = geom
+        for separator, footprint in zip(sorted_separators, footprints):
+            for geom in get_polygons(footprint):
+                new_separator = self._copy_separator(
+                    separator=separator, footprint=geom
+                )
                 new_separator.openings = {
-                    opening
+                    self._copy_opening(
+                        opening=opening,
+                        separator=new_separator,
+                        footprint=opening.adjust_geometry_to_wall(
+                            opening=opening.footprint, wall=geom, buffer_width=1.05
+                        ),
+                    )
                     for opening in separator.openings
                     if opening.footprint.intersects(geom)
                 }
-                for opening in new_separator.openings:
-                    opening.footprint = opening.adjust_geometry_to_wall(
-                        opening=opening.footprint, wall=geom, buffer_width=1.05
-                    )
                 polygonal_separators.add(new_separator)
         return polygonal_separators
 
+    @staticmethod
+    def _copy_separator(separator: SimSeparator, footprint: Polygon) -> SimSeparator:
+        new_separator = SimSeparator(
+            footprint=footprint,
+            separator_type=separator.type,
+            editor_properties=separator.editor_properties,
+            height=separator.height,
+            separator_id=new_entity_id(),
+        )
+        new_separator.direction = separator.direction
+        new_separator.angle = separator.angle
+        new_separator.position = separator.position
+        new_separator.geometry_new_editor = separator.geometry_new_editor
+        return new_separator
+
+    @staticmethod
+    def _copy_opening(
+        opening: SimOpening, separator: SimSeparator, footprint: Polygon
+    ) -> SimOpening:
+        new_opening = SimOpening(
+            footprint=footprint,
+            height=opening.height,
+            separator=separator,
+            separator_reference_line=opening.separator_reference_line,
+            opening_id=opening.id,
+            opening_type=opening.type,
+            editor_properties=opening.editor_properties,
+            sweeping_points=opening.sweeping_points,
+            opening_sub_type=opening.opening_sub_type,
+            geometry_new_editor=opening.geometry_new_editor,
+        )
+        new_opening.direction = opening.direction
+        new_opening.angle = opening.angle
+        new_opening.position = opening.position
+        return new_opening
+
     @cached_property
     def areas_openings(self) -> Dict[str, Set[SimOpening]]:
         """dict keys are area.id, dict values are all openings"""
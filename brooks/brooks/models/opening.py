@@ -24,6 +24,14 @@ if TYPE_CHECKING:
 class SimOpening(SpatialEntity, BrooksSerializable):
     """An opening is an opening like a door or a window belonging to an area"""
 
+    __slots__ = (
+        "separator_reference_line",
+        "separator",
+        "sweeping_points",
+        "opening_sub_type",
+        "editor_properties",
+    )
+
     __serializable_fields__ = (
         "type",
         "id",
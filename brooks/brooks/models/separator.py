@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 class BaseSeparator(SpatialEntity, BrooksSerializable):
     """A separator separates spaces from each other"""
 
+    __slots__ = ("openings", "editor_properties")
+
     __serializable_fields__ = (
         "type",
         "id",
@@ -73,6 +75,8 @@ class BaseSeparator(SpatialEntity, BrooksSerializable):
 
 
 class SimSeparator(BaseSeparator):
+    __slots__ = ()
+
     def __init__(
         self,
         footprint: Polygon,
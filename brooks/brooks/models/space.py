@@ -11,6 +11,8 @@ from .spatial_entity import SpatialEntity
 
 
 class SimSpace(SpatialEntity, BrooksSerializable):
+    __slots__ = ("areas",)
+
     __serializable_fields__ = (
         "id",
         "type",
@@ -1,7 +1,10 @@
+import os
 import uuid
 from functools import cached_property
-from typing import TYPE_CHECKING, Optional, Tuple
+from itertools import count
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
 
+from pygeos import from_shapely, is_valid
 from shapely import wkt
 from shapely.affinity import translate
 from shapely.geometry import Point, Polygon
@@ -14,6 +17,29 @@ if TYPE_CHECKING:
     from simulations.view.meshes import GeoreferencingTransformation
 
 
+# Shapely geometries are not mutated in place, so entities without a position share it
+_ORIGIN = Point(0, 0)
+
+_entity_id_prefix = uuid.uuid4().hex[:8]
+_entity_id_sequence = count()
+
+
+def _reset_entity_ids():
+    global _entity_id_prefix, _entity_id_sequence
+    _entity_id_prefix = uuid.uuid4().hex[:8]
+    _entity_id_sequence = count()
+
+
+# Forked workers get their own prefix, otherwise they would generate the same ids
+os.register_at_fork(after_in_child=_reset_entity_ids)
+
+
+def new_entity_id() -> str:
+    """Sequential id, unique within the process and prefixed to be unique
+    across processes, much cheaper to generate than a random uuid."""
+    return f"{_entity_id_prefix}{next(_entity_id_sequence):x}"
+
+
 class SpatialEntity:
     """A spatial entity is an object embedded in three dimensional space.
 
@@ -22,8 +48,28 @@ class SpatialEntity:
     to be defined within the ifc import and not used in the archilogic
     framework -  right now it has only a height.
     A spatial entity optionally contains a direction - like a chair
+
+    Layouts contain hundreds of thousands of entities, so the attributes are stored
+    in slots. The __dict__ slot is kept for cached properties and is only allocated
+    when one is used. The validity of the footprint given on creation is ensured
+    when it is first accessed or, for all the entities of a layout at once, by
+    `ensure_footprints_validity`.
     """
 
+    __slots__ = (
+        "id",
+        "_footprint",
+        "_footprint_validated",
+        "height",
+        "direction",
+        "angle",
+        "position",
+        "geometry_new_editor",
+        "_type",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         footprint: Polygon,
@@ -34,12 +80,13 @@ class SpatialEntity:
         position: Point = None,
         geometry_new_editor: Optional[Polygon] = None,
     ):
-        entity_id = entity_id or uuid.uuid4().hex
+        entity_id = entity_id or new_entity_id()
         angle = angle or 0.0
-        position = position or Point(0, 0)
+        position = position or _ORIGIN
 
         self.id: str = entity_id
-        self.footprint: Polygon = ensure_geometry_validity(geometry=footprint)
+        self._footprint: Polygon = footprint
+        self._footprint_validated: bool = False
         self.height = height
         self.direction = direction
 
@@ -48,6 +95,34 @@ class SpatialEntity:
         self.position = position
         self.geometry_new_editor = geometry_new_editor
 
+    @property
+    def footprint(self) -> Polygon:
+        if not self._footprint_validated:
+            self._footprint = ensure_geometry_validity(geometry=self._footprint)
+            self._footprint_validated = True
+        return self._footprint
+
+    @footprint.setter
+    def footprint(self, footprint: Polygon):
+        self._footprint = footprint
+        self._footprint_validated = True
+
+    @staticmethod
+    def ensure_footprints_validity(entities: Iterable["SpatialEntity"]):
+        """Checks the validity of the pending footprints of all the entities in one
+        vectorized call, only the invalid ones are fixed one by one."""
+        pending = [entity for entity in entities if not entity._footprint_validated]
+        if not pending:
+            return
+        footprints_validity = is_valid(
+            from_shapely([entity._footprint for entity in pending])
+        )
+        for entity, footprint_is_valid in zip(pending, footprints_validity):
+            if footprint_is_valid:
+                entity._footprint_validated = True
+            else:
+                entity.footprint = ensure_geometry_validity(geometry=entity._footprint)
+
     @property
     def type(self):
         if hasattr(self, "_type"):
@@ -1,6 +1,8 @@
-from typing import Any, List, Optional, Set
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Set
 
-from pygeos import buffer, from_shapely, intersection, intersects, to_shapely, union_all
+from numpy import ndarray
+from pygeos import STRtree, buffer, from_shapely, intersection, to_shapely, union_all
 from shapely.ops import unary_union
 
 from brooks.models import SimArea, SimLayout, SimOpening, SimSeparator, SimSpace
@@ -11,6 +13,29 @@ class UnitLayoutFactory:
     def __init__(self, plan_layout: SimLayout):
         self.plan_layout = plan_layout
 
+    @cached_property
+    def _separators(self) -> List[SimSeparator]:
+        return list(self.plan_layout.separators)
+
+    @cached_property
+    def _separator_geometries(self) -> ndarray:
+        return from_shapely([sep.footprint for sep in self._separators])
+
+    @cached_property
+    def _buffered_separators_tree(self) -> STRtree:
+        return STRtree(
+            buffer(
+                self._separator_geometries,
+                radius=0.1,
+                cap_style="square",
+                join_style="mitre",
+            )
+        )
+
+    @cached_property
+    def _spaces_by_id(self) -> Dict[str, SimSpace]:
+        return {space.id: space for space in self.plan_layout.spaces}
+
     def create_sub_layout(
         self,
         spaces_ids: Set[str],
@@ -22,75 +47,101 @@ class UnitLayoutFactory:
         Creates a new layout based on a subset of spaces ids of the layout.
         New separators, openings and features will be generated based on originals
         """
-        unit_layout = SimLayout(floor_number=floor_number)
+        [unit_layout] = self.create_sub_layouts(
+            spaces_ids_by_unit=[spaces_ids],
+            area_db_ids_by_unit=[area_db_ids],
+            floor_number=floor_number,
+            public_space=public_space,
+        )
+        return unit_layout
 
-        spaces_to_keep = {
-            space for space in self.plan_layout.spaces if space.id in spaces_ids
-        }
+    def create_sub_layouts(
+        self,
+        spaces_ids_by_unit: List[Set[str]],
+        area_db_ids_by_unit: List[Any],
+        floor_number: int = 0,
+        public_space: bool = False,
+    ) -> List[SimLayout]:
+        """
+        Same as `create_sub_layout` for many subsets of spaces of the layout at once.
+        The geometries of the plan elements are prepared only once and assigned to all
+        the sub layouts in one pass, so it should be preferred to calling
+        `create_sub_layout` for each unit of a plan.
+        """
+        unit_layouts = []
+        for spaces_ids, area_db_ids in zip(spaces_ids_by_unit, area_db_ids_by_unit):
+            unit_layout = SimLayout(floor_number=floor_number)
+            self._copy_spaces_and_areas_to_sub_layout(
+                spaces_to_keep={
+                    self._spaces_by_id[space_id]
+                    for space_id in spaces_ids
+                    if space_id in self._spaces_by_id
+                },
+                unit_layout=unit_layout,
+                areas_to_keep=area_db_ids,
+            )
+            unit_layouts.append(unit_layout)
 
-        self._copy_spaces_and_areas_to_sub_layout(
-            spaces_to_keep=spaces_to_keep,
-            unit_layout=unit_layout,
-            areas_to_keep=area_db_ids,
+        self._copy_separators_openings_features_to_sub_layouts(
+            unit_layouts=unit_layouts, public_space=public_space
         )
-        self._copy_separators_openings_features_to_sub_layout(
-            unit_layout=unit_layout, public_space=public_space
-        )
-        return unit_layout
+        return unit_layouts
 
-    def _copy_separators_openings_features_to_sub_layout(
-        self, unit_layout: SimLayout, public_space: bool
+    def _copy_separators_openings_features_to_sub_layouts(
+        self, unit_layouts: List[SimLayout], public_space: bool
     ) -> None:
-        """Copy separators, openings and layout based on the spaces of the sub_layout
-        provided into it
+        """Copy separators, openings and layout based on the spaces of the sub_layouts
+        provided into them
         """
-        union_spaces_buffered = unit_layout.get_spaces_union(
-            spaces=unit_layout.areas, public_space=public_space
-        )
-        union_spaces_no_buffer = union_all(
-            from_shapely([space.footprint for space in unit_layout.spaces])
+        if not self._separators:
+            return
+
+        unions_spaces_buffered = from_shapely(
+            [
+                unit_layout.get_spaces_union(
+                    spaces=unit_layout.areas, public_space=public_space
+                )
+                for unit_layout in unit_layouts
+            ]
         )
-        separator_list = list(self.plan_layout.separators)
-        separator_intersects_indexes = intersects(
-            buffer(
-                from_shapely([sep.footprint for sep in separator_list]),
-                radius=0.1,
-                cap_style="square",
-                join_style="mitre",
-            ),
-            union_spaces_no_buffer,
+        unions_spaces_no_buffer = [
+            union_all(from_shapely([space.footprint for space in unit_layout.spaces]))
+            for unit_layout in unit_layouts
+        ]
+        unit_indexes, separator_indexes = self._buffered_separators_tree.query_bulk(
+            unions_spaces_no_buffer, predicate="intersects"
         )
-        separator_intersections_indexes = intersection(
-            from_shapely([sep.footprint for sep in separator_list]),
-            from_shapely(union_spaces_buffered),
+        # NOTE: here we are cutting the original separators such that they do not extend
+        # more than the buffered union of all spaces of the unit. This is important not to
+        # block windows of other units.
+        cut_separator_footprints = to_shapely(
+            intersection(
+                self._separator_geometries[separator_indexes],
+                unions_spaces_buffered[unit_indexes],
+            )
         )
-        for index, separator in enumerate(separator_list):
-            if separator_intersects_indexes[index]:
-                # NOTE: here we are cutting the original separator such that it does not extend
-                # more than the buffered union of all spaces. This is important not to
-                # block windows of other units.
-                cut_separator_footprint = to_shapely(
-                    separator_intersections_indexes[index]
+        for unit_index, separator_index, cut_separator_footprint in zip(
+            unit_indexes, separator_indexes, cut_separator_footprints
+        ):
+            separator = self._separators[separator_index]
+            new_separators = [
+                SimSeparator(
+                    footprint=polygon,
+                    height=separator.height,
+                    separator_type=separator.type,
+                    editor_properties=separator.editor_properties,
                 )
+                for polygon in as_multipolygon(cut_separator_footprint).geoms
+            ]
+            # We have to copy new openings where the reference parent/child is correct
+            for opening in separator.openings:
+                for new_separator in new_separators:
+                    if self._copy_opening_to_separator(
+                        opening=opening, new_separator=new_separator
+                    ):
+                        break
 
-                new_separators = [
-                    SimSeparator(
-                        footprint=polygon,
-                        height=separator.height,
-                        separator_type=separator.type,
-                        editor_properties=separator.editor_properties,
-                    )
-                    for polygon in as_multipolygon(cut_separator_footprint).geoms
-                ]
-                # We have to copy new openings where the reference parent/child is correct
-                for opening in separator.openings:
-                    for new_separator in new_separators:
-                        if self._copy_opening_to_separator(
-                            opening=opening, new_separator=new_separator
-                        ):
-                            break
-
-                unit_layout.separators.update(new_separators)
+            unit_layouts[unit_index].separators.update(new_separators)
 
     @staticmethod
     def _copy_opening_to_separator(
@@ -9,6 +9,8 @@ from shapely.geometry import MultiPolygon, Point, Polygon, mapping
 
 
 class BrooksSerializable:
+    __slots__ = ()
+
     def asdict(self) -> Dict:
         return BrooksJSONEncoder().default(self)
 
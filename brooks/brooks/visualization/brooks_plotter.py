@@ -1,5 +1,5 @@
 import io
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 import matplotlib
 from matplotlib.backend_bases import register_backend
@@ -22,6 +22,14 @@ register_backend("dxf", FigureCanvasDXF, "DXF Format")
 
 
 class BrooksPlotter:
+    FLOOR_LAYOUT_BY_FILE_FORMAT: Dict[
+        SUPPORTED_OUTPUT_FILES, Type[AssetManagerFloorLayout]
+    ] = {
+        SUPPORTED_OUTPUT_FILES.PNG: AssetManagerFloorLayout,
+        SUPPORTED_OUTPUT_FILES.PDF: AssetManagerFloorLayout,
+        SUPPORTED_OUTPUT_FILES.DXF: DXFFloorLayout,
+    }
+
     def __init__(self):
         self.fig = None
         self.dxf_scale_factor = 1.0
@@ -37,6 +45,7 @@ class BrooksPlotter:
         self, file_format: SUPPORTED_OUTPUT_FILES, dpi: int
     ) -> Union[io.BytesIO, io.StringIO]:
         matplotlib.use("Agg")
+        background_visible = self.fig.patch.get_visible()
         if file_format == SUPPORTED_OUTPUT_FILES.DXF:
             self.fig.patch.set_visible(False)
             io_file = io.StringIO()
@@ -50,6 +59,8 @@ class BrooksPlotter:
             dpi=dpi,
             dxf_scale_factor=self.dxf_scale_factor,
         )
+        # The same figure can be saved afterwards in other formats
+        self.fig.patch.set_visible(background_visible)
         io_file.seek(0)
         matplotlib.pyplot.close()
         return io_file
@@ -67,22 +78,54 @@ class BrooksPlotter:
         """Plots the apartment onto a matplotlib axes object.If no axis is provided,
         a 4:3 figure will be generated at 200dpi.
         """
-        self.fig = AssetManagerApartmentLayout(
-            language=language,
+        [(_, _, io_image)] = self.generate_unit_plots(
+            unit_target_layout=unit_target_layout,
+            floor_plan_layout=floor_plan_layout,
+            metadata=metadata,
+            languages=[language],
+            file_formats=[file_format],
+            angle_north=angle_north,
+            logo_content=logo_content,
+        )
+        return io_image
+
+    def generate_unit_plots(
+        self,
+        unit_target_layout: SimLayout,
+        floor_plan_layout: SimLayout,
+        metadata: Dict[str, Any],
+        languages: Iterable[SUPPORTED_LANGUAGES],
+        file_formats: Iterable[SUPPORTED_OUTPUT_FILES],
+        angle_north: int = 0,
+        logo_content: Optional[bytes] = None,
+    ) -> Iterator[
+        Tuple[
+            SUPPORTED_LANGUAGES, SUPPORTED_OUTPUT_FILES, Union[io.BytesIO, io.StringIO]
+        ]
+    ]:
+        """Generates the figure of the apartment only once and renders it in all the
+        languages and file formats requested, only the texts are translated in between.
+        """
+        languages = list(languages)
+        layout = AssetManagerApartmentLayout(
+            language=languages[0],
             assetmanager_text_generator=ApartmentAssetManagerTextGenerator(
-                metadata=metadata, language=language
+                metadata=metadata, language=languages[0]
             ),
-        ).generate_layout(
+        )
+        self.fig = layout.generate_layout(
             floor_layout=floor_plan_layout,
             unit_layout=unit_target_layout,
             angle_north=angle_north,
             logo_content=logo_content,
         )
-
-        return self._get_io_image(
-            file_format=file_format,
-            dpi=3 * IMAGES_DPI if unit_target_layout.is_large_layout else IMAGES_DPI,
-        )
+        dpi = 3 * IMAGES_DPI if unit_target_layout.is_large_layout else IMAGES_DPI
+        for language in languages:
+            layout.set_language(language=language)
+            for file_format in file_formats:
+                yield language, file_format, self._get_io_image(
+                    file_format=file_format, dpi=dpi
+                )
 
     def generate_floor_plot(
         self,
@@ -98,33 +141,78 @@ class BrooksPlotter:
         """Plots the apartment onto a matplotlib axes object. If no axis is provided,
         a 4:3 figure will be generated at 200dpi.
         """
-        # later we can make a differentiation by client here
-        layout = {
-            SUPPORTED_OUTPUT_FILES.PNG: AssetManagerFloorLayout,
-            SUPPORTED_OUTPUT_FILES.PDF: AssetManagerFloorLayout,
-            SUPPORTED_OUTPUT_FILES.DXF: DXFFloorLayout,
-        }[file_format]
-        self.fig, self.dxf_scale_factor = layout(
-            language=language,
-            assetmanager_text_generator=FloorAssetManagerTextGenerator(
-                metadata=metadata, language=language
-            ),
-        ).generate_layout(
-            floor_layout=floor_plan_layout,
+        [(_, _, io_image)] = self.generate_floor_plots(
+            floor_plan_layout=floor_plan_layout,
             unit_layouts=unit_layouts,
             unit_ids=unit_ids,
+            metadata=metadata,
+            languages=[language],
+            file_formats=[file_format],
             angle_north=angle_north,
             logo_content=logo_content,
         )
-        dpi = IMAGES_DPI
-        if floor_plan_layout.is_large_layout and file_format in {
-            SUPPORTED_OUTPUT_FILES.PNG,
-            SUPPORTED_OUTPUT_FILES.PDF,
-        }:
-            dpi = IMAGES_DPI * 3
-
-        if file_format in {SUPPORTED_OUTPUT_FILES.DXF, SUPPORTED_OUTPUT_FILES.DWG}:
-            self.dxf_scale_factor = 1 / (
-                self.dxf_scale_factor * self.dxf_scale_factor_correction(dpi=dpi)
+        return io_image
+
+    def generate_floor_plots(
+        self,
+        floor_plan_layout: SimLayout,
+        unit_layouts: List[SimLayout],
+        unit_ids: List[str],
+        metadata: Dict[str, Any],
+        languages: Iterable[SUPPORTED_LANGUAGES],
+        file_formats: Iterable[SUPPORTED_OUTPUT_FILES],
+        angle_north: int = 0,
+        logo_content: Optional[bytes] = None,
+    ) -> Iterator[
+        Tuple[
+            SUPPORTED_LANGUAGES, SUPPORTED_OUTPUT_FILES, Union[io.BytesIO, io.StringIO]
+        ]
+    ]:
+        """Generates the figure of the floor only once per figure layout and renders it
+        in all the languages and file formats requested, only the texts are translated
+        in between.
+        """
+        languages = list(languages)
+        file_formats_by_layout: Dict[Type[AssetManagerFloorLayout], List] = {}
+        for file_format in file_formats:
+            # later we can make a differentiation by client here
+            file_formats_by_layout.setdefault(
+                self.FLOOR_LAYOUT_BY_FILE_FORMAT[file_format], []
+            ).append(file_format)
+
+        for layout_class, layout_file_formats in file_formats_by_layout.items():
+            layout = layout_class(
+                language=languages[0],
+                assetmanager_text_generator=FloorAssetManagerTextGenerator(
+                    metadata=metadata, language=languages[0]
+                ),
+            )
+            self.fig, layout_scale_factor = layout.generate_layout(
+                floor_layout=floor_plan_layout,
+                unit_layouts=unit_layouts,
+                unit_ids=unit_ids,
+                angle_north=angle_north,
+                logo_content=logo_content,
             )
-        return self._get_io_image(file_format=file_format, dpi=dpi)
+            for language in languages:
+                layout.set_language(language=language)
+                for file_format in layout_file_formats:
+                    dpi = IMAGES_DPI
+                    if floor_plan_layout.is_large_layout and file_format in {
+                        SUPPORTED_OUTPUT_FILES.PNG,
+                        SUPPORTED_OUTPUT_FILES.PDF,
+                    }:
+                        dpi = IMAGES_DPI * 3
+
+                    self.dxf_scale_factor = layout_scale_factor
+                    if file_format in {
+                        SUPPORTED_OUTPUT_FILES.DXF,
+                        SUPPORTED_OUTPUT_FILES.DWG,
+                    }:
+                        self.dxf_scale_factor = 1 / (
+                            layout_scale_factor
+                            * self.dxf_scale_factor_correction(dpi=dpi)
+                        )
+                    yield language, file_format, self._get_io_image(
+                        file_format=file_format, dpi=dpi
+                    )
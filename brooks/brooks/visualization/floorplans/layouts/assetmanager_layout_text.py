@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from matplotlib.text import Text
 
 from brooks.classifications import UnifiedClassificationScheme
 from brooks.types import AreaType, SIACategory
@@ -53,7 +55,34 @@ class BaseAssetManagerTextGenerator:
             SUPPORTED_LANGUAGES.IT: "Tutte le informazioni sono fornite senza garanzia \ne sono soggette a modifiche.",
         }[self.language]
 
-    def generate_metadata_texts(self, axis, w: float, h: float):
+    def _metadata_contents(self) -> List[Tuple[int, int, str, Dict[str, Any]]]:
+        """Column, row, content and style of every metadata text, in drawing order"""
+        contents = []
+        for column, row, metadata in (
+            (0, 1, self.metadata_upper_left),
+            (0, 0, self.metadata_bottom_left),
+            (2, 1, self.metadata_upper_right),
+            (2, 0, self.metadata_bottom_right),
+        ):
+            for key, value in metadata.items():
+                contents.append(
+                    (column, row, key, AssetManagerFloorOverviewStyle.INFO_FONT_STYLE)
+                )
+                contents.append(
+                    (
+                        column + 1,
+                        row,
+                        value,
+                        AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
+                    )
+                )
+
+        contents.append(
+            (0, 2, self.metadata_title, AssetManagerFloorOverviewStyle.TITLE_FONT_STYLE)
+        )
+        return contents
+
+    def generate_metadata_texts(self, axis, w: float, h: float) -> List[Text]:
         info_font_height_inch = (
             AssetManagerFloorOverviewStyle.INFO_FONT_STYLE.get("size", 12) / 72
         )
@@ -67,68 +96,16 @@ class BaseAssetManagerTextGenerator:
         ]
         columns = [0, 0.2 * w, 0.65 * w, 0.9 * w]
 
-        for key, value in self.metadata_upper_left.items():
-            axis.text(
-                columns[0],
-                rows[1],
-                key,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-            axis.text(
-                columns[1],
-                rows[1],
-                value,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-
-        for key, value in self.metadata_bottom_left.items():
-            axis.text(
-                columns[0],
-                rows[0],
-                key,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-            axis.text(
-                columns[1],
-                rows[0],
-                value,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-
-        for key, value in self.metadata_upper_right.items():
-            axis.text(
-                columns[2],
-                rows[1],
-                key,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-            axis.text(
-                columns[3],
-                rows[1],
-                value,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-
-        for key, value in self.metadata_bottom_right.items():
-            axis.text(
-                columns[2],
-                rows[0],
-                key,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-            axis.text(
-                columns[3],
-                rows[0],
-                value,
-                **AssetManagerFloorOverviewStyle.INFO_FONT_STYLE,
-            )
-
-        axis.text(
-            columns[0],
-            rows[2],
-            self.metadata_title,
-            **AssetManagerFloorOverviewStyle.TITLE_FONT_STYLE,
-        )
+        return [
+            axis.text(columns[column], rows[row], content, **style)
+            for column, row, content, style in self._metadata_contents()
+        ]
+
+    def translate_metadata_texts(self, texts: List[Text]):
+        """Replaces the content of the texts created by `generate_metadata_texts` with
+        the one of the current language"""
+        for text, (_, _, content, _) in zip(texts, self._metadata_contents()):
+            text.set_text(content)
 
     def _verbose_floor_number(self, floor_number: int):
         if floor_number == 0:
@@ -3,12 +3,14 @@ from functools import partial
 from typing import Callable, Dict, List, Optional, Set, Tuple, Type
 
 from matplotlib import image as mpimg
+from matplotlib.artist import Artist
 from matplotlib.axes import Axes
 from matplotlib.patches import Patch
 from matplotlib.pyplot import Figure
+from matplotlib.text import Text
 
 from brooks.classifications import CLASSIFICATIONS
-from brooks.models import SimLayout
+from brooks.models import SimArea, SimLayout
 from brooks.types import FeatureType
 from brooks.visualization.floorplans.assetmanager_style import (
     AssetManagerFloorOverviewStyle,
@@ -28,9 +30,10 @@ from brooks.visualization.floorplans.patches.generators import (
     generate_feature_patches,
     generate_orientation_patches,
     generate_railings_patches,
-    generate_room_texts,
+    generate_room_stamps,
     generate_wall_and_column_patches,
     generate_window_patches,
+    get_room_text,
 )
 from common_utils.constants import SUPPORTED_LANGUAGES
 
@@ -90,6 +93,27 @@ class AssetManagerLayout:
             figsize=(AssetManagerLayout.PAGE_WIDTH, AssetManagerLayout.PAGE_HEIGHT)
         )
         self._axes: Dict[str, Axes] = {}
+        self._layered_artists: List[Tuple[Artist, LayoutLayers, Optional[str]]] = []
+        self._translatable_texts: List[Tuple[Text, Callable[[], str]]] = []
+        self._metadata_texts: List[Text] = []
+
+    def set_language(self, language: SUPPORTED_LANGUAGES):
+        """Translates the texts and layer names of the already generated figure, so that
+        the same figure can be rendered in all the languages without generating the
+        patches again.
+        """
+        if language == self.language:
+            return
+
+        self.language = language
+        self.assetmanager_text_generator.language = language
+        self.assetmanager_text_generator.translate_metadata_texts(
+            texts=self._metadata_texts
+        )
+        for text, get_content in self._translatable_texts:
+            text.set_text(get_content())
+        for artist, layer, group in self._layered_artists:
+            self._set_artist_gid(artist=artist, layer=layer, group=group)
 
     # PROPERTIES
 
@@ -210,7 +234,7 @@ class AssetManagerLayout:
 
         ax = self._add_axis(x, y, w, h, label="legal_advise")
 
-        ax.text(
+        text = ax.text(
             x=1,
             y=0.5,
             s=self.assetmanager_text_generator.legal_advise,
@@ -219,6 +243,9 @@ class AssetManagerLayout:
             horizontalalignment="right",
             verticalalignment="center",
         )
+        self._translatable_texts.append(
+            (text, lambda: self.assetmanager_text_generator.legal_advise)
+        )
 
         return ax
 
@@ -235,7 +262,9 @@ class AssetManagerLayout:
         h = self.TOP_HEIGHT
 
         ax = self._add_axis(x, y, w, h, label="metadata")
-        self.assetmanager_text_generator.generate_metadata_texts(axis=ax, w=w, h=h)
+        self._metadata_texts = self.assetmanager_text_generator.generate_metadata_texts(
+            axis=ax, w=w, h=h
+        )
         align_and_fit_axis(ax, "NW", autoscale=False)
 
         return ax
@@ -357,23 +386,29 @@ class AssetManagerLayout:
             1 if layout.is_large_layout else style.ROOM_TEXT_STYLE["size"]
         )
         if style.ADD_ROOM_TEXTS:
-            for x, y, text, angle in generate_room_texts(
+            for x, y, area, next_to_toilet in generate_room_stamps(
                 layout=layout,
                 area_type_to_name=self.assetmanager_text_generator.area_type_to_name_mapping,
                 axis=axis,
-                use_superscript_for_squaremeters=style.USE_SUPERSCRIPT_FOR_SQUAREMETERS,
             ):
+                get_content = partial(
+                    self._get_room_text,
+                    area=area,
+                    next_to_toilet=next_to_toilet,
+                    use_superscript_for_squaremeters=style.USE_SUPERSCRIPT_FOR_SQUAREMETERS,
+                )
                 text = axis.text(
                     x=x,
                     y=y,
-                    s=text,
-                    rotation=angle,
+                    s=get_content(),
+                    rotation=0,
                     size=room_stamp_font_size,
                     name=style.ROOM_TEXT_STYLE["name"],
                     color=style.ROOM_TEXT_STYLE["color"],
                     verticalalignment=style.ROOM_TEXT_STYLE["verticalalignment"],
                     horizontalalignment=style.ROOM_TEXT_STYLE["horizontalalignment"],
                 )
+                self._translatable_texts.append((text, get_content))
                 self._set_artist_layer_and_group(
                     artist=text, layer=LayoutLayers.ROOM_STAMP
                 )
@@ -399,6 +434,19 @@ class AssetManagerLayout:
 
     # VERBOSE TEXTS
 
+    def _get_room_text(
+        self,
+        area: SimArea,
+        next_to_toilet: bool,
+        use_superscript_for_squaremeters: bool,
+    ) -> str:
+        return get_room_text(
+            area=area,
+            area_type_to_name=self.assetmanager_text_generator.area_type_to_name_mapping,
+            next_to_toilet=next_to_toilet,
+            use_superscript_for_squaremeters=use_superscript_for_squaremeters,
+        )
+
     # UTILS
 
     @staticmethod
@@ -427,6 +475,10 @@ class AssetManagerLayout:
     def _set_artist_layer_and_group(
         self, artist, layer: LayoutLayers, group: str = None
     ):
+        self._layered_artists.append((artist, layer, group))
+        self._set_artist_gid(artist=artist, layer=layer, group=group)
+
+    def _set_artist_gid(self, artist, layer: LayoutLayers, group: Optional[str]):
         artist.set_gid(
             (self.assetmanager_text_generator._verbose_layer(layer=layer), group)
         )
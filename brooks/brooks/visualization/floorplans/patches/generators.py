@@ -462,6 +462,37 @@ def generate_room_texts(
         - Content of the text
         - Angle
     """
+    for x, y, area, next_to_toilet in generate_room_stamps(
+        layout=layout, area_type_to_name=area_type_to_name, axis=axis
+    ):
+        yield (
+            x,
+            y,
+            get_room_text(
+                area=area,
+                area_type_to_name=area_type_to_name,
+                next_to_toilet=next_to_toilet,
+                use_superscript_for_squaremeters=use_superscript_for_squaremeters,
+            ),
+            0,
+        )
+
+
+def generate_room_stamps(
+    layout: SimLayout,
+    area_type_to_name: Dict[Enum, Any],
+    axis: Axes,
+) -> Iterator[Tuple[float, float, SimArea, bool]]:
+    """
+    Language independent part of the room texts, so that the position of the texts is
+    computed only once for all the languages.
+
+    Yields:
+        - Coordinate X for the text
+        - Coordinate Y for the text
+        - Area of the text
+        - If the space of the area is next to a toilet
+    """
 
     spaces_id_next_to_toilet = layout.spaces_next_to_toilet_space()
 
@@ -485,31 +516,38 @@ def generate_room_texts(
             footprint = ensure_geometry_validity(geometry=footprint)
             if footprint and footprint.area:
                 visual_center = get_visual_center(footprint=footprint)
-
-                area_name = (
-                    apply_area_name_logic(
-                        area=area,
-                        area_type_to_name_mapping=area_type_to_name,
-                        next_to_toilet=space.id in spaces_id_next_to_toilet,
-                    )
-                    if area_type_to_name
-                    else area.type.name
-                )
-                area_size = round(number=area.footprint.area, ndigits=1)
-
-                text_to_display = (
-                    f"{area_name}\n{area_size:.1f} m$^2$"
-                    if use_superscript_for_squaremeters
-                    else f"{area_name}\n{area_size:.1f} m2"
-                )
                 yield (
                     visual_center.x,
                     visual_center.y,
-                    text_to_display,
-                    0,
+                    area,
+                    space.id in spaces_id_next_to_toilet,
                 )
 
 
+def get_room_text(
+    area: SimArea,
+    area_type_to_name: Dict[Enum, Any],
+    next_to_toilet: bool,
+    use_superscript_for_squaremeters: bool,
+) -> str:
+    area_name = (
+        apply_area_name_logic(
+            area=area,
+            area_type_to_name_mapping=area_type_to_name,
+            next_to_toilet=next_to_toilet,
+        )
+        if area_type_to_name
+        else area.type.name
+    )
+    area_size = round(number=area.footprint.area, ndigits=1)
+
+    return (
+        f"{area_name}\n{area_size:.1f} m$^2$"
+        if use_superscript_for_squaremeters
+        else f"{area_name}\n{area_size:.1f} m2"
+    )
+
+
 def footprint_without_features(axis: Axes, area: SimArea):
     obstacle_geometries = []
     for obstacle in axis.patches:
@@ -5,14 +5,22 @@ from tasks.utils.utils import celery_retry_task
 
 
 @celery_retry_task()
-def migrate_all_react_annotations(self):
-    from handlers.db import ReactPlannerProjectsDBHandler
+def migrate_all_react_annotations(self, after_id: int = 0, dry_run: bool = False):
+    """Migrates the stored annotations batch by batch, each batch enqueuing the next
+    one so an interrupted migration continues from the last batch migrated"""
+    from handlers.editor_v2 import ReactPlannerHandler
 
-    for project in ReactPlannerProjectsDBHandler.find_iter(
-        output_columns=["id", "data"]
-    ):
-        if project["data"]["version"] != CURRENT_REACT_ANNOTATION_VERSION:
-            migrate_react_annotations.delay(project_id=project["id"])
+    batch = ReactPlannerHandler.migrate_stored_annotations(
+        after_id=after_id, dry_run=dry_run
+    )
+    for project_id, error in batch.failed.items():
+        logger.error(f"Could not migrate react annotation {project_id}: {error}")
+    logger.info(
+        f"{'Checked' if dry_run else 'Migrated'} react annotations {batch.migrated}, "
+        f"skipped {batch.skipped} saved during the migration"
+    )
+    if batch.last_id is not None:
+        migrate_all_react_annotations.delay(after_id=batch.last_id, dry_run=dry_run)
 
 
 @celery_retry_task()
@@ -124,40 +124,26 @@ def generate_building_triangulation_task(self, building_id: int):
 def generate_unit_pngs_and_pdfs(self, unit_id: int):
     from handlers import DMSUnitDeliverableHandler
 
-    dms_handler = DMSUnitDeliverableHandler()
-    for language in SUPPORTED_LANGUAGES:
-        for file_format in (SUPPORTED_OUTPUT_FILES.PNG, SUPPORTED_OUTPUT_FILES.PDF):
-            logger.info(
-                f"generating {file_format.name} file for unit {unit_id} and language {language.name}"
-            )
-            dms_handler.generate_upload_floorplan(
-                unit_id=unit_id,
-                language=language,
-                file_format=file_format,
-            )
-            logger.info(
-                f"generated {file_format.name} file for unit {unit_id} and language {language.name}"
-            )
+    logger.info(f"generating PNG and PDF files for unit {unit_id}")
+    DMSUnitDeliverableHandler().generate_upload_floorplans(
+        unit_id=unit_id,
+        languages=SUPPORTED_LANGUAGES,
+        file_formats=(SUPPORTED_OUTPUT_FILES.PNG, SUPPORTED_OUTPUT_FILES.PDF),
+    )
+    logger.info(f"generated PNG and PDF files for unit {unit_id}")
 
 
 @celery_retry_task
 def generate_pngs_and_pdfs_for_floor_task(self, floor_id: int):
     from handlers import DMSFloorDeliverableHandler
 
-    dms_handler = DMSFloorDeliverableHandler()
-    for language in SUPPORTED_LANGUAGES:
-        for file_format in (SUPPORTED_OUTPUT_FILES.PNG, SUPPORTED_OUTPUT_FILES.PDF):
-            logger.info(
-                f"generating {file_format.name} file for floor {floor_id} and language {language.name}"
-            )
-            dms_handler.generate_upload_floorplan(
-                floor_id=floor_id,
-                language=language,
-                file_format=file_format,
-            )
-            logger.info(
-                f"generated {file_format.name} file for floor {floor_id} and language {language.name}"
-            )
+    logger.info(f"generating PNG and PDF files for floor {floor_id}")
+    DMSFloorDeliverableHandler().generate_upload_floorplans(
+        floor_id=floor_id,
+        languages=SUPPORTED_LANGUAGES,
+        file_formats=(SUPPORTED_OUTPUT_FILES.PNG, SUPPORTED_OUTPUT_FILES.PDF),
+    )
+    logger.info(f"generated PNG and PDF files for floor {floor_id}")
 
 
 @celery_retry_task
@@ -165,19 +151,13 @@ def generate_dxf_floor_task(self, floor_id: int):
     """Task that generates all the DXF files of a floor"""
     from handlers import DMSFloorDeliverableHandler
 
-    dms_handler = DMSFloorDeliverableHandler()
-    for language in SUPPORTED_LANGUAGES:
-        logger.info(
-            f"generating dxf file for floor {floor_id} and language {language.name}"
-        )
-        dms_handler.generate_upload_floorplan(
-            floor_id=floor_id,
-            language=language,
-            file_format=SUPPORTED_OUTPUT_FILES.DXF,
-        )
-        logger.info(
-            f"generated dxf file for floor {floor_id} and language {language.name}"
-        )
+    logger.info(f"generating dxf files for floor {floor_id}")
+    DMSFloorDeliverableHandler().generate_upload_floorplans(
+        floor_id=floor_id,
+        languages=SUPPORTED_LANGUAGES,
+        file_formats=(SUPPORTED_OUTPUT_FILES.DXF,),
+    )
+    logger.info(f"generated dxf files for floor {floor_id}")
 
 
 @celery_retry_task
@@ -8,6 +8,7 @@ def copy_site_task(
     site_id_to_copy: int,
     copy_area_types: bool,
     target_existing_site_id: int | None = None,
+    copy_simulation_results: bool = False,
 ):
     from handlers.copy_site import CopySite
 
@@ -16,5 +17,6 @@ def copy_site_task(
         site_id_to_copy=site_id_to_copy,
         copy_area_types=copy_area_types,
         target_existing_site_id=target_existing_site_id,
+        copy_simulation_results=copy_simulation_results,
     )
     return new_site_id
@@ -1,6 +1,9 @@
 from typing import Dict
 
+from shapely.geometry import Polygon
+
 from brooks.types import AreaType
+from tasks.utils.constants import RECTANGULATOR_N_JOBS
 from tasks.utils.utils import celery_retry_task
 
 AREA_TYPES_TO_EXCLUDE = {
@@ -18,7 +21,7 @@ def biggest_rectangle_task(self, site_id: int, run_id: str):
     from common_utils.constants import UNIT_USAGE
     from handlers import SiteHandler, SlamSimulationHandler
     from handlers.db import UnitDBHandler
-    from simulations.rectangulator import get_max_rectangle_in_convex_polygon
+    from simulations.rectangulator import get_max_rectangles_in_polygons
 
     residential_unit_ids = set(
         UnitDBHandler.find_ids(
@@ -35,18 +38,21 @@ def biggest_rectangle_task(self, site_id: int, run_id: str):
         if unit_info["id"] in residential_unit_ids
     ]
 
-    biggest_rectangle_by_area: Dict[int, str] = {}
-    for _, unit_layout in residential_unit_layouts:
-        for area in unit_layout.areas:
-            if (
-                area.type not in AREA_TYPES_TO_EXCLUDE
-                and area.db_area_id not in biggest_rectangle_by_area
-            ):
-                biggest_rectangle_by_area[
-                    area.db_area_id
-                ] = get_max_rectangle_in_convex_polygon(
-                    target_convex_polygon=area.footprint, generations=500
-                ).wkt
+    # Repeated floor plans produce congruent areas, which are solved only once
+    footprint_by_area: Dict[int, Polygon] = {
+        area.db_area_id: area.footprint
+        for _, unit_layout in residential_unit_layouts
+        for area in unit_layout.areas
+        if area.type not in AREA_TYPES_TO_EXCLUDE
+    }
+    biggest_rectangle_by_area: Dict[int, str] = {
+        area_id: rectangle.wkt
+        for area_id, rectangle in get_max_rectangles_in_polygons(
+            polygons_by_id=footprint_by_area,
+            generations=500,
+            n_jobs=RECTANGULATOR_N_JOBS,
+        ).items()
+    }
 
     SlamSimulationHandler.store_results(
         run_id=run_id,
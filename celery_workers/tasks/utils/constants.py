@@ -138,3 +138,6 @@ EMAIL_CONTENT_BY_TYPE: Dict[EmailTypes, Dict[str, Union[Path, str]]] = {
 }
 
 sendgrid_sandbox_mode = bool(strtobool(os.environ.get("TEST_ENVIRONMENT", "False")))
+
+# Processes used by each rectangulator task, celery already runs one task per worker
+RECTANGULATOR_N_JOBS = int(os.environ.get("RECTANGULATOR_N_JOBS", 1))
@@ -9,6 +9,7 @@ from celery.signals import setup_logging
 from scout_apm.api import Config
 
 from common_utils.logging_config import DefaultLogFormatter, configure_logging
+from workers_config import warm_pool  # noqa: F401 connects the worker signals
 
 celery_app = Celery("workers")
 celery_app.config_from_object("workers_config.celery_config")
@@ -42,7 +42,25 @@ result_expires = 86400 * 5  # 5 days in seconds
 
 worker_prefetch_multiplier = 1
 worker_concurrency = int(os.environ.get("WORKER_CONCURRENCY", 1))
-worker_max_tasks_per_child = 1
+# In the warm pool mode the heavy modules and read only assets are preloaded in the
+# main worker process before the pool processes are forked, and the pool processes are
+# recycled after a number of tasks or once their resident memory (in KiB) is exceeded,
+# instead of after every task. See workers_config.warm_pool
+WORKER_WARM_POOL = strtobool(os.environ.get("WORKER_WARM_POOL", "False"))
+if WORKER_WARM_POOL:
+    worker_max_tasks_per_child = int(os.environ.get("WORKER_MAX_TASKS_PER_CHILD", 100))
+    worker_max_memory_per_child = int(
+        os.environ.get("WORKER_MAX_MEMORY_PER_CHILD", 4 * 2**20)
+    )
+else:
+    worker_max_tasks_per_child = 1
+# A pool process whose resident memory grows after each of the last
+# WORKER_LEAK_CHECK_TASKS tasks, by more than WORKER_LEAK_THRESHOLD_KB in total, is
+# reported as leaking
+WORKER_LEAK_CHECK_TASKS = int(os.environ.get("WORKER_LEAK_CHECK_TASKS", 5))
+WORKER_LEAK_THRESHOLD_KB = int(
+    os.environ.get("WORKER_LEAK_THRESHOLD_KB", 200 * 2**10)
+)
 worker_send_task_events = True
 worker_redirect_stdouts = False
 worker_cancel_long_running_tasks_on_connection_loss = True  # Important change in celery 5.x that is causing problems with duplicated tasks if False
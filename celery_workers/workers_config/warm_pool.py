@@ -0,0 +1,224 @@
+"""Warm worker pool.
+
+With WORKER_WARM_POOL the heavy modules and the read only assets (pyproj
+transformers, area classifier, benchmark reference data) are loaded once in the main
+worker process before the pool is forked, so every pool process starts with them
+already in (copy on write) memory. The pool processes are then recycled by celery
+after `worker_max_tasks_per_child` tasks or once their resident memory goes over
+`worker_max_memory_per_child`, instead of after every task.
+
+As a pool process runs several tasks, the class level caches of DB reads are cleared
+before each task, so that a task never sees the data cached by a previous one.
+
+Independently of the mode, every task logs the wall time, CPU time and resident memory
+growth of its pool process, and a pool process whose resident memory keeps growing
+task after task is reported as leaking, which is what the memory limit is bounding.
+"""
+import importlib
+import os
+import resource
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from billiard.compat import mem_rss
+from celery.signals import task_postrun, task_prerun, worker_init, worker_process_init
+
+from common_utils.logger import logger
+from workers_config.celery_config import (
+    WORKER_LEAK_CHECK_TASKS,
+    WORKER_LEAK_THRESHOLD_KB,
+    WORKER_WARM_POOL,
+)
+
+PRELOADED_MODULES = (
+    "numpy",
+    "pandas",
+    "shapely.geometry",
+    "shapely.ops",
+    "pygeos",
+    "pyproj",
+    "rasterio",
+    "matplotlib.pyplot",
+    "ifcopenshell",
+    "ifcopenshell.geom",
+    "brooks.models",
+    "brooks.area_classifier",
+    "handlers",
+    "handlers.charts.chart_data_handler",
+    "handlers.ifc",
+    "simulations.basic_features",
+    "simulations.view",
+    "surroundings",
+)
+
+_PAGE_SIZE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def current_rss_kb() -> int:
+    """Current resident memory of the process, celery's own limit uses the peak"""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE_KB
+    except OSError:
+        return mem_rss()
+
+
+def preload_modules(modules: Iterable[str] = PRELOADED_MODULES) -> Tuple[str, ...]:
+    loaded = []
+    for module in modules:
+        try:
+            importlib.import_module(module)
+            loaded.append(module)
+        except ImportError as e:
+            logger.warning(f"Module {module} could not be preloaded: {e}")
+    return tuple(loaded)
+
+
+def preload_assets():
+    from brooks.area_classifier import AreaClassifier
+    from brooks.util.projections import (
+        REGIONS_CRS,
+        _get_or_set_transformer,
+        get_all_crs_proj4,
+    )
+    from common_utils.constants import REGION
+    from common_utils.exceptions import NoClassifierAvailableException
+    from handlers.charts.reference_data import load_manifest
+
+    for region in REGIONS_CRS:
+        if region != REGION.LAT_LON:
+            _get_or_set_transformer(crs_from=region, crs_to=REGION.LAT_LON)
+            _get_or_set_transformer(crs_from=REGION.LAT_LON, crs_to=region)
+    get_all_crs_proj4()
+
+    try:
+        AreaClassifier().load()
+    except NoClassifierAvailableException as e:
+        logger.warning(f"Area classifier could not be preloaded: {e}")
+
+    load_manifest()
+
+
+def clear_db_caches():
+    """Clears the caches shared by all the instances of the handlers reading from the
+    DB, the caches of the handler instances do not outlive a task"""
+    from handlers import ClientHandler, FloorHandler
+
+    ClientHandler.get_logo_content.cache_clear()
+    FloorHandler.get_floor_number_heights.cache_clear()
+
+
+class TaskResourceUsage(NamedTuple):
+    wall_time: float
+    cpu_time: float
+    rss_before_kb: int
+    rss_after_kb: int
+
+    @property
+    def rss_growth_kb(self) -> int:
+        return self.rss_after_kb - self.rss_before_kb
+
+
+class PoolProcessMonitor:
+    """Accounts the resources used by the tasks of a pool process and detects the
+    processes whose resident memory grows after each of the last `leak_check_tasks`
+    tasks by more than `leak_threshold_kb` in total."""
+
+    def __init__(self, leak_check_tasks: int, leak_threshold_kb: int):
+        self.leak_threshold_kb = leak_threshold_kb
+        self.tasks_completed = 0
+        self._started: Dict[str, Tuple[float, float, int]] = {}
+        self._recent: Deque[Tuple[str, TaskResourceUsage]] = deque(
+            maxlen=leak_check_tasks
+        )
+
+    @staticmethod
+    def _cpu_time() -> float:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
+
+    def task_started(self, task_id: str):
+        self._started[task_id] = (time.monotonic(), self._cpu_time(), current_rss_kb())
+
+    def task_finished(
+        self, task_id: str, task_name: str
+    ) -> Optional[TaskResourceUsage]:
+        if (started := self._started.pop(task_id, None)) is None:
+            return None
+        wall_start, cpu_start, rss_before_kb = started
+        usage = TaskResourceUsage(
+            wall_time=time.monotonic() - wall_start,
+            cpu_time=self._cpu_time() - cpu_start,
+            rss_before_kb=rss_before_kb,
+            rss_after_kb=current_rss_kb(),
+        )
+        self.tasks_completed += 1
+        self._recent.append((task_name, usage))
+        return usage
+
+    def leaking_tasks(self) -> Tuple[str, ...]:
+        """Names of the last tasks if all of them increased the resident memory and
+        together by more than the threshold, empty otherwise."""
+        if len(self._recent) < self._recent.maxlen:
+            return ()
+        growths = [usage.rss_growth_kb for _, usage in self._recent]
+        if min(growths) > 0 and sum(growths) > self.leak_threshold_kb:
+            return tuple(task_name for task_name, _ in self._recent)
+        return ()
+
+
+_monitor = PoolProcessMonitor(
+    leak_check_tasks=WORKER_LEAK_CHECK_TASKS,
+    leak_threshold_kb=WORKER_LEAK_THRESHOLD_KB,
+)
+
+
+@worker_init.connect
+def preload_warm_pool(*args, **kwargs):
+    if not WORKER_WARM_POOL:
+        return
+    start = time.monotonic()
+    loaded = preload_modules()
+    preload_assets()
+    logger.info(
+        f"Warm pool preloaded {len(loaded)} modules and the read only assets in "
+        f"{time.monotonic() - start:.1f}s, resident memory {current_rss_kb() // 1024}MiB"
+    )
+
+
+@worker_process_init.connect
+def reset_pool_process_monitor(*args, **kwargs):
+    global _monitor
+    _monitor = PoolProcessMonitor(
+        leak_check_tasks=WORKER_LEAK_CHECK_TASKS,
+        leak_threshold_kb=WORKER_LEAK_THRESHOLD_KB,
+    )
+
+
+@task_prerun.connect
+def clear_previous_task_caches(*args, **kwargs):
+    if WORKER_WARM_POOL:
+        clear_db_caches()
+
+
+@task_prerun.connect
+def start_task_accounting(task_id: str, *args, **kwargs):
+    _monitor.task_started(task_id=task_id)
+
+
+@task_postrun.connect
+def finish_task_accounting(task_id: str, task, *args, **kwargs):
+    if (usage := _monitor.task_finished(task_id=task_id, task_name=task.name)) is None:
+        return
+    logger.info(
+        f"Task {task.name} used {usage.wall_time:.2f}s, {usage.cpu_time:.2f}s CPU, "
+        f"resident memory {usage.rss_after_kb // 1024}MiB "
+        f"({usage.rss_growth_kb // 1024:+d}MiB), "
+        f"task {_monitor.tasks_completed} of process {os.getpid()}"
+    )
+    if leaking_tasks := _monitor.leaking_tasks():
+        logger.warning(
+            f"Possible memory leak in pool process {os.getpid()}, the resident memory "
+            f"grew after each of the tasks {', '.join(leaking_tasks)}"
+        )
@@ -7,9 +7,10 @@ import heapq
 import operator
 from collections import namedtuple
 from itertools import chain, cycle, islice, tee
-from typing import List, Union
+from typing import List
 
-from euclid3 import Line2, LineSegment2, Point2, Ray2
+import numpy as np
+from euclid3 import Line2, LineSegment2, Point2, Ray2, Vector2
 
 from common_utils.logger import logger
 
@@ -38,6 +39,27 @@ def _approximately_same(point_a, point_b):
     )
 
 
+def _as_array(vectors: List[Vector2]) -> np.ndarray:
+    return np.array([(vector.x, vector.y) for vector in vectors], dtype=float).reshape(
+        -1, 2
+    )
+
+
+def _normalized_vectors(vectors: np.ndarray) -> np.ndarray:
+    """Row-wise equivalent of `Vector2.normalized`, zero vectors are kept as they are"""
+    magnitudes = np.sqrt(vectors[:, 0] * vectors[:, 0] + vectors[:, 1] * vectors[:, 1])
+    return np.divide(
+        vectors,
+        magnitudes[:, None],
+        out=vectors.copy(),
+        where=magnitudes[:, None] != 0,
+    )
+
+
+def _cross_vectors(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return a[:, 0] * b[:, 1] - b[:, 0] * a[:, 1]
+
+
 def _normalize_contour(contour):
     contour = [Point2(float(x), float(y)) for (x, y) in contour]
     return [
@@ -76,6 +98,31 @@ class _EdgeEvent(
 
 _OriginalEdge = namedtuple("_OriginalEdge", "edge bisector_left, bisector_right")
 
+
+class _OriginalEdgesArrays:
+    """Coordinates of the original edges and of the bisectors of their vertices as
+    arrays, so the split event candidates of a vertex are computed for all the
+    edges at once."""
+
+    def __init__(self, original_edges: List[_OriginalEdge]):
+        self.edges = [original_edge.edge for original_edge in original_edges]
+        self.points = _as_array([edge.edge.p for edge in original_edges])
+        self.vectors = _as_array([edge.edge.v for edge in original_edges])
+        self.directions = _normalized_vectors(self.vectors)
+        self.bisectors_left_points = _as_array(
+            [edge.bisector_left.p for edge in original_edges]
+        )
+        self.bisectors_left_directions = _normalized_vectors(
+            _as_array([edge.bisector_left.v for edge in original_edges])
+        )
+        self.bisectors_right_points = _as_array(
+            [edge.bisector_right.p for edge in original_edges]
+        )
+        self.bisectors_right_directions = _normalized_vectors(
+            _as_array([edge.bisector_right.v for edge in original_edges])
+        )
+
+
 Subtree = namedtuple("Subtree", "source, height, sinks")
 
 
@@ -96,7 +143,7 @@ class _LAVertex:
         self._bisector = Ray2(
             self.point, operator.add(*creator_vectors) * (-1 if self.is_reflex else 1)
         )
-        logger.debug("Created vertex %s", self.__repr__())
+        logger.debug("Created vertex %r", self)
 
     @property
     def bisector(self):
@@ -106,65 +153,122 @@ class _LAVertex:
     def is_reflex(self):
         return self._is_reflex
 
-    def original_edges(self):
-        for edge in self.lav._slav._original_edges:
-            if edge.edge != self.edge_left or edge.edge != self.edge_right:
-                logger.debug("\tconsidering EDGE %s", edge)
-                yield edge
-
-    def next_valid_event(self, self_edge, edge) -> Union[None, Line2]:
-        i = Line2(self_edge).intersect(Line2(edge.edge))
-        if i is not None and not _approximately_equals(i, self.point):
-            # locate candidate b
-            linvec = (self.point - i).normalized()
-            edvec = edge.edge.v.normalized()
-            if linvec.dot(edvec) < 0:
-                edvec = -edvec
-
-            bisecvec = edvec + linvec
-            if abs(bisecvec) == 0:
-                return
-            bisector = Line2(i, bisecvec)
-            next_bisector = bisector.intersect(self.bisector)
+    def split_events(self) -> List[_SplitEvent]:
+        """Split events of the vertex against all the original edges of the polygon,
+        computed as array operations over the edges:
+
+        A potential b is at the intersection of between our own bisector and the
+        bisector of the angle between the tested edge and any one of our own edges.
+        A valid b should lie within the area limited by the edge and the bisectors of
+        its two vertices.
+        """
+        edges = self.lav._slav.original_edges_arrays
+        point = np.array((self.point.x, self.point.y))
+
+        # we choose the "less parallel" edge (in order to exclude a potentially parallel edge)
+        own_edges_points = _as_array([self.edge_left.p, self.edge_right.p])
+        own_edges_vectors = _as_array([self.edge_left.v, self.edge_right.v])
+        own_edges_directions = _normalized_vectors(own_edges_vectors)
+        dots = np.abs(
+            edges.directions[:, 0, None] * own_edges_directions[None, :, 0]
+            + edges.directions[:, 1, None] * own_edges_directions[None, :, 1]
+        )
+        own_edge_index = np.where(dots[:, 0] < dots[:, 1], 0, 1)
+        own_points = own_edges_points[own_edge_index]
+        own_vectors = own_edges_vectors[own_edge_index]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # intersection of the lines of the tested edge and our own edge
+            denominator = (
+                own_vectors[:, 1] * edges.vectors[:, 0]
+                - own_vectors[:, 0] * edges.vectors[:, 1]
+            )
+            offset = edges.points - own_points
+            u = (
+                own_vectors[:, 0] * offset[:, 1] - own_vectors[:, 1] * offset[:, 0]
+            ) / denominator
+            intersections = edges.points + u[:, None] * edges.vectors
+
+            to_point = point - intersections
+            valid = (denominator != 0) & ~(
+                ((intersections[:, 0] == point[0]) & (intersections[:, 1] == point[1]))
+                | (
+                    np.sqrt(
+                        to_point[:, 0] * to_point[:, 0]
+                        + to_point[:, 1] * to_point[:, 1]
+                    )
+                    <= np.maximum(
+                        np.sqrt(
+                            intersections[:, 0] * intersections[:, 0]
+                            + intersections[:, 1] * intersections[:, 1]
+                        ),
+                        abs(self.point),
+                    )
+                    * 0.001
+                )
+            )
 
-            if next_bisector is None:
-                return
+            # bisector of the angle between the tested edge and our own edge
+            line_directions = _normalized_vectors(to_point)
+            edge_directions = np.where(
+                (
+                    line_directions[:, 0] * edges.directions[:, 0]
+                    + line_directions[:, 1] * edges.directions[:, 1]
+                    < 0
+                )[:, None],
+                -edges.directions,
+                edges.directions,
+            )
+            bisectors = edge_directions + line_directions
+            valid &= (bisectors[:, 0] != 0) | (bisectors[:, 1] != 0)
+
+            # intersection of that bisector with our own bisector ray
+            bisector_direction = np.array((self.bisector.v.x, self.bisector.v.y))
+            denominator = (
+                bisectors[:, 1] * bisector_direction[0]
+                - bisectors[:, 0] * bisector_direction[1]
+            )
+            offset = point - intersections
+            u = (
+                bisectors[:, 0] * offset[:, 1] - bisectors[:, 1] * offset[:, 0]
+            ) / denominator
+            valid &= (denominator != 0) & (u >= 0.0)
+            candidates = point + u[:, None] * bisector_direction
 
             # check eligibility of b
-            # a valid b should lie within the area limited by the edge and the bisectors of its two vertices:
-            xleft = (
-                _cross(
-                    edge.bisector_left.v.normalized(),
-                    (next_bisector - edge.bisector_left.p).normalized(),
+            valid &= (
+                (
+                    _cross_vectors(
+                        edges.bisectors_left_directions,
+                        _normalized_vectors(candidates - edges.bisectors_left_points),
+                    )
+                    > -EPSILON
                 )
-                > -EPSILON
-            )
-            xright = (
-                _cross(
-                    edge.bisector_right.v.normalized(),
-                    (next_bisector - edge.bisector_right.p).normalized(),
+                & (
+                    _cross_vectors(
+                        edges.bisectors_right_directions,
+                        _normalized_vectors(candidates - edges.bisectors_right_points),
+                    )
+                    < EPSILON
                 )
-                < EPSILON
-            )
-            xedge = (
-                _cross(
-                    edge.edge.v.normalized(), (next_bisector - edge.edge.p).normalized()
+                & (
+                    _cross_vectors(
+                        edges.directions,
+                        _normalized_vectors(candidates - edges.points),
+                    )
+                    < EPSILON
                 )
-                < EPSILON
             )
 
-            if not (xleft and xright and xedge):
-                logger.debug(
-                    "\t\tDiscarded candidate %s (%s-%s-%s)",
-                    next_bisector,
-                    xleft,
-                    xright,
-                    xedge,
-                )
-                return
-
-            logger.debug("\t\tFound valid candidate %s", next_bisector)
-            return next_bisector
+        events = []
+        for edge_index in np.flatnonzero(valid):
+            candidate = Point2(*candidates[edge_index].tolist())
+            edge = edges.edges[edge_index]
+            logger.debug("\t\tFound valid candidate %s", candidate)
+            events.append(
+                _SplitEvent(Line2(edge).distance(candidate), candidate, self, edge)
+            )
+        return events
 
     def next_event(self):
         events = []
@@ -172,29 +276,7 @@ class _LAVertex:
             # a reflex vertex may generate a split event
             # split events happen when a vertex hits an opposite edge, splitting the polygon in two.
             logger.debug("looking for split candidates for vertex %s", self)
-            for edge in self.original_edges():
-                # a potential b is at the intersection of between our own bisector and the bisector of the
-                # angle between the tested edge and any one of our own edges.
-
-                # we choose the "less parallel" edge (in order to exclude a potentially parallel edge)
-                left_dot = abs(
-                    self.edge_left.v.normalized().dot(edge.edge.v.normalized())
-                )
-                right_dot = abs(
-                    self.edge_right.v.normalized().dot(edge.edge.v.normalized())
-                )
-                self_edge = self.edge_left if left_dot < right_dot else self.edge_right
-
-                next_bisector = self.next_valid_event(self_edge=self_edge, edge=edge)
-                if next_bisector:
-                    events.append(
-                        _SplitEvent(
-                            Line2(edge.edge).distance(next_bisector),
-                            next_bisector,
-                            self,
-                            edge.edge,
-                        )
-                    )
+            events.extend(self.split_events())
 
         i_prev = self.bisector.intersect(self.prev.bisector)
         i_next = self.bisector.intersect(self.next.bisector)
@@ -262,6 +344,7 @@ class _SLAV:
             )
             for vertex in chain.from_iterable(self._lavs)
         ]
+        self.original_edges_arrays = _OriginalEdgesArrays(self._original_edges)
 
     def __iter__(self):
         for lav in self._lavs:
@@ -522,25 +605,28 @@ class _LAV:
 
 
 class _EventQueue:
+    """Heap of (distance, event) tuples, the events are only compared when the
+    distances are equal, which keeps the same order as comparing the events."""
+
     def __init__(self):
         self.__data = []
 
     def put(self, item):
         if item is not None:
-            heapq.heappush(self.__data, item)
+            heapq.heappush(self.__data, (item.distance, item))
 
     def put_all(self, iterable):
         for item in iterable:
-            heapq.heappush(self.__data, item)
+            heapq.heappush(self.__data, (item.distance, item))
 
     def get(self):
-        return heapq.heappop(self.__data)
+        return heapq.heappop(self.__data)[1]
 
     def empty(self):
         return len(self.__data) == 0
 
     def peek(self):
-        return self.__data[0]
+        return self.__data[0][1]
 
 
 def _merge_sources(skeleton):
@@ -0,0 +1,35 @@
+"""Materialized area vectors per unit
+
+Revision ID: 0294
+Revises: 0293
+Create Date: 2022-11-28 09:12:41.318204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0294"
+down_revision = "0293"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "unit_area_vectors",
+        sa.Column("created", sa.DateTime(), nullable=False),
+        sa.Column("updated", sa.DateTime(), nullable=True),
+        sa.Column("unit_id", sa.Integer(), nullable=False),
+        sa.Column("fingerprint", sa.String(), nullable=False),
+        sa.Column("vector", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["unit_id"], ["units.id"], onupdate="CASCADE", ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("unit_id"),
+    )
+
+
+def downgrade():
+    op.drop_table("unit_area_vectors")
@@ -1,16 +1,18 @@
 import contextlib
 import os
 import threading
+from collections import Counter, defaultdict
 from contextlib import contextmanager
 from distutils.util import strtobool
-from typing import Optional
+from typing import Dict, Optional
 
 from contexttimer import timer
 from scout_apm.sqlalchemy import instrument_sqlalchemy
 from sqlalchemy import create_engine, event, orm
-from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DisconnectionError, OperationalError, ProgrammingError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy_utils import create_database, force_auto_coercion
 from tenacity import (
     retry,
@@ -32,14 +34,120 @@ db_url = (
     f'postgresql+psycopg2://{db_config["user"]}:{db_config["password"]}@'
     f'{db_config["address"]}:{db_config["port"]}/{db_config["name"]}'
 )
+# The read only sessions are routed to a replica when its host is configured. As the
+# replica can lag behind, the reads which must see the latest writes should not be
+# done in a read only session
+db_replica_url: Optional[str] = (
+    f'postgresql+psycopg2://{db_config["user"]}:{db_config["password"]}@'
+    f'{os.environ["DB_REPLICA_HOST"]}:'
+    f'{os.environ.get("DB_REPLICA_PORT", db_config["port"])}/{db_config["name"]}'
+    if os.environ.get("DB_REPLICA_HOST")
+    else None
+)
 BaseDBModel = declarative_base()
 force_auto_coercion()
 
 _engine = None
+_replica_engine = None
 _scoped_session = None
+_replica_scoped_session = None
 _local_manager = threading.local()
 
 DEFAULT_ISOLATION_LEVEL: str = "SERIALIZABLE"
+# Reads don't need the serializable guarantees, a snapshot of the DB is enough and
+# avoids the serialization failures of the concurrent transactions
+READONLY_ISOLATION_LEVEL: str = os.environ.get(
+    "DB_READONLY_ISOLATION_LEVEL", "REPEATABLE READ"
+)
+
+# Client side pooling, disabled by default as Pgbouncer already is the Pool
+DB_POOL_ENABLED = strtobool(os.environ.get("DB_POOL_ENABLED", "False"))
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+DB_POOL_MAX_OVERFLOW = int(os.environ.get("DB_POOL_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))  # seconds
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 30 * 60))  # seconds
+
+
+class DBStatistics:
+    """Thread safe counters of the pool events per engine role and of the retried
+    DB operations, exported by `get_db_stats`"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = defaultdict(Counter)
+
+    def increment(self, group: str, name: str):
+        with self._lock:
+            self._counters[group][name] += 1
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {group: dict(counter) for group, counter in self._counters.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+db_statistics = DBStatistics()
+
+
+def _pool_options() -> Dict:
+    if DB_POOL_ENABLED:
+        return dict(
+            poolclass=QueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_POOL_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+        )
+    return dict(poolclass=NullPool)
+
+
+def _register_pool_listeners(engine: Engine, role: str):
+    """Counts the pool events of the engine and discards the pooled connections
+    inherited from a parent process, as a forked uwsgi or celery worker can't share
+    them with its parent"""
+
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        connection_record.info["pid"] = os.getpid()
+        db_statistics.increment(group=role, name="connects")
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        if connection_record.info["pid"] != os.getpid():
+            connection_record.dbapi_connection = None
+            connection_proxy.dbapi_connection = None
+            raise DisconnectionError(
+                f"Connection record belongs to pid {connection_record.info['pid']}, "
+                f"attempting to check out in pid {os.getpid()}"
+            )
+        db_statistics.increment(group=role, name="checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        db_statistics.increment(group=role, name="checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _invalidate(dbapi_connection, connection_record, exception):
+        db_statistics.increment(group=role, name="invalidations")
+
+
+def _create_db_engine(url: str, role: str) -> Engine:
+    engine = create_engine(
+        url,
+        client_encoding="utf8",
+        isolation_level=DEFAULT_ISOLATION_LEVEL,
+        **_pool_options(),
+    )
+    _register_pool_listeners(engine=engine, role=role)
+
+    if not strtobool(os.environ.get("TEST_ENVIRONMENT", "False")):
+        instrument_sqlalchemy(engine)
+
+    return engine
 
 
 def get_db_engine(engine=None):
@@ -53,21 +161,32 @@ def get_db_engine(engine=None):
         _engine = engine
 
     if not _engine:
-        _engine = create_engine(
-            db_url,
-            client_encoding="utf8",
-            isolation_level=DEFAULT_ISOLATION_LEVEL,
-            poolclass=NullPool,  # As Pgbouncer already is the Pool
-        )
-
-        if not strtobool(os.environ.get("TEST_ENVIRONMENT", "False")):
-            instrument_sqlalchemy(_engine)
+        _engine = _create_db_engine(url=db_url, role="primary")
 
     return _engine
 
 
-def get_scoped_session(engine=None):
-    global _scoped_session
+def get_replica_db_engine():
+    """Engine of the read replica, the primary one if no replica is configured"""
+    global _replica_engine
+    if not db_replica_url:
+        return get_db_engine()
+
+    if not _replica_engine:
+        _replica_engine = _create_db_engine(url=db_replica_url, role="replica")
+
+    return _replica_engine
+
+
+def get_scoped_session(engine=None, readonly: bool = False):
+    global _scoped_session, _replica_scoped_session
+
+    if readonly and db_replica_url:
+        if not _replica_scoped_session:
+            _replica_scoped_session = orm.scoped_session(
+                orm.sessionmaker(bind=get_replica_db_engine())
+            )
+        return _replica_scoped_session
 
     if not _scoped_session:
         _scoped_session = orm.scoped_session(
@@ -77,6 +196,32 @@ def get_scoped_session(engine=None):
     return _scoped_session
 
 
+def _get_pool_status(engine: Engine) -> Dict:
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        return dict(
+            pool_size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return dict(pool=type(pool).__name__)
+
+
+def get_db_stats() -> Dict:
+    """Status of the pools of the engines created so far and the counters of their
+    events and of the retried DB operations"""
+    engines = {"primary": _engine, "replica": _replica_engine}
+    return {
+        "pools": {
+            role: _get_pool_status(engine=engine)
+            for role, engine in engines.items()
+            if engine is not None
+        },
+        **db_statistics.as_dict(),
+    }
+
+
 @retry(
     retry=retry_if_exception_type(OperationalError),
     stop=stop_after_attempt(5),
@@ -168,7 +313,7 @@ class SessionManager:
             self._transaction_set = False
 
     def _get_configured_session(self, readonly: bool, isolation_level: str):
-        session = get_scoped_session()()
+        session = get_scoped_session(readonly=readonly)()
         if self._set_transaction_required(
             readonly=readonly, isolation_level=isolation_level
         ):
@@ -203,11 +348,15 @@ def get_session_manager():
 
 @contextmanager
 def get_db_session_scope(readonly: bool = False, isolation_level: Optional[str] = None):
-    """This ensures that all methods in a call stack use the same transaction"""
+    """This ensures that all methods in a call stack use the same transaction.
+    Without an explicit isolation level the read only sessions run at
+    READONLY_ISOLATION_LEVEL and the rest at DEFAULT_ISOLATION_LEVEL"""
     manager = get_session_manager()
-    session = manager.get_session(
-        readonly=readonly, isolation_level=isolation_level or DEFAULT_ISOLATION_LEVEL
-    )
+    if not isolation_level:
+        isolation_level = (
+            READONLY_ISOLATION_LEVEL if readonly else DEFAULT_ISOLATION_LEVEL
+        )
+    session = manager.get_session(readonly=readonly, isolation_level=isolation_level)
     try:
         yield session
         session.commit()
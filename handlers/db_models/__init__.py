@@ -20,6 +20,7 @@ from .db_entities import (
     SlamSimulationDBModel,
     SlamSimulationValidationDBModel,
     UnitAreaStatsDBModel,
+    UnitAreaVectorDBModel,
     UnitDBModel,
     UnitsAreasDBModel,
     UnitSimulationDBModel,
@@ -46,6 +47,7 @@ __all__ = [
     SlamSimulationDBModel.__name__,
     UnitSimulationDBModel.__name__,
     UnitAreaStatsDBModel.__name__,
+    UnitAreaVectorDBModel.__name__,
     UnitStatsDBModel.__name__,
     DmsPermissionModel.__name__,
     ReactPlannerProjectDBModel.__name__,
@@ -651,6 +651,22 @@ class UnitSimulationDBModel(BaseDBModel):
     results = Column(JSONB(none_as_null=False), nullable=False)
 
 
+class UnitAreaVectorDBModel(BaseDBModel, BaseDatesDBMixin):
+    """Materialized area vector rows of a unit. The fingerprint identifies the
+    simulation runs and annotation revision the rows were computed from."""
+
+    __tablename__ = "unit_area_vectors"
+
+    unit_id = Column(
+        Integer,
+        ForeignKey(column="units.id", ondelete="CASCADE", onupdate="CASCADE"),
+        nullable=False,
+        primary_key=True,
+    )
+    fingerprint = Column(String, nullable=False)
+    vector = Column(JSONB(none_as_null=False), nullable=False)
+
+
 class CompetitionFeaturesDBModel(BaseDBModel, BaseDatesDBMixin):
     __tablename__ = "competition_features"
     run_id = Column(
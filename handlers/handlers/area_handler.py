@@ -214,16 +214,21 @@ class AreaHandler:
         area_classifier.load()
 
         db_areas = layout_handler.areas_db
-        for db_area in db_areas:
-            if (
-                get_valid_area_type_from_string(db_area["area_type"])
-                == AreaType.NOT_DEFINED
-                and db_area["id"] in db_area_id_to_brooks_area
-            ):
-                db_area["area_type"] = area_classifier.classify(
-                    plan_layout=layout_scaled,
-                    area=db_area_id_to_brooks_area[db_area["id"]],
-                ).name
+        db_areas_to_classify = [
+            db_area
+            for db_area in db_areas
+            if get_valid_area_type_from_string(db_area["area_type"])
+            == AreaType.NOT_DEFINED
+            and db_area["id"] in db_area_id_to_brooks_area
+        ]
+        classified_area_types = area_classifier.classify_areas(
+            layout_areas=[
+                (layout_scaled, db_area_id_to_brooks_area[db_area["id"]])
+                for db_area in db_areas_to_classify
+            ]
+        )
+        for db_area, area_type in zip(db_areas_to_classify, classified_area_types):
+            db_area["area_type"] = area_type.name
 
         # HACK: classification UI uses the _unscaled_ area coordinates to match
         #       the areas from auto classification. Thus, we update them here.
@@ -1,6 +1,7 @@
 import json
+from collections import defaultdict
 from functools import cached_property, lru_cache
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -11,13 +12,57 @@ from common_utils.constants import (
     BENCHMARK_PERCENTILES_APARTMENT_SCORES_PATH,
     BENCHMARK_PERCENTILES_DIMENSIONS_PATH,
     PRICEHUBBLE_AREA_TYPES,
-    RESULT_VECTORS,
 )
 from common_utils.logger import logger
 from handlers.charts.constants import CLUSTER_COLUMNS
+from handlers.charts.reference_data import (
+    load_percentile_tables,
+    load_reference_dataframe,
+)
 from handlers.charts.scoring_handler import ScoringHandler
 from handlers.charts.utils import find_closest_source_column_and_take_target_column
-from handlers.ph_vector.ph2022 import NeufertResultVectorHandler
+from handlers.ph_vector.ph2022 import NeufertAreaVector
+
+FUNCTIONAL_ACCESSIBILITY_FACTORS = {
+    PRICEHUBBLE_AREA_TYPES.ROOM.value: [
+        "connectivity_bathroom_distance_p20",
+        "connectivity_kitchen_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.KITCHEN_DINING.value: [
+        "connectivity_bathroom_distance_p20",
+        "connectivity_kitchen_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.BATHROOM.value: [
+        "connectivity_room_distance_p20",
+        "connectivity_living_dining_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.KITCHEN.value: [
+        "connectivity_room_distance_p20",
+        "connectivity_living_dining_distance_p20",
+        "connectivity_balcony_distance_p20",
+        "connectivity_loggia_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.BALCONY.value: [
+        "connectivity_room_distance_p20",
+        "connectivity_living_dining_distance_p20",
+        "connectivity_kitchen_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.LOGGIA.value: [
+        "connectivity_room_distance_p20",
+        "connectivity_living_dining_distance_p20",
+        "connectivity_kitchen_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.WINTERGARTEN.value: [
+        "connectivity_room_distance_p20",
+        "connectivity_living_dining_distance_p20",
+        "connectivity_kitchen_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.CORRIDOR.value: [
+        "connectivity_bathroom_distance_p20",
+        "connectivity_kitchen_distance_p20",
+    ],
+    PRICEHUBBLE_AREA_TYPES.STOREROOM.value: ["connectivity_kitchen_distance_p20"],
+}
 
 
 class ChartDataHandler:
@@ -35,10 +80,8 @@ class ChartDataHandler:
     @property
     def _unprocessed_target_dataframe(self) -> pd.DataFrame:
         logger.info(f"Loading target dataframe for site {self.site_id}...")
-        return pd.DataFrame(
-            NeufertResultVectorHandler.generate_vectors(
-                site_id=self.site_id, representative_units_only=False, anonymized=False
-            )[RESULT_VECTORS.NEUFERT_AREA_SIMULATIONS]
+        return NeufertAreaVector(site_id=self.site_id).get_vector_dataframe(
+            representative_units_only=False, anonymized=False
         )
 
     @property
@@ -67,15 +110,18 @@ class ChartDataHandler:
         )
         return dataframe
 
+    def compute_reference_dataframe(self) -> pd.DataFrame:
+        dataframe = self._add_extra_vector_columns(
+            self._unprocessed_reference_dataframe
+        )
+        return self._add_extra_room_features_percentile_based(dataframe=dataframe)
+
     @cached_property
     def reference_dataframe(self) -> pd.DataFrame:
         if self._rerference_dataframe is None:
-            dataframe = self._add_extra_vector_columns(
-                self._unprocessed_reference_dataframe
-            )
-            dataframe = self._add_extra_room_features_percentile_based(
-                dataframe=dataframe
-            )
+            dataframe = load_reference_dataframe()
+            if dataframe is None:
+                dataframe = self.compute_reference_dataframe()
             ChartDataHandler._rerference_dataframe = dataframe
         else:
             return self._rerference_dataframe
@@ -105,6 +151,29 @@ class ChartDataHandler:
 
         return self._reference_dataframe_percentiles_per_cluster
 
+    @cached_property
+    def reference_percentile_tables(
+        self,
+    ) -> Dict[Tuple[str, str], Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+        """Percentile levels in % and sorted reference values of each column per
+        (apartment cluster, area type) as numpy arrays"""
+        if (percentile_tables := load_percentile_tables()) is not None:
+            return percentile_tables
+
+        return {
+            (apartment_type, area_type): (
+                percentiles.index.values.astype(float) * 100,
+                {
+                    column: percentiles[column].to_numpy()
+                    for column in percentiles.columns
+                },
+            )
+            for apartment_type, area_type_percentiles in (
+                self.reference_dataframe_percentiles_per_cluster.items()
+            )
+            for area_type, percentiles in area_type_percentiles.items()
+        }
+
     @cached_property
     def apartment_score_bins_dataframe(self) -> pd.DataFrame:
         return pd.read_csv(BENCHMARK_PERCENTILES_APARTMENT_SCORES_PATH)
@@ -207,51 +276,35 @@ class ChartDataHandler:
 
         dataframe[
             "room_aggregate_functional_accessibility"
-        ] = percentile_dataframe.apply(self._functional_accessibility, axis=1)
+        ] = self._functional_accessibility(percentile_dataframe=percentile_dataframe)
 
         return dataframe
 
-    def _functional_accessibility(self, row):
-        match row["layout_area_type"]:
-            case PRICEHUBBLE_AREA_TYPES.ROOM.value | PRICEHUBBLE_AREA_TYPES.KITCHEN_DINING.value:
-                factors = [
-                    "connectivity_bathroom_distance_p20",
-                    "connectivity_kitchen_distance_p20",
-                ]
-            case PRICEHUBBLE_AREA_TYPES.BATHROOM.value:
-                factors = [
-                    "connectivity_room_distance_p20",
-                    "connectivity_living_dining_distance_p20",
-                ]
-            case PRICEHUBBLE_AREA_TYPES.KITCHEN.value:
-                factors = [
-                    "connectivity_room_distance_p20",
-                    "connectivity_living_dining_distance_p20",
-                    "connectivity_balcony_distance_p20",
-                    "connectivity_loggia_distance_p20",
-                ]
-            case PRICEHUBBLE_AREA_TYPES.BALCONY.value | PRICEHUBBLE_AREA_TYPES.LOGGIA.value | PRICEHUBBLE_AREA_TYPES.WINTERGARTEN.value:
-                factors = [
-                    "connectivity_room_distance_p20",
-                    "connectivity_living_dining_distance_p20",
-                    "connectivity_kitchen_distance_p20",
-                ]
-            case PRICEHUBBLE_AREA_TYPES.CORRIDOR.value:
-                factors = [
-                    "connectivity_bathroom_distance_p20",
-                    "connectivity_kitchen_distance_p20",
-                ]
-            case PRICEHUBBLE_AREA_TYPES.STOREROOM.value:
-                factors = ["connectivity_kitchen_distance_p20"]
-            case _:
-                logger.warning(row["layout_area_type"])
-                factors = []
-
-        result = 1
-        for factor in factors:
-            result *= 100 - row[factor]
-
-        return result
+    @staticmethod
+    def _functional_accessibility(percentile_dataframe: pd.DataFrame) -> pd.Series:
+        """Product of the inverted distance percentiles relevant for each area type,
+        computed column by column for all rooms at once"""
+        area_types = percentile_dataframe["layout_area_type"]
+        for area_type in area_types[
+            ~area_types.isin(list(FUNCTIONAL_ACCESSIBILITY_FACTORS))
+        ].unique():
+            logger.warning(area_type)
+
+        area_types_by_factor = defaultdict(list)
+        for area_type, factors in FUNCTIONAL_ACCESSIBILITY_FACTORS.items():
+            for factor in factors:
+                area_types_by_factor[factor].append(area_type)
+
+        functional_accessibility = np.ones(len(percentile_dataframe))
+        for factor, factor_area_types in area_types_by_factor.items():
+            uses_factor = area_types.isin(factor_area_types).to_numpy()
+            if not uses_factor.any():
+                continue
+            functional_accessibility *= np.where(
+                uses_factor, 100 - percentile_dataframe[factor].to_numpy(dtype=float), 1
+            )
+
+        return pd.Series(functional_accessibility, index=percentile_dataframe.index)
 
     @staticmethod
     def _add_apartment_cluster_columns(dataframe: pd.DataFrame) -> pd.DataFrame:
@@ -318,39 +371,49 @@ class ChartDataHandler:
         ),
         weights: Optional[dict] = None,
     ) -> pd.DataFrame:
-        percentiles_dataframe = pd.DataFrame(
-            columns=CLUSTER_COLUMNS + output_columns + list(index_columns)
-        )
-        for (apartment_type, area_type), df in dataframe.groupby(CLUSTER_COLUMNS):
-            reference_percentiles = self.reference_dataframe_percentiles_per_cluster[
-                apartment_type
-            ][area_type]
-            for column in output_columns:
-                # NOTE: We always order such that apartment has "good" quality rather than bad quality
-                #       e.g. lets say 20% of rooms have a water view of 0, then the score of all these
-                #       rooms in the water dimension is 20. However, if 20% of rooms have no railway_track view
-                #       then all these rooms have score 80 (because weight = -1).
-                indices = (
-                    reference_percentiles[column]
-                    .searchsorted(
-                        df[column],
-                        side="right" if not weights or weights[column] > 0 else "left",
-                    )
-                    .clip(1, 100)
-                )
-                df[column] = (
-                    reference_percentiles.index[indices - 1].values.astype(float) * 100
-                )
-                if weights:
-                    df[column] *= weights[column]
-                    if weights[column] < 0:
-                        df[column] = 100 + df[column]
-
-            df.reset_index(inplace=True)
-            percentiles_dataframe = percentiles_dataframe.append(
-                df[CLUSTER_COLUMNS + output_columns + list(index_columns)]
+        """Ranks every value of the output columns against the reference percentiles
+        of its (apartment cluster, area type) group.
+
+        NOTE: We always order such that apartment has "good" quality rather than bad quality
+              e.g. lets say 20% of rooms have a water view of 0, then the score of all these
+              rooms in the water dimension is 20. However, if 20% of rooms have no railway_track view
+              then all these rooms have score 80 (because weight = -1).
+        """
+        dataframe = dataframe.reset_index()
+        grouped = dataframe.groupby(CLUSTER_COLUMNS)
+        # rows with a missing cluster column don't belong to any group and are dropped
+        group_numbers = grouped.ngroup().fillna(-1).to_numpy(dtype=int)
+
+        values = dataframe[output_columns].to_numpy(dtype=float)
+        percentiles = np.full_like(values, np.nan)
+        sides = [
+            "right" if not weights or weights[column] > 0 else "left"
+            for column in output_columns
+        ]
+        for group_number, group_key in enumerate(grouped.size().index):
+            positions = np.flatnonzero(group_numbers == group_number)
+            levels, reference_values = self.reference_percentile_tables[group_key]
+            for column_index, (column, side) in enumerate(zip(output_columns, sides)):
+                indices = np.searchsorted(
+                    reference_values[column], values[positions, column_index], side=side
+                ).clip(1, 100)
+                percentiles[positions, column_index] = levels[indices - 1]
+
+        if weights:
+            column_weights = np.array([weights[column] for column in output_columns])
+            percentiles = percentiles * column_weights + np.where(
+                column_weights < 0, 100, 0
             )
 
+        grouped_positions = np.flatnonzero(group_numbers >= 0)
+        order = grouped_positions[
+            np.argsort(group_numbers[grouped_positions], kind="stable")
+        ]
+        percentiles_dataframe = dataframe.iloc[order][
+            CLUSTER_COLUMNS + output_columns + list(index_columns)
+        ]
+        percentiles_dataframe[output_columns] = percentiles[order]
+
         percentiles_dataframe.set_index(list(index_columns), drop=True, inplace=True)
         return percentiles_dataframe
 
@@ -0,0 +1,186 @@
+"""Preprocessed benchmark reference data for the charts.
+
+The reference dataframe with all its extra columns and the reference percentiles per
+(apartment cluster, area type) are stored as numpy arrays which are memory mapped on
+load, so that the page cache is shared between workers instead of every process
+parsing the benchmark CSV and JSON files. The manifest stores the checksums of the
+source files and the data is only used if they still match.
+"""
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from common_utils.constants import (
+    BENCHMARK_DATASET_SIMULATIONS_PATH,
+    BENCHMARK_PERCENTILES_DIMENSIONS_PATH,
+    BENCHMARK_REFERENCE_DATA_DIR,
+)
+from common_utils.logger import logger
+from handlers.gcloud_storage import get_md5_hash_from_path
+
+# Increase it when the format of the stored data changes
+REFERENCE_DATA_VERSION = 3
+REFERENCE_DATA_SOURCES = (
+    BENCHMARK_DATASET_SIMULATIONS_PATH,
+    BENCHMARK_PERCENTILES_DIMENSIONS_PATH,
+)
+
+MANIFEST_FILE = "manifest.json"
+PERCENTILES_FILE = "percentiles.npy"
+PERCENTILE_LEVELS_FILE = "percentile_levels.npy"
+
+PercentileTables = Dict[Tuple[str, str], Tuple[np.ndarray, Dict[str, np.ndarray]]]
+
+
+def _source_checksums() -> Dict[str, str]:
+    return {
+        source.name: get_md5_hash_from_path(file_path=source)
+        for source in REFERENCE_DATA_SOURCES
+    }
+
+
+def _block_file(block_index: int) -> str:
+    return f"block_{block_index}.npy"
+
+
+def _split_blocks(reference_dataframe: pd.DataFrame) -> List[List[str]]:
+    """Consecutive columns with the same numeric dtype, every other column on its
+    own, so that concatenating the blocks restores the order of the columns"""
+    blocks: List[List[str]] = []
+    previous_dtype = None
+    for column in reference_dataframe.columns:
+        dtype = reference_dataframe[column].dtype
+        if pd.api.types.is_numeric_dtype(dtype) and dtype == previous_dtype:
+            blocks[-1].append(column)
+        else:
+            blocks.append([column])
+        previous_dtype = dtype if pd.api.types.is_numeric_dtype(dtype) else None
+    return blocks
+
+
+def write_reference_data(
+    reference_dataframe: pd.DataFrame,
+    percentile_tables: PercentileTables,
+    directory: Path = BENCHMARK_REFERENCE_DATA_DIR,
+):
+    directory.mkdir(parents=True, exist_ok=True)
+
+    # Consecutive columns with the same numeric dtype are stored as a single 2D block
+    # so that they can be loaded into the dataframe without copying them, the other
+    # columns are stored as categorical codes
+    blocks = _split_blocks(reference_dataframe=reference_dataframe)
+    categories: Dict[str, list] = {}
+    for block_index, columns in enumerate(blocks):
+        values = reference_dataframe[columns]
+        if not pd.api.types.is_numeric_dtype(values[columns[0]]):
+            categorical = pd.Categorical(values[columns[0]])
+            categories[columns[0]] = categorical.categories.tolist()
+            values = categorical.codes
+        np.save(
+            directory.joinpath(_block_file(block_index)),
+            np.ascontiguousarray(np.asarray(values)),
+        )
+
+    clusters = sorted(percentile_tables)
+    percentile_columns = sorted(
+        {
+            column
+            for _, reference_values in percentile_tables.values()
+            for column in reference_values
+        }
+    )
+    levels = percentile_tables[clusters[0]][0]
+    percentiles = np.full((len(clusters), len(percentile_columns), len(levels)), np.nan)
+    for cluster_index, cluster in enumerate(clusters):
+        _, reference_values = percentile_tables[cluster]
+        for column_index, column in enumerate(percentile_columns):
+            if column in reference_values:
+                percentiles[cluster_index, column_index] = reference_values[column]
+    np.save(directory.joinpath(PERCENTILES_FILE), percentiles)
+    np.save(directory.joinpath(PERCENTILE_LEVELS_FILE), levels)
+
+    with directory.joinpath(MANIFEST_FILE).open("w") as fh:
+        json.dump(
+            {
+                "version": REFERENCE_DATA_VERSION,
+                "sources": _source_checksums(),
+                "num_rows": len(reference_dataframe),
+                "blocks": blocks,
+                "categories": categories,
+                "clusters": clusters,
+                "percentile_columns": percentile_columns,
+            },
+            fh,
+        )
+
+
+@lru_cache()
+def load_manifest(directory: Path = BENCHMARK_REFERENCE_DATA_DIR) -> Optional[dict]:
+    """Returns the manifest of the reference data if it is up to date with the
+    version and the source files, None otherwise."""
+    manifest_path = directory.joinpath(MANIFEST_FILE)
+    if not manifest_path.exists():
+        return None
+
+    with manifest_path.open() as fh:
+        manifest = json.load(fh)
+
+    if manifest["version"] != REFERENCE_DATA_VERSION:
+        logger.warning(
+            f"Ignoring benchmark reference data of version {manifest['version']}, "
+            f"expected version {REFERENCE_DATA_VERSION}"
+        )
+        return None
+    if manifest["sources"] != _source_checksums():
+        logger.warning(
+            "Ignoring benchmark reference data as it is not consistent with the "
+            "benchmark source files"
+        )
+        return None
+    return manifest
+
+
+def load_reference_dataframe(
+    directory: Path = BENCHMARK_REFERENCE_DATA_DIR,
+) -> Optional[pd.DataFrame]:
+    if not (manifest := load_manifest(directory=directory)):
+        return None
+
+    dataframes = []
+    for block_index, columns in enumerate(manifest["blocks"]):
+        values = np.load(directory.joinpath(_block_file(block_index)), mmap_mode="r")
+        if (categories := manifest["categories"].get(columns[0])) is not None:
+            values = pd.Categorical.from_codes(
+                codes=values, categories=categories
+            ).astype(object)
+            dataframes.append(pd.DataFrame({columns[0]: values}))
+        else:
+            dataframes.append(pd.DataFrame(values, columns=columns, copy=False))
+
+    # The blocks are stored in the order of the columns, so no reindexing (which
+    # would copy the memory mapped blocks) is needed
+    return pd.concat(dataframes, axis=1, copy=False)
+
+
+def load_percentile_tables(
+    directory: Path = BENCHMARK_REFERENCE_DATA_DIR,
+) -> Optional[PercentileTables]:
+    if not (manifest := load_manifest(directory=directory)):
+        return None
+
+    percentiles = np.load(directory.joinpath(PERCENTILES_FILE), mmap_mode="r")
+    levels = np.load(directory.joinpath(PERCENTILE_LEVELS_FILE))
+    return {
+        tuple(cluster): (
+            levels,
+            {
+                column: percentiles[cluster_index, column_index]
+                for column_index, column in enumerate(manifest["percentile_columns"])
+            },
+        )
+        for cluster_index, cluster in enumerate(manifest["clusters"])
+    }
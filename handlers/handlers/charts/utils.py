@@ -141,7 +141,7 @@ def find_closest_source_column_and_take_target_column(
     the reference dataframe and replaces it with the target value of reference dataframe.
     """
 
-    adjusted_target_dataframe = pd.DataFrame()
+    adjusted_target_group_dfs = []
     target_group_dfs = dict(list(target_dataframe.groupby(groupby_columns)))
 
     for group, reference_group_df in reference_dataframe.groupby(groupby_columns):
@@ -156,6 +156,8 @@ def find_closest_source_column_and_take_target_column(
         target_group_df[source_column] = (
             reference_group_df.iloc[indices - 1][target_column] * 100
         ).values
-        adjusted_target_dataframe = adjusted_target_dataframe.append(target_group_df)
+        adjusted_target_group_dfs.append(target_group_df)
 
-    return adjusted_target_dataframe
+    if not adjusted_target_group_dfs:
+        return pd.DataFrame()
+    return pd.concat(adjusted_target_group_dfs)
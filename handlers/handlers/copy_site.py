@@ -1,6 +1,8 @@
-from typing import Dict
+import uuid
+from typing import Dict, Iterable, List, Optional
 
 from brooks.types import AreaType
+from common_utils.constants import TASK_TYPE
 from common_utils.exceptions import DBNotFoundException
 from connectors.db_connector import get_db_session_scope
 from db_models import (
@@ -13,11 +15,14 @@ from db_models import (
     PlanDBModel,
     ReactPlannerProjectDBModel,
     SiteDBModel,
+    SlamSimulationDBModel,
     UnitDBModel,
 )
-from handlers import PlanHandler
+from handlers import GCloudStorageHandler
 from handlers.db import (
+    ApartmentStatsDBHandler,
     AreaDBHandler,
+    BaseDBHandler,
     BuildingDBHandler,
     FloorDBHandler,
     ManualSurroundingsDBHandler,
@@ -25,10 +30,15 @@ from handlers.db import (
     QADBHandler,
     ReactPlannerProjectsDBHandler,
     SiteDBHandler,
+    SlamSimulationDBHandler,
     UnitAreaDBHandler,
+    UnitAreaStatsDBHandler,
     UnitDBHandler,
+    UnitSimulationDBHandler,
+    UnitStatsDBHandler,
 )
 from handlers.db.utils import retry_on_db_operational_error
+from handlers.utils import get_client_bucket_name
 
 required_site_columns = [
     SiteDBModel.name.name,
@@ -61,6 +71,9 @@ required_plan_columns = [
     PlanDBModel.georef_rot_y.name,
     PlanDBModel.georef_rot_angle.name,
     PlanDBModel.image_mime_type.name,
+    PlanDBModel.image_hash.name,
+    PlanDBModel.image_width.name,
+    PlanDBModel.image_height.name,
     PlanDBModel.annotation_finished.name,
     PlanDBModel.is_masterplan.name,
     PlanDBModel.without_units.name,
@@ -98,6 +111,16 @@ required_unit_columns = [
 
 required_units_areas_column = ["labels"]
 
+required_simulation_columns = [
+    SlamSimulationDBModel.type.name,
+    SlamSimulationDBModel.state.name,
+    SlamSimulationDBModel.errors.name,
+]
+required_site_simulation_status_columns = [
+    SiteDBModel.full_slam_results.name,
+    SiteDBModel.basic_features_status.name,
+]
+
 required_qa_columns = [
     ExpectedClientDataDBModel.data.name,
 ]
@@ -107,6 +130,14 @@ required_manual_surr_columns = [
 
 
 class CopySite:
+    """Copies a site table by table. The ids of the new rows are reserved upfront to
+    build the old to new id mappings, so each table is copied with a single
+    INSERT ... SELECT in the DB.
+    """
+
+    # The competition features are computed for a whole competition, not per site
+    SIMULATION_TASK_TYPES_TO_COPY = set(TASK_TYPE) - {TASK_TYPE.COMPETITION}
+
     def __init__(self):
         self.new_site_id: int = None
         self.building_mapping: Dict[int, int] = {}
@@ -122,19 +153,24 @@ class CopySite:
         site_id_to_copy: int,
         copy_area_types: bool,
         target_existing_site_id: int | None = None,
+        copy_simulation_results: bool = False,
     ) -> int:
         """
         target_client_id: client id to which the copy of the site should be added
         site_id_to_cop: ID of site which should be copied
         copy_area_types: If set to False, area_type of copied areas is set to not defined
         target_existing_site_id (optional): If set, the buildings of the site_id_to_copy are added to the target_existing_site_id
+        copy_simulation_results (optional): If set, the latest successful simulations of the site are copied as well,
+            so the new site doesn't have to be simulated again. Ignored when copying to an existing site
         """
         with get_db_session_scope():
             if target_existing_site_id is not None:
                 self.new_site_id = target_existing_site_id
             else:
                 self.new_site_id = self._copy_site_info(
-                    target_client_id=target_client_id, site_id=site_id_to_copy
+                    target_client_id=target_client_id,
+                    site_id=site_id_to_copy,
+                    copy_simulation_status=copy_simulation_results,
                 )["id"]
                 self._copy_qa_data(
                     target_client_id=target_client_id, site_id=site_id_to_copy
@@ -143,28 +179,33 @@ class CopySite:
                     target_client_id=target_client_id, site_id=site_id_to_copy
                 )
 
-            for building in BuildingDBHandler.find(
-                site_id=site_id_to_copy, output_columns=["id"]
-            ):
-                self._copy_building_info(building_id=building["id"])
-                for plan in PlanDBHandler.find(
-                    building_id=building["id"], output_columns=["id", "building_id"]
-                ):
-                    self._copy_plan_info(plan=plan)
-                    self._copy_annotation(plan=plan, site_id=site_id_to_copy)
-                    self._copy_areas(plan=plan, copy_area_types=copy_area_types)
-
-                for floor in FloorDBHandler.find(
-                    building_id=building["id"],
-                    output_columns=["id", "plan_id", "building_id"],
-                ):
-                    self._copy_floor_info(floor=floor)
-                    self._copy_units(floor=floor)
+            self._copy_buildings(site_id=site_id_to_copy)
+            self._copy_plans(site_id=site_id_to_copy)
+            self._copy_annotations()
+            self._copy_areas(copy_area_types=copy_area_types)
+            self._copy_floors()
+            self._copy_units()
+            if copy_simulation_results and target_existing_site_id is None:
+                self._copy_simulation_results(site_id=site_id_to_copy)
         return self.new_site_id
 
-    def _copy_site_info(self, target_client_id: int, site_id: int):
+    @staticmethod
+    def _new_ids(db_handler: BaseDBHandler, old_ids: List[int]) -> Dict[int, int]:
+        if not old_ids:
+            return {}
+        return dict(zip(old_ids, db_handler.allocate_ids(number_of_ids=len(old_ids))))
+
+    def _copy_site_info(
+        self, target_client_id: int, site_id: int, copy_simulation_status: bool = False
+    ):
         old_site = SiteDBHandler.get_by(
-            id=site_id, output_columns=required_site_columns
+            id=site_id,
+            output_columns=required_site_columns
+            + (
+                required_site_simulation_status_columns
+                if copy_simulation_status
+                else []
+            ),
         )
         old_site[SiteDBModel.name.name] = f"COPY_{old_site[SiteDBModel.name.name]}"
         old_site.pop("georef_proj", None)
@@ -191,89 +232,169 @@ class CopySite:
         except DBNotFoundException:
             pass
 
-    def _copy_building_info(self, building_id: int):
-        old_building = BuildingDBHandler.get_by(
-            id=building_id, output_columns=required_building_columns
+    def _copy_buildings(self, site_id: int):
+        self.building_mapping = self._new_ids(
+            db_handler=BuildingDBHandler,
+            old_ids=BuildingDBHandler.find_ids(site_id=site_id),
         )
-        old_building["site_id"] = self.new_site_id
-        building_copy = BuildingDBHandler.add(**old_building)
-        self.building_mapping[building_id] = building_copy["id"]
-
-    def _copy_plan_info(self, plan: Dict):
-        old_plan = PlanDBHandler.get_by(
-            id=plan["id"], output_columns=required_plan_columns
+        BuildingDBHandler.bulk_copy(
+            mappings={"id": self.building_mapping},
+            values={"site_id": self.new_site_id},
+            columns=required_building_columns,
         )
-        plan_content = PlanHandler(plan_id=plan["id"]).get_plan_image_as_bytes()
-        plan_copy = PlanHandler.add(
-            plan_content=plan_content,
-            plan_mime_type=old_plan.pop(PlanDBModel.image_mime_type.name),
-            site_id=self.new_site_id,
-            building_id=self.building_mapping[plan["building_id"]],
-            **old_plan,
-        )
-        self.plan_mapping[plan["id"]] = plan_copy["id"]
 
-    def _copy_floor_info(self, floor: Dict):
-        floor_data = FloorDBHandler.get_by(
-            id=floor["id"], output_columns=required_floor_columns
+    def _copy_plans(self, site_id: int):
+        plans = list(
+            PlanDBHandler.find_in(
+                building_id=list(self.building_mapping),
+                output_columns=["id", "image_hash", "image_gcs_link"],
+            )
         )
-        floor_copy = FloorDBHandler.add(
-            plan_id=self.plan_mapping[floor["plan_id"]],
-            building_id=self.building_mapping[floor["building_id"]],
-            **floor_data,
+        self.plan_mapping = self._new_ids(
+            db_handler=PlanDBHandler, old_ids=[plan["id"] for plan in plans]
         )
-        self.floor_mapping[floor["id"]] = floor_copy["id"]
+        mappings = {"id": self.plan_mapping, "building_id": self.building_mapping}
+        columns = list(required_plan_columns)
+        if (
+            image_links := self._copy_plan_images(plans=plans, site_id=site_id)
+        ) is None:
+            columns.append(PlanDBModel.image_gcs_link.name)
+        else:
+            mappings[PlanDBModel.image_gcs_link.name] = image_links
 
-    def _copy_annotation(self, plan: Dict, site_id: int):
-        db_handler, required_columns = (
-            ReactPlannerProjectsDBHandler,
-            required_react_annotation_columns,
+        PlanDBHandler.bulk_copy(
+            mappings=mappings, values={"site_id": self.new_site_id}, columns=columns
         )
 
-        try:
-            annotation_data = db_handler.get_by(
-                plan_id=plan["id"], output_columns=required_columns
+    def _copy_plan_images(
+        self, plans: Iterable[Dict], site_id: int
+    ) -> Optional[Dict[str, str]]:
+        """Copies the plan images to the bucket of the new site inside of the storage,
+        once per image content. Returns the new link of each old image link, or None if
+        the images can be referenced as they are, as both sites belong to the same client.
+        """
+        source_bucket, target_bucket = (
+            get_client_bucket_name(
+                client_id=SiteDBHandler.get_by(
+                    id=bucket_site_id, output_columns=["client_id"]
+                )["client_id"]
             )
-            db_handler.add(plan_id=self.plan_mapping[plan["id"]], **annotation_data)
-        except DBNotFoundException:
-            pass
+            for bucket_site_id in (site_id, self.new_site_id)
+        )
+        if source_bucket == target_bucket:
+            return None
 
-    def _copy_areas(self, plan: Dict, copy_area_types: bool):
-        areas_data = AreaDBHandler.find(
-            plan_id=plan["id"], output_columns=required_area_columns + ["id"]
+        new_link_by_image_hash: Dict[str, str] = {}
+        for plan in plans:
+            if plan["image_hash"] not in new_link_by_image_hash:
+                new_link_by_image_hash[
+                    plan["image_hash"]
+                ] = GCloudStorageHandler().copy_file_to_another_bucket(
+                    source_bucket_name=source_bucket,
+                    media_link=plan["image_gcs_link"],
+                    destination_bucket_name=target_bucket,
+                )
+        return {
+            plan["image_gcs_link"]: new_link_by_image_hash[plan["image_hash"]]
+            for plan in plans
+        }
+
+    def _copy_annotations(self):
+        ReactPlannerProjectsDBHandler.bulk_copy(
+            mappings={"plan_id": self.plan_mapping},
+            columns=required_react_annotation_columns,
         )
+
+    def _copy_areas(self, copy_area_types: bool):
+        self.area_mapping = self._new_ids(
+            db_handler=AreaDBHandler,
+            old_ids=[
+                area["id"]
+                for area in AreaDBHandler.find_in(
+                    plan_id=list(self.plan_mapping), output_columns=["id"]
+                )
+            ],
+        )
+        values = {}
+        columns = list(required_area_columns)
         if not copy_area_types:
-            for area in areas_data:
-                area["area_type"] = AreaType.NOT_DEFINED.name
-        for area in areas_data:
-            old_area_id = area.pop("id")
-            area_copy = AreaDBHandler.add(
-                plan_id=self.plan_mapping[plan["id"]],
-                **area,
-            )
-            self.area_mapping[old_area_id] = area_copy["id"]
+            values[AreaDBModel.area_type.name] = AreaType.NOT_DEFINED.name
+            columns.remove(AreaDBModel.area_type.name)
 
-    def _copy_units(self, floor: Dict):
-        units_data = UnitDBHandler.find(
-            floor_id=floor["id"], output_columns=required_unit_columns + ["id"]
+        AreaDBHandler.bulk_copy(
+            mappings={"id": self.area_mapping, "plan_id": self.plan_mapping},
+            values=values,
+            columns=columns,
         )
-        for unit in units_data:
-            old_unit_id = unit.pop("id")
-            unit_copy = UnitDBHandler.add(
-                site_id=self.new_site_id,
-                plan_id=self.plan_mapping[floor["plan_id"]],
-                floor_id=self.floor_mapping[floor["id"]],
-                **unit,
-            )
-            self.unit_mapping[old_unit_id] = unit_copy["id"]
-            unit_areas_data = UnitAreaDBHandler.find(
-                unit_id=old_unit_id,
-                output_columns=required_units_areas_column + ["area_id"],
-            )
-            for unit_area in unit_areas_data:
-                old_area_id = unit_area.pop("area_id")
-                UnitAreaDBHandler.add(
-                    unit_id=unit_copy["id"],
-                    area_id=self.area_mapping[old_area_id],
-                    **unit_area,
+
+    def _copy_floors(self):
+        self.floor_mapping = self._new_ids(
+            db_handler=FloorDBHandler,
+            old_ids=[
+                floor["id"]
+                for floor in FloorDBHandler.find_in(
+                    building_id=list(self.building_mapping), output_columns=["id"]
+                )
+            ],
+        )
+        FloorDBHandler.bulk_copy(
+            mappings={
+                "id": self.floor_mapping,
+                "plan_id": self.plan_mapping,
+                "building_id": self.building_mapping,
+            },
+            columns=required_floor_columns,
+        )
+
+    def _copy_units(self):
+        self.unit_mapping = self._new_ids(
+            db_handler=UnitDBHandler,
+            old_ids=[
+                unit["id"]
+                for unit in UnitDBHandler.find_in(
+                    floor_id=list(self.floor_mapping), output_columns=["id"]
                 )
+            ],
+        )
+        UnitDBHandler.bulk_copy(
+            mappings={
+                "id": self.unit_mapping,
+                "plan_id": self.plan_mapping,
+                "floor_id": self.floor_mapping,
+            },
+            values={"site_id": self.new_site_id},
+            columns=required_unit_columns,
+        )
+        UnitAreaDBHandler.bulk_copy(
+            mappings={"unit_id": self.unit_mapping, "area_id": self.area_mapping},
+            columns=required_units_areas_column,
+        )
+
+    def _copy_simulation_results(self, site_id: int):
+        run_id_mapping = {
+            run_id: str(uuid.uuid4())
+            for run_id in SlamSimulationDBHandler.get_latest_run_ids(
+                site_id=site_id, task_types=self.SIMULATION_TASK_TYPES_TO_COPY
+            )
+        }
+        SlamSimulationDBHandler.bulk_copy(
+            mappings={"run_id": run_id_mapping},
+            values={"site_id": self.new_site_id},
+            columns=required_simulation_columns,
+        )
+        UnitSimulationDBHandler.bulk_copy_results(
+            run_id_mapping=run_id_mapping,
+            unit_id_mapping=self.unit_mapping,
+            area_id_mapping=self.area_mapping,
+        )
+        UnitStatsDBHandler.bulk_copy(
+            mappings={"run_id": run_id_mapping, "unit_id": self.unit_mapping}
+        )
+        UnitAreaStatsDBHandler.bulk_copy(
+            mappings={
+                "run_id": run_id_mapping,
+                "unit_id": self.unit_mapping,
+                "area_id": self.area_mapping,
+            }
+        )
+        ApartmentStatsDBHandler.bulk_copy(mappings={"run_id": run_id_mapping})
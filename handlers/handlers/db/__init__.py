@@ -23,6 +23,7 @@ from .site_handler import SiteDBHandler
 from .slam_simulation_handler import SlamSimulationDBHandler
 from .slam_simulation_validation import SlamSimulationValidationDBHandler
 from .unit_area_stats_handler import UnitAreaStatsDBHandler
+from .unit_area_vector_handler import UnitAreaVectorDBHandler
 from .unit_handler import UnitDBHandler
 from .unit_simulation_handler import UnitSimulationDBHandler
 from .unit_stats_handler import UnitStatsDBHandler
@@ -54,6 +55,7 @@ __all__ = (
     UnitSimulationDBHandler.__name__,
     UnitStatsDBHandler.__name__,
     UnitAreaStatsDBHandler.__name__,
+    UnitAreaVectorDBHandler.__name__,
     FolderDBHandler.__name__,
     CompetitionDBHandler.__name__,
     CompetitionFeaturesDBHandler.__name__,
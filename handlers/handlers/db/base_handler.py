@@ -1,4 +1,5 @@
 import contextlib
+from datetime import datetime
 from typing import (
     Any,
     Collection,
@@ -13,11 +14,14 @@ from typing import (
 
 from marshmallow import ValidationError, fields
 from marshmallow.fields import Field
-from sqlalchemy import and_, bindparam
+from sqlalchemy import and_, bindparam, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.exc import FlushError, NoResultFound
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.type_api import TypeEngine
 
 from common_utils.chunker import chunker
 from common_utils.exceptions import (
@@ -25,7 +29,7 @@ from common_utils.exceptions import (
     DBNotFoundException,
     DBValidationException,
 )
-from connectors.db_connector import DEFAULT_ISOLATION_LEVEL, get_db_session_scope
+from connectors.db_connector import get_db_session_scope
 from db_models import BaseDBModel
 from handlers.db.serialization import BaseDBSchema
 
@@ -34,7 +38,8 @@ class BaseDBHandler:
     model: BaseDBModel
     schema: BaseDBSchema
     BATCH_SIZE: int = 100
-    ISOLATION_LEVEL: str = DEFAULT_ISOLATION_LEVEL
+    # None to use the isolation level of the session role, see get_db_session_scope
+    ISOLATION_LEVEL: Optional[str] = None
 
     @classmethod
     @contextlib.contextmanager
@@ -52,7 +57,7 @@ class BaseDBHandler:
             raise DBException(e) from e
 
     @classmethod
-    def bulk_insert(cls, items: List[Dict]):
+    def bulk_insert(cls, items: Iterable[Dict]):
         with cls.begin_session() as session:
             items_inserted = 0
             for chunk in chunker(items, cls.BATCH_SIZE):
@@ -60,6 +65,110 @@ class BaseDBHandler:
                 items_inserted += len(chunk)
             return items_inserted
 
+    @classmethod
+    def bulk_upsert(cls, items: List[Dict], index_elements: List[str]):
+        """Inserts the items in a single transaction, the rows conflicting on the
+        index_elements (e.g. the primary key) are updated with the new values instead
+
+        Examples:
+            >>> cls.bulk_upsert(items=[{"unit_id": 1, "vector": []}], index_elements=["unit_id"])
+        """
+        table = cls.model.__table__
+        with cls.begin_session() as session:
+            for chunk in chunker(items, cls.BATCH_SIZE):
+                statement = insert(table).values(chunk)
+                new_values = {
+                    column: statement.excluded[column]
+                    for column in chunk[0]
+                    if column not in index_elements
+                }
+                # onupdate defaults are not applied to the ON CONFLICT DO UPDATE clause
+                if "updated" in table.c:
+                    new_values["updated"] = datetime.utcnow()
+                session.execute(
+                    statement.on_conflict_do_update(
+                        index_elements=index_elements, set_=new_values
+                    )
+                )
+
+    @classmethod
+    def allocate_ids(cls, number_of_ids: int) -> List[int]:
+        """Reserves ids of the table sequence, so rows can be inserted with known ids"""
+        with cls.begin_session() as session:
+            return list(
+                session.execute(
+                    select(
+                        func.nextval(f"{cls.model.__tablename__}_id_seq")
+                    ).select_from(func.generate_series(1, number_of_ids))
+                ).scalars()
+            )
+
+    @staticmethod
+    def _mapping_subquery(mapping: Mapping[Any, Any], name: str, type_: TypeEngine):
+        """Subquery with the old_value, new_value pairs of the mapping as rows"""
+        return select(
+            func.unnest(cast(list(mapping.keys()), ARRAY(type_))).label("old_value"),
+            func.unnest(cast(list(mapping.values()), ARRAY(type_))).label("new_value"),
+        ).subquery(name)
+
+    @classmethod
+    def bulk_copy(
+        cls,
+        mappings: Dict[str, Mapping[Any, Any]],
+        values: Optional[Dict[str, Any]] = None,
+        columns: Optional[Collection[str]] = None,
+    ) -> int:
+        """Copies the rows whose values are present in all the given mappings with a
+        single INSERT ... SELECT, replacing the mapped columns with the new values.
+        `values` are set for all the copied rows, either as constants or SQL
+        expressions, and `columns` are copied unchanged. By default all the columns
+        are copied except the id and the dates.
+
+        Examples:
+            >>> cls.bulk_copy(
+            ...     mappings={"id": {1: 11, 2: 12}, "site_id": {5: 6}},
+            ...     values={"labels": None},
+            ... )
+        """
+        if not all(mappings.values()):
+            return 0
+
+        table = cls.model.__table__
+        values = values or {}
+        if columns is None:
+            columns = [
+                column.name
+                for column in table.columns
+                if column.name not in {"id", "created", "updated", *mappings, *values}
+            ]
+
+        source = table
+        selected_columns = []
+        for column_name, mapping in mappings.items():
+            column = table.c[column_name]
+            mapping_subquery = cls._mapping_subquery(
+                mapping=mapping, name=f"{column_name}_mapping", type_=column.type
+            )
+            source = source.join(
+                mapping_subquery, column == mapping_subquery.c.old_value
+            )
+            selected_columns.append(mapping_subquery.c.new_value)
+        selected_columns.extend(
+            value
+            if isinstance(value, ClauseElement)
+            else literal(value, type_=table.c[column_name].type)
+            for column_name, value in values.items()
+        )
+        selected_columns.extend(table.c[column_name] for column_name in columns)
+
+        with cls.begin_session() as session:
+            return session.execute(
+                table.insert().from_select(
+                    [*mappings, *values, *columns],
+                    select(*selected_columns).select_from(source),
+                )
+            ).rowcount
+
     @classmethod
     def bulk_update(
         cls,
@@ -1,3 +1,5 @@
+from typing import Dict, List, Set
+
 from db_models import ReactPlannerProjectDBModel
 from handlers.db import BaseDBHandler
 from handlers.db.serialization import BaseDBSchema
@@ -11,3 +13,44 @@ class ReactPlannerProjectsDBSchema(BaseDBSchema):
 class ReactPlannerProjectsDBHandler(BaseDBHandler):
     schema = ReactPlannerProjectsDBSchema()
     model = ReactPlannerProjectDBModel
+
+    @classmethod
+    def find_ids_not_in_version(
+        cls, version: str, after_id: int, limit: int
+    ) -> List[int]:
+        """Ids of the projects whose annotation is in another version, in id order
+        starting after the given id"""
+        with cls.begin_session(readonly=True) as session:
+            return [
+                project.id
+                for project in session.query(cls.model.id)
+                .filter(
+                    cls.model.id > after_id,
+                    cls.model.data["version"].as_string().is_distinct_from(version),
+                )
+                .order_by(cls.model.id)
+                .limit(limit)
+            ]
+
+    @classmethod
+    def bulk_update_data_from_version(
+        cls, data_by_id: Dict[int, Dict], version_by_id: Dict[int, str]
+    ) -> Set[int]:
+        """Updates the annotations only if they are still in the given version, so the
+        ones saved in the meantime are not overwritten. Returns the ids updated."""
+        table = cls.model.__table__
+        updated_ids = set()
+        with cls.begin_session() as session:
+            for project_id, data in data_by_id.items():
+                result = session.execute(
+                    table.update()
+                    .where(
+                        table.c.id == project_id,
+                        table.c.data["version"].as_string()
+                        == version_by_id[project_id],
+                    )
+                    .values(data=data)
+                )
+                if result.rowcount:
+                    updated_ids.add(project_id)
+        return updated_ids
@@ -0,0 +1,13 @@
+from db_models import UnitAreaVectorDBModel
+from handlers.db import BaseDBHandler
+from handlers.db.serialization import BaseDBSchema
+
+
+class UnitAreaVectorDBSchema(BaseDBSchema):
+    class Meta(BaseDBSchema.Meta):
+        model = UnitAreaVectorDBModel
+
+
+class UnitAreaVectorDBHandler(BaseDBHandler):
+    schema = UnitAreaVectorDBSchema()
+    model = UnitAreaVectorDBModel
@@ -1,3 +1,7 @@
+from typing import Dict
+
+from sqlalchemy import Integer, String, case, cast, func, select
+
 from db_models import UnitSimulationDBModel
 from handlers.db import BaseDBHandler
 from handlers.db.serialization import BaseDBSchema
@@ -11,3 +15,50 @@ class UnitSimulationDBSchema(BaseDBSchema):
 class UnitSimulationDBHandler(BaseDBHandler):
     schema = UnitSimulationDBSchema()
     model = UnitSimulationDBModel
+
+    @classmethod
+    def bulk_copy_results(
+        cls,
+        run_id_mapping: Dict[str, str],
+        unit_id_mapping: Dict[int, int],
+        area_id_mapping: Dict[int, int],
+    ) -> int:
+        """Copies the results of the units to the new runs and units, replacing the
+        area ids used as keys of the results by the ids of the copied areas.
+        """
+        area_mapping = cls._mapping_subquery(
+            mapping=area_id_mapping, name="area_id_mapping", type_=Integer()
+        )
+        results = cls.model.__table__.c.results
+        result_items = (
+            func.jsonb_each(results).table_valued("key", "value").alias("result_item")
+        )
+        remapped_results = (
+            select(
+                func.jsonb_object_agg(
+                    func.coalesce(
+                        cast(area_mapping.c.new_value, String), result_items.c.key
+                    ),
+                    result_items.c.value,
+                )
+            )
+            .select_from(
+                result_items.outerjoin(
+                    area_mapping,
+                    result_items.c.key == cast(area_mapping.c.old_value, String),
+                )
+            )
+            .scalar_subquery()
+        )
+        return cls.bulk_copy(
+            mappings={"run_id": run_id_mapping, "unit_id": unit_id_mapping},
+            values={
+                "results": case(
+                    (
+                        func.jsonb_typeof(results) == "object",
+                        func.coalesce(remapped_results, func.jsonb_build_object()),
+                    ),
+                    else_=results,
+                )
+            },
+        )
@@ -12,7 +12,7 @@ from tenacity import (
 )
 
 from common_utils.utils import get_class_public_methods
-from connectors.db_connector import get_session_manager
+from connectors.db_connector import db_statistics, get_session_manager
 
 DB_WAIT_EXPONENTIAL_MULTIPLIER = 1
 DB_EXPONENTIAL_MAX = 10
@@ -24,6 +24,19 @@ def _operational_error(exc):
 
 
 RETRY_ON_DB_OPERATIONAL_ERROR = retry_if_exception(_operational_error)
+
+
+def _record_retry(retry_state):
+    """Counts the retries by function and by the error of the DB driver, e.g.
+    SerializationFailure for the concurrent serializable transactions"""
+    exception = retry_state.outcome.exception()
+    db_statistics.increment(group="retries", name=retry_state.fn.__qualname__)
+    db_statistics.increment(
+        group="retried_errors",
+        name=type(getattr(exception, "orig", None) or exception).__name__,
+    )
+
+
 POTENTIAL_DB_WAIT_STRATEGY = dict(
     stop=stop_after_attempt(5),
     wait=wait_random(0, 30) + wait_random_exponential(multiplier=15),
@@ -45,7 +58,10 @@ def retry_on_db_operational_error(**wait_strategy):
             # only the most outer transaction's decorated method is retried
             if get_session_manager().tran_count == 0:
                 return retry(
-                    retry=RETRY_ON_DB_OPERATIONAL_ERROR, reraise=True, **wait_strategy
+                    retry=RETRY_ON_DB_OPERATIONAL_ERROR,
+                    reraise=True,
+                    before_sleep=_record_retry,
+                    **wait_strategy,
                 )(func)(*args, **kwargs)
 
             return func(*args, **kwargs)
@@ -6,7 +6,7 @@ import zipfile
 from glob import glob
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import IO, TYPE_CHECKING, Dict, List, Optional, Set, Union
+from typing import IO, TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Union
 
 from google.cloud.exceptions import NotFound
 from werkzeug.datastructures import FileStorage
@@ -189,6 +189,34 @@ class DMSFloorDeliverableHandler(DMSDeliverableMixin, PlanLayoutHandlerIDCacheMi
             buff=io_image,
         )
 
+    def generate_upload_floorplans(
+        self,
+        floor_id: int,
+        languages: Iterable[SUPPORTED_LANGUAGES],
+        file_formats: Iterable[SUPPORTED_OUTPUT_FILES],
+    ):
+        """Same as `generate_upload_floorplan` but plotting the floor only once for all
+        the languages and file formats"""
+        from handlers import FloorHandler
+
+        for (language, file_format, io_image, filename, site_info,) in FloorHandler(
+            layout_handler_by_id=self._layout_handler_by_id
+        ).generate_floorplan_images(
+            floor_id=floor_id, languages=languages, file_formats=file_formats
+        ):
+            self.create_or_replace_dms_file(
+                client_id=site_info["client_id"],
+                site_id=site_info["id"],
+                floor_id=floor_id,
+                filename=filename,
+                extension=file_format.name,
+                labels=[file_format.name],
+                buff=io_image,
+            )
+            logger.info(
+                f"Uploaded {file_format.name} file for floor {floor_id} and language {language.name}"
+            )
+
     @classmethod
     def get_file_info(
         cls,
@@ -307,6 +335,36 @@ class DMSUnitDeliverableHandler(DMSDeliverableMixin, PlanLayoutHandlerIDCacheMix
             buff=io_image,
         )
 
+    def generate_upload_floorplans(
+        self,
+        unit_id: int,
+        languages: Iterable[SUPPORTED_LANGUAGES],
+        file_formats: Iterable[SUPPORTED_OUTPUT_FILES],
+    ):
+        """Same as `generate_upload_floorplan` but plotting the unit only once for all
+        the languages and file formats"""
+        for (
+            language,
+            file_format,
+            io_image,
+            filename,
+            site_info,
+        ) in self.unit_handler.generate_floorplan_images(
+            unit_id=unit_id, languages=languages, file_formats=file_formats
+        ):
+            self.create_or_replace_dms_file(
+                client_id=site_info["client_id"],
+                site_id=site_info["id"],
+                unit_id=unit_id,
+                filename=filename,
+                extension=file_format.name,
+                labels=[file_format.name],
+                buff=io_image,
+            )
+            logger.info(
+                f"Uploaded {file_format.name} file for unit {unit_id} and language {language.name}"
+            )
+
     @classmethod
     def download_unit_file(
         cls,
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
 from itertools import groupby
@@ -17,7 +18,9 @@ from shapely.geometry import (
     Polygon,
     shape,
 )
+from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
+from shapely.prepared import prep
 from shapely.validation import explain_validity, make_valid
 
 from brooks.types import AreaType
@@ -67,24 +70,88 @@ class DXFClassificationInfo:
     area_type: AreaType
 
 
+class WallsUnion:
+    """Union of the reference walls used by all the item layers of an import"""
+
+    def __init__(self, wall_polygons: list[Polygon]):
+        self.wall_polygons = wall_polygons
+        self.union = unary_union(wall_polygons)
+        self.prepared = prep(self.union)
+
+    @cached_property
+    def sanitary_reference(self) -> BaseGeometry:
+        return self.union.buffer(
+            distance=2, cap_style=CAP_STYLE.square, join_style=JOIN_STYLE.mitre
+        )
+
+
 # --------- DXF Geometries --------- #
 
 
 class DXFtoShapelyMapper:
     def __init__(self, dxf_modelspace: Modelspace):
         self.dxf_modelspace = dxf_modelspace
+        self._geometries_by_index_key: dict[tuple, list[tuple]] = {}
+        self._walls_union: WallsUnion | None = None
+
+    def get_walls_union(self, wall_polygons: list[Polygon]) -> WallsUnion:
+        """The same walls are the reference of all the items of the import, so the
+        union is only computed again if a different list of walls is provided"""
+        if (
+            self._walls_union is None
+            or self._walls_union.wall_polygons is not wall_polygons
+        ):
+            self._walls_union = WallsUnion(wall_polygons=wall_polygons)
+        return self._walls_union
+
+    @cached_property
+    def _entities_by_layer_and_type(
+        self,
+    ) -> dict[tuple[str, str], list[tuple[int, DXFEntity]]]:
+        """Single pass over the modelspace, the entities are indexed by their layer and
+        DXF type keeping their position in the modelspace to preserve the query order"""
+        entities_by_layer_and_type = defaultdict(list)
+        for position, entity in enumerate(self.dxf_modelspace.query("*")):
+            entities_by_layer_and_type[(entity.dxf.layer, entity.dxftype())].append(
+                (position, entity)
+            )
+        return entities_by_layer_and_type
+
+    @cached_property
+    def _block_entities_by_name_and_type(
+        self,
+    ) -> dict[tuple[str, str], list[tuple[tuple[int, int], str, DXFEntity]]]:
+        """Virtual entities of all the blocks indexed by block name and DXF type, along
+        with the layer of the block they belong to"""
+        block_entities_by_name_and_type = defaultdict(list)
+        for block_name, blocks in self.blocks.items():
+            for block_position, block in enumerate(blocks):
+                for position, entity in enumerate(block.virtual_entities()):
+                    block_entities_by_name_and_type[
+                        (block_name, entity.dxf.dxftype)
+                    ].append(((block_position, position), block.dxf.layer, entity))
+        return block_entities_by_name_and_type
 
     @cached_property
     def layer_names(self) -> set[str]:
-        return set([entity.dxf.layer for entity in self.dxf_modelspace.query("*")])
+        return {layer for layer, _ in self._entities_by_layer_and_type.keys()}
 
     @cached_property
     def blocks(self):
+        inserts = sorted(
+            [
+                indexed_entity
+                for (_, dxf_type), entities in self._entities_by_layer_and_type.items()
+                if dxf_type == "INSERT"
+                for indexed_entity in entities
+            ],
+            key=lambda z: z[0],
+        )
         return {
-            block_name: list(blocks)
+            block_name: [entity for _, entity in blocks]
             for block_name, blocks in groupby(
-                sorted(self.dxf_modelspace.query("INSERT"), key=lambda z: z.dxf.name),
-                key=lambda z: z.dxf.name,
+                sorted(inserts, key=lambda z: z[1].dxf.name),
+                key=lambda z: z[1].dxf.name,
             )
         }
 
@@ -104,15 +171,15 @@ class DXFtoShapelyMapper:
 
     def get_block_names(self, react_planner_names: set[ReactPlannerName]) -> set[str]:
         block_names = set()
-        for block in self.dxf_modelspace.query("INSERT"):
+        for block_name in self.blocks.keys():
             if any(
                 [
-                    keyword in block.dxf.name
+                    keyword in block_name
                     for planner_name in react_planner_names
                     for keyword in BLOCK_KEYWORDS[planner_name]
                 ]
             ):
-                block_names.add(block.dxf.name)
+                block_names.add(block_name)
 
         return block_names
 
@@ -186,6 +253,21 @@ class DXFtoShapelyMapper:
 
         return self.make_all_geometries_valid(geometries=geometries)
 
+    def _get_indexed_geometries(
+        self, index_key: tuple, indexed_entities: list[tuple]
+    ) -> list[tuple]:
+        """Converts the entities of an index entry into geometries only the first time
+        they are requested, as the same layers are queried by several element types"""
+        if index_key not in self._geometries_by_index_key:
+            self._geometries_by_index_key[index_key] = [
+                (
+                    *entity_info,
+                    self.get_allowed_layer_dxf_entity_geometries(entities=[entity]),
+                )
+                for *entity_info, entity in indexed_entities
+            ]
+        return self._geometries_by_index_key[index_key]
+
     def get_dxf_geometries(
         self,
         allowed_layers: set[str],
@@ -193,26 +275,44 @@ class DXFtoShapelyMapper:
         block_name_prefix: str | None = None,
     ) -> list[LineString | Polygon]:
         if block_name_prefix:
-            filtered_entities = []
             for block_name in self.blocks.keys():
                 if block_name.startswith(block_name_prefix):
-                    filtered_entities += [
-                        entity
-                        for block in self.blocks.get(block_name)
-                        for entity in block.virtual_entities()
-                        if entity.dxf.dxftype in allowed_geometry_types
-                        and block.dxf.layer in allowed_layers
+                    block_geometries = [
+                        (position, geometries)
+                        for dxf_type in allowed_geometry_types
+                        for position, block_layer, geometries in self._get_indexed_geometries(
+                            index_key=("BLOCK", block_name, dxf_type),
+                            indexed_entities=self._block_entities_by_name_and_type.get(
+                                (block_name, dxf_type), []
+                            ),
+                        )
+                        if block_layer in allowed_layers
                     ]
+                    return [
+                        geometry
+                        for _, geometries in sorted(
+                            block_geometries, key=lambda z: z[0]
+                        )
+                        for geometry in geometries
+                    ]
+            return []
 
-                    return self.get_allowed_layer_dxf_entity_geometries(
-                        entities=filtered_entities
-                    )
-            return filtered_entities
-
-        filtered_entities = self.dxf_modelspace.query(" ".join(allowed_geometry_types))
-        return self.get_allowed_layer_dxf_entity_geometries(
-            entities=filtered_entities, allowed_layers=allowed_layers
-        )
+        layer_geometries = [
+            (position, geometries)
+            for layer in allowed_layers
+            for dxf_type in allowed_geometry_types
+            for position, geometries in self._get_indexed_geometries(
+                index_key=("LAYER", layer, dxf_type),
+                indexed_entities=self._entities_by_layer_and_type.get(
+                    (layer, dxf_type), []
+                ),
+            )
+        ]
+        return [
+            geometry
+            for _, geometries in sorted(layer_geometries, key=lambda z: z[0])
+            for geometry in geometries
+        ]
 
     @classmethod
     def _get_hatch_polygons(cls, entity: DXFEntity) -> list[Polygon]:
@@ -292,12 +392,13 @@ class DXFtoShapelyMapper:
         lines_from_polylines = [
             x for x in existing_dxf_polygons if isinstance(x, LineString)
         ]
-        all_walls_union = unary_union(wall_polygons)
+        walls_union = self.get_walls_union(wall_polygons=wall_polygons)
         polygons_from_lines: list[Polygon] = list(
             group_line_and_arcs_into_rectangles(
                 distance_to_consider_group=distance_to_consider_group,
                 all_elements=lines_and_arcs + lines_from_polylines,
-                all_walls_union=all_walls_union,
+                all_walls_union=walls_union.union,
+                prepared_walls_union=walls_union.prepared,
             )
         )
 
@@ -309,7 +410,9 @@ class DXFtoShapelyMapper:
             )
             return (
                 split_polygons_fully_intersected_by_a_wall(
-                    bounding_boxes=item_bounding_boxes, all_walls_union=all_walls_union
+                    bounding_boxes=item_bounding_boxes,
+                    all_walls_union=walls_union.union,
+                    prepared_walls_union=walls_union.prepared,
                 ),
                 raw_geometries,
             )
@@ -567,13 +670,12 @@ class DXFtoShapelyMapper:
             condition="within",
         )
 
-    @staticmethod
     def get_sanitary_element_type_by_geometry(
-        polygon: Polygon, wall_polygons: list[Polygon]
+        self, polygon: Polygon, wall_polygons: list[Polygon]
     ) -> ReactPlannerName | None:
-        wall_union = unary_union(wall_polygons).buffer(
-            distance=2, cap_style=CAP_STYLE.square, join_style=JOIN_STYLE.mitre
-        )
+        wall_union = self.get_walls_union(
+            wall_polygons=wall_polygons
+        ).sanitary_reference
         short_side, short_side2, long_side, long_side2 = get_sides_as_lines_by_length(
             polygon.minimum_rotated_rectangle
         )
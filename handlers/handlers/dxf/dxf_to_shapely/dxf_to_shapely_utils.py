@@ -1,9 +1,10 @@
 from itertools import chain
-from typing import Dict, Iterator, List, Optional, Set, Tuple
+from typing import Iterator, List, Optional, Set, Tuple
 
 import numpy
-from pygeos import Geometry
+from pygeos import Geometry, STRtree
 from pygeos import area as pygeos_areas
+from pygeos import box as pygeos_box
 from pygeos import (
     distance,
     from_shapely,
@@ -23,6 +24,7 @@ from shapely.geometry import (
 )
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import polygonize_full, unary_union
+from shapely.prepared import PreparedGeometry, prep
 
 from brooks.constants import THICKEST_WALL_POSSIBLE_IN_M
 from brooks.types import AreaType
@@ -40,13 +42,13 @@ from handlers.dxf.dxf_constants import (
 def is_wall_between_geometries(
     group_centroid: Point,
     element: Polygon,
-    walls: MultiPolygon,
+    walls: MultiPolygon | PreparedGeometry,
 ) -> bool:
 
     connecting_line_between_element_and_group = LineString(
         [element.centroid, group_centroid]
     )
-    return connecting_line_between_element_and_group.intersects(walls)
+    return walls.intersects(connecting_line_between_element_and_group)
 
 
 def filter_overlapping_or_small_polygons(
@@ -93,28 +95,51 @@ def exclude_polygons_split_by_walls(
 
 def _group_geometries_by_distance_threshold(
     index_element_to_group_around: int,
-    all_elements_indexed: Dict[int, Polygon],
+    all_elements: List[LineString],
+    elements_tree: STRtree,
+    remaining_elements: numpy.ndarray,
     distance_to_consider_group: int,
-    all_walls_union: MultiPolygon,
+    all_walls_union: PreparedGeometry,
 ) -> Set[int]:
     group_indices = {index_element_to_group_around}
-    element_to_group_around = all_elements_indexed[index_element_to_group_around]
+    element_to_group_around = all_elements[index_element_to_group_around]
     group_elements = [element_to_group_around]
 
-    for i, element in sorted(
-        all_elements_indexed.items(),
-        key=lambda elem: elem[1].distance(element_to_group_around),
-    ):
+    # Only the elements whose envelope is within the distance threshold can be grouped
+    min_x, min_y, max_x, max_y = element_to_group_around.bounds
+    candidate_indices = elements_tree.query(
+        pygeos_box(
+            min_x - distance_to_consider_group,
+            min_y - distance_to_consider_group,
+            max_x + distance_to_consider_group,
+            max_y + distance_to_consider_group,
+        )
+    )
+    candidate_indices = numpy.sort(
+        candidate_indices[remaining_elements[candidate_indices]]
+    )
+    candidate_distances = distance(
+        elements_tree.geometries[index_element_to_group_around],
+        elements_tree.geometries[candidate_indices],
+    )
+    close_candidates = candidate_distances < distance_to_consider_group
+    candidate_indices = candidate_indices[close_candidates]
+    candidate_distances = candidate_distances[close_candidates]
+
+    group_centroid = None
+    for i in candidate_indices[numpy.argsort(candidate_distances, kind="stable")]:
         if i != index_element_to_group_around:
-            if element.distance(element_to_group_around) < distance_to_consider_group:
-                if is_wall_between_geometries(
-                    group_centroid=unary_union(group_elements).centroid,
-                    element=element,
-                    walls=all_walls_union,
-                ):
-                    continue
-                group_elements.append(element)
-                group_indices.add(i)
+            if group_centroid is None:
+                group_centroid = unary_union(group_elements).centroid
+            if is_wall_between_geometries(
+                group_centroid=group_centroid,
+                element=all_elements[i],
+                walls=all_walls_union,
+            ):
+                continue
+            group_elements.append(all_elements[i])
+            group_indices.add(int(i))
+            group_centroid = None
     return group_indices
 
 
@@ -158,11 +183,19 @@ def get_bounding_boxes_for_groups_of_geometries(
 
 
 def split_polygons_fully_intersected_by_a_wall(
-    bounding_boxes: List[Polygon], all_walls_union: MultiPolygon
+    bounding_boxes: List[Polygon],
+    all_walls_union: MultiPolygon,
+    prepared_walls_union: PreparedGeometry | None = None,
 ):
     """In some cases 2 items separated by a wall are merged together, if that is the case we split it"""
+    if prepared_walls_union is None:
+        prepared_walls_union = prep(all_walls_union)
+
     final_geometries = []
     for bounding_box in bounding_boxes:
+        if not prepared_walls_union.intersects(bounding_box):
+            final_geometries.append(bounding_box.minimum_rotated_rectangle)
+            continue
         sub_bounding_boxes = as_multipolygon(bounding_box.difference(all_walls_union))
         for sub_bounding_box in sub_bounding_boxes.geoms:
             final_geometries.append(sub_bounding_box.minimum_rotated_rectangle)
@@ -186,22 +219,32 @@ def group_line_and_arcs_into_rectangles(
     distance_to_consider_group: int,
     all_elements: List[LineString],
     all_walls_union: MultiPolygon,
+    prepared_walls_union: PreparedGeometry | None = None,
 ) -> Iterator[Polygon]:
-    all_elements_indexed = {i: element for i, element in enumerate(all_elements)}
-    while all_elements_indexed:
+    if not all_elements:
+        return
+    if prepared_walls_union is None:
+        prepared_walls_union = prep(all_walls_union)
+
+    elements_tree = STRtree(from_shapely(all_elements))
+    remaining_elements = numpy.ones(len(all_elements), dtype=bool)
+    for index_element_to_group_around in range(len(all_elements)):
+        if not remaining_elements[index_element_to_group_around]:
+            continue
         # We group here all lines that are close to each other
         new_group_indices = _group_geometries_by_distance_threshold(
-            index_element_to_group_around=list(all_elements_indexed.keys())[0],
-            all_elements_indexed=all_elements_indexed,
+            index_element_to_group_around=index_element_to_group_around,
+            all_elements=all_elements,
+            elements_tree=elements_tree,
+            remaining_elements=remaining_elements,
             distance_to_consider_group=distance_to_consider_group,
-            all_walls_union=all_walls_union,
+            all_walls_union=prepared_walls_union,
         )
         new_group_geometries = [
-            all_elements_indexed[index].difference(all_walls_union)
+            all_elements[index].difference(all_walls_union)
             for index in new_group_indices
         ]
-        for index in new_group_indices:
-            all_elements_indexed.pop(index)
+        remaining_elements[list(new_group_indices)] = False
         # To avoid creating items that can go over the wall, we have to calculate the difference with the walls
         # on each line or polygon of the group. This specially to avoid water connections that are drawn as
         # lines in DXF
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from itertools import chain
 from typing import (
     DefaultDict,
     Dict,
@@ -11,6 +12,7 @@ from typing import (
     ValuesView,
 )
 
+from pygeos import STRtree, from_shapely
 from shapely.affinity import rotate
 from shapely.geometry import LineString, MultiPolygon, Point, Polygon
 
@@ -22,6 +24,7 @@ from brooks.models import (
     SimOpening,
     SimSeparator,
     SimSpace,
+    SpatialEntity,
 )
 from brooks.types import (
     AreaType,
@@ -124,8 +127,9 @@ class ReactPlannerToBrooksMapper:
             post_processed=post_processed,
             default_element_heights=default_element_heights,
         )
+        SpatialEntity.ensure_footprints_validity(separators)
 
-        _: Set[SimOpening] = cls._create_n_assign_opening_to_separators(
+        openings: Set[SimOpening] = cls._create_n_assign_opening_to_separators(
             planner_elements=planner_elements,
             separators_by_id=separators_by_id,
             post_processed=post_processed,
@@ -140,6 +144,9 @@ class ReactPlannerToBrooksMapper:
             separator_whitelist=(SeparatorType.AREA_SPLITTER,),
             default_element_heights=default_element_heights,
         )
+        SpatialEntity.ensure_footprints_validity(
+            chain(openings, features, area_splitters)
+        )
 
         spaces: Set[SimSpace] = cls._get_spaces_from_areas(
             separators=separators,
@@ -385,14 +392,45 @@ class ReactPlannerToBrooksMapper:
     def _set_area_types_from_react_areas(
         cls, brooks_areas: Set[SimArea], react_areas: ValuesView[ReactPlannerArea]
     ):
-        for react_area in react_areas:
-            if not react_area.properties.areaType:
-                continue
-            representative_point = react_area.polygon.representative_point()
-            for brooks_area in brooks_areas:
-                if representative_point.within(brooks_area.footprint):
-                    brooks_area._type = AreaType[react_area.properties.areaType]
-                    break
+        typed_react_areas = [
+            react_area for react_area in react_areas if react_area.properties.areaType
+        ]
+        if not typed_react_areas or not brooks_areas:
+            return
+
+        brooks_areas_list = list(brooks_areas)
+        representative_point_indexes, brooks_area_indexes = STRtree(
+            from_shapely([brooks_area.footprint for brooks_area in brooks_areas_list])
+        ).query_bulk(
+            from_shapely(
+                [
+                    react_area.polygon.representative_point()
+                    for react_area in typed_react_areas
+                ]
+            ),
+            predicate="within",
+        )
+        # The first brooks area containing the point, in the iteration order of the set
+        brooks_area_index_by_react_area: Dict[int, int] = {}
+        for react_area_index, brooks_area_index in zip(
+            representative_point_indexes, brooks_area_indexes
+        ):
+            brooks_area_index_by_react_area[react_area_index] = min(
+                brooks_area_index,
+                brooks_area_index_by_react_area.get(
+                    react_area_index, brooks_area_index
+                ),
+            )
+
+        for react_area_index, react_area in enumerate(typed_react_areas):
+            if (
+                brooks_area_index := brooks_area_index_by_react_area.get(
+                    react_area_index
+                )
+            ) is not None:
+                brooks_areas_list[brooks_area_index]._type = AreaType[
+                    react_area.properties.areaType
+                ]
 
 
 class ReactPlannerOpeningMapper:
@@ -1,10 +1,16 @@
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import asdict
 from itertools import chain
-from typing import Any, Dict, List, Optional
+from threading import Lock
+from typing import Any, Dict, List, NamedTuple, Optional, Set
 
+from marshmallow import ValidationError
 from methodtools import lru_cache
 from shapely.geometry import Point
 
-from brooks.layout_validations import SimLayoutValidations
+from brooks.layout_validations import OpeningChecksCache, SimLayoutValidations
 from brooks.models import SimLayout
 from brooks.models.violation import Violation
 from brooks.util.io import BrooksJSONEncoder
@@ -22,10 +28,44 @@ from handlers.editor_v2.schema import (
     ReactPlannerData,
     ReactPlannerSchema,
 )
-from handlers.editor_v2.utils import m_to_pixels_scale, pixels_to_meters_scale
+from handlers.editor_v2.utils import (
+    m_to_pixels_scale,
+    pixels_to_meters_scale,
+    update_planner_element_coordinates,
+)
+
+
+def _without_selection(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _without_selection(item)
+            for key, item in value.items()
+            if key != "selected"
+        }
+    if isinstance(value, list):
+        return [_without_selection(item) for item in value]
+    return value
+
+
+class AnnotationsMigrationBatch(NamedTuple):
+    last_id: Optional[int]  # None when there are no more projects to migrate
+    migrated: List[int]
+    failed: Dict[int, str]
+    # Projects saved in a newer version while the batch was being migrated
+    skipped: List[int]
 
 
 class ReactPlannerHandler:
+    ANNOTATIONS_MIGRATION_BATCH_SIZE = 100
+    # Layout violations of the latest validated annotations, by plan and layout digest.
+    # The editor validates on every save, most of them not changing the layout.
+    LAYOUT_VIOLATIONS_CACHE_SIZE = 32
+    _layout_violations_cache: "OrderedDict[str, List[Violation]]" = OrderedDict()
+    # Checks of the openings of the latest validated layout, by plan, for the saves
+    # changing the layout, see OpeningChecksCache
+    _opening_checks_cache: "OrderedDict[int, Dict[str, bool]]" = OrderedDict()
+    _layout_violations_lock = Lock()
+
     def __init__(
         self,
         plan_data: Optional[Dict] = None,
@@ -122,18 +162,35 @@ class ReactPlannerHandler:
     def _validate_plan_data(
         self, plan_id: int, schema_loaded: ReactPlannerData
     ) -> List[Violation]:
-        plan_layout: SimLayout = ReactPlannerToBrooksMapper.get_layout(
-            planner_elements=schema_loaded,
-            scaled=True,
-            post_processed=False,
-        )
+        cache_key = f"{plan_id}:{self.layout_digest(planner_data=schema_loaded)}"
+        layout_errors = self._get_cached_layout_violations(cache_key=cache_key)
+        if layout_errors is None:
+            plan_layout: SimLayout = ReactPlannerToBrooksMapper.get_layout(
+                planner_elements=schema_loaded,
+                scaled=True,
+                post_processed=False,
+            )
 
-        # layout validations
-        violations = list(SimLayoutValidations.validate(layout=plan_layout))
-        layout_errors = list(chain(plan_layout.errors, violations))
-        schema_errors = list(schema_loaded.validate())
+            # layout validations
+            opening_checks = OpeningChecksCache(
+                previous_checks=self._get_cached_opening_checks(plan_id=plan_id)
+            )
+            violations = list(
+                SimLayoutValidations.validate(
+                    layout=plan_layout, opening_checks=opening_checks
+                )
+            )
+            self._cache_opening_checks(plan_id=plan_id, checks=opening_checks.checks)
+            layout_errors = list(chain(plan_layout.errors, violations))
+            for error in layout_errors:
+                self.violation_position_to_pixels(plan_id=plan_id, violation=error)
+            self._cache_layout_violations(cache_key=cache_key, violations=layout_errors)
+        else:
+            # The schema validations expect the coordinates scaled as get_layout does
+            update_planner_element_coordinates(data=schema_loaded, scaled=True)
 
-        for error in layout_errors + schema_errors:
+        schema_errors = list(schema_loaded.validate())
+        for error in schema_errors:
             self.violation_position_to_pixels(
                 plan_id=plan_id,
                 violation=error,
@@ -141,6 +198,59 @@ class ReactPlannerHandler:
 
         return layout_errors + schema_errors
 
+    @staticmethod
+    def layout_digest(planner_data: ReactPlannerData) -> str:
+        """Hash of the annotation fields the layout is built from, ignoring the
+        selection state of the editor"""
+        layout_fields = {
+            "scale": planner_data.scale,
+            "width": planner_data.width,
+            "height": planner_data.height,
+            "layers": {
+                layer_id: _without_selection(asdict(layer))
+                for layer_id, layer in planner_data.layers.items()
+            },
+        }
+        return hashlib.sha256(
+            json.dumps(layout_fields, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    @classmethod
+    def _get_cached_layout_violations(cls, cache_key: str) -> Optional[List[Violation]]:
+        with cls._layout_violations_lock:
+            violations = cls._layout_violations_cache.get(cache_key)
+            if violations is None:
+                return None
+            cls._layout_violations_cache.move_to_end(cache_key)
+            return list(violations)
+
+    @classmethod
+    def _cache_layout_violations(cls, cache_key: str, violations: List[Violation]):
+        with cls._layout_violations_lock:
+            cls._layout_violations_cache[cache_key] = list(violations)
+            cls._layout_violations_cache.move_to_end(cache_key)
+            while len(cls._layout_violations_cache) > cls.LAYOUT_VIOLATIONS_CACHE_SIZE:
+                cls._layout_violations_cache.popitem(last=False)
+
+    @classmethod
+    def _get_cached_opening_checks(cls, plan_id: int) -> Optional[Dict[str, bool]]:
+        with cls._layout_violations_lock:
+            return cls._opening_checks_cache.get(plan_id)
+
+    @classmethod
+    def _cache_opening_checks(cls, plan_id: int, checks: Dict[str, bool]):
+        with cls._layout_violations_lock:
+            cls._opening_checks_cache[plan_id] = checks
+            cls._opening_checks_cache.move_to_end(plan_id)
+            while len(cls._opening_checks_cache) > cls.LAYOUT_VIOLATIONS_CACHE_SIZE:
+                cls._opening_checks_cache.popitem(last=False)
+
+    @classmethod
+    def clear_layout_violations_cache(cls):
+        with cls._layout_violations_lock:
+            cls._layout_violations_cache.clear()
+            cls._opening_checks_cache.clear()
+
     def violation_position_to_pixels(
         self, plan_id: int, violation: Violation
     ) -> Violation:
@@ -173,9 +283,13 @@ class ReactPlannerHandler:
                     item_pks={"id": plan_id},
                     new_values={"georef_x": None, "georef_y": None},
                 )
+            new_data = ReactPlannerSchema().dump(schema_loaded)
+            if new_data == saved_data["data"]:
+                # Saves without changes don't rewrite the whole annotation
+                return saved_data
             return ReactPlannerProjectsDBHandler.update(
                 item_pks={"id": saved_data["id"]},
-                new_values={"data": ReactPlannerSchema().dump(schema_loaded)},
+                new_values={"data": new_data},
             )
         except DBNotFoundException:
             return ReactPlannerProjectsDBHandler.add(
@@ -211,9 +325,76 @@ class ReactPlannerHandler:
         project = self.plan_data or ReactPlannerProjectsDBHandler.get_by(
             plan_id=plan_id
         )
+        # The stored annotations are upgraded by migrate_stored_annotations
         project["data"] = self.migrate_data_if_old_version(plan_data=project["data"])
         return project
 
+    @classmethod
+    def migrate_stored_annotations(
+        cls,
+        after_id: int = 0,
+        batch_size: int = ANNOTATIONS_MIGRATION_BATCH_SIZE,
+        dry_run: bool = False,
+    ) -> AnnotationsMigrationBatch:
+        """Migrates to the current version the next batch of stored annotations with
+        an id bigger than after_id. Continuing from the last id of each batch migrates
+        all the projects, restarting from scratch only revisits the failed ones."""
+        project_ids = ReactPlannerProjectsDBHandler.find_ids_not_in_version(
+            version=CURRENT_REACT_ANNOTATION_VERSION,
+            after_id=after_id,
+            limit=batch_size,
+        )
+        migrated_data_by_id: Dict[int, Dict] = {}
+        version_by_id: Dict[int, str] = {}
+        failed: Dict[int, str] = {}
+        for project in ReactPlannerProjectsDBHandler.find_in(
+            id=project_ids, output_columns=["id", "data"]
+        ):
+            version_by_id[project["id"]] = project["data"].get("version")
+            try:
+                migrated_data_by_id[project["id"]] = cls._migrate_checking_integrity(
+                    plan_data=project["data"]
+                )
+            except (ReactAnnotationMigrationException, ValidationError) as e:
+                failed[project["id"]] = str(e)
+
+        if dry_run:
+            migrated_ids: Set[int] = set(migrated_data_by_id)
+        else:
+            migrated_ids = ReactPlannerProjectsDBHandler.bulk_update_data_from_version(
+                data_by_id=migrated_data_by_id, version_by_id=version_by_id
+            )
+        return AnnotationsMigrationBatch(
+            last_id=max(project_ids) if project_ids else None,
+            migrated=sorted(migrated_ids),
+            failed=failed,
+            skipped=sorted(set(migrated_data_by_id) - migrated_ids),
+        )
+
+    @classmethod
+    def _migrate_checking_integrity(cls, plan_data: Dict) -> Dict:
+        """The migrations can only remove orphan vertices, every other element of the
+        annotation has to be kept"""
+        element_ids = cls._element_ids(plan_data=plan_data)
+        migrated_data = cls.migrate_data_if_old_version(plan_data=plan_data)
+        ReactPlannerSchema().load(migrated_data)
+        if cls._element_ids(plan_data=migrated_data) != element_ids:
+            raise ReactAnnotationMigrationException(
+                "Migration is adding or removing elements of the annotation"
+            )
+        return migrated_data
+
+    @staticmethod
+    def _element_ids(plan_data: Dict) -> Dict[str, Set[str]]:
+        return {
+            element_type: {
+                element_id
+                for layer in plan_data.get("layers", {}).values()
+                for element_id in layer.get(element_type, {})
+            }
+            for element_type in ("lines", "holes", "items", "areas")
+        }
+
     def get_image_transformation(self, plan_id: int) -> Dict:
         try:
             data = self.get_data(plan_id=plan_id)
@@ -4,6 +4,8 @@ from functools import cached_property
 from math import isclose
 from typing import Dict, List, Tuple, Union
 
+import numpy
+from pygeos import STRtree, box, distance, from_shapely, get_x, get_y, points
 from shapely.geometry import GeometryCollection, MultiPolygon, Point, Polygon
 from shapely.ops import nearest_points, unary_union
 
@@ -119,44 +121,114 @@ class ReactPlannerPostprocessor:
     def get_line_ids_from_constructed_polygons(
         self, polygons: List[Polygon], separator_type: SeparatorType
     ) -> List[List[str]]:
-
-        polygons_indexed = {i: polygon for i, polygon in enumerate(polygons)}
+        """Assigns each line to the first polygon containing all its points, or else
+        to the polygon with the smallest sum of distances to its points."""
+        pygeos_polygons = from_shapely(list(polygons))
         line_points_by_line_id = self.vertices_by_type_and_id[separator_type]
+        if not len(pygeos_polygons) or not line_points_by_line_id:
+            return [[] for _ in pygeos_polygons]
+
+        line_ids = list(line_points_by_line_id.keys())
+        points_line_index = numpy.array(
+            [
+                line_index
+                for line_index, line_points in enumerate(
+                    line_points_by_line_id.values()
+                )
+                for _ in line_points
+            ],
+            dtype=int,
+        )
+        pygeos_points = points(
+            numpy.array(
+                [
+                    (point.x, point.y)
+                    for line_points in line_points_by_line_id.values()
+                    for point in line_points
+                ],
+                dtype=float,
+            ).reshape(-1, 2)
+        )
 
-        lines_ids_by_polygon_id = defaultdict(list)
-        for line_id, line_points in line_points_by_line_id.items():
-            polygon_id = self.id_matching_polygon(
-                line_points=line_points, polygons_indexed=polygons_indexed
-            ) or self.id_nearest_polygon(
-                line_points=line_points, polygons_indexed=polygons_indexed
-            )
-
-            lines_ids_by_polygon_id[polygon_id].append(line_id)
-
-        return [lines_ids_by_polygon_id[i] for i, _ in enumerate(polygons_indexed)]
+        polygon_index_by_line = self._index_matching_polygon(
+            line_points=pygeos_points,
+            points_line_index=points_line_index,
+            number_of_lines=len(line_ids),
+            polygons=pygeos_polygons,
+        )
+        # A match with the first polygon is also resolved by distance, as it was
+        # historically the case when the polygon index was evaluated as a boolean
+        lines_by_distance = numpy.flatnonzero(polygon_index_by_line <= 0)
+        polygon_index_by_line[lines_by_distance] = self._index_nearest_polygon(
+            line_points=pygeos_points,
+            points_line_index=points_line_index,
+            lines=lines_by_distance,
+            polygons=pygeos_polygons,
+        )
 
-    def id_matching_polygon(
-        self, line_points: List[Point], polygons_indexed: Dict[int, Polygon]
-    ) -> typing.Optional[int]:
-        for polygon_id, polygon in polygons_indexed.items():
-            if all(
-                self.shapely_intersects_customized(
-                    line_point, polygon, max_distance=0.01
-                )
-                for line_point in line_points
-            ):
-                return polygon_id
-        return None
+        lines_ids_by_polygon_id: List[List[str]] = [[] for _ in pygeos_polygons]
+        for line_id, polygon_index in zip(line_ids, polygon_index_by_line):
+            lines_ids_by_polygon_id[polygon_index].append(line_id)
+        return lines_ids_by_polygon_id
 
-    def id_nearest_polygon(
-        self, line_points: List[Point], polygons_indexed: Dict[int, Polygon]
-    ) -> int:
-        distances_to_polygons = []
-        for polygon_id, polygon in polygons_indexed.items():
-            distance = sum([point.distance(polygon) for point in line_points])
-            distances_to_polygons.append((polygon_id, distance))
+    @staticmethod
+    def _index_matching_polygon(
+        line_points: numpy.ndarray,
+        points_line_index: numpy.ndarray,
+        number_of_lines: int,
+        polygons: numpy.ndarray,
+        max_distance: float = 0.01,
+    ) -> numpy.ndarray:
+        """Index of the first polygon closer than max_distance to all the points of
+        each line, -1 if there is none"""
+        x, y = get_x(line_points), get_y(line_points)
+        point_indexes, polygon_indexes = STRtree(polygons).query_bulk(
+            box(x - max_distance, y - max_distance, x + max_distance, y + max_distance)
+        )
+        close = (
+            distance(line_points[point_indexes], polygons[polygon_indexes])
+            < max_distance
+        )
+        line_polygon_pairs, number_of_close_points = numpy.unique(
+            numpy.stack(
+                [points_line_index[point_indexes[close]], polygon_indexes[close]],
+                axis=1,
+            ),
+            axis=0,
+            return_counts=True,
+        )
+        number_of_points = numpy.bincount(points_line_index, minlength=number_of_lines)
+
+        polygon_index_by_line = numpy.full(number_of_lines, -1)
+        # Unique pairs are sorted by line and then by polygon, so the first polygon
+        # of each line is the one set last when iterating them backwards
+        for (line_index, polygon_index), number_of_close in zip(
+            line_polygon_pairs[::-1], number_of_close_points[::-1]
+        ):
+            if number_of_close == number_of_points[line_index]:
+                polygon_index_by_line[line_index] = polygon_index
+        return polygon_index_by_line
 
-        return min(distances_to_polygons, key=lambda x: x[1])[0]
+    @staticmethod
+    def _index_nearest_polygon(
+        line_points: numpy.ndarray,
+        points_line_index: numpy.ndarray,
+        lines: numpy.ndarray,
+        polygons: numpy.ndarray,
+    ) -> numpy.ndarray:
+        """Index of the polygon with the smallest sum of distances to the points of
+        each of the lines"""
+        selected_points = numpy.isin(points_line_index, lines)
+        sum_of_distances = numpy.zeros((len(lines), len(polygons)))
+        # Accumulated point by point in order, as the sum of the distances of a line
+        numpy.add.at(
+            sum_of_distances,
+            numpy.searchsorted(lines, points_line_index[selected_points]),
+            distance(
+                line_points[selected_points, numpy.newaxis], polygons[numpy.newaxis]
+            ),
+        )
+        return sum_of_distances.argmin(axis=1)
 
     def get_unary_union_of_plan_separators(
         self, separators_polygons: List[Polygon]
@@ -172,10 +244,6 @@ class ReactPlannerPostprocessor:
             )
         )
 
-    @staticmethod
-    def shapely_intersects_customized(geom1, geom2, max_distance: float):
-        return geom1.distance(geom2) < max_distance
-
     @staticmethod
     def get_non_overlapped_railings(
         railing_polygons: MultiPolygon,
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import IO, Dict, List, Optional, Set, Tuple, Union
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 from methodtools import lru_cache
 from sqlalchemy.exc import IntegrityError
@@ -158,6 +158,19 @@ class FloorHandler(PlanLayoutHandlerIDCacheMixin):
         language: SUPPORTED_LANGUAGES,
         file_format: SUPPORTED_OUTPUT_FILES,
     ) -> Tuple[IO, str, Dict]:
+        [(_, _, io_image, image_filename, site_info)] = self.generate_floorplan_images(
+            floor_id=floor_id, languages=[language], file_formats=[file_format]
+        )
+        return io_image, image_filename, site_info
+
+    def generate_floorplan_images(
+        self,
+        floor_id: int,
+        languages: Iterable[SUPPORTED_LANGUAGES],
+        file_formats: Iterable[SUPPORTED_OUTPUT_FILES],
+    ) -> Iterator[Tuple[SUPPORTED_LANGUAGES, SUPPORTED_OUTPUT_FILES, IO, str, Dict]]:
+        """The layouts of the floor are loaded and plotted only once for all the
+        languages and file formats requested"""
         from handlers import ClientHandler, UnitHandler
 
         floor_info = FloorDBHandler.get_by(id=floor_id)
@@ -188,33 +201,33 @@ class FloorHandler(PlanLayoutHandlerIDCacheMixin):
             scaled=True, classified=True, postprocessed=True, georeferenced=False
         )
 
-        io_image = BrooksPlotter().generate_floor_plot(
+        for language, file_format, io_image in BrooksPlotter().generate_floor_plots(
             angle_north=90 - georef_rot_angle,
             floor_plan_layout=floor_plan_layout_scaled,
             unit_layouts=unit_layouts,
             unit_ids=[unit["client_id"] for unit in units_info],
             metadata=metadata,
             logo_content=logo_content,
-            language=language,
-            file_format=file_format,
-        )
-        logger.info(
-            f"Generated floorplan for floor id:{floor_info['id']}, "
-            f"floor number:{floor_info['floor_number']}, plan id:{floor_info['plan_id']}, "
-            f"building {building_info['id']}, site {building_info['site_id']} "
-            f"in language {language.name}"
-        )
-        image_filename = self.old_upload_content_to_gcs(
-            site_id=building_info["site_id"],
-            building_id=building_info["id"],
-            floor_id=floor_id,
-            floor_number=floor_info["floor_number"],
-            contents=io_image.read(),
-            file_format=file_format,
-            language=language,
-        )
-        io_image.seek(0)
-        return io_image, image_filename, site_info
+            languages=languages,
+            file_formats=file_formats,
+        ):
+            logger.info(
+                f"Generated floorplan for floor id:{floor_info['id']}, "
+                f"floor number:{floor_info['floor_number']}, plan id:{floor_info['plan_id']}, "
+                f"building {building_info['id']}, site {building_info['site_id']} "
+                f"in language {language.name} and format {file_format.name}"
+            )
+            image_filename = self.old_upload_content_to_gcs(
+                site_id=building_info["site_id"],
+                building_id=building_info["id"],
+                floor_id=floor_id,
+                floor_number=floor_info["floor_number"],
+                contents=io_image.read(),
+                file_format=file_format,
+                language=language,
+            )
+            io_image.seek(0)
+            yield language, file_format, io_image, image_filename, site_info
 
     @classmethod
     def old_upload_content_to_gcs(
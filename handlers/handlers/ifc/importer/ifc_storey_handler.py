@@ -1,6 +1,7 @@
 import math
 from collections import defaultdict
 from io import BytesIO
+from itertools import chain
 from typing import Dict, Optional, Union
 
 from methodtools import lru_cache
@@ -47,16 +48,24 @@ class IfcStoreyHandler:
 
         Elevator are not part of the storeys so an additional lookup in the file is required.
         """
-        geometries_by_type = defaultdict(list)
-        for ifc_element in self.ifc_reader.storey_elements(storey_id=storey_id):
-            if ifc_element.is_a() in IFC_ELEMENTS_TO_IGNORE:
-                continue
+        ifc_elements = [
+            ifc_element
+            for ifc_element in self.ifc_reader.storey_elements(storey_id=storey_id)
+            if ifc_element.is_a() not in IFC_ELEMENTS_TO_IGNORE
+        ]
+        ifc_elevators = self.ifc_reader.get_elevators()
+        # The geometries of the whole storey are generated at once using all the cores
+        self.ifc_reader.extract_ifc_2d_entities(
+            ifc_elements=chain(ifc_elements, ifc_elevators)
+        )
 
+        geometries_by_type = defaultdict(list)
+        for ifc_element in ifc_elements:
             ifc_2d_entity = self.group_geometries_of_ifc_sub_elements(ifc_element)
             if ifc_2d_entity:
                 geometries_by_type[ifc_element.is_a()].append(ifc_2d_entity)
 
-        for ifc_elevator in self.ifc_reader.get_elevators():
+        for ifc_elevator in ifc_elevators:
             ifc_2d_entity = self.group_geometries_of_ifc_sub_elements(ifc_elevator)
             if ifc_2d_entity:
                 geometries_by_type[ifc_elevator.is_a()].append(ifc_2d_entity)
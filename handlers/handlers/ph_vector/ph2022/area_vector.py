@@ -1,15 +1,19 @@
 import hashlib
-from dataclasses import asdict
+import json
+from collections import defaultdict
+from dataclasses import asdict, fields
 from functools import cached_property
-from typing import Any, Collection, Dict, Optional, Set
+from typing import Any, Collection, Dict, Iterator, List, Optional, Set
 
 import pandas as pd
+from methodtools import lru_cache
 from shapely import wkt
 from shapely.geometry import Polygon
+from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
 
 from brooks.classifications import UnifiedClassificationScheme
-from brooks.models import SimArea, SimLayout
+from brooks.models import SimArea, SimLayout, SimOpening
 from brooks.types import AreaType, FeatureType, OpeningType
 from brooks.util.geometry_ops import get_line_strings
 from common_utils.constants import (
@@ -20,10 +24,20 @@ from common_utils.constants import (
     UNIT_USAGE,
     VIEW_DIMENSION_2,
 )
+from common_utils.logger import logger
 from dufresne.polygon import get_sides_as_lines_by_length
 from handlers import PlanLayoutHandler, SiteHandler, SlamSimulationHandler, StatsHandler
 from handlers.competition import CompetitionFeaturesCalculator
-from handlers.db import BuildingDBHandler, FloorDBHandler, UnitDBHandler
+from handlers.db import (
+    AreaDBHandler,
+    BuildingDBHandler,
+    FloorDBHandler,
+    ReactPlannerProjectsDBHandler,
+    SlamSimulationDBHandler,
+    UnitAreaDBHandler,
+    UnitAreaVectorDBHandler,
+    UnitDBHandler,
+)
 from handlers.ph_vector.ph2022.area_vector_schema import (
     AreaVectorSchema,
     AreaVectorStatsSchema,
@@ -33,11 +47,19 @@ from handlers.ph_vector.ph2022.area_vector_schema import (
     NeufertAreaVectorSchema,
     NeufertGeometryVectorSchema,
 )
-from handlers.ph_vector.ph2022.utils import vector_stats_format_value, vector_stats_key
+from handlers.ph_vector.ph2022.utils import (
+    json_compatible_values,
+    vector_stats_format_value,
+    vector_stats_key,
+)
 from simulations.room_shapes import get_room_shapes
 
 VECTOR_MIN_CORRIDOR_WIDTH = 1.2
 VECTOR_STATS_DEFAULT_FIELDS = {"min", "max", "stddev", "mean", "median", "p20", "p80"}
+# Version of the persisted area vectors, increase it to recompute them after changing
+# how the vector is computed
+AREA_VECTOR_VERSION = 1
+PERIMETER_SAFETY_BUFFER = 0.001
 
 
 class LayoutFeatures:
@@ -87,48 +109,57 @@ class LayoutFeatures:
             ),
         }
 
+    @staticmethod
+    def _buffered_union(sim_element_footprints: Collection[Polygon]) -> BaseGeometry:
+        return unary_union(sim_element_footprints).buffer(PERIMETER_SAFETY_BUFFER)
+
+    @lru_cache()
+    def _layout_elements_footprints(self, layout: SimLayout) -> Dict[str, BaseGeometry]:
+        """Buffered union of the elements of each perimeter type of the layout,
+        computed once per layout and shared by all its areas."""
+        return {
+            "layout_window_perimeter": self._buffered_union(
+                [
+                    element.footprint
+                    for element in layout.openings_by_type[OpeningType.WINDOW]
+                ]
+            ),
+            "layout_door_perimeter": self._buffered_union(
+                [element.footprint for element in layout.doors]
+            ),
+            "layout_open_perimeter": self._buffered_union(
+                [element.footprint for element in layout.area_splitters]
+            ),
+            "layout_railing_perimeter": self._buffered_union(
+                [element.footprint for element in layout.railings]
+            ),
+        }
+
     @staticmethod
     def _area_perimeter_intersection(
-        area_footprint: Polygon, sim_element_footprints: Collection[Polygon]
+        area_footprint: Polygon, elements_footprint: BaseGeometry
     ) -> float:
-        safety_buffer = 0.001
         area_footprint_perimeter = [area_footprint.exterior, *area_footprint.interiors]
-        elements_footprint = unary_union(sim_element_footprints).buffer(safety_buffer)
         return sum(
             line.length
             for linear_ring in area_footprint_perimeter
             for line in get_line_strings(linear_ring.intersection(elements_footprint))
         )
 
-    @classmethod
     def _area_perimeter_features(
-        cls, area: SimArea, layout: SimLayout
+        self, area: SimArea, layout: SimLayout
     ) -> Dict[str, float]:
         return {
             "layout_perimeter": area.footprint.length,
-            "layout_window_perimeter": cls._area_perimeter_intersection(
-                area_footprint=area.footprint,
-                sim_element_footprints=[
-                    element.footprint
-                    for element in layout.openings_by_type[OpeningType.WINDOW]
-                ],
-            ),
-            "layout_door_perimeter": cls._area_perimeter_intersection(
-                area_footprint=area.footprint,
-                sim_element_footprints=[element.footprint for element in layout.doors],
-            ),
-            "layout_open_perimeter": cls._area_perimeter_intersection(
-                area_footprint=area.footprint,
-                sim_element_footprints=[
-                    element.footprint for element in layout.area_splitters
-                ],
-            ),
-            "layout_railing_perimeter": cls._area_perimeter_intersection(
-                area_footprint=area.footprint,
-                sim_element_footprints=[
-                    element.footprint for element in layout.railings
-                ],
-            ),
+            **{
+                feature_name: self._area_perimeter_intersection(
+                    area_footprint=area.footprint,
+                    elements_footprint=elements_footprint,
+                )
+                for feature_name, elements_footprint in self._layout_elements_footprints(
+                    layout
+                ).items()
+            },
         }
 
     @staticmethod
@@ -138,20 +169,29 @@ class LayoutFeatures:
             for opening in layout.areas_openings[area.id]
         )
 
-    @staticmethod
+    @lru_cache()
+    def _layout_openings_areas(
+        self, layout: SimLayout
+    ) -> Dict[SimOpening, Set[SimArea]]:
+        """Adjacency map from each opening of the layout to the areas it belongs to"""
+        areas_by_id = {area.id: area for area in layout.areas}
+        openings_areas: Dict[SimOpening, Set[SimArea]] = defaultdict(set)
+        for area_id, openings in layout.areas_openings.items():
+            for opening in openings:
+                openings_areas[opening].add(areas_by_id[area_id])
+        return openings_areas
+
     def _area_connects_to_area_type(
-        area: SimArea, layout: SimLayout, target_types: Set[AreaType]
+        self, area: SimArea, layout: SimLayout, target_types: Set[AreaType]
     ) -> bool:
-        other_areas = layout.areas - {area}
-        for opening in layout.areas_openings[area.id]:
-            if opening.is_door:
-                for other_area in other_areas:
-                    if (
-                        other_area.type in target_types
-                        and opening in layout.areas_openings[other_area.id]
-                    ):
-                        return True
-        return False
+        openings_areas = self._layout_openings_areas(layout)
+        return any(
+            other_area.type in target_types
+            for opening in layout.areas_openings[area.id]
+            if opening.is_door
+            for other_area in openings_areas[opening]
+            if other_area != area
+        )
 
     def _get_net_area(self, area: SimArea) -> float:
         return (
@@ -235,6 +275,10 @@ class AreaVectorStats:
             ),
         ]
 
+    @classmethod
+    def get_task_types(cls) -> Set[TASK_TYPE]:
+        return {config["task_type"] for config in cls._get_area_vector_stats_config()}
+
     @staticmethod
     def _get_area_vector_stats(
         site_id: int,
@@ -284,11 +328,15 @@ class AreaVectorStats:
 
 class BiggestRectangles:
     @staticmethod
-    def get_biggest_rectangles(site_id: int) -> Dict[int, BiggestRectangleSchema]:
+    def get_biggest_rectangles(
+        site_id: int, unit_ids: Optional[Set[int]] = None
+    ) -> Dict[int, BiggestRectangleSchema]:
         biggest_rectangles = {}
         for unit_results in SlamSimulationHandler.get_all_results(
             site_id=site_id, task_type=TASK_TYPE.BIGGEST_RECTANGLE
         ):
+            if unit_ids is not None and unit_results["unit_id"] not in unit_ids:
+                continue
             for area_id, biggest_rectangle_wkt in unit_results["results"].items():
                 biggest_rectangle = wkt.loads(biggest_rectangle_wkt)
                 small_side, long_side = get_sides_as_lines_by_length(
@@ -327,34 +375,52 @@ class FloorFeatures:
 
 
 class AreaVector:
+    _vector_schema: type = AreaVectorSchema
+
     def __init__(self, site_id: int):
         self._site_id = site_id
         self._classification_scheme = UnifiedClassificationScheme()
 
+    @cached_property
+    def _residential_units_info(self) -> list[dict]:
+        return UnitDBHandler.find(
+            site_id=self._site_id,
+            unit_usage=UNIT_USAGE.RESIDENTIAL.name,
+            output_columns=[
+                "id",
+                "floor_id",
+                "plan_id",
+                "client_id",
+                "representative_unit_client_id",
+            ],
+        )
+
     def _get_units_info(self, representative_units_only: bool):
         return (
             unit_info
-            for unit_info in UnitDBHandler.find(
-                site_id=self._site_id,
-                unit_usage=UNIT_USAGE.RESIDENTIAL.name,
-                output_columns=[
-                    "id",
-                    "floor_id",
-                    "client_id",
-                    "representative_unit_client_id",
-                ],
-            )
+            for unit_info in self._residential_units_info
             if (unit_info["client_id"] == unit_info["representative_unit_client_id"])
             or not representative_units_only
         )
 
-    @cached_property
-    def _units_layout(self):
+    @lru_cache()
+    def _get_layout_handler(self, plan_id: int) -> PlanLayoutHandler:
+        return PlanLayoutHandler(plan_id=plan_id)
+
+    def _get_units_layout(self, unit_ids: Set[int]) -> Dict[int, SimLayout]:
+        floor_ids_by_plan: Dict[int, Set[int]] = defaultdict(set)
+        for unit_info in self._get_units_info(representative_units_only=False):
+            if unit_info["id"] in unit_ids:
+                floor_ids_by_plan[unit_info["plan_id"]].add(unit_info["floor_id"])
+
         return {
             unit_info["id"]: unit_layout
-            for unit_info, unit_layout in SiteHandler.get_unit_layouts(
-                site_id=self._site_id, scaled=True
-            )
+            for plan_id, floor_ids in floor_ids_by_plan.items()
+            for floor_id in floor_ids
+            for unit_info, unit_layout in self._get_layout_handler(
+                plan_id=plan_id
+            ).get_unit_layouts(floor_id=floor_id, scaled=True)
+            if unit_info["id"] in unit_ids
         }
 
     @cached_property
@@ -367,54 +433,222 @@ class AreaVector:
             )
         }
 
-    def _get_floors_public_layouts(self):
-        plan_ids = {f["plan_id"] for f in self._floors_info.values()}
+    def _get_floors_public_layouts(self, floor_ids: Set[int]) -> Dict[int, SimLayout]:
+        plan_ids = {self._floors_info[floor_id]["plan_id"] for floor_id in floor_ids}
         plans_public_layouts = {
-            plan_id: PlanLayoutHandler(plan_id=plan_id).get_public_layout()
+            plan_id: self._get_layout_handler(plan_id=plan_id).get_public_layout()
             for plan_id in plan_ids
         }
         return {
-            floor_id: plans_public_layouts[floor_info["plan_id"]]
-            for floor_id, floor_info in self._floors_info.items()
+            floor_id: plans_public_layouts[self._floors_info[floor_id]["plan_id"]]
+            for floor_id in floor_ids
         }
 
-    def get_vector(self, representative_units_only: bool) -> list[AreaVectorSchema]:
+    def _get_units_fingerprint(self) -> Dict[int, str]:
+        """The vector of a unit only depends on the latest simulation runs of the
+        site, the annotation of its plan, its floor number and the classification
+        of its areas"""
+        run_ids = {
+            task_type.name: SlamSimulationDBHandler.get_latest_run_id(
+                site_id=self._site_id, task_type=task_type
+            )
+            for task_type in AreaVectorStats.get_task_types()
+            | {TASK_TYPE.BIGGEST_RECTANGLE}
+        }
+        units_info = list(self._get_units_info(representative_units_only=False))
+        annotation_revisions = {
+            project["plan_id"]: project["updated"] or project["created"]
+            for project in ReactPlannerProjectsDBHandler.find_in(
+                plan_id=list({unit_info["plan_id"] for unit_info in units_info}),
+                output_columns=["plan_id", "created", "updated"],
+            )
+        }
+        units_areas = self._get_units_areas(
+            unit_ids=[unit_info["id"] for unit_info in units_info]
+        )
+        return {
+            unit_info["id"]: hashlib.md5(
+                json.dumps(
+                    {
+                        "version": AREA_VECTOR_VERSION,
+                        "run_ids": run_ids,
+                        "annotation_revision": annotation_revisions.get(
+                            unit_info["plan_id"]
+                        ),
+                        "floor_number": self._floors_info[unit_info["floor_id"]][
+                            "floor_number"
+                        ],
+                        "areas": units_areas.get(unit_info["id"], []),
+                    },
+                    sort_keys=True,
+                    default=str,
+                ).encode("utf-8")
+            ).hexdigest()
+            for unit_info in units_info
+        }
+
+    @staticmethod
+    def _get_units_areas(unit_ids: List[int]) -> Dict[int, List[List[Any]]]:
+        """Area ids and types of each unit, as reclassifying an area or changing
+        the areas of a unit does not touch the annotation of the plan"""
+        area_ids_by_unit: Dict[int, List[int]] = defaultdict(list)
+        for unit_area in UnitAreaDBHandler.find_in(
+            unit_id=unit_ids, output_columns=["unit_id", "area_id"]
+        ):
+            area_ids_by_unit[unit_area["unit_id"]].append(unit_area["area_id"])
+
+        area_types = {
+            area["id"]: area["area_type"]
+            for area in AreaDBHandler.find_in(
+                id=list(
+                    {
+                        area_id
+                        for area_ids in area_ids_by_unit.values()
+                        for area_id in area_ids
+                    }
+                ),
+                output_columns=["id", "area_type"],
+            )
+        }
+        return {
+            unit_id: sorted([area_id, area_types.get(area_id)] for area_id in area_ids)
+            for unit_id, area_ids in area_ids_by_unit.items()
+        }
+
+    def _compute_units_vector(
+        self, unit_ids: Set[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        units_info = [
+            unit_info
+            for unit_info in self._get_units_info(representative_units_only=False)
+            if unit_info["id"] in unit_ids
+        ]
+        floor_ids = {unit_info["floor_id"] for unit_info in units_info}
+
         vector_stats = AreaVectorStats.get_vector_stats(site_id=self._site_id)
         vector_stats_default_values = AreaVectorStatsSchema()
         biggest_rectangles = BiggestRectangles.get_biggest_rectangles(
-            site_id=self._site_id
+            site_id=self._site_id, unit_ids=unit_ids
         )
         biggest_rectangles_default_values = BiggestRectangleSchema()
+        units_layout = self._get_units_layout(unit_ids=unit_ids)
         layout_features = LayoutFeatures(
-            layouts=self._units_layout.values()
+            layouts=units_layout.values()
         ).get_area_features()
         floor_features = FloorFeatures(
-            floors_info=self._floors_info,
-            floors_public_layout=self._get_floors_public_layouts(),
+            floors_info={
+                floor_id: self._floors_info[floor_id] for floor_id in floor_ids
+            },
+            floors_public_layout=self._get_floors_public_layouts(floor_ids=floor_ids),
         ).get_floor_features()
-        return [
-            AreaVectorSchema(
-                apartment_id=unit_info["client_id"],
-                **asdict(floor_features[unit_info["floor_id"]]),
-                **asdict(layout_features[area.db_area_id]),
-                **asdict(
-                    biggest_rectangles.get(
-                        area.db_area_id, biggest_rectangles_default_values
-                    )
-                ),
-                **asdict(
-                    vector_stats.get(unit_info["id"], {}).get(
-                        area.db_area_id, vector_stats_default_values
-                    )
-                ),
+        return {
+            unit_info["id"]: [
+                json_compatible_values(
+                    {
+                        "area_id": area.db_area_id,
+                        **asdict(floor_features[unit_info["floor_id"]]),
+                        **asdict(layout_features[area.db_area_id]),
+                        **asdict(
+                            biggest_rectangles.get(
+                                area.db_area_id, biggest_rectangles_default_values
+                            )
+                        ),
+                        **asdict(
+                            vector_stats.get(unit_info["id"], {}).get(
+                                area.db_area_id, vector_stats_default_values
+                            )
+                        ),
+                    }
+                )
+                for area in units_layout[unit_info["id"]].areas
+                if area.type in self._classification_scheme.ROOM_VECTOR_NAMING
+            ]
+            for unit_info in units_info
+        }
+
+    @cached_property
+    def _units_vector(self) -> Dict[int, List[Dict[str, Any]]]:
+        """Area vector rows of every residential unit of the site. The persisted rows
+        of a unit are reused while its fingerprint is unchanged, only the units with
+        new simulation runs or annotations are recomputed and persisted again."""
+        fingerprints = self._get_units_fingerprint()
+        units_vector = {
+            unit_vector["unit_id"]: unit_vector["vector"]
+            for unit_vector in UnitAreaVectorDBHandler.find_in(
+                unit_id=list(fingerprints),
+                output_columns=["unit_id", "fingerprint", "vector"],
             )
-            for unit_info in self._get_units_info(
-                representative_units_only=representative_units_only
+            if unit_vector["fingerprint"] == fingerprints[unit_vector["unit_id"]]
+        }
+
+        if outdated_unit_ids := set(fingerprints) - set(units_vector):
+            logger.info(
+                f"Computing area vector of {len(outdated_unit_ids)} units "
+                f"of site {self._site_id}"
+            )
+            outdated_units_vector = self._compute_units_vector(
+                unit_ids=outdated_unit_ids
+            )
+            UnitAreaVectorDBHandler.bulk_upsert(
+                items=[
+                    {
+                        "unit_id": unit_id,
+                        "fingerprint": fingerprints[unit_id],
+                        "vector": unit_vector,
+                    }
+                    for unit_id, unit_vector in outdated_units_vector.items()
+                ],
+                index_elements=["unit_id"],
+            )
+            units_vector.update(outdated_units_vector)
+
+        return units_vector
+
+    def _make_vector_row(
+        self, unit_info: Dict[str, Any], area_vector: Dict[str, Any], anonymized: bool
+    ) -> Dict[str, Any]:
+        return {
+            "apartment_id": unit_info["client_id"],
+            **{
+                field_name: value
+                for field_name, value in area_vector.items()
+                if field_name != "area_id"
+            },
+        }
+
+    def _get_vector_rows(
+        self, representative_units_only: bool, anonymized: bool
+    ) -> Iterator[Dict[str, Any]]:
+        for unit_info in self._get_units_info(
+            representative_units_only=representative_units_only
+        ):
+            for area_vector in self._units_vector[unit_info["id"]]:
+                yield self._make_vector_row(
+                    unit_info=unit_info, area_vector=area_vector, anonymized=anonymized
+                )
+
+    def get_vector(self, representative_units_only: bool) -> list[AreaVectorSchema]:
+        return [
+            AreaVectorSchema(**row)
+            for row in self._get_vector_rows(
+                representative_units_only=representative_units_only, anonymized=False
             )
-            for area in self._units_layout[unit_info["id"]].areas
-            if area.type in self._classification_scheme.ROOM_VECTOR_NAMING
         ]
 
+    def get_vector_dataframe(
+        self, representative_units_only: bool, anonymized: bool = True
+    ) -> pd.DataFrame:
+        """Same rows as get_vector as a dataframe with one column per schema field"""
+        return pd.DataFrame(
+            list(
+                self._get_vector_rows(
+                    representative_units_only=representative_units_only,
+                    anonymized=anonymized,
+                )
+            ),
+            columns=[field.name for field in fields(self._vector_schema)],
+        )
+
 
 class NeufertAreaVector(AreaVector):
     """Our vector for simulation version PH_2022_H1 which also includes the internal
@@ -424,6 +658,8 @@ class NeufertAreaVector(AreaVector):
     Used for https://zenodo.org/record/7070952
     """
 
+    _vector_schema = NeufertAreaVectorSchema
+
     @cached_property
     def _floors_info(self):
         return {
@@ -440,50 +676,29 @@ class NeufertAreaVector(AreaVector):
             )
         }
 
+    def _make_vector_row(
+        self, unit_info: Dict[str, Any], area_vector: Dict[str, Any], anonymized: bool
+    ) -> Dict[str, Any]:
+        return {
+            "site_id": self._site_id,
+            "building_id": self._floors_info[unit_info["floor_id"]]["building_id"],
+            "floor_id": unit_info["floor_id"],
+            "unit_id": unit_info["id"],
+            "apartment_id": hashlib.md5(
+                unit_info["client_id"].encode("utf-8")
+            ).hexdigest()
+            if anonymized
+            else unit_info["client_id"],
+            **area_vector,
+        }
+
     def get_vector(self, representative_units_only: bool, anonymized: bool = True):
-        vector_stats = AreaVectorStats.get_vector_stats(site_id=self._site_id)
-        vector_stats_default_values = AreaVectorStatsSchema()
-        biggest_rectangles = BiggestRectangles.get_biggest_rectangles(
-            site_id=self._site_id
-        )
-        biggest_rectangles_default_values = BiggestRectangleSchema()
-        layout_features = LayoutFeatures(
-            layouts=self._units_layout.values()
-        ).get_area_features()
-        floor_features = FloorFeatures(
-            floors_info=self._floors_info,
-            floors_public_layout=self._get_floors_public_layouts(),
-        ).get_floor_features()
         return [
-            NeufertAreaVectorSchema(
-                site_id=self._site_id,
-                building_id=self._floors_info[unit_info["floor_id"]]["building_id"],
-                floor_id=unit_info["floor_id"],
-                unit_id=unit_info["id"],
-                area_id=area.db_area_id,
-                apartment_id=hashlib.md5(
-                    unit_info["client_id"].encode("utf-8")
-                ).hexdigest()
-                if anonymized
-                else unit_info["client_id"],
-                **asdict(floor_features[unit_info["floor_id"]]),
-                **asdict(layout_features[area.db_area_id]),
-                **asdict(
-                    biggest_rectangles.get(
-                        area.db_area_id, biggest_rectangles_default_values
-                    )
-                ),
-                **asdict(
-                    vector_stats.get(unit_info["id"], {}).get(
-                        area.db_area_id, vector_stats_default_values
-                    )
-                ),
+            NeufertAreaVectorSchema(**row)
+            for row in self._get_vector_rows(
+                representative_units_only=representative_units_only,
+                anonymized=anonymized,
             )
-            for unit_info in self._get_units_info(
-                representative_units_only=representative_units_only
-            )
-            for area in self._units_layout[unit_info["id"]].areas
-            if area.type in self._classification_scheme.ROOM_VECTOR_NAMING
         ]
 
 
@@ -536,24 +751,35 @@ class NeufertGeometryVector(NeufertAreaVector):
             columns=["area_id", "entity_type", "entity_subtype", "geometry"],
         )
 
+    _vector_schema = NeufertGeometryVectorSchema
+
+    def _get_vector_rows(
+        self, representative_units_only: bool, anonymized: bool
+    ) -> Iterator[Dict[str, Any]]:
+        for unit_info in self._get_units_info(
+            representative_units_only=representative_units_only
+        ):
+            for _, geometry_row in self.get_geometry(
+                unit_layout=self._units_layout[unit_info["id"]]
+            ).iterrows():
+                yield dict(
+                    site_id=self._site_id,
+                    building_id=self._floors_info[unit_info["floor_id"]]["building_id"],
+                    floor_id=unit_info["floor_id"],
+                    unit_id=unit_info["id"],
+                    apartment_id=hashlib.md5(
+                        unit_info["client_id"].encode("utf-8")
+                    ).hexdigest()
+                    if anonymized
+                    else unit_info["client_id"],
+                    **geometry_row.to_dict(),
+                )
+
     def get_vector(self, representative_units_only: bool, anonymized: bool = True):
         return [
-            NeufertGeometryVectorSchema(
-                site_id=self._site_id,
-                building_id=self._floors_info[unit_info["floor_id"]]["building_id"],
-                floor_id=unit_info["floor_id"],
-                unit_id=unit_info["id"],
-                apartment_id=hashlib.md5(
-                    unit_info["client_id"].encode("utf-8")
-                ).hexdigest()
-                if anonymized
-                else unit_info["client_id"],
-                **geometry_row.to_dict(),
+            NeufertGeometryVectorSchema(**row)
+            for row in self._get_vector_rows(
+                representative_units_only=representative_units_only,
+                anonymized=anonymized,
             )
-            for unit_info in self._get_units_info(
-                representative_units_only=representative_units_only
-            )
-            for _, geometry_row in self.get_geometry(
-                unit_layout=self._units_layout[unit_info["id"]]
-            ).iterrows()
         ]
@@ -1,6 +1,6 @@
 import math
 from datetime import datetime
-from typing import Union
+from typing import Any, Dict, Union
 
 from common_utils.constants import TASK_TYPE
 
@@ -26,3 +26,11 @@ def vector_stats_format_value(task_type: TASK_TYPE, value: Union[float, None]):
     if task_type == TASK_TYPE.VIEW_SUN and value is not None:
         return value / (4 * math.pi)
     return value
+
+
+def json_compatible_values(row: Dict[str, Any]) -> Dict[str, Any]:
+    """NaN is not valid JSON, so it is replaced by None as for missing values"""
+    return {
+        key: None if isinstance(value, float) and math.isnan(value) else value
+        for key, value in row.items()
+    }
@@ -234,7 +234,7 @@ class PlanLayoutHandler:
         public_areas = {
             area["id"] for area in self.areas_db if area["id"] not in private_areas
         }
-        return UnitLayoutFactory(plan_layout=plan_layout).create_sub_layout(
+        return self.get_unit_layout_factory(plan_layout=plan_layout).create_sub_layout(
             spaces_ids={
                 space.id
                 for space in plan_layout.spaces
@@ -258,7 +258,7 @@ class PlanLayoutHandler:
                 unit_id=list(UnitDBHandler.find_ids(plan_id=self.plan_id)),
             )
         }
-        return UnitLayoutFactory(plan_layout=plan_layout).create_sub_layout(
+        return self.get_unit_layout_factory(plan_layout=plan_layout).create_sub_layout(
             spaces_ids={
                 space.id
                 for space in plan_layout.spaces
@@ -301,16 +301,27 @@ class PlanLayoutHandler:
             for space in plan_layout.spaces
             for area in space.areas
         }
-        for unit_info in units_info:
-            yield unit_info, UnitLayoutFactory(
-                plan_layout=plan_layout
-            ).create_sub_layout(
-                spaces_ids={
+        unit_layouts = self.get_unit_layout_factory(
+            plan_layout=plan_layout
+        ).create_sub_layouts(
+            spaces_ids_by_unit=[
+                {
                     brooks_space_by_db_area[db_area_id]
                     for db_area_id in units_areas[unit_info["id"]]
-                },
-                area_db_ids=set(units_areas[unit_info["id"]]),
-            )
+                }
+                for unit_info in units_info
+            ],
+            area_db_ids_by_unit=[
+                set(units_areas[unit_info["id"]]) for unit_info in units_info
+            ],
+        )
+        yield from zip(units_info, unit_layouts)
+
+    @lru_cache()
+    def get_unit_layout_factory(self, plan_layout: SimLayout) -> UnitLayoutFactory:
+        """The factory keeps the prepared geometries of the plan elements, so it is
+        reused for all the units created from the same (cached) plan layout"""
+        return UnitLayoutFactory(plan_layout=plan_layout)
 
     def get_georeferencing_transformation(
         self,
@@ -14,9 +14,13 @@ from common_utils.constants import (
 )
 from common_utils.exceptions import QuavisSimulationException
 from dufresne.solar_from_wgs84 import get_solar_parameters_from_wgs84
-from simulations.view.view_wrapper import ViewWrapper
+from simulations.view.view_wrapper import QuavisResults, ViewWrapper
 from surroundings.utils import SurrTrianglesType
 
+# Key of the quavis input metadata with the offset and number of the observation
+# points of each area, in the order they were added to the quavis input
+OBS_POINTS_INDEX_KEY = "obs_points_index"
+
 
 class QuavisHandler:
     # METHODS IMPLEMENTED FOR SLAM AND POTENTIAL VIEW IN SUBCLASSES
@@ -86,8 +90,19 @@ class QuavisHandler:
             obs_height=obs_height,
             simulation_version=simulation_version,
         )
-        for _, obs_points_by_area in sorted(obs_points_by_unit.items()):
-            for _, obs_points in sorted(obs_points_by_area.items()):
+        obs_points_index = []
+        offset = 0
+        for unit_id, obs_points_by_area in sorted(obs_points_by_unit.items()):
+            for area_id, obs_points in sorted(obs_points_by_area.items()):
+                obs_points_index.append(
+                    {
+                        "unit_id": unit_id,
+                        "area_id": area_id,
+                        "offset": offset,
+                        "count": len(obs_points),
+                    }
+                )
+                offset += len(obs_points)
                 for obs_point in obs_points:
                     wrapper.add_observation_point(
                         obs_point,
@@ -119,9 +134,11 @@ class QuavisHandler:
                 triangle_array[:, :, [0, 1]] = triangle_array[:, :, [1, 0]]
                 wrapper.add_triangles(triangle_array, group=group)
 
-        return wrapper.generate_input(
+        quavis_input = wrapper.generate_input(
             run_volume=True, run_area=True, run_sun=True, use_sun_v2=cls.use_sun_v2()
         )
+        quavis_input["quavis"]["metaData"][OBS_POINTS_INDEX_KEY] = obs_points_index
+        return quavis_input
 
     @classmethod
     def get_quavis_results(
@@ -157,75 +174,127 @@ class QuavisHandler:
         wrapper = ViewWrapper.load_wrapper_from_input_no_geometries(
             input_data=quavis_input
         )
-        quavis_results = wrapper.parse_quavis_output(output_data=quavis_output)
-
-        obs_point_index = 0
-        obs_points_by_unit = cls.get_obs_points_by_area(
-            entity_info=entity_info,
-            grid_resolution=grid_resolution,
-            grid_buffer=grid_buffer,
-            obs_height=obs_height,
-            simulation_version=simulation_version,
+        quavis_results = wrapper.parse_quavis_output_arrays(output_data=quavis_output)
+        results_by_dimension = cls._get_results_by_dimension(
+            quavis_results=quavis_results,
+            datetimes=datetimes,
+            dimensions_mapping=dimensions_mapping,
         )
 
+        obs_points_index = quavis_input["quavis"]["metaData"].get(OBS_POINTS_INDEX_KEY)
+        if obs_points_index is None:
+            # Inputs generated before the index was stored in the metadata
+            obs_points_index = cls._get_obs_points_index(
+                quavis_results=quavis_results,
+                obs_points_by_unit=cls.get_obs_points_by_area(
+                    entity_info=entity_info,
+                    grid_resolution=grid_resolution,
+                    grid_buffer=grid_buffer,
+                    obs_height=obs_height,
+                    simulation_version=simulation_version,
+                ),
+                grid_resolution=grid_resolution,
+            )
+
+        if sum(area["count"] for area in obs_points_index) != len(
+            quavis_results.positions
+        ):
+            raise QuavisSimulationException(
+                f"The observation points of the areas don't match the "
+                f"{len(quavis_results.positions)} observation points of the quavis "
+                f"input of {entity_info['id']}"
+            )
+
         site_results: DefaultDict[
-            Union[int, str], dict[Union[int, str], DefaultDict[str, list]]
+            Union[int, str], dict[Union[int, str], dict[str, list]]
         ] = defaultdict(dict)
+        for area in obs_points_index:
+            if not area["count"]:
+                site_results[area["unit_id"]][area["area_id"]] = {}
+                continue
+            # Views of the site arrays, only converted to lists when stored
+            area_slice = slice(area["offset"], area["offset"] + area["count"])
+            site_results[area["unit_id"]][area["area_id"]] = {
+                "observation_points": quavis_results.positions[area_slice],
+                **{
+                    dimension: values[area_slice]
+                    for dimension, values in results_by_dimension.items()
+                },
+            }
+
+        return site_results
+
+    @classmethod
+    def _get_obs_points_index(
+        cls,
+        quavis_results: QuavisResults,
+        obs_points_by_unit: dict[Any, dict[Any, np.ndarray]],
+        grid_resolution: float,
+    ) -> list[dict]:
+        """Index of the observation points of each area regenerated from the layouts,
+        checking that they match the positions of the quavis input"""
+        obs_points_index = []
+        offset = 0
         for unit_id, obs_points_by_area in sorted(obs_points_by_unit.items()):
             for area_db_id, obs_points in sorted(obs_points_by_area.items()):
-                site_results[unit_id][area_db_id] = defaultdict(list)
-                for i, obs_point in enumerate(obs_points):
-                    obs_point_quavis = quavis_results[obs_point_index + i]
-                    if (
-                        np.linalg.norm(obs_point_quavis["position"] - obs_point)
-                        > grid_resolution * 1e-3
-                    ):
-                        raise QuavisSimulationException(
-                            "Observation point calculated before the quavis execution "
-                            "doesn't match with the observation point afterwards:"
-                            f"Quavis: {obs_point_quavis['position']}. Now: {obs_point}. "
-                            f"Area id: {area_db_id} of unit {unit_id}"
-                        )
-
-                    site_results[unit_id][area_db_id]["observation_points"].append(
-                        obs_point_quavis["position"]
+                obs_points = np.asarray(obs_points, dtype=float).reshape(-1, 3)
+                quavis_positions = quavis_results.positions[
+                    offset : offset + len(obs_points)
+                ]
+                if len(quavis_positions) != len(obs_points):
+                    raise QuavisSimulationException(
+                        f"Area id: {area_db_id} of unit {unit_id} has more observation "
+                        f"points than the quavis input"
                     )
-
-                    obs_point_result = cls._get_results_of_obs_point(
-                        obs_point_quavis,
-                        datetimes=datetimes,
-                        dimensions_mapping=dimensions_mapping,
+                distances = np.linalg.norm(quavis_positions - obs_points, axis=1)
+                mismatches = np.flatnonzero(distances > grid_resolution * 1e-3)
+                if mismatches.size:
+                    i = mismatches[0]
+                    raise QuavisSimulationException(
+                        "Observation point calculated before the quavis execution "
+                        "doesn't match with the observation point afterwards:"
+                        f"Quavis: {quavis_positions[i]}. Now: {obs_points[i]}. "
+                        f"Area id: {area_db_id} of unit {unit_id}"
                     )
-                    for dimension, value in obs_point_result.items():
-                        site_results[unit_id][area_db_id][dimension].append(value)
-
-                obs_point_index += len(obs_points)
+                obs_points_index.append(
+                    {
+                        "unit_id": unit_id,
+                        "area_id": area_db_id,
+                        "offset": offset,
+                        "count": len(obs_points),
+                    }
+                )
+                offset += len(obs_points)
 
-        return site_results
+        return obs_points_index
 
     @classmethod
-    def _get_results_of_obs_point(
+    def _get_results_by_dimension(
         cls,
-        obs_point_result: dict,
+        quavis_results: QuavisResults,
         datetimes: list,
         dimensions_mapping: dict[str, str],
-    ) -> dict:
-        values = defaultdict(int)
+    ) -> dict[str, np.ndarray]:
+        """Values of every dimension for all the observation points"""
+        number_of_obs_points = len(quavis_results.positions)
+        values: dict[str, np.ndarray] = {}
 
         # SUN
-        for idx, v in enumerate(obs_point_result["simulations"]["sun"]):
-            key = "sun-" + str(datetimes[idx])
-            values[key] = v
+        if quavis_results.sun is not None:
+            for idx, sun_values in enumerate(quavis_results.sun.T):
+                values["sun-" + str(datetimes[idx])] = sun_values
 
         # VIEW
-        view_sim_values: dict = obs_point_result["simulations"]["area_by_group"]
-        renamed_fields = set(dimensions_mapping.keys())
-        computed_fields = set(view_sim_values.keys())
-        for key in computed_fields.union(renamed_fields):
-            normalized_name = dimensions_mapping.get(key, key)
-            values[normalized_name] += view_sim_values.get(key, 0)
-
-        values["isovist"] = obs_point_result["simulations"]["volume"]
-        values["sky"] = 4 * np.pi - obs_point_result["simulations"]["area"]
+        for normalized_name in set(dimensions_mapping.values()):
+            values[normalized_name] = np.zeros(number_of_obs_points)
+        for group_idx, group in enumerate(quavis_results.groups):
+            normalized_name = dimensions_mapping.get(group, group)
+            values[normalized_name] = (
+                values.get(normalized_name, 0)
+                + quavis_results.area_by_group[:, group_idx]
+            )
+
+        values["isovist"] = quavis_results.volume
+        values["sky"] = 4 * np.pi - quavis_results.area
 
         return values
@@ -0,0 +1,304 @@
+import json
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from pygeos import STRtree, from_shapely, points
+from shapely import wkt
+from shapely.geometry import Polygon
+from sqlalchemy import or_
+
+from common_utils.constants import POTENTIAL_SIMULATION_STATUS, SIMULATION_TYPE
+from common_utils.exceptions import DBMultipleResultsException, DBNotFoundException
+from common_utils.logger import logger
+from handlers.db import PotentialSimulationDBHandler
+
+IndexKey = Tuple[int, SIMULATION_TYPE]
+
+
+class _IndexedSimulation(NamedTuple):
+    key: IndexKey
+    footprint: Polygon
+    revision: str  # last change of the row, payloads of older revisions are stale
+
+
+class _IndexState(NamedTuple):
+    simulations: Dict[int, _IndexedSimulation]
+    trees: Dict[IndexKey, Tuple[STRtree, List[int]]]
+
+
+class PotentialSimulationLocationIndex:
+    """In process spatial index of the successful potential simulations, answering
+    the location queries of the potential API without a DB round trip.
+
+    The footprints of all the simulations are kept in an STRtree per floor number
+    and simulation type. The compact json payloads of the recently requested
+    simulations are kept in a bounded LRU cache, the other ones are loaded by id
+    once the simulation is found. The index is refreshed incrementally from the
+    created / updated timestamps of the simulations by a background thread, the
+    locations not found in the index (or queried before its first refresh) are
+    looked up in the DB.
+    """
+
+    REFRESH_INTERVAL_IN_SECS = 60
+    PAYLOAD_CACHE_SIZE = 256
+    # Rows committed after a refresh can have timestamps older than the ones seen
+    REFRESH_OVERLAP = timedelta(minutes=5)
+    COLUMNS = [
+        "id",
+        "floor_number",
+        "type",
+        "status",
+        "identifier",
+        "building_footprint",
+        "created",
+        "updated",
+    ]
+    # Fields returned by the potential API
+    PAYLOAD_COLUMNS = ["id", "type", "floor_number", "building_footprint", "result"]
+
+    _instance: Optional["PotentialSimulationLocationIndex"] = None
+    _instance_lock = Lock()
+
+    def __init__(self):
+        # Replaced as a whole on refresh, so the queries of other threads always see
+        # the simulations and trees of the same refresh
+        self._state = _IndexState(simulations={}, trees={})
+        self._last_change: Optional[datetime] = None
+        self._loaded = False
+        self._refresh_lock = Lock()
+        self._payloads: "OrderedDict[Tuple[int, str], str]" = OrderedDict()
+        self._payloads_lock = Lock()
+        self._stop_refresh = Event()
+
+    @classmethod
+    def get_instance(cls) -> "PotentialSimulationLocationIndex":
+        """The index of the process, refreshed by a background thread started with
+        it, so that no request waits for the index to load"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                cls._instance.start_refresh_thread()
+            return cls._instance
+
+    @classmethod
+    def reset(cls):
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.stop_refresh_thread()
+            cls._instance = None
+
+    def start_refresh_thread(self) -> Thread:
+        thread = Thread(
+            target=self._refresh_periodically,
+            name="potential-location-index-refresh",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def stop_refresh_thread(self):
+        self._stop_refresh.set()
+
+    def _refresh_periodically(self):
+        while not self._stop_refresh.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                # The queries keep being answered by the last state or the DB
+                logger.exception(f"Potential location index refresh failed: {e}")
+            self._stop_refresh.wait(self.REFRESH_INTERVAL_IN_SECS)
+
+    def get_by_location(
+        self,
+        lat: float,
+        lon: float,
+        floor_number: int,
+        sim_type: SIMULATION_TYPE,
+    ) -> dict:
+        state = self._state
+        simulation_ids = self._query(
+            state=state, lat=lat, lon=lon, floor_number=floor_number, sim_type=sim_type
+        )
+        if len(simulation_ids) > 1:
+            raise DBMultipleResultsException(
+                f"Potential simulations {simulation_ids} contain the location {lat}, {lon}"
+            )
+        if simulation_ids:
+            simulation_id = simulation_ids[0]
+            if payload := self._get_payload(
+                simulation_id=simulation_id,
+                revision=state.simulations[simulation_id].revision,
+            ):
+                # A new dict on every call, as the callers add fields to it
+                return json.loads(payload)
+            # Deleted or no longer successful since the last refresh
+        return PotentialSimulationDBHandler.get_by_location(
+            lat=lat, lon=lon, floor_number=floor_number, sim_type=sim_type
+        )
+
+    def _get_payload(self, simulation_id: int, revision: str) -> Optional[str]:
+        cache_key = (simulation_id, revision)
+        with self._payloads_lock:
+            if (payload := self._payloads.get(cache_key)) is not None:
+                self._payloads.move_to_end(cache_key)
+                return payload
+
+        try:
+            simulation = PotentialSimulationDBHandler.get_by(
+                output_columns=self.PAYLOAD_COLUMNS,
+                id=simulation_id,
+                status=POTENTIAL_SIMULATION_STATUS.SUCCESS,
+            )
+        except DBNotFoundException:
+            return None
+
+        payload = json.dumps(simulation, separators=(",", ":"))
+        with self._payloads_lock:
+            self._payloads[cache_key] = payload
+            while len(self._payloads) > self.PAYLOAD_CACHE_SIZE:
+                self._payloads.popitem(last=False)
+        return payload
+
+    def query(
+        self,
+        lat: float,
+        lon: float,
+        floor_number: int,
+        sim_type: SIMULATION_TYPE,
+    ) -> List[int]:
+        """Ids of the indexed simulations whose footprint contains the location"""
+        return self._query(
+            state=self._state,
+            lat=lat,
+            lon=lon,
+            floor_number=floor_number,
+            sim_type=sim_type,
+        )
+
+    @staticmethod
+    def _query(
+        state: _IndexState,
+        lat: float,
+        lon: float,
+        floor_number: int,
+        sim_type: SIMULATION_TYPE,
+    ) -> List[int]:
+        tree_and_ids = state.trees.get((floor_number, sim_type))
+        if tree_and_ids is None:
+            return []
+        tree, simulation_ids = tree_and_ids
+        # Inverted as polygons are stored as lon lat
+        return [
+            simulation_ids[index]
+            for index in tree.query(points(lon, lat), predicate="within")
+        ]
+
+    def refresh(self):
+        with self._refresh_lock:
+            self._refresh()
+
+    def _refresh(self):
+        if self._last_change is None:
+            rows = PotentialSimulationDBHandler.find_iter(
+                output_columns=self.COLUMNS,
+                status=POTENTIAL_SIMULATION_STATUS.SUCCESS,
+                identifier=None,
+            )
+        else:
+            since = self._last_change - self.REFRESH_OVERLAP
+            rows = PotentialSimulationDBHandler.find_iter(
+                output_columns=self.COLUMNS,
+                special_filter=(
+                    or_(
+                        PotentialSimulationDBHandler.model.created >= since,
+                        PotentialSimulationDBHandler.model.updated >= since,
+                    ),
+                ),
+            )
+
+        simulations = dict(self._state.simulations)
+        changed_keys = self._update_simulations(simulations=simulations, rows=rows)
+        if self._loaded:
+            changed_keys |= self._remove_deleted_simulations(simulations=simulations)
+
+        self._state = _IndexState(
+            simulations=simulations,
+            trees=self._build_trees(simulations=simulations, keys=changed_keys),
+        )
+        self._loaded = True
+        logger.debug(
+            f"Potential location index refreshed, {len(simulations)} simulations"
+        )
+
+    def _update_simulations(
+        self, simulations: Dict[int, _IndexedSimulation], rows: Iterable[dict]
+    ) -> Set[IndexKey]:
+        changed_keys = set()
+        for row in rows:
+            revision = row["updated"] or row["created"]
+            last_change = datetime.fromisoformat(revision)
+            if self._last_change is None or last_change > self._last_change:
+                self._last_change = last_change
+
+            if indexed_simulation := simulations.pop(row["id"], None):
+                changed_keys.add(indexed_simulation.key)
+
+            if (
+                row["status"] == POTENTIAL_SIMULATION_STATUS.SUCCESS.value
+                and row["identifier"] is None
+                and row["building_footprint"]
+            ):
+                indexed_simulation = _IndexedSimulation(
+                    key=(row["floor_number"], SIMULATION_TYPE(row["type"])),
+                    footprint=wkt.loads(row["building_footprint"]),
+                    revision=revision,
+                )
+                simulations[row["id"]] = indexed_simulation
+                changed_keys.add(indexed_simulation.key)
+        return changed_keys
+
+    @staticmethod
+    def _remove_deleted_simulations(
+        simulations: Dict[int, _IndexedSimulation]
+    ) -> Set[IndexKey]:
+        existing_ids = {
+            simulation["id"]
+            for simulation in PotentialSimulationDBHandler.find(
+                output_columns=["id"],
+                status=POTENTIAL_SIMULATION_STATUS.SUCCESS,
+                identifier=None,
+            )
+        }
+        return {
+            simulations.pop(simulation_id).key
+            for simulation_id in set(simulations) - existing_ids
+        }
+
+    def _build_trees(
+        self, simulations: Dict[int, _IndexedSimulation], keys: Set[IndexKey]
+    ) -> Dict[IndexKey, Tuple[STRtree, List[int]]]:
+        """Trees of the new state, only the ones of the changed keys are rebuilt"""
+        simulation_ids_by_key = defaultdict(list)
+        for simulation_id, simulation in simulations.items():
+            if simulation.key in keys:
+                simulation_ids_by_key[simulation.key].append(simulation_id)
+
+        trees = dict(self._state.trees)
+        for key in keys:
+            if simulation_ids := simulation_ids_by_key.get(key):
+                trees[key] = (
+                    STRtree(
+                        from_shapely(
+                            [
+                                simulations[simulation_id].footprint
+                                for simulation_id in simulation_ids
+                            ]
+                        )
+                    ),
+                    simulation_ids,
+                )
+            else:
+                trees.pop(key, None)
+        return trees
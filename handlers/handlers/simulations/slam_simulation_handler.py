@@ -1,11 +1,14 @@
 from collections import defaultdict
-from typing import Optional
+from functools import partial
+from typing import Callable, Iterator, Optional
 
+import numpy as np
 from pygeos import Geometry, get_x, get_y, get_z
 from shapely.geometry import Point
 
 from brooks.models import SimLayout
 from brooks.util.projections import pygeos_project
+from common_utils.chunker import ChunkedList
 from common_utils.constants import (
     ADMIN_SIM_STATUS,
     REGION,
@@ -62,11 +65,18 @@ class SlamSimulationHandler:
     @retry_on_db_operational_error()
     def store_results(cls, run_id: str, results: SimulationResults):
         with get_db_session_scope():
+            # Converted to json compatible results one batch of units at a time
             UnitSimulationDBHandler.bulk_insert(
-                items=[
-                    dict(run_id=run_id, unit_id=unit_id, results=unit_results)
+                items=(
+                    dict(
+                        run_id=run_id,
+                        unit_id=unit_id,
+                        results=cls._serializable_unit_results(
+                            unit_results=unit_results
+                        ),
+                    )
                     for unit_id, unit_results in results.items()
-                ]
+                )
             )
             task_type = SlamSimulationDBHandler.get_by(
                 run_id=run_id, output_columns=["type"]
@@ -82,6 +92,20 @@ class SlamSimulationHandler:
 
                 StatsHandler(run_id=run_id, results=results).compute_and_store_stats()
 
+    @staticmethod
+    def _serializable_unit_results(unit_results: dict) -> dict:
+        """The values of the areas can be numpy arrays, like the slices of the quavis
+        results, which are only converted to lists to be stored"""
+        return {
+            area_id: {
+                dimension: values.tolist() if isinstance(values, np.ndarray) else values
+                for dimension, values in area_results.items()
+            }
+            if isinstance(area_results, dict)
+            else area_results
+            for area_id, area_results in unit_results.items()
+        }
+
     @classmethod
     def get_results(
         cls, unit_id: int, site_id: int, task_type: TASK_TYPE, check_status: bool = True
@@ -154,28 +178,50 @@ class SlamSimulationHandler:
         return view_sun_result
 
     @staticmethod
-    def _ungeoreferenced_obs_points(floor_id: int, raw_results: dict) -> dict:
-        georef_transformation = FloorHandler.get_georeferencing_transformation(
-            floor_id=floor_id
-        )
-        raw_results["observation_points"] = georef_transformation.invert(
-            raw_results["observation_points"]
-        ).tolist()
-        return raw_results
-
-    @staticmethod
-    def _format_results(raw_results: dict, flattened: Optional[bool] = True) -> dict:
+    def _iter_formatted_results(raw_results: dict) -> Iterator[dict]:
+        """Generator version of `_format_results`, yielding the results of each area
+        instead of concatenating them"""
         # HACK: Because we want to be able to access _old_ view results which were only stored by
         #       unit and not by area_id, we have to aggregate them for new ones
-        if flattened and "observation_points" not in raw_results:
+        if "observation_points" not in raw_results:
             # new raw_results of format {<area_id>: {"observation_points": [...]}, }
-            results = defaultdict(list)
-            for area_results in raw_results.values():
-                for dimension, values in area_results.items():
-                    results[dimension].extend(values)
-            return results
-        # old raw_results aggregated over the whole unit of format {"observation_points": [...]}
-        return raw_results
+            yield from raw_results.values()
+        else:
+            # old raw_results aggregated over the whole unit of format {"observation_points": [...]}
+            yield raw_results
+
+    @classmethod
+    def _format_results(
+        cls, raw_results: dict, flattened: Optional[bool] = True
+    ) -> dict:
+        if not flattened:
+            return raw_results
+        results = defaultdict(list)
+        for area_results in cls._iter_formatted_results(raw_results=raw_results):
+            for dimension, values in area_results.items():
+                results[dimension].extend(values)
+        return results
+
+    @staticmethod
+    def _chunked_dimension(
+        areas_results: list[dict],
+        dimensions: list[str],
+        format_values: Callable[..., list],
+    ) -> ChunkedList:
+        """Values of the dimensions computed area by area with format_values"""
+
+        def _chunks():
+            for area_results in areas_results:
+                values = [area_results.get(d, []) for d in dimensions]
+                yield format_values(*values) if all(values) else []
+
+        return ChunkedList(
+            chunks=_chunks,
+            length=sum(
+                min(len(area_results.get(d, [])) for d in dimensions)
+                for area_results in areas_results
+            ),
+        )
 
     @classmethod
     def get_simulation_results_formatted(
@@ -185,6 +231,27 @@ class SlamSimulationHandler:
         georeferenced: Optional[bool] = True,
         project: bool = True,
     ) -> dict:
+        return {
+            key: list(value) if isinstance(value, ChunkedList) else value
+            for key, value in cls.get_simulation_results_chunked(
+                unit_id=unit_id,
+                simulation_type=simulation_type,
+                georeferenced=georeferenced,
+                project=project,
+            ).items()
+        }
+
+    @classmethod
+    def get_simulation_results_chunked(
+        cls,
+        unit_id: int,
+        simulation_type: TASK_TYPE,
+        georeferenced: Optional[bool] = True,
+        project: bool = True,
+    ) -> dict:
+        """Same results as `get_simulation_results_formatted`, with the values of each
+        dimension as a ChunkedList which formats and projects the results of one area
+        at a time while it is iterated, so they can be streamed"""
         site_id = UnitDBHandler.get_by(id=unit_id, output_columns=["site_id"])[
             "site_id"
         ]
@@ -198,7 +265,22 @@ class SlamSimulationHandler:
             )
 
         resolution = raw_results.pop("resolution", None)
-        results = cls._format_results(raw_results=raw_results, flattened=True)
+        areas_results = list(cls._iter_formatted_results(raw_results=raw_results))
+        dimensions = list(
+            dict.fromkeys(
+                dimension
+                for area_results in areas_results
+                for dimension in area_results
+            )
+        )
+        results = {
+            dimension: cls._chunked_dimension(
+                areas_results=areas_results,
+                dimensions=[dimension],
+                format_values=lambda values: values,
+            )
+            for dimension in dimensions
+        }
 
         site_info = SiteDBHandler.get_by(
             id=site_id,
@@ -208,29 +290,25 @@ class SlamSimulationHandler:
             unit_floor_id = UnitDBHandler.get_by(
                 id=unit_id, output_columns=["floor_id"]
             )["floor_id"]
-            results = cls._ungeoreferenced_obs_points(
-                floor_id=unit_floor_id, raw_results=results
+            georef_transformation = FloorHandler.get_georeferencing_transformation(
+                floor_id=unit_floor_id
+            )
+            results["observation_points"] = cls._chunked_dimension(
+                areas_results=areas_results,
+                dimensions=["observation_points"],
+                format_values=lambda points: georef_transformation.invert(
+                    points
+                ).tolist(),
             )
-        else:  # We convert to latlon
+        elif project:  # We convert to latlon
             georef_region = site_info["georef_region"]
-
-            if project:
-                pygeos_geometries = [
-                    Geometry(f"POINT ({p[1]} {p[0]} {p[2]})")
-                    for p in results["observation_points"]
-                ]
-                transformed_pygeos = pygeos_project(
-                    geometries=pygeos_geometries,
-                    crs_from=REGION[georef_region],
-                    crs_to=REGION.LAT_LON,
-                )
-                results["observation_points"] = []
-                for x, y, z in zip(
-                    get_x(transformed_pygeos),
-                    get_y(transformed_pygeos),
-                    get_z(transformed_pygeos),
-                ):
-                    results["observation_points"].append([x, y, z])
+            results["observation_points"] = cls._chunked_dimension(
+                areas_results=areas_results,
+                dimensions=["observation_points"],
+                format_values=partial(
+                    cls._project_obs_points, crs_from=REGION[georef_region]
+                ),
+            )
 
         if resolution:
             results["resolution"] = resolution
@@ -240,20 +318,41 @@ class SlamSimulationHandler:
             and site_info["simulation_version"] == SIMULATION_VERSION.PH_2022_H1.value
         ):
             # We add streets as an extra dimension, aggregating all the streets dimensions
-            street_values = [
-                results[key.value]
-                for key in (
-                    VIEW_DIMENSION_2.VIEW_TERTIARY_STREETS,
-                    VIEW_DIMENSION_2.VIEW_SECONDARY_STREETS,
-                    VIEW_DIMENSION_2.VIEW_PRIMARY_STREETS,
-                    VIEW_DIMENSION_2.VIEW_HIGHWAYS,
-                    VIEW_DIMENSION_2.VIEW_PEDESTRIAN,
-                )
-            ]
-            results[VIEW_DIMENSION.VIEW_STREETS.value] = [
-                sum(x) for x in zip(*street_values)
-            ]
-        return dict(results)
+            results[VIEW_DIMENSION.VIEW_STREETS.value] = cls._chunked_dimension(
+                areas_results=areas_results,
+                dimensions=[
+                    key.value
+                    for key in (
+                        VIEW_DIMENSION_2.VIEW_TERTIARY_STREETS,
+                        VIEW_DIMENSION_2.VIEW_SECONDARY_STREETS,
+                        VIEW_DIMENSION_2.VIEW_PRIMARY_STREETS,
+                        VIEW_DIMENSION_2.VIEW_HIGHWAYS,
+                        VIEW_DIMENSION_2.VIEW_PEDESTRIAN,
+                    )
+                ],
+                format_values=lambda *street_values: [
+                    sum(x) for x in zip(*street_values)
+                ],
+            )
+        return results
+
+    @staticmethod
+    def _project_obs_points(
+        obs_points: list[list[float]], crs_from: REGION
+    ) -> list[list[float]]:
+        transformed_pygeos = pygeos_project(
+            geometries=[Geometry(f"POINT ({p[1]} {p[0]} {p[2]})") for p in obs_points],
+            crs_from=crs_from,
+            crs_to=REGION.LAT_LON,
+        )
+        return [
+            [x, y, z]
+            for x, y, z in zip(
+                get_x(transformed_pygeos),
+                get_y(transformed_pygeos),
+                get_z(transformed_pygeos),
+            )
+        ]
 
     @staticmethod
     def format_results_by_area(
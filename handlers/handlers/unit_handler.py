@@ -1,5 +1,15 @@
 from collections import defaultdict
-from typing import IO, Collection, Dict, Iterable, List, Optional, Tuple, Union
+from typing import (
+    IO,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from methodtools import lru_cache
 from numpy import ndarray
@@ -8,7 +18,6 @@ from shapely.geometry import Point
 from brooks.classifications import UnifiedClassificationScheme
 from brooks.models import SimLayout
 from brooks.models.violation import Violation, ViolationType
-from brooks.unit_layout_factory import UnitLayoutFactory
 from brooks.visualization.brooks_plotter import BrooksPlotter
 from common_utils.constants import (
     GOOGLE_CLOUD_RESULT_IMAGES,
@@ -266,14 +275,18 @@ class UnitHandler(PlanLayoutHandlerIDCacheMixin):
             if area.db_area_id is not None
         }
 
-        return UnitLayoutFactory(plan_layout=plan_layout).create_sub_layout(
-            spaces_ids={
-                db_area_to_brooks_space[db_area_id]
-                for db_area_id in area_ids
-                if db_area_id in db_area_to_brooks_space
-            },
-            area_db_ids=set(area_ids),
-            floor_number=floor_number,
+        return (
+            self.layout_handler_by_id(plan_id=plan_id)
+            .get_unit_layout_factory(plan_layout=plan_layout)
+            .create_sub_layout(
+                spaces_ids={
+                    db_area_to_brooks_space[db_area_id]
+                    for db_area_id in area_ids
+                    if db_area_id in db_area_to_brooks_space
+                },
+                area_db_ids=set(area_ids),
+                floor_number=floor_number,
+            )
         )
 
     def get_unit_type(self, unit_id: int) -> UnitType:
@@ -362,6 +375,19 @@ class UnitHandler(PlanLayoutHandlerIDCacheMixin):
         language: SUPPORTED_LANGUAGES,
         file_format: SUPPORTED_OUTPUT_FILES,
     ) -> Tuple[IO, str, Dict]:
+        [(_, _, io_image, image_filename, site_info)] = self.generate_floorplan_images(
+            unit_id=unit_id, languages=[language], file_formats=[file_format]
+        )
+        return io_image, image_filename, site_info
+
+    def generate_floorplan_images(
+        self,
+        unit_id: int,
+        languages: Iterable[SUPPORTED_LANGUAGES],
+        file_formats: Iterable[SUPPORTED_OUTPUT_FILES],
+    ) -> Iterator[Tuple[SUPPORTED_LANGUAGES, SUPPORTED_OUTPUT_FILES, IO, str, Dict]]:
+        """The layouts of the unit are loaded and plotted only once for all the
+        languages and file formats requested"""
         unit_info = self._get_unit_info(unit_id)
         logger.info(
             f"Generating floorplan for unit id:{unit_info['id']}, "
@@ -397,31 +423,31 @@ class UnitHandler(PlanLayoutHandlerIDCacheMixin):
         logo_content = ClientHandler.get_logo_content(client_id=site_info["client_id"])
 
         plotter = BrooksPlotter()
-        io_image = plotter.generate_unit_plot(
+        for language, file_format, io_image in plotter.generate_unit_plots(
             unit_target_layout=target_layout,
             angle_north=90
             - self._get_plan_info(unit_info["plan_id"])["georef_rot_angle"],
             floor_plan_layout=floor_plan_layout,
             metadata=unit_metadata,
             logo_content=logo_content,
-            language=language,
-            file_format=file_format,
-        )
-
-        logger.info(
-            f"Generated floorplan for unit id:{unit_info['id']}, client_id :{unit_info['client_id']}, "
-            f"floor number: {floor_info['floor_number']}, plan id: {floor_info['plan_id']}, "
-            f"building: {floor_info['building_id']}, site {site_info['id']}"
-        )
+            languages=languages,
+            file_formats=file_formats,
+        ):
+            logger.info(
+                f"Generated floorplan for unit id:{unit_info['id']}, client_id :{unit_info['client_id']}, "
+                f"floor number: {floor_info['floor_number']}, plan id: {floor_info['plan_id']}, "
+                f"building: {floor_info['building_id']}, site {site_info['id']} "
+                f"in language {language.name} and format {file_format.name}"
+            )
 
-        image_filename = self.old_upload_content_to_gcs(
-            file_format=file_format,
-            content=io_image.read(),
-            language=language,
-            unit_id=unit_id,
-        )
-        io_image.seek(0)
-        return io_image, image_filename, site_info
+            image_filename = self.old_upload_content_to_gcs(
+                file_format=file_format,
+                content=io_image.read(),
+                language=language,
+                unit_id=unit_id,
+            )
+            io_image.seek(0)
+            yield language, file_format, io_image, image_filename, site_info
 
     def old_upload_content_to_gcs(
         self,
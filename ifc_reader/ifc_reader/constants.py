@@ -1,4 +1,5 @@
 # IFC Reader constants
+import os
 
 # standard element names
 
@@ -67,3 +68,13 @@ SUPPORTED_IFC_TYPES = {
     IFC_FURNITURE_TYPE,
     IFC_FURNITURE,
 }
+
+# Threads of the ifcopenshell geometry iterator. The importer runs in a celery worker
+# process next to the other processes of the worker, so by default the cores of the
+# host are shared between them
+IFC_GEOMETRY_ITERATOR_THREADS = int(
+    os.environ.get(
+        "IFC_GEOMETRY_ITERATOR_THREADS",
+        max(1, (os.cpu_count() or 1) // int(os.environ.get("WORKER_CONCURRENCY", 1))),
+    )
+)
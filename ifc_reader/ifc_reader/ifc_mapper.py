@@ -1,5 +1,10 @@
 from abc import ABC
-from typing import TYPE_CHECKING, List, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy
+from pygeos import from_shapely, is_valid, make_valid
+from pygeos import polygons as pygeos_polygons
+from pygeos import to_shapely, union_all
 
 from brooks.util.geometry_ops import ensure_geometry_validity
 from dufresne.polygon.utils import as_multipolygon
@@ -9,16 +14,24 @@ if TYPE_CHECKING:
     from ifc_reader.reader import IfcReader
 
 from ifcopenshell.geom import create_shape as ifc_create_shape
+from ifcopenshell.geom import iterator as ifc_geometry_iterator
 from ifcopenshell.geom import settings
 from shapely.geometry import CAP_STYLE, JOIN_STYLE, LineString, MultiPolygon, Polygon
+from shapely.geometry.base import BaseGeometry
 from shapely.ops import unary_union
 
 from common_utils.logger import logger
+from ifc_reader.constants import IFC_GEOMETRY_ITERATOR_THREADS
 from ifc_reader.exceptions import (
     IfcMapperException,
     IfcUncoveredGeometricalRepresentation,
 )
 
+# Faces with a normal this close to horizontal are vertical, they have no footprint
+VERTICAL_FACE_TOLERANCE = 1e-6
+# Height difference up to which the vertices of a face are at the same level
+HORIZONTAL_FACE_TOLERANCE = 1e-6
+
 
 class IfcToSpatialEntityMapper(ABC):
     """
@@ -48,6 +61,61 @@ class IfcToSpatialEntityMapper(ABC):
             logger.debug(f"Could not generate geometry from an IFC shape. {e}")
             raise IfcMapperException(e) from e
 
+    def get_ifc_2d_entities_by_id(
+        self, ifc_elements: Iterable, num_threads: int = IFC_GEOMETRY_ITERATOR_THREADS
+    ) -> Dict[int, Ifc2DEntity]:
+        """Tessellates all the elements at once using the geometry iterator of
+        ifcopenshell. The elements without a valid geometry or not processed by the
+        iterator are not part of the result."""
+        ifc_2d_entities_by_id = {}
+        for ifc_shape in self.iter_ifc_shapes(
+            ifc_elements=ifc_elements, num_threads=num_threads
+        ):
+            try:
+                ifc_2d_entities_by_id[ifc_shape.id] = self._get_geometry_from_ifc_shape(
+                    ifc_shape=ifc_shape,
+                    ifc_type=self.wrapper.by_id(ifc_shape.id).is_a(),
+                )
+            except Exception as e:
+                logger.debug(f"Could not generate geometry from an IFC shape. {e}")
+        return ifc_2d_entities_by_id
+
+    def iter_ifc_shapes(self, ifc_elements: Iterable, num_threads: int) -> Iterator:
+        ifc_elements = list(ifc_elements)
+        if not ifc_elements:
+            return
+
+        ifc_iterator = ifc_geometry_iterator(
+            self.__ifc_settings,
+            self.wrapper,
+            num_threads,
+            include=ifc_elements,
+        )
+        # Failures of the iterator are logged, the elements it does not yield are
+        # mapped one by one with get_ifc_2d_entity instead
+        try:
+            if not ifc_iterator.initialize():
+                # None of the elements has a geometry that can be processed
+                return
+        except RuntimeError as e:
+            logger.warning(f"Could not initialize the IFC geometry iterator. {e}")
+            return
+        while True:
+            try:
+                ifc_shape = ifc_iterator.get()
+            except RuntimeError as e:
+                logger.warning(
+                    f"Could not get a shape from the IFC geometry iterator. {e}"
+                )
+            else:
+                yield ifc_shape
+            try:
+                if not ifc_iterator.next():
+                    break
+            except RuntimeError as e:
+                logger.warning(f"Could not advance the IFC geometry iterator. {e}")
+                break
+
     @staticmethod
     def _get_polygon_from_vertices(face_vertices: List) -> Polygon:
         """
@@ -72,23 +140,19 @@ class IfcToSpatialEntityMapper(ABC):
 
     def _get_geometry_from_ifc_shape(self, ifc_shape, ifc_type: str) -> Ifc2DEntity:
         # Get IFC shape geometry
-        f = ifc_shape.geometry.faces
-        v = ifc_shape.geometry.verts
-
-        # Create vertices, faces
-        verts = [v[i : i + 3] for i in range(0, len(v), 3)]
-        faces = [f[i : i + 3] for i in range(0, len(f), 3)]
-        if not verts or not faces:
+        vertices = numpy.array(ifc_shape.geometry.verts, dtype=float).reshape(-1, 3)
+        faces = numpy.array(ifc_shape.geometry.faces, dtype=int).reshape(-1, 3)
+        if not len(vertices) or not len(faces):
             raise IfcMapperException(
                 f"IFC element with id {ifc_shape.id} does not have a valid mesh to generate a geometry"
             )
 
-        valid_polygons = self.get_polygons_from_vertices_and_faces(
-            faces=faces, vertices=verts
-        )
-        combined_polygons = unary_union(valid_polygons)
         combined_polygons = as_multipolygon(
-            ensure_geometry_validity(geometry=combined_polygons)
+            ensure_geometry_validity(
+                geometry=self.get_footprint_from_vertices_and_faces(
+                    faces=faces, vertices=vertices
+                )
+            )
         )
 
         if combined_polygons.length == 0.0 or combined_polygons.area == 0.0:
@@ -104,10 +168,9 @@ class IfcToSpatialEntityMapper(ABC):
                 MultiPolygon,
             ),
         ):
-            coord_z = [v[2] for v in verts]
             return Ifc2DEntity(
-                min_height=min(coord_z),
-                max_height=max(coord_z),
+                min_height=float(vertices[:, 2].min()),
+                max_height=float(vertices[:, 2].max()),
                 geometry=combined_polygons,
                 ifc_type=ifc_type,
             )
@@ -117,6 +180,94 @@ class IfcToSpatialEntityMapper(ABC):
             f" and not a Polygon/MultiPolygon."
         )
 
+    def get_footprint_from_vertices_and_faces(
+        self, faces: numpy.ndarray, vertices: numpy.ndarray
+    ) -> BaseGeometry:
+        """Projects the mesh to the XY plane as the union of its non vertical faces.
+        The vertical faces of closed meshes are covered by the other faces, the ones
+        of open meshes (e.g. a wall modelled as a single face next to a slab) are
+        projected face by face as buffered lines, as the meshes made only of vertical
+        faces. Extruded prisms are projected using only their bottom faces.
+        """
+        triangles = vertices[faces]
+        normals = numpy.cross(
+            triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0]
+        )
+        non_vertical = numpy.abs(
+            normals[:, 2]
+        ) > VERTICAL_FACE_TOLERANCE * numpy.linalg.norm(normals, axis=1)
+        if not non_vertical.any():
+            return unary_union(
+                self.get_polygons_from_vertices_and_faces(
+                    faces=faces.tolist(), vertices=vertices.tolist()
+                )
+            )
+
+        is_closed = self._is_closed_mesh(faces=faces, vertices=vertices)
+        triangles = triangles[non_vertical]
+        if (
+            is_closed
+            and (bottom_faces := self._prism_bottom_faces(triangles=triangles))
+            is not None
+        ):
+            triangles = triangles[bottom_faces]
+
+        projected_faces = pygeos_polygons(triangles[:, :, :2])
+        invalid_faces = ~is_valid(projected_faces)
+        projected_faces[invalid_faces] = make_valid(projected_faces[invalid_faces])
+        if not is_closed and not non_vertical.all():
+            projected_faces = numpy.concatenate(
+                [
+                    projected_faces,
+                    from_shapely(
+                        self.get_polygons_from_vertices_and_faces(
+                            faces=faces[~non_vertical].tolist(),
+                            vertices=vertices.tolist(),
+                        )
+                    ),
+                ]
+            )
+        return to_shapely(union_all(projected_faces))
+
+    @staticmethod
+    def _is_closed_mesh(faces: numpy.ndarray, vertices: numpy.ndarray) -> bool:
+        """Whether every edge of the mesh is shared by an even number of faces, the
+        vertices at the same position being merged first"""
+        _, vertex_ids = numpy.unique(
+            vertices.round(decimals=9), axis=0, return_inverse=True
+        )
+        welded_faces = vertex_ids.reshape(-1)[faces]
+        edges = numpy.sort(
+            numpy.concatenate(
+                [
+                    welded_faces[:, [0, 1]],
+                    welded_faces[:, [1, 2]],
+                    welded_faces[:, [2, 0]],
+                ]
+            ),
+            axis=1,
+        )
+        _, edge_counts = numpy.unique(edges, axis=0, return_counts=True)
+        return bool(numpy.all(edge_counts % 2 == 0))
+
+    @staticmethod
+    def _prism_bottom_faces(triangles: numpy.ndarray) -> Optional[numpy.ndarray]:
+        """Mask of the bottom faces if the non vertical faces of the mesh are all
+        horizontal at its lowest or highest level, as in extruded prisms"""
+        heights = triangles[:, :, 2]
+        min_height, max_height = heights.min(), heights.max()
+        bottom_faces = numpy.all(
+            numpy.abs(heights - min_height) < HORIZONTAL_FACE_TOLERANCE, axis=1
+        )
+        top_faces = numpy.all(
+            numpy.abs(heights - max_height) < HORIZONTAL_FACE_TOLERANCE, axis=1
+        )
+        if max_height - min_height > HORIZONTAL_FACE_TOLERANCE and numpy.all(
+            bottom_faces | top_faces
+        ):
+            return bottom_faces
+        return None
+
     def get_polygons_from_vertices_and_faces(
         self, faces: List[int], vertices: List[Tuple[float, float, float]]
     ):
@@ -47,6 +47,9 @@ class IfcReader:
 
     def __init__(self, filepath: Path):
         self.filepath = filepath
+        # Footprints of the elements extracted in bulk by extract_ifc_2d_entities
+        self.ifc_2d_entities_by_id: Dict[int, Ifc2DEntity] = {}
+        self._extracted_element_ids: Set[int] = set()
 
     @property
     def site(self):
@@ -242,7 +245,9 @@ class IfcReader:
         )
 
         space_properties_by_storey_id = defaultdict(list)
-        for ifc_space in self.wrapper.by_type(IFC_SPACE):
+        ifc_spaces = self.wrapper.by_type(IFC_SPACE)
+        self.extract_ifc_2d_entities(ifc_elements=ifc_spaces)
+        for ifc_space in ifc_spaces:
             # To understand the hierarchy traversed to find the floor id:
             # https://standards.buildingsmart.org/IFC/RELEASE/IFC4_1/FINAL/HTML/figures/ifcspace-spatialstructure.png
             properties = self.get_all_properties(ifc_element=ifc_space)
@@ -304,23 +309,28 @@ class IfcReader:
                 storey_floor_number_index[storey.id()] = i + starting_storey_number
         return storey_floor_number_index
 
-    @classmethod
-    def _children_recursive(cls, parent):
-        if not isinstance(parent, entity_instance):
-            return []
-
-        children = []
-        if hasattr(parent, "ContainsElements"):
-            for relation in parent.ContainsElements:
-                for child in relation.RelatedElements:
-                    children += cls._children_recursive(child)
-
-        if hasattr(parent, "IsDecomposedBy"):
-            for relation in parent.IsDecomposedBy:
-                for child in relation.RelatedObjects:
-                    children += cls._children_recursive(child)
-
-        return [parent, *children]
+    @staticmethod
+    def _children_recursive(parent) -> List:
+        """The parent followed by all the elements it contains or is decomposed by,
+        depth first"""
+        elements = []
+        pending = [parent]
+        while pending:
+            element = pending.pop()
+            if not isinstance(element, entity_instance):
+                continue
+            elements.append(element)
+            children = [
+                child
+                for relation in getattr(element, "ContainsElements", None) or []
+                for child in relation.RelatedElements
+            ] + [
+                child
+                for relation in getattr(element, "IsDecomposedBy", None) or []
+                for child in relation.RelatedObjects
+            ]
+            pending.extend(reversed(children))
+        return elements
 
     def storey_elements(
         self, storey_id: int, element_types: Optional[Iterable[str]] = None
@@ -394,7 +404,30 @@ class IfcReader:
                     f"Error reading a geometry from IFC file {self.filepath}: {sub_element}"
                 )
 
+    def extract_ifc_2d_entities(self, ifc_elements: Iterable):
+        """Generates in parallel the footprints of the elements not extracted yet,
+        including their sub elements, to be consumed by get_ifc_2d_entity_if_valid.
+        The elements not tessellated by the iterator are still mapped one by one."""
+        elements_to_extract = {}
+        for element in ifc_elements:
+            for sub_element in (
+                self.get_decomposed_elements(element)
+                if element.IsDecomposedBy
+                else [element]
+            ):
+                if sub_element.id() not in self._extracted_element_ids:
+                    elements_to_extract[sub_element.id()] = sub_element
+
+        self.ifc_2d_entities_by_id.update(
+            self.ifc_mapper.get_ifc_2d_entities_by_id(
+                ifc_elements=elements_to_extract.values()
+            )
+        )
+        self._extracted_element_ids.update(elements_to_extract)
+
     def get_ifc_2d_entity_if_valid(self, ifc_element) -> Union[Ifc2DEntity, bool]:
+        if ifc_2d_entity := self.ifc_2d_entities_by_id.get(ifc_element.id()):
+            return ifc_2d_entity
         try:
             return self.ifc_mapper.get_ifc_2d_entity(ifc_element=ifc_element)
         except (
@@ -1,7 +1,9 @@
+from .congruent_polygons import get_max_rectangles_in_polygons
 from .ea_rectangulator import get_max_rectangle_in_convex_polygon
 from .rectangulator import DeterministicRectangulator
 
 __all__ = [
     get_max_rectangle_in_convex_polygon.__name__,
+    get_max_rectangles_in_polygons.__name__,
     DeterministicRectangulator.__name__,
 ]
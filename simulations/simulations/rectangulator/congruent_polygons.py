@@ -0,0 +1,128 @@
+import math
+import os
+from typing import Dict, Hashable, List, NamedTuple, Tuple
+
+from joblib import Parallel, delayed
+from shapely.affinity import rotate, translate
+from shapely.geometry import Polygon
+from shapely.geometry.polygon import orient
+
+from simulations.rectangulator.ea_rectangulator import (
+    get_max_rectangle_in_convex_polygon,
+)
+
+# Polygons whose normalized coordinates are equal up to this number of decimals
+# (1mm in scaled layouts) are considered congruent
+CANONICAL_PRECISION = 3
+
+
+class CanonicalPolygon(NamedTuple):
+    """Normalized footprint of a polygon, invariant to translation and rotation.
+
+    The polygon is moved to have its centroid at the origin and then rotated by -angle,
+    so `key` is equal for all polygons that are congruent.
+    """
+
+    key: Hashable
+    centroid: Tuple[float, float]
+    angle: float
+
+
+def _normalized_ring(coords: List[Tuple[float, float]]) -> Tuple:
+    """Rounded ring coordinates starting on the lowest vertex, so that the result
+    does not depend on which vertex the ring was starting on."""
+    points = [
+        (round(x, CANONICAL_PRECISION) + 0.0, round(y, CANONICAL_PRECISION) + 0.0)
+        for x, y in coords[:-1]
+    ]
+    start = points.index(min(points))
+    return tuple(points[start:] + points[:start])
+
+
+def get_canonical_polygon(polygon: Polygon) -> CanonicalPolygon:
+    centroid = polygon.centroid
+    centered = orient(translate(polygon, xoff=-centroid.x, yoff=-centroid.y))
+
+    # The minimum rotated rectangle of congruent polygons is the same up to rotation,
+    # so its first side gives the orientation of the polygon modulo 90 degrees.
+    (x1, y1), (x2, y2) = centered.minimum_rotated_rectangle.exterior.coords[:2]
+    base_angle = math.degrees(math.atan2(y2 - y1, x2 - x1)) % 90
+
+    candidates = []
+    for angle in (base_angle + 90 * quadrant for quadrant in range(4)):
+        rotated = rotate(centered, -angle, origin=(0, 0))
+        key = (
+            _normalized_ring(rotated.exterior.coords),
+            tuple(
+                sorted(
+                    _normalized_ring(interior.coords) for interior in rotated.interiors
+                )
+            ),
+        )
+        candidates.append((key, angle))
+
+    key, angle = min(candidates, key=lambda candidate: candidate[0])
+    return CanonicalPolygon(key=key, centroid=(centroid.x, centroid.y), angle=angle)
+
+
+def transform_between_congruent_polygons(
+    geometry: Polygon, source: CanonicalPolygon, target: CanonicalPolygon
+) -> Polygon:
+    """Moves a geometry placed relative to the source polygon to the same relative
+    position in the target polygon."""
+    canonical = rotate(
+        translate(geometry, xoff=-source.centroid[0], yoff=-source.centroid[1]),
+        -source.angle,
+        origin=(0, 0),
+    )
+    return translate(
+        rotate(canonical, target.angle, origin=(0, 0)),
+        xoff=target.centroid[0],
+        yoff=target.centroid[1],
+    )
+
+
+def get_max_rectangles_in_polygons(
+    polygons_by_id: Dict[int, Polygon],
+    generations: int = 10,
+    n_jobs: int = 1,
+) -> Dict[int, Polygon]:
+    """Computes the biggest rectangle of each polygon only once per group of congruent
+    polygons, the rest of the polygons of the group get the rectangle transformed into
+    their position. With n_jobs > 1 the unique polygons are solved in a process pool,
+    -1 uses all the cpus of the host.
+    """
+    canonical_by_id = {
+        polygon_id: get_canonical_polygon(polygon)
+        for polygon_id, polygon in polygons_by_id.items()
+    }
+
+    representative_by_key: Dict[Hashable, int] = {}
+    for polygon_id, canonical in canonical_by_id.items():
+        representative_by_key.setdefault(canonical.key, polygon_id)
+
+    representative_ids = list(representative_by_key.values())
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = max(min(n_jobs, len(representative_ids)), 1)
+
+    solved_rectangles = Parallel(n_jobs=n_jobs)(
+        delayed(get_max_rectangle_in_convex_polygon)(
+            target_convex_polygon=polygons_by_id[polygon_id], generations=generations
+        )
+        for polygon_id in representative_ids
+    )
+    rectangle_by_representative = dict(zip(representative_ids, solved_rectangles))
+
+    rectangles = {}
+    for polygon_id, canonical in canonical_by_id.items():
+        representative_id = representative_by_key[canonical.key]
+        if polygon_id == representative_id:
+            rectangles[polygon_id] = rectangle_by_representative[polygon_id]
+        else:
+            rectangles[polygon_id] = transform_between_congruent_polygons(
+                geometry=rectangle_by_representative[representative_id],
+                source=canonical_by_id[representative_id],
+                target=canonical,
+            )
+    return rectangles
@@ -2,7 +2,7 @@
 import json
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 import delegator
 import numpy as np
@@ -11,6 +11,20 @@ from common_utils.exceptions import QuavisSimulationException
 from common_utils.logger import logger
 
 
+class QuavisResults(NamedTuple):
+    """Results of the quavis simulation as arrays with one row per observation point,
+    in the order the observation points were added. The dimensions not computed are
+    None.
+    """
+
+    positions: np.ndarray  # (points, 3)
+    groups: List[str]
+    volume: Optional[np.ndarray]  # (points,)
+    area: Optional[np.ndarray]  # (points,)
+    area_by_group: Optional[np.ndarray]  # (points, groups)
+    sun: Optional[np.ndarray]  # (points, sun positions)
+
+
 class ViewWrapper:
     """A wrapper for the CPP view implementation.
 
@@ -310,6 +324,48 @@ class ViewWrapper:
 
         return wrapper
 
+    @staticmethod
+    def _get_output_values(results: List[dict], stage: str) -> Optional[np.ndarray]:
+        if not results or stage not in results[0]:
+            return None
+        return np.array([result[stage]["values"] for result in results], dtype=float)
+
+    def parse_quavis_output_arrays(self, output_data: dict) -> QuavisResults:
+        """Parse the output of the cpp implementation into arrays by dimension.
+
+        Args:
+            output_data (dict): The dictionary returned as json from the cpp
+                process.
+
+        Returns:
+            QuavisResults: the positions of the observation points and the results of
+                each shader stage, with one row per observation point.
+        """
+        self._invert_anti_gpu_glitch_translation()
+
+        number_of_obs_points = len(self._obs_positions)
+        if len(output_data["results"]) < number_of_obs_points:
+            raise QuavisSimulationException(
+                f"Quavis returned {len(output_data['results'])} results for "
+                f"{number_of_obs_points} observation points"
+            )
+        results = output_data["results"][:number_of_obs_points]
+        volume = self._get_output_values(results=results, stage="volume")
+        groups_values = self._get_output_values(results=results, stage="groups")
+
+        return QuavisResults(
+            positions=np.array(self._obs_positions, dtype=float).reshape(-1, 3),
+            groups=list(self._geom_groups),
+            volume=volume[:, 0] if volume is not None else None,
+            area=groups_values.sum(axis=1) if groups_values is not None else None,
+            area_by_group=(
+                groups_values[:, 1 : len(self._geom_groups) + 1]
+                if groups_values is not None
+                else None
+            ),
+            sun=self._get_output_values(results=results, stage="sun"),
+        )
+
     def parse_quavis_output(self, output_data: dict) -> list:
         """Parse the output of the cpp implementation.
 
@@ -339,47 +395,39 @@ class ViewWrapper:
             list: A list of dictionaries containing the simulations results
                 for each observation point. See section "Output Format" above.
         """
-        self._invert_anti_gpu_glitch_translation()
-
-        obs_results = []
-        for idx, obs_position in enumerate(self._obs_positions):
-            results = output_data["results"][idx]
-
-            # Extract shader stage data
-            volume = None
-            area = None
-            area_by_group = None
-            sun = None
-
-            if "volume" in results:
-                volume = results["volume"]["values"][0]
+        quavis_results = self.parse_quavis_output_arrays(output_data=output_data)
 
-            if "groups" in results:
-                area = sum(results["groups"]["values"])
+        def _rows(values: Optional[np.ndarray]) -> list:
+            if values is None:
+                return [None] * len(quavis_results.positions)
+            return values.tolist()
 
-                area_by_group = {}
-                for group_idx, group in enumerate(self._geom_groups):
-                    area_by_group[group] = results["groups"]["values"][group_idx + 1]
-
-            if "sun" in results:
-                sun = results["sun"]["values"]
-
-            # generate result dictionary
-            obs_result = {
-                "position": obs_position,
+        return [
+            {
+                "position": position,
                 "view-direction": self._obs_view_directions[idx],
                 "field-of-view": self._obs_field_of_views[idx],
                 "simulations": {
                     "volume": volume,
                     "area": area,
-                    "area_by_group": area_by_group,
+                    "area_by_group": (
+                        dict(zip(quavis_results.groups, area_by_group))
+                        if area_by_group is not None
+                        else None
+                    ),
                     "sun": sun,
                 },
             }
-
-            obs_results.append(obs_result)
-
-        return obs_results
+            for idx, (position, volume, area, area_by_group, sun) in enumerate(
+                zip(
+                    quavis_results.positions.tolist(),
+                    _rows(quavis_results.volume),
+                    _rows(quavis_results.area),
+                    _rows(quavis_results.area_by_group),
+                    _rows(quavis_results.sun),
+                )
+            )
+        ]
 
     def generate_input(
         self,
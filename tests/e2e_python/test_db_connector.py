@@ -6,6 +6,7 @@ from sqlalchemy.exc import InternalError
 
 from connectors.db_connector import (
     DEFAULT_ISOLATION_LEVEL,
+    READONLY_ISOLATION_LEVEL,
     get_db_session_scope,
     get_session_manager,
 )
@@ -229,3 +230,21 @@ class TestGetDbSessionScope:
                     isolation_level.transaction_isolation.upper()
                     == NON_DEFAULT_ISOLATION_LEVEL
                 )
+
+    def test_readonly_isolation_level(self):
+        show_isolation_level_sql = "SHOW TRANSACTION ISOLATION LEVEL;"
+
+        with get_db_session_scope(readonly=True) as session:
+            isolation_level = session.execute(show_isolation_level_sql).first()
+            assert (
+                isolation_level.transaction_isolation.upper()
+                == READONLY_ISOLATION_LEVEL
+            )
+
+        with get_db_session_scope(
+            readonly=True, isolation_level=DEFAULT_ISOLATION_LEVEL
+        ) as session:
+            isolation_level = session.execute(show_isolation_level_sql).first()
+            assert (
+                isolation_level.transaction_isolation.upper() == DEFAULT_ISOLATION_LEVEL
+            )
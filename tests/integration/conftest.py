@@ -115,6 +115,26 @@ def reset_all_sequences():
             )
 
 
+@pytest.fixture(autouse=True)
+def reset_potential_location_index():
+    """The index would otherwise keep the simulations of the rolled back tests"""
+    from handlers.simulations.potential_location_index import (
+        PotentialSimulationLocationIndex,
+    )
+
+    yield
+    PotentialSimulationLocationIndex.reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_layout_violations_cache():
+    """Plan ids are reused across the rolled back tests"""
+    from handlers.editor_v2 import ReactPlannerHandler
+
+    yield
+    ReactPlannerHandler.clear_layout_violations_cache()
+
+
 def pytest_addoption(parser):
     parser.addoption("--generate-quavis-fixtures", action="store_true", default=False)
     parser.addoption("--quavis", action="store_true", default=False)
@@ -1517,7 +1517,16 @@ class TestSiteTaskView:
 
 
 class TestCopySiteView:
-    def test_copy_site_launch_copy_site_task(self, mocker, client, site):
+    @pytest.mark.parametrize(
+        "payload, copy_simulation_results",
+        [
+            ({"client_target_id": 12}, False),
+            ({"client_target_id": 12, "copy_simulation_results": True}, True),
+        ],
+    )
+    def test_copy_site_launch_copy_site_task(
+        self, mocker, client, site, payload, copy_simulation_results
+    ):
         from api.slam_api.apis.site import copy_site_task
 
         copy_site_task_mocked = mocker.patch.object(
@@ -1530,12 +1539,15 @@ class TestCopySiteView:
             get_address_for(
                 blueprint=site_app, view_function=CopySiteView, site_id=site["id"]
             ),
-            json={"client_target_id": 12},
+            json=payload,
         )
         assert response.status_code == HTTPStatus.OK
 
         copy_site_task_mocked.assert_called_once_with(
-            target_client_id=12, site_id_to_copy=site["id"], copy_area_types=True
+            target_client_id=12,
+            site_id_to_copy=site["id"],
+            copy_area_types=True,
+            copy_simulation_results=copy_simulation_results,
         )
 
     def test_copy_site_bad_params(self, mocker, client, site):
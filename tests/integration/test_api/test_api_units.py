@@ -1,6 +1,8 @@
+import gzip
 import uuid
 from http import HTTPStatus
 
+import msgpack
 import pytest
 from deepdiff import DeepDiff
 from shapely.geometry import shape
@@ -213,6 +215,39 @@ def test_get_unit_results_resolution(client, slam_simulation_with_results, unit)
     assert response.json == expected
 
 
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {"Accept": "application/msgpack"},
+        {"Accept": "application/msgpack", "Accept-Encoding": "gzip"},
+    ],
+)
+def test_get_unit_results_streamed_as_msgpack(
+    client, slam_simulation_with_results, unit, headers
+):
+    url = get_address_for(
+        blueprint=unit_app,
+        view_function=simulation_results,
+        unit_id=unit["id"],
+        simulation_type=TASK_TYPE.VIEW_SUN.name,
+        georeferenced=True,
+        use_external_address=False,
+    )
+    response = client.get(url, headers=headers)
+
+    assert response.status_code == HTTPStatus.OK, response.data
+    assert response.mimetype == "application/msgpack"
+    data = response.data
+    if "Accept-Encoding" in headers:
+        assert response.headers["Content-Encoding"] == "gzip"
+        data = gzip.decompress(data)
+
+    results = msgpack.loads(data)
+    assert results["resolution"] == 0.25
+    assert results["traffic_day"] == [100, 200, 300, 400, 500, 600]
+    assert len(results["observation_points"]) == 6
+
+
 def test_get_unit_connectivity_results_formatted(
     client,
     plan_georeferenced,
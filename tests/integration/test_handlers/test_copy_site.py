@@ -2,7 +2,7 @@ import pytest
 
 from brooks.types import AreaType
 from common_utils.exceptions import DBNotFoundException
-from handlers import PlanHandler, SiteHandler
+from handlers import GCloudStorageHandler, SiteHandler
 from handlers.copy_site import CopySite
 from handlers.db import (
     AreaDBHandler,
@@ -14,44 +14,80 @@ from handlers.db import (
     QADBHandler,
     ReactPlannerProjectsDBHandler,
     SiteDBHandler,
+    SlamSimulationDBHandler,
+    UnitAreaDBHandler,
     UnitDBHandler,
+    UnitSimulationDBHandler,
 )
 from handlers.utils import get_client_bucket_name
 from tasks.dev_helper_tasks import copy_site_task
 
 
 @pytest.fixture
-def mocked_image_as_bytes(fixtures_path, mocker):
-    with fixtures_path.joinpath("images/image_plan_332.jpg").open(mode="rb") as f:
-        image_bytes = f.read()
-
-    mocker.patch.object(
-        PlanHandler, "get_plan_image_as_bytes", return_value=image_bytes
+def mocked_copy_plan_image(mocker):
+    return mocker.patch.object(
+        GCloudStorageHandler,
+        "copy_file_to_another_bucket",
+        side_effect=lambda media_link, **kwargs: f"{media_link}_copy",
     )
 
 
 class TestCopySite:
-    def test_copy_plan_without_annotation_not_failing(
+    @pytest.mark.parametrize("same_client", [True, False])
+    def test_copy_plans_copies_each_image_once(
         self,
-        make_sites,
+        same_client,
         client_db,
-        make_plans,
+        make_clients,
+        make_sites,
         make_buildings,
-        mocked_image_as_bytes,
+        make_plans,
+        mocked_copy_plan_image,
     ):
-
-        site1, site2 = make_sites(*(client_db, client_db))
-        building1, building2 = make_buildings(*(site1, site2))
-        (plan_1,) = make_plans(*(building1,))
+        (other_client,) = make_clients(1)
+        old_site, new_site = make_sites(
+            *(client_db, client_db if same_client else other_client)
+        )
+        old_building_1, old_building_2 = make_buildings(*(old_site, old_site))
+        plan_1, plan_2 = make_plans(*(old_building_1, old_building_2))
+        # Same image in both buildings
+        PlanDBHandler.update(
+            item_pks={"id": plan_2["id"]},
+            new_values={"image_hash": plan_1["image_hash"]},
+        )
         with pytest.raises(DBNotFoundException):
             ReactPlannerProjectsDBHandler.get_by(plan_id=plan_1["id"])
 
         site_copier = CopySite()
-        site_copier.building_mapping = {building1["id"]: building2["id"]}
-        site_copier.new_site_id = site2["id"]
-        site_copier._copy_plan_info(plan_1)
-
-        assert len(PlanDBHandler.find(site_id=site2["id"])) == 1
+        site_copier.new_site_id = new_site["id"]
+        site_copier._copy_buildings(site_id=old_site["id"])
+        site_copier._copy_plans(site_id=old_site["id"])
+        site_copier._copy_annotations()
+
+        new_plans = PlanDBHandler.find(site_id=new_site["id"])
+        assert {plan["id"] for plan in new_plans} == set(
+            site_copier.plan_mapping.values()
+        )
+        assert {plan["building_id"] for plan in new_plans} == set(
+            site_copier.building_mapping.values()
+        )
+        assert {plan["image_hash"] for plan in new_plans} == {plan_1["image_hash"]}
+        if same_client:
+            mocked_copy_plan_image.assert_not_called()
+            assert {plan["image_gcs_link"] for plan in new_plans} == {
+                plan_1["image_gcs_link"]
+            }
+        else:
+            mocked_copy_plan_image.assert_called_once_with(
+                source_bucket_name=get_client_bucket_name(client_id=client_db["id"]),
+                media_link=plan_1["image_gcs_link"],
+                destination_bucket_name=get_client_bucket_name(
+                    client_id=other_client["id"]
+                ),
+            )
+            assert {plan["image_gcs_link"] for plan in new_plans} == {
+                f"{plan_1['image_gcs_link']}_copy"
+            }
 
     @pytest.mark.parametrize("copy_area_types", [True, False])
     def test_copy_plan(
@@ -79,59 +115,85 @@ class TestCopySite:
         )  # create old areas
         site_copier = CopySite()
         site_copier.plan_mapping[old_plan["id"]] = new_plan["id"]
-        site_copier._copy_areas(plan=old_plan, copy_area_types=copy_area_types)
+        site_copier._copy_areas(copy_area_types=copy_area_types)
 
-        area_types_new_plan = {
-            area["area_type"]
-            for area in AreaDBHandler.find(
-                plan_id=new_plan["id"], output_columns=["area_type"]
-            )
-        }
+        new_areas = AreaDBHandler.find(
+            plan_id=new_plan["id"], output_columns=["id", "area_type"]
+        )
+        area_types_new_plan = {area["area_type"] for area in new_areas}
 
         expected_area_types = (
             set(area_types_old_plan) if copy_area_types else {AreaType.NOT_DEFINED.name}
         )
 
         assert area_types_new_plan == expected_area_types
+        assert {area["id"] for area in new_areas} == set(
+            site_copier.area_mapping.values()
+        )
 
     def test_copy_annotation(
         self,
-        mocker,
         client_db,
         make_sites,
         make_buildings,
         make_plans,
-        mocked_image_as_bytes,
     ):
         site1, site2 = make_sites(*(client_db, client_db))
         building1, building2 = make_buildings(*(site1, site2))
-        (plan_1,) = make_plans(*(building1,))
+        plan_1, plan_2 = make_plans(*(building1, building2))
         annotations_data = {"foo": "bar"}
         ReactPlannerProjectsDBHandler.add(plan_id=plan_1["id"], data=annotations_data)
 
-        db_handler_get_by_spy = mocker.spy(ReactPlannerProjectsDBHandler, "get_by")
-        db_handler_add_spy = mocker.spy(ReactPlannerProjectsDBHandler, "add")
-
         site_copier = CopySite()
-        site_copier.building_mapping = {building1["id"]: building2["id"]}
-        site_copier.new_site_id = site2["id"]
-        site_copier._copy_plan_info(plan=plan_1)
-        new_plan_id = site_copier.plan_mapping[plan_1["id"]]
+        site_copier.plan_mapping = {plan_1["id"]: plan_2["id"]}
+        site_copier._copy_annotations()
 
-        site_copier._copy_annotation(plan=plan_1, site_id=site1["id"])
+        assert ReactPlannerProjectsDBHandler.get_by(
+            plan_id=plan_2["id"], output_columns=["data"]
+        ) == dict(data=annotations_data)
 
-        db_handler_get_by_spy.assert_called_once_with(
-            plan_id=plan_1["id"], output_columns=["data"]
+    def test_copy_simulation_results(
+        self,
+        client_db,
+        site,
+        plan_classified_scaled,
+        unit,
+        slam_simulation_with_results,
+        mocked_copy_plan_image,
+    ):
+        simulation, areas = slam_simulation_with_results
+        old_results = UnitSimulationDBHandler.get_by(
+            unit_id=unit["id"], run_id=simulation["run_id"]
+        )["results"]
+
+        new_site_id = CopySite().copy_site(
+            target_client_id=client_db["id"],
+            site_id_to_copy=site["id"],
+            copy_area_types=True,
+            copy_simulation_results=True,
         )
-        db_handler_add_spy.assert_called_once_with(
-            plan_id=new_plan_id, data=annotations_data
+
+        new_simulation = SlamSimulationDBHandler.get_by(site_id=new_site_id)
+        assert new_simulation["run_id"] != simulation["run_id"]
+        assert new_simulation["type"] == simulation["type"]
+        assert new_simulation["state"] == simulation["state"]
+
+        (new_unit,) = UnitDBHandler.find(site_id=new_site_id)
+        new_results = UnitSimulationDBHandler.get_by(
+            unit_id=new_unit["id"], run_id=new_simulation["run_id"]
+        )["results"]
+        new_area_ids = {
+            unit_area["area_id"]
+            for unit_area in UnitAreaDBHandler.find(unit_id=new_unit["id"])
+        }
+        assert new_results.pop("resolution") == old_results.pop("resolution")
+        assert {int(area_id) for area_id in new_results} == new_area_ids
+        assert sorted(new_results.values(), key=str) == sorted(
+            old_results.values(), key=str
         )
-        assert ReactPlannerProjectsDBHandler.get_by(
-            plan_id=new_plan_id, output_columns=["data"]
-        ) == dict(data=annotations_data)
 
     def test_full_copy_of_a_site(
-        self, site_834, mocked_image_as_bytes, celery_eager, mocker, client_db
+        self, site_834, mocked_copy_plan_image, celery_eager, client_db
     ):
 
         site_id = site_834["site"]["id"]
@@ -147,10 +209,6 @@ class TestCopySite:
 
         new_client = ClientDBHandler.add(name="Client2")
 
-        mocked_plan_upload = mocker.spy(
-            PlanHandler, "upload_plan_image_to_google_cloud"
-        )
-
         new_site_id = copy_site_task(
             target_client_id=new_client["id"],
             site_id_to_copy=site_id,
@@ -168,8 +226,8 @@ class TestCopySite:
         assert len(QADBHandler.find()) == 2 * nbr_of_qa
         assert len(ManualSurroundingsDBHandler.find()) == 2 * nbr_of_manual_surr
 
-        assert mocked_plan_upload.call_args_list[0].kwargs[
-            "destination_bucket"
+        assert mocked_copy_plan_image.call_args_list[0].kwargs[
+            "destination_bucket_name"
         ] == get_client_bucket_name(client_id=new_client["id"])
 
         old_results = SiteHandler.generate_basic_features(site_id=site_id)
@@ -183,7 +241,7 @@ class TestCopySite:
                 )
 
     def test_copy_to_existing_site(
-        self, site_834, mocked_image_as_bytes, celery_eager, mocker, client_db
+        self, site_834, mocked_copy_plan_image, celery_eager, client_db
     ):
 
         site_id = site_834["site"]["id"]
@@ -205,10 +263,6 @@ class TestCopySite:
         new_site_info.pop("id")
         new_site_info = SiteDBHandler.add(**new_site_info)
 
-        mocked_plan_upload = mocker.spy(
-            PlanHandler, "upload_plan_image_to_google_cloud"
-        )
-
         new_site_id = copy_site_task(
             target_client_id=new_site_info["client_id"],
             site_id_to_copy=site_id,
@@ -225,9 +279,11 @@ class TestCopySite:
         assert len(AreaDBHandler.find()) == 2 * nbr_of_areas
         assert len(QADBHandler.find()) == 1 * nbr_of_qa
 
-        assert mocked_plan_upload.call_args_list[0].kwargs[
-            "destination_bucket"
-        ] == get_client_bucket_name(client_id=new_site_info["client_id"])
+        # Same client, the images are referenced instead of copied
+        mocked_copy_plan_image.assert_not_called()
+        assert {plan["image_gcs_link"] for plan in PlanDBHandler.find()} == {
+            plan["image_gcs_link"] for plan in PlanDBHandler.find(site_id=site_id)
+        }
 
         old_results = SiteHandler.generate_basic_features(site_id=site_id)
         new_results = SiteHandler.generate_basic_features(site_id=new_site_id)
@@ -13,6 +13,7 @@ from handlers.db import (
     SiteDBHandler,
     SlamSimulationDBHandler,
     UnitAreaDBHandler,
+    UnitAreaVectorDBHandler,
     UnitDBHandler,
     UserDBHandler,
     get_db_handlers,
@@ -583,3 +584,29 @@ def test_created_updated_change_each_time():
     )
     clients = ClientDBHandler.find()
     assert clients[0]["updated"] != clients[1]["updated"]
+
+
+def test_bulk_upsert_updates_conflicting_rows(unit, make_units, floor):
+    (other_unit,) = make_units(floor)
+    UnitAreaVectorDBHandler.bulk_insert(
+        items=[{"unit_id": unit["id"], "fingerprint": "old", "vector": [{"a": 1}]}]
+    )
+
+    UnitAreaVectorDBHandler.bulk_upsert(
+        items=[
+            {"unit_id": unit["id"], "fingerprint": "new", "vector": [{"a": 2}]},
+            {"unit_id": other_unit["id"], "fingerprint": "new", "vector": []},
+        ],
+        index_elements=["unit_id"],
+    )
+
+    rows = {
+        row["unit_id"]: row
+        for row in UnitAreaVectorDBHandler.find(
+            output_columns=["unit_id", "fingerprint", "vector", "updated"]
+        )
+    }
+    assert rows[unit["id"]]["fingerprint"] == "new"
+    assert rows[unit["id"]]["vector"] == [{"a": 2}]
+    assert rows[unit["id"]]["updated"] is not None
+    assert rows[other_unit["id"]]["vector"] == []
@@ -571,7 +571,15 @@ def test_floor_generate_upload_floorplan_caches_layouts(
     mocked_mapper_get_layout_raw = mocker.patch.object(
         ReactPlannerToBrooksMapper, "get_layout", return_value=SimLayout()
     )
-    mocker.patch.object(BrooksPlotter, "generate_floor_plot")
+    mocker.patch.object(
+        BrooksPlotter,
+        "generate_floor_plots",
+        side_effect=lambda languages, file_formats, **kwargs: [
+            (language, file_format, StringIO())
+            for language in languages
+            for file_format in file_formats
+        ],
+    )
     mocker.patch.object(
         UnitLayoutFactory, "create_sub_layout", return_value=SimLayout()
     )
@@ -589,3 +597,43 @@ def test_floor_generate_upload_floorplan_caches_layouts(
     )
     # Then
     assert mocked_mapper_get_layout_raw.call_count == 1
+
+
+def test_floor_generate_upload_floorplans_plots_floor_once(
+    mocker,
+    mocked_gcp_upload_bytes_to_bucket,
+    plan_georeferenced,
+    floor,
+    make_units,
+    make_annotations,
+):
+    make_annotations(plan_georeferenced)
+    make_units(floor, floor)
+    create_or_replace_mocked = mocker.patch.object(
+        DMSFloorDeliverableHandler, "create_or_replace_dms_file"
+    )
+    mocker.patch.object(ClientHandler, "get_logo_content", return_value=b"asdsadas")
+    mocker.patch.object(
+        ReactPlannerToBrooksMapper, "get_layout", return_value=SimLayout()
+    )
+    generate_floor_plots_mocked = mocker.patch.object(
+        BrooksPlotter,
+        "generate_floor_plots",
+        side_effect=lambda languages, file_formats, **kwargs: [
+            (language, file_format, StringIO())
+            for language in languages
+            for file_format in file_formats
+        ],
+    )
+    mocker.patch.object(
+        UnitLayoutFactory, "create_sub_layout", return_value=SimLayout()
+    )
+
+    DMSFloorDeliverableHandler().generate_upload_floorplans(
+        floor_id=floor["id"],
+        languages=SUPPORTED_LANGUAGES,
+        file_formats=(SUPPORTED_OUTPUT_FILES.PNG, SUPPORTED_OUTPUT_FILES.PDF),
+    )
+
+    assert generate_floor_plots_mocked.call_count == 1
+    assert create_or_replace_mocked.call_count == 2 * len(SUPPORTED_LANGUAGES)
@@ -0,0 +1,69 @@
+import pytest
+
+from handlers.db import ReactPlannerProjectsDBHandler
+from handlers.editor_v2.schema import (
+    CURRENT_REACT_ANNOTATION_VERSION,
+    ReactPlannerVersions,
+)
+from tasks.annotations_migration_tasks import migrate_all_react_annotations
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_migrate_all_react_annotations(
+    celery_eager,
+    plan,
+    plan_masterplan,
+    react_planner_background_image_one_unit,
+    dry_run,
+):
+    previous_version = ReactPlannerVersions.V18.name
+    outdated = ReactPlannerProjectsDBHandler.add(
+        plan_id=plan["id"],
+        data={**react_planner_background_image_one_unit, "version": previous_version},
+    )
+    corrupted = ReactPlannerProjectsDBHandler.add(
+        plan_id=plan_masterplan["id"],
+        data={"version": previous_version, "layers": {}},
+    )
+
+    migrate_all_react_annotations.delay(dry_run=dry_run)
+
+    projects = {
+        project["id"]: project["data"]
+        for project in ReactPlannerProjectsDBHandler.find(output_columns=["id", "data"])
+    }
+    assert projects[outdated["id"]]["version"] == (
+        previous_version if dry_run else CURRENT_REACT_ANNOTATION_VERSION
+    )
+    assert projects[corrupted["id"]] == {"version": previous_version, "layers": {}}
+
+
+def test_migrate_stored_annotations_does_not_overwrite_newer_saves(
+    mocker, plan, react_planner_background_image_one_unit
+):
+    from handlers.editor_v2 import ReactPlannerHandler
+
+    project = ReactPlannerProjectsDBHandler.add(
+        plan_id=plan["id"],
+        data={
+            **react_planner_background_image_one_unit,
+            "version": ReactPlannerVersions.V18.name,
+        },
+    )
+
+    def save_while_migrating(plan_data):
+        ReactPlannerProjectsDBHandler.update(
+            item_pks={"id": project["id"]},
+            new_values={"data": react_planner_background_image_one_unit},
+        )
+        return react_planner_background_image_one_unit
+
+    mocker.patch.object(
+        ReactPlannerHandler,
+        "_migrate_checking_integrity",
+        side_effect=save_while_migrating,
+    )
+    batch = ReactPlannerHandler.migrate_stored_annotations()
+
+    assert batch.migrated == []
+    assert batch.skipped == [project["id"]]
@@ -1,10 +1,20 @@
+"""Load test of the DMS endpoints, the API reads hitting the DB the most.
+
+    locust --config tests/load_testing/locust.conf
+
+The DB pool and retry statistics of the API are logged when the test stops, to
+compare the configurations of the pool (DB_POOL_ENABLED, DB_POOL_SIZE, ...) and of
+the read only sessions (DB_READONLY_ISOLATION_LEVEL, DB_REPLICA_HOST).
+"""
 import os
 from http import HTTPStatus
 
-from locust import HttpUser, between, task
+import requests
+from locust import HttpUser, between, events, task
 
 from common_utils.constants import TASK_TYPE
-from handlers.db import UnitDBHandler
+from common_utils.logger import logger
+from handlers.db import SiteDBHandler, UnitDBHandler
 
 TIME_LIMIT_IN_S = 1.0
 
@@ -16,11 +26,23 @@ def check_response(response):
         response.failure("Request took too long")
 
 
+def login(host: str) -> str:
+    response = requests.post(
+        url=f"{host}/api/auth/login",
+        json={
+            "user": os.environ.get("user", "admin"),
+            "password": os.environ.get("password", "admin"),
+        },
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
 class MyUser(HttpUser):
-    @task
-    def get_layout_for_heatmap(self):
+    def _get(self, url: str, params: dict = None):
         with self.client.get(
-            url=f"/api/unit/{self.unit_id}/brooks/simple",
+            url=url,
+            params=params,
             catch_response=True,
             headers={
                 "Authorization": f"Bearer {self.token}",
@@ -30,19 +52,38 @@ class MyUser(HttpUser):
         ) as response:
             check_response(response=response)
 
+    @task
+    def get_dms_sites(self):
+        self._get(
+            url="/api/site/", params={"client_id": self.client_id, "dms_sites": True}
+        )
+
+    @task
+    def get_dms_buildings(self):
+        self._get(url="/api/building/", params={"site_id": self.site_id})
+
+    @task
+    def get_dms_site_units(self):
+        self._get(url=f"/api/site/{self.site_id}/units")
+
+    @task
+    def get_dms_files(self):
+        self._get(url="/api/file/", params={"client_id": self.client_id})
+
+    @task
+    def get_dms_folders(self):
+        self._get(url="/api/folder/", params={"client_id": self.client_id})
+
+    @task
+    def get_layout_for_heatmap(self):
+        self._get(url=f"/api/unit/{self.unit_id}/brooks/simple")
+
     @task
     def get_payload_heatmap(self):
-        with self.client.get(
+        self._get(
             url=f"/api/unit/{self.unit_id}/simulation_results",
             params={"georeferenced": True, "simulation_type": TASK_TYPE.VIEW_SUN.name},
-            catch_response=True,
-            headers={
-                "Authorization": f"Bearer {self.token}",
-                "Cache-Control": "no-cache",
-            },
-            cookies={},
-        ) as response:
-            check_response(response=response)
+        )
 
     def on_start(self):
         with self.client.post(
@@ -57,5 +98,17 @@ class MyUser(HttpUser):
             self.token = response.json()["access_token"]
             unit = next(UnitDBHandler.find_iter())
             self.unit_id = unit["id"]
+            self.site_id = unit["site_id"]
+            self.client_id = SiteDBHandler.get_by(id=self.site_id)["client_id"]
 
     wait_time = between(0.5, 1.0)
+
+
+@events.test_stop.add_listener
+def log_db_stats(environment, **kwargs):
+    # Only available to admins
+    response = requests.get(
+        f"{environment.host}/api/_internal_/db_stats",
+        headers={"Authorization": f"Bearer {login(host=environment.host)}"},
+    )
+    logger.info(f"DB stats of the API: {response.json()}")
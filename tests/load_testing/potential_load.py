@@ -0,0 +1,77 @@
+"""Load test of the potential API location lookup.
+
+    locust -f tests/load_testing/potential_load.py --host http://localhost:8000
+
+The locations are sampled inside the footprints of the successful simulations, so
+the requests exercise the in process location index instead of the DB fallback.
+"""
+import os
+import random
+from http import HTTPStatus
+
+from locust import HttpUser, task
+from shapely import wkt
+
+from common_utils.constants import POTENTIAL_SIMULATION_STATUS
+from handlers.db import PotentialSimulationDBHandler
+
+NUMBER_OF_LOCATIONS = 1000
+TIME_LIMIT_IN_S = 0.2
+
+
+def check_response(response):
+    if response.status_code != HTTPStatus.OK:
+        response.failure(f"Got wrong response: {response}")
+    elif response.elapsed.total_seconds() > TIME_LIMIT_IN_S:
+        response.failure("Request took too long")
+
+
+def get_locations():
+    locations = []
+    for simulation in PotentialSimulationDBHandler.find_iter(
+        output_columns=["floor_number", "type", "building_footprint"],
+        status=POTENTIAL_SIMULATION_STATUS.SUCCESS,
+        identifier=None,
+    ):
+        point = wkt.loads(simulation["building_footprint"]).representative_point()
+        locations.append(
+            {
+                "lat": point.y,
+                "lon": point.x,
+                "floor_number": simulation["floor_number"],
+                "sim_type": simulation["type"],
+            }
+        )
+        if len(locations) == NUMBER_OF_LOCATIONS:
+            break
+    return locations
+
+
+class PotentialUser(HttpUser):
+    @task
+    def get_potential_simulation(self):
+        with self.client.get(
+            url="/api/potential/",
+            params=random.choice(self.locations),
+            catch_response=True,
+            headers={
+                "Authorization": f"Bearer {self.token}",
+                "Cache-Control": "no-cache",
+            },
+            cookies={},
+            name="/api/potential/",
+        ) as response:
+            check_response(response=response)
+
+    def on_start(self):
+        with self.client.post(
+            url="/api/auth/login",
+            json={
+                "user": os.environ.get("user", "admin"),
+                "password": os.environ.get("password", "admin"),
+            },
+            catch_response=True,
+        ) as response:
+            assert response.ok, response
+            self.token = response.json()["access_token"]
+            self.locations = get_locations()
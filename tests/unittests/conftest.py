@@ -133,3 +133,11 @@ def layout_scaled_classified_wo_db_conn(
 def requests_mock(requests_mock):
     """To make sure no requests are happening in unittests"""
     return requests_mock
+
+
+@pytest.fixture(autouse=True)
+def clear_layout_violations_cache():
+    from handlers.editor_v2 import ReactPlannerHandler
+
+    yield
+    ReactPlannerHandler.clear_layout_violations_cache()
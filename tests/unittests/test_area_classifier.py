@@ -1,5 +1,11 @@
+import pickle
+
+import pytest
+
+from brooks import area_classifier
 from brooks.area_classifier import AreaClassifier
 from brooks.types import FeatureType
+from common_utils.exceptions import NoClassifierAvailableException
 
 
 def test_allowed_features():
@@ -20,3 +26,57 @@ def test_allowed_features():
         FeatureType.TOILET.name,
         FeatureType.WASHING_MACHINE.name,
     }
+
+
+def test_classify_areas_predicts_all_layouts_at_once(
+    mocker, layout_scaled_classified_wo_db_conn
+):
+    layouts = [
+        layout_scaled_classified_wo_db_conn(annotation_plan_id=plan_id)
+        for plan_id in (3332, 5825)
+    ]
+    layout_areas = [(layout, area) for layout in layouts for area in layout.areas]
+    classifier = AreaClassifier()
+    classifier._classifier = mocker.MagicMock()
+    classifier._classifier.predict.side_effect = lambda feature_matrix: [0] * len(
+        feature_matrix
+    )
+
+    area_types = classifier.classify_areas(layout_areas=layout_areas)
+
+    assert classifier._classifier.predict.call_count == 1
+    (feature_matrix,) = classifier._classifier.predict.call_args.args
+    assert feature_matrix.shape[0] == len(layout_areas)
+    assert area_types == classifier._decode_labels([0]) * len(layout_areas)
+
+
+def test_classify_areas_without_areas_does_not_predict(mocker):
+    classifier = AreaClassifier()
+    classifier._classifier = mocker.MagicMock()
+
+    assert classifier.classify_areas(layout_areas=[]) == []
+    classifier._classifier.predict.assert_not_called()
+
+
+def test_load_shares_the_unpickled_model(mocker, tmp_path):
+    model_path = tmp_path.joinpath("CLASSIFICATIONS.UNIFIED.pickle")
+    with model_path.open("wb") as fh:
+        pickle.dump({"model": 1}, fh)
+    mocker.patch.object(area_classifier, "CLASSIFIER_DIR", tmp_path)
+    mocker.patch.dict(area_classifier._LOADED_CLASSIFIERS, clear=True)
+    pickle_load_spy = mocker.spy(area_classifier.pickle, "load")
+
+    classifiers = [AreaClassifier(), AreaClassifier()]
+    for classifier in classifiers:
+        classifier.load()
+
+    assert pickle_load_spy.call_count == 1
+    assert classifiers[0]._classifier is classifiers[1]._classifier
+
+
+def test_load_raises_without_model(mocker, tmp_path):
+    mocker.patch.object(area_classifier, "CLASSIFIER_DIR", tmp_path)
+    mocker.patch.dict(area_classifier._LOADED_CLASSIFIERS, clear=True)
+
+    with pytest.raises(NoClassifierAvailableException):
+        AreaClassifier().load()
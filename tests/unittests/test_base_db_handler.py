@@ -7,7 +7,8 @@ from tests.constants import NON_DEFAULT_ISOLATION_LEVEL
 class TestBaseDBHandler:
     @pytest.mark.parametrize("readonly", [True, False])
     @pytest.mark.parametrize(
-        "isolation_level", [DEFAULT_ISOLATION_LEVEL, NON_DEFAULT_ISOLATION_LEVEL]
+        "isolation_level",
+        [None, DEFAULT_ISOLATION_LEVEL, NON_DEFAULT_ISOLATION_LEVEL],
     )
     def test_begin_session_applies_db_handler_isolation_level(
         self, mocker, readonly, isolation_level
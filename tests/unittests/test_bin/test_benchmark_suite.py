@@ -0,0 +1,192 @@
+import random
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from bin.profiling.benchmark_suite import cases, runner
+from bin.profiling.benchmark_suite.runner import (
+    Benchmark,
+    BenchmarkComparison,
+    BenchmarkResult,
+    StackSampler,
+    compare_with_baseline,
+    load_report,
+    make_report,
+    profile_benchmark,
+    register_benchmark,
+    run_benchmark,
+    save_report,
+)
+from bin.profiling.run_benchmark_suite import run_benchmark_suite
+
+
+def _sleep_a_bit():
+    time.sleep(0.02)
+
+
+@pytest.fixture
+def random_benchmark():
+    draws = []
+
+    def _prepare():
+        draws.append(random.random())
+        return lambda: draws.append(random.random())
+
+    return Benchmark(name="random", prepare=_prepare, regression_threshold=0.1), draws
+
+
+@pytest.fixture
+def registry(mocker):
+    return mocker.patch.dict(runner.BENCHMARKS, clear=True)
+
+
+def test_register_benchmark(registry):
+    @register_benchmark("fake", regression_threshold=0.2)
+    def fake():
+        return lambda: None
+
+    assert runner.BENCHMARKS["fake"] == Benchmark(
+        name="fake", prepare=fake, regression_threshold=0.2
+    )
+    with pytest.raises(ValueError):
+        register_benchmark("fake")(fake)
+
+
+def test_run_benchmark_is_reproducible(random_benchmark):
+    benchmark, draws = random_benchmark
+
+    result = run_benchmark(
+        benchmark=benchmark, repetitions=3, warmup=2, measure_memory=True
+    )
+
+    assert result.name == "random"
+    assert len(result.times) == 3
+    assert result.allocated_bytes is not None
+    # preparation, warmup, repetitions and memory run are all seeded the same way
+    assert len(draws) == 1 + 2 + 3 + 1
+    assert len(set(draws)) == 1
+
+
+def test_run_benchmark_without_memory(random_benchmark):
+    benchmark, draws = random_benchmark
+    result = run_benchmark(
+        benchmark=benchmark, repetitions=2, warmup=0, measure_memory=False
+    )
+    assert result.allocated_bytes is None
+    assert len(draws) == 1 + 2
+
+
+def test_benchmark_result_to_dict():
+    result = BenchmarkResult(
+        name="fake", times=[3.0, 1.0, 2.0], regression_threshold=0.1
+    ).to_dict()
+    assert result == {
+        "repetitions": 3,
+        "min": 1.0,
+        "median": 2.0,
+        "mean": 2.0,
+        "stddev": pytest.approx(0.8164965),
+        "times": [3.0, 1.0, 2.0],
+        "allocated_bytes": None,
+        "regression_threshold": 0.1,
+    }
+
+
+def test_save_and_load_report(tmp_path):
+    report = make_report(
+        results=[BenchmarkResult(name="fake", times=[1.0], regression_threshold=0.1)]
+    )
+    path = tmp_path.joinpath("reports", "report.json")
+    save_report(report=report, path=path)
+
+    loaded = load_report(path=path)
+    assert loaded == report
+    assert loaded["benchmarks"]["fake"]["median"] == 1.0
+    assert loaded["errors"] == {}
+    assert "python" in loaded["environment"]
+
+
+@pytest.mark.parametrize(
+    "median, expected_regression", [(1.05, False), (1.1, False), (1.2, True)]
+)
+def test_compare_with_baseline(median, expected_regression):
+    report = {
+        "benchmarks": {
+            "fake": {"median": median, "regression_threshold": 0.1},
+            "new": {"median": 1.0, "regression_threshold": 0.1},
+        }
+    }
+    baseline = {"benchmarks": {"fake": {"median": 1.0}, "removed": {"median": 1.0}}}
+
+    comparisons = compare_with_baseline(report=report, baseline=baseline)
+
+    assert comparisons == [
+        BenchmarkComparison(
+            name="fake", baseline_median=1.0, median=median, regression_threshold=0.1
+        )
+    ]
+    assert comparisons[0].ratio == pytest.approx(median)
+    assert comparisons[0].is_regression is expected_regression
+
+
+def test_stack_sampler(tmp_path):
+    with StackSampler(interval=0.001) as sampler:
+        _sleep_a_bit()
+
+    assert sampler.samples
+    assert any(
+        stack.split(";")[-1].startswith("_sleep_a_bit (") for stack in sampler.samples
+    )
+
+    path = tmp_path.joinpath("stacks.folded")
+    sampler.write_folded(path)
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert sampler.samples[stack] == int(count)
+
+
+def test_profile_benchmark(tmp_path):
+    benchmark = Benchmark(
+        name="sleep", prepare=lambda: _sleep_a_bit, regression_threshold=0.1
+    )
+
+    stats_path, folded_path = profile_benchmark(
+        benchmark=benchmark, directory=tmp_path.joinpath("profiles")
+    )
+
+    assert stats_path == tmp_path.joinpath("profiles", "sleep.prof")
+    assert folded_path == tmp_path.joinpath("profiles", "sleep.folded")
+    assert stats_path.stat().st_size > 0
+    assert "_sleep_a_bit" in folded_path.read_text()
+
+
+def test_run_benchmark_suite_records_failing_benchmarks(registry, tmp_path):
+    @register_benchmark("failing")
+    def failing():
+        def _fail():
+            raise ValueError("broken fixture")
+
+        return _fail
+
+    register_benchmark("passing")(lambda: lambda: None)
+    output = tmp_path.joinpath("report.json")
+
+    result = CliRunner().invoke(
+        run_benchmark_suite,
+        ["--repetitions", "1", "--no-memory", "--output", str(output)],
+    )
+
+    assert result.exit_code == 1
+    assert "Benchmarks failed: failing" in result.output
+    report = load_report(path=output)
+    assert report["errors"] == {"failing": "ValueError: broken fixture"}
+    assert list(report["benchmarks"]) == ["passing"]
+
+
+@pytest.mark.parametrize("name", sorted(runner.BENCHMARKS))
+def test_benchmark_cases(name):
+    """Every registered benchmark can be prepared and run from the fixtures"""
+    assert cases.FIXTURES_PATH.exists()
+    benchmark = runner.BENCHMARKS[name]
+    run_benchmark(benchmark=benchmark, repetitions=1, warmup=0, measure_memory=False)
@@ -608,3 +608,45 @@ def test_footprints_buffered_n_rounded_for_union():
         ]
     )
     assert all(f.is_valid for f in footprints)
+
+
+def test_non_overlapping_separators():
+    """
+    The thinner wall crossing the thicker wall is split in 2 pieces, the isolated wall
+    is left untouched and the original separators are not modified
+    """
+    thick_wall = SimSeparator(
+        footprint=box(0, 0, 10, 0.5), separator_type=SeparatorType.WALL
+    )
+    crossing_wall = SimSeparator(
+        footprint=box(4, -2, 4.2, 2), separator_type=SeparatorType.WALL
+    )
+    isolated_wall = SimSeparator(
+        footprint=box(20, 0, 20.2, 5), separator_type=SeparatorType.RAILING
+    )
+    window = SimOpening(
+        footprint=box(4, 1, 4.2, 1.5),
+        height=(1, 2),
+        separator=crossing_wall,
+        separator_reference_line=None,
+        opening_type=OpeningType.WINDOW,
+    )
+    crossing_wall.add_opening(window)
+    layout = SimLayout(separators={thick_wall, crossing_wall, isolated_wall})
+
+    separators = layout.non_overlapping_separators
+
+    assert len(separators) == 4
+    assert sum(separator.footprint.area for separator in separators) == pytest.approx(
+        5 + 0.2 * 3.5 + 1
+    )
+    assert crossing_wall.footprint.area == pytest.approx(0.8)
+    openings = [opening for separator in separators for opening in separator.openings]
+    assert len(openings) == 1
+    assert openings[0].id == window.id
+    assert openings[0] is not window
+    assert openings[0].separator.footprint.intersects(window.footprint)
+    assert {separator.type for separator in separators} == {
+        SeparatorType.WALL,
+        SeparatorType.RAILING,
+    }
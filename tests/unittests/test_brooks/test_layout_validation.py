@@ -4,7 +4,8 @@ from unittest.mock import PropertyMock
 import pytest
 from shapely.geometry import LineString, Polygon, box
 
-from brooks.layout_validations import SimLayoutValidations
+from brooks import layout_validations
+from brooks.layout_validations import OpeningChecksCache, SimLayoutValidations
 from brooks.models import (
     SimArea,
     SimFeature,
@@ -104,6 +105,78 @@ def test_validate_openings_do_not_overlap(mocker, opening_a, opening_b, expected
         assert not violations
 
 
+def test_validate_openings_overlap_only_reports_overlapping_openings(mocker):
+    separator = SimSeparator(footprint=Polygon(), separator_type=SeparatorType.WALL)
+    openings = [
+        SimOpening(
+            footprint=box(*bounds),
+            separator=separator,
+            height=(1, 1),
+            separator_reference_line=LineString(),
+        )
+        for bounds in [(0, 0, 2, 2), (1, 0, 3, 2), (3, 0, 5, 2), (10, 0, 12, 2)]
+    ]
+    mocker.patch.object(SimLayout, "openings", PropertyMock(return_value=openings))
+
+    violations = list(
+        SimLayoutValidations.validate_openings_overlap_openings(layout=SimLayout())
+    )
+    assert [violation.entity for violation in violations] == openings[:2]
+
+
+def test_validate_openings_overlap_rechecks_only_changed_neighbourhoods(mocker):
+    separator = SimSeparator(footprint=Polygon(), separator_type=SeparatorType.WALL)
+
+    def make_openings(bounds_list):
+        return [
+            SimOpening(
+                footprint=box(*bounds),
+                separator=separator,
+                height=(1, 1),
+                separator_reference_line=LineString(),
+            )
+            for bounds in bounds_list
+        ]
+
+    openings_mock = mocker.patch.object(
+        SimLayout,
+        "openings",
+        PropertyMock(
+            return_value=make_openings(
+                [(0, 0, 2, 2), (1, 0, 3, 2), (10, 0, 12, 2), (20, 0, 22, 2)]
+            )
+        ),
+    )
+    opening_checks = OpeningChecksCache()
+    assert (
+        len(
+            list(
+                SimLayoutValidations.validate_openings_overlap_openings(
+                    layout=SimLayout(), opening_checks=opening_checks
+                )
+            )
+        )
+        == 2
+    )
+
+    # The 3rd opening now overlaps the 4th one, the first 2 are unchanged
+    openings = make_openings(
+        [(0, 0, 2, 2), (1, 0, 3, 2), (19, 0, 21, 2), (20, 0, 22, 2)]
+    )
+    openings_mock.return_value = openings
+    intersection_spy = mocker.spy(layout_validations, "intersection")
+    new_opening_checks = OpeningChecksCache(previous_checks=opening_checks.checks)
+    violations = list(
+        SimLayoutValidations.validate_openings_overlap_openings(
+            layout=SimLayout(), opening_checks=new_opening_checks
+        )
+    )
+
+    assert [violation.entity for violation in violations] == openings
+    assert intersection_spy.call_count == 2
+    assert len(new_opening_checks.checks) == 4
+
+
 @pytest.mark.parametrize(
     "feature_footprint, expected",
     [
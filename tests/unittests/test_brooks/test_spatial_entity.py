@@ -0,0 +1,66 @@
+import copy
+import pickle
+
+from shapely.geometry import Polygon, box
+
+from brooks.models import SimArea, SimLayout, SimSpace, SpatialEntity, spatial_entity
+
+BOW_TIE = Polygon([(0, 0), (2, 2), (2, 0), (0, 2), (0, 0)])
+
+
+def test_entities_have_sequential_unique_ids():
+    first, second = SimArea(footprint=box(0, 0, 1, 1)), SimArea(
+        footprint=box(0, 0, 1, 1)
+    )
+    assert first.id != second.id
+    assert int(second.id[8:], 16) > int(first.id[8:], 16)
+
+
+def test_entities_store_attributes_in_slots():
+    area = SimArea(footprint=box(0, 0, 1, 1), db_area_id=5)
+    area.features.add(SimArea(footprint=box(0, 0, 1, 1)))
+
+    assert "features" in SimArea.__slots__
+    assert area.__dict__ == {}
+
+
+def test_footprint_validity_is_ensured_on_first_access(mocker):
+    validity_spy = mocker.spy(spatial_entity, "ensure_geometry_validity")
+    area = SimArea(footprint=BOW_TIE)
+    validity_spy.assert_not_called()
+
+    assert area.footprint.is_valid
+    assert area.footprint.is_valid
+    assert validity_spy.call_count == 1
+
+
+def test_ensure_footprints_validity_only_fixes_invalid_footprints(mocker):
+    valid, invalid = SimArea(footprint=box(0, 0, 1, 1)), SimArea(footprint=BOW_TIE)
+    validity_spy = mocker.spy(spatial_entity, "ensure_geometry_validity")
+
+    SpatialEntity.ensure_footprints_validity([valid, invalid])
+
+    validity_spy.assert_called_once_with(geometry=BOW_TIE)
+    assert invalid.footprint.is_valid
+    assert valid._footprint_validated
+
+
+def test_layout_ensures_footprints_validity_of_its_entities():
+    area = SimArea(footprint=BOW_TIE)
+    space = SimSpace(footprint=box(0, 0, 2, 2), areas={area})
+
+    SimLayout(spaces={space})
+
+    assert area._footprint_validated
+    assert area._footprint.is_valid
+
+
+def test_entities_can_be_copied_and_pickled():
+    area = SimArea(footprint=box(0, 0, 1, 1), db_area_id=5)
+    assert area.area_without_stairs == 1.0
+
+    for copied in (copy.deepcopy(area), pickle.loads(pickle.dumps(area))):
+        assert copied.id == area.id
+        assert copied.db_area_id == 5
+        assert copied.footprint.equals(area.footprint)
+        assert copied.area_without_stairs == 1.0
@@ -1,8 +1,8 @@
 import pytest
-from shapely.geometry import LineString, box
+from shapely.geometry import LineString, Polygon, box
 
-from brooks.models import SimLayout, SimOpening, SimSeparator
-from brooks.types import SeparatorType
+from brooks.models import SimArea, SimLayout, SimOpening, SimSeparator, SimSpace
+from brooks.types import AreaType, OpeningType, SeparatorType
 from brooks.unit_layout_factory import UnitLayoutFactory
 
 
@@ -32,3 +32,96 @@ def test_copy_opening_to_separator(
         overlap_threshold=overlap_threshold,
     )
     assert bool(separator.openings) == expected_assignment
+
+
+def test_create_sub_layouts():
+    """Expected geometries are the ones of the previous implementation creating the
+    sub layouts one by one"""
+    spaces = []
+    for x, area_types in (
+        (0, (AreaType.ROOM, AreaType.KITCHEN)),
+        (5, (AreaType.BATHROOM,)),
+    ):
+        space = SimSpace(footprint=box(x, 0, x + 4.9, 4))
+        width = 4.9 / len(area_types)
+        for i, area_type in enumerate(area_types):
+            space.add_area(
+                SimArea(
+                    footprint=box(x + i * width, 0, x + (i + 1) * width, 4),
+                    area_type=area_type,
+                )
+            )
+        spaces.append(space)
+    wall_between = SimSeparator(
+        footprint=box(4.9, 0, 5, 4), separator_type=SeparatorType.WALL
+    )
+    wall_between.add_opening(
+        SimOpening(
+            footprint=box(4.9, 1, 5, 2),
+            height=(0, 2),
+            separator=wall_between,
+            separator_reference_line=LineString([(4.95, 0), (4.95, 4)]),
+            opening_type=OpeningType.DOOR,
+        )
+    )
+    separators = {
+        wall_between,
+        SimSeparator(
+            footprint=box(-0.2, -0.2, 10.1, 0), separator_type=SeparatorType.WALL
+        ),
+        SimSeparator(footprint=box(20, 20, 21, 21), separator_type=SeparatorType.WALL),
+    }
+    plan_layout = SimLayout(spaces=set(spaces), separators=separators)
+    units_spaces_ids = [{spaces[0].id}, {spaces[1].id}, set()]
+
+    unit_layouts = UnitLayoutFactory(plan_layout=plan_layout).create_sub_layouts(
+        spaces_ids_by_unit=units_spaces_ids,
+        area_db_ids_by_unit=[None] * len(units_spaces_ids),
+    )
+
+    expected_by_unit = [
+        {
+            "areas": [
+                (AreaType.KITCHEN, box(2.45, 0, 4.9, 4)),
+                (AreaType.ROOM, box(0, 0, 2.45, 4)),
+            ],
+            "separators": [box(-0.2, -0.2, 5.8, 0), box(4.9, 0, 5, 4)],
+            "openings": [(OpeningType.DOOR, box(4.9, 1, 5, 2))],
+        },
+        {
+            "areas": [(AreaType.BATHROOM, box(5, 0, 9.9, 4))],
+            "separators": [box(4.1, -0.2, 10.1, 0), box(4.9, 0, 5, 4)],
+            "openings": [(OpeningType.DOOR, box(4.9, 1, 5, 2))],
+        },
+        {"areas": [], "separators": [], "openings": []},
+    ]
+    for spaces_ids, unit_layout, expected in zip(
+        units_spaces_ids, unit_layouts, expected_by_unit
+    ):
+        assert {space.id for space in unit_layout.spaces} == spaces_ids
+
+        areas = sorted(unit_layout.areas, key=lambda area: area.type.name)
+        assert [area.type for area in areas] == [
+            area_type for area_type, _ in expected["areas"]
+        ]
+        for area, (_, expected_footprint) in zip(areas, expected["areas"]):
+            assert area.footprint.equals(expected_footprint)
+
+        unit_separators = sorted(
+            unit_layout.separators, key=lambda separator: separator.footprint.bounds
+        )
+        assert len(unit_separators) == len(expected["separators"])
+        for separator, expected_footprint in zip(
+            unit_separators, expected["separators"]
+        ):
+            assert isinstance(separator.footprint, Polygon)
+            assert separator.footprint.equals(expected_footprint)
+
+        openings = list(unit_layout.openings)
+        assert len(openings) == len(expected["openings"])
+        for opening, (expected_type, expected_footprint) in zip(
+            openings, expected["openings"]
+        ):
+            assert opening.type == expected_type
+            assert opening.footprint.equals(expected_footprint)
+            assert opening.separator in unit_layout.separators
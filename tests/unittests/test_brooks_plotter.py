@@ -25,6 +25,7 @@ from brooks.visualization.brooks_plotter import BrooksPlotter
 from brooks.visualization.floorplans.layouts.assetmanager_layout_text import (
     BaseAssetManagerTextGenerator,
 )
+from brooks.visualization.floorplans.layouts.floor_layout import AssetManagerFloorLayout
 from brooks.visualization.floorplans.patches.generators import (
     _are_lines_parallel,
     _get_layout_separator_interior_lines,
@@ -95,6 +96,43 @@ def test_opening_sub_types(mocker, fixtures_path, opening_sub_type):
     )
 
 
+def test_generate_floor_plots_translates_the_same_figure(mocker):
+    metadata = dict(street="Street", housenumber="1", level=1, zipcode=8000, city="Z")
+    dummy_layout = _generate_dummy_layout(feature_type=FeatureType.SHOWER)
+    generate_layout_spy = mocker.spy(AssetManagerFloorLayout, "generate_layout")
+
+    plots = list(
+        BrooksPlotter().generate_floor_plots(
+            floor_plan_layout=dummy_layout,
+            unit_layouts=[dummy_layout],
+            unit_ids=["unit_id"],
+            metadata=metadata,
+            languages=[SUPPORTED_LANGUAGES.EN, SUPPORTED_LANGUAGES.DE],
+            file_formats=[SUPPORTED_OUTPUT_FILES.PNG],
+        )
+    )
+
+    assert generate_layout_spy.call_count == 1
+    assert [(language, file_format) for language, file_format, _ in plots] == [
+        (SUPPORTED_LANGUAGES.EN, SUPPORTED_OUTPUT_FILES.PNG),
+        (SUPPORTED_LANGUAGES.DE, SUPPORTED_OUTPUT_FILES.PNG),
+    ]
+    for language, file_format, io_image in plots:
+        assert (
+            io_image.read()
+            == BrooksPlotter()
+            .generate_floor_plot(
+                floor_plan_layout=dummy_layout,
+                unit_layouts=[dummy_layout],
+                unit_ids=["unit_id"],
+                metadata=metadata,
+                language=language,
+                file_format=file_format,
+            )
+            .read()
+        )
+
+
 class TestWindowPatchGenerator:
     @pytest.mark.parametrize(
         "wall_geometry, opening_geometry",
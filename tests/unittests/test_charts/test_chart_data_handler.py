@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from common_utils.constants import PRICEHUBBLE_AREA_TYPES
+from handlers.charts.chart_data_handler import ChartDataHandler
+
+CLUSTER = "MEDIUM_LEVEL_3.X"
+
+
+@pytest.fixture
+def mocked_reference_percentiles(mocker):
+    levels = [f"{percentile / 100:.2f}" for percentile in range(1, 101)]
+    percentiles = pd.DataFrame(
+        {
+            "view_sky": dict(zip(levels, np.linspace(0.01, 1, 100))),
+            "connectivity_kitchen_distance_p20": dict(
+                zip(levels, np.linspace(1, 100, 100))
+            ),
+        }
+    )
+    return mocker.patch.object(
+        ChartDataHandler,
+        "reference_dataframe_percentiles_per_cluster",
+        mocker.PropertyMock(
+            return_value={
+                CLUSTER: {
+                    PRICEHUBBLE_AREA_TYPES.STOREROOM.value: percentiles,
+                    PRICEHUBBLE_AREA_TYPES.ROOM.value: percentiles * 2,
+                }
+            }
+        ),
+    )
+
+
+def test_get_dataframe_per_room_type_as_cluster_percentiles(
+    mocked_reference_percentiles,
+):
+    dataframe = pd.DataFrame(
+        {
+            "apartment_aggregate_cluster": [CLUSTER, CLUSTER, CLUSTER, None],
+            "layout_area_type": [
+                PRICEHUBBLE_AREA_TYPES.ROOM.value,
+                PRICEHUBBLE_AREA_TYPES.STOREROOM.value,
+                PRICEHUBBLE_AREA_TYPES.ROOM.value,
+                PRICEHUBBLE_AREA_TYPES.ROOM.value,
+            ],
+            "view_sky": [0.5, 0.5, 0.0, 0.5],
+            "connectivity_kitchen_distance_p20": [50.0, 50.0, 500.0, 50.0],
+        },
+        index=[10, 11, 12, 13],
+    )
+
+    percentiles = ChartDataHandler(
+        site_id=1
+    ).get_dataframe_per_room_type_as_cluster_percentiles(
+        dataframe=dataframe,
+        output_columns=["view_sky", "connectivity_kitchen_distance_p20"],
+        index_columns=("index",),
+        weights={"view_sky": 1, "connectivity_kitchen_distance_p20": -1},
+    )
+
+    # rows are grouped by cluster and area type and rows without cluster are dropped
+    assert percentiles.index.tolist() == [10, 12, 11]
+    assert percentiles["view_sky"].tolist() == pytest.approx([25.0, 1.0, 50.0])
+    assert percentiles["connectivity_kitchen_distance_p20"].tolist() == (
+        pytest.approx([76.0, 0.0, 51.0])
+    )
+
+
+def test_functional_accessibility():
+    percentile_dataframe = pd.DataFrame(
+        {
+            "layout_area_type": [
+                PRICEHUBBLE_AREA_TYPES.ROOM.value,
+                PRICEHUBBLE_AREA_TYPES.STOREROOM.value,
+                "Unknown",
+            ],
+            "connectivity_bathroom_distance_p20": [10.0, 20.0, 30.0],
+            "connectivity_kitchen_distance_p20": [50.0, 60.0, 70.0],
+        },
+        index=[3, 4, 5],
+    )
+
+    functional_accessibility = ChartDataHandler._functional_accessibility(
+        percentile_dataframe=percentile_dataframe
+    )
+
+    assert functional_accessibility.index.tolist() == [3, 4, 5]
+    assert functional_accessibility.tolist() == pytest.approx([90 * 50, 40, 1])
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from handlers.charts import reference_data
+from handlers.charts.reference_data import (
+    load_manifest,
+    load_percentile_tables,
+    load_reference_dataframe,
+    write_reference_data,
+)
+
+
+@pytest.fixture
+def reference_sources(tmp_path, mocker):
+    sources = (tmp_path.joinpath("simulations.csv"), tmp_path.joinpath("p.json"))
+    for source in sources:
+        source.write_text(source.name)
+    mocker.patch.object(reference_data, "REFERENCE_DATA_SOURCES", sources)
+    load_manifest.cache_clear()
+    yield sources
+    load_manifest.cache_clear()
+
+
+@pytest.fixture
+def reference_dataframe():
+    return pd.DataFrame(
+        {
+            "site_id": [1, 1, 2],
+            "layout_area": [10.5, np.nan, 3.0],
+            "apartment_aggregate_is_maisonette": [True, False, False],
+            "apartment_id": ["a", "b", None],
+            "layout_area_type": ["Room", "Kitchen", "Room"],
+        }
+    )
+
+
+@pytest.fixture
+def percentile_tables():
+    levels = np.arange(0, 100, 1.0)
+    return {
+        ("GROUND_LEVEL_2.X", "Room"): (
+            levels,
+            {"view_sky": np.linspace(0, 1, 100), "layout_area": np.arange(100.0)},
+        ),
+        ("TOP_LEVEL_3.X", "Kitchen"): (
+            levels,
+            {"view_sky": np.linspace(1, 2, 100), "layout_area": np.arange(100.0)},
+        ),
+    }
+
+
+def test_reference_data_round_trip(
+    tmp_path, reference_sources, reference_dataframe, percentile_tables, mocker
+):
+    write_reference_data(
+        reference_dataframe=reference_dataframe,
+        percentile_tables=percentile_tables,
+        directory=tmp_path,
+    )
+    loaded_blocks = {}
+
+    def load(file, *args, **kwargs):
+        loaded_blocks[Path(file).name] = np.lib.npyio.load(file, *args, **kwargs)
+        return loaded_blocks[Path(file).name]
+
+    mocker.patch.object(reference_data.np, "load", side_effect=load)
+
+    loaded_dataframe = load_reference_dataframe(directory=tmp_path)
+    pd.testing.assert_frame_equal(loaded_dataframe, reference_dataframe)
+    # The numeric columns of the loaded dataframe are views of the memory mapped files
+    for block_file, column in [
+        ("block_0.npy", "site_id"),
+        ("block_1.npy", "layout_area"),
+    ]:
+        assert isinstance(loaded_blocks[block_file], np.memmap)
+        assert np.shares_memory(
+            loaded_dataframe[column].to_numpy(), loaded_blocks[block_file]
+        )
+
+    loaded_tables = load_percentile_tables(directory=tmp_path)
+    assert loaded_tables.keys() == percentile_tables.keys()
+    for cluster, (levels, reference_values) in percentile_tables.items():
+        np.testing.assert_array_equal(loaded_tables[cluster][0], levels)
+        for column, values in reference_values.items():
+            np.testing.assert_array_equal(loaded_tables[cluster][1][column], values)
+
+
+def test_reference_data_is_ignored_if_sources_changed(
+    tmp_path, reference_sources, reference_dataframe, percentile_tables
+):
+    write_reference_data(
+        reference_dataframe=reference_dataframe,
+        percentile_tables=percentile_tables,
+        directory=tmp_path,
+    )
+    reference_sources[0].write_text("new benchmark dataset")
+
+    assert load_reference_dataframe(directory=tmp_path) is None
+    assert load_percentile_tables(directory=tmp_path) is None
+
+
+def test_reference_data_missing(tmp_path, reference_sources):
+    assert load_reference_dataframe(directory=tmp_path) is None
@@ -7,6 +7,7 @@ from handlers.db.utils import (
     DEFAULT_DB_WAIT_STRATEGY,
     POTENTIAL_DB_WAIT_STRATEGY,
     RETRY_ON_DB_OPERATIONAL_ERROR,
+    _record_retry,
     retry_on_db_operational_error,
 )
 
@@ -120,6 +121,7 @@ class TestRetryOnDbOperationalError:
         mocked_retry_decorator.assert_called_once_with(
             retry=RETRY_ON_DB_OPERATIONAL_ERROR,
             reraise=True,
+            before_sleep=_record_retry,
             **wait_strategy or DEFAULT_DB_WAIT_STRATEGY
         )
 
@@ -190,6 +192,29 @@ class TestRetryOnDbOperationalError:
         # Then
         assert method_counter == 3
 
+    def test_retries_are_counted(self, mocker, mocked_session_manager):
+        from connectors.db_connector import DBStatistics
+
+        statistics = mocker.patch("handlers.db.utils.db_statistics", DBStatistics())
+        mocked_session_manager(tran_count=0)
+
+        @retry_on_db_operational_error(stop=stop_after_attempt(3))
+        def method_raising_a_serialization_failure():
+            raise OperationalError(
+                statement="buhu", params={}, orig=psycopg2.errors.SerializationFailure()
+            )
+
+        with pytest.raises(OperationalError):
+            method_raising_a_serialization_failure()
+
+        # the last attempt is not retried
+        assert statistics.as_dict() == {
+            "retries": {
+                method_raising_a_serialization_failure.__wrapped__.__qualname__: 2
+            },
+            "retried_errors": {"SerializationFailure": 2},
+        }
+
 
 def test_db_handlers_using_db_wait_strategy(mocked_retry_decorator):
     from handlers.db import BaseDBHandler, PotentialSimulationDBHandler
@@ -202,12 +227,16 @@ def test_db_handlers_using_db_wait_strategy(mocked_retry_decorator):
 
     # Then
     mocked_retry_decorator.assert_called_with(
-        retry=RETRY_ON_DB_OPERATIONAL_ERROR, reraise=True, **DEFAULT_DB_WAIT_STRATEGY
+        retry=RETRY_ON_DB_OPERATIONAL_ERROR,
+        reraise=True,
+        before_sleep=_record_retry,
+        **DEFAULT_DB_WAIT_STRATEGY
     )
     with pytest.raises(AssertionError):
         mocked_retry_decorator.assert_called_with(
             retry=RETRY_ON_DB_OPERATIONAL_ERROR,
             reraise=True,
+            before_sleep=_record_retry,
             **POTENTIAL_DB_WAIT_STRATEGY
         )
 
@@ -215,5 +244,8 @@ def test_db_handlers_using_db_wait_strategy(mocked_retry_decorator):
     PotentialSimulationDBHandler.get_by(id=1)
     # Then
     mocked_retry_decorator.assert_called_with(
-        retry=RETRY_ON_DB_OPERATIONAL_ERROR, reraise=True, **POTENTIAL_DB_WAIT_STRATEGY
+        retry=RETRY_ON_DB_OPERATIONAL_ERROR,
+        reraise=True,
+        before_sleep=_record_retry,
+        **POTENTIAL_DB_WAIT_STRATEGY
     )
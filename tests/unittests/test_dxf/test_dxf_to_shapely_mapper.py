@@ -567,6 +567,50 @@ class TestDXFtoShapelyMapper:
         elif isinstance(valid_geometry, Polygon):
             assert valid_geometry.area > 0
 
+    @staticmethod
+    def test_get_dxf_geometries_keeps_modelspace_order_and_converts_once(mocker):
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        msp.add_line((0, 0), (1, 0), dxfattribs={"layer": "WALL"})
+        msp.add_lwpolyline([(0, 0), (0, 5)], dxfattribs={"layer": "WALL"})
+        msp.add_line((0, 0), (2, 0), dxfattribs={"layer": "RAILING"})
+        msp.add_line((0, 0), (3, 0), dxfattribs={"layer": "WALL"})
+
+        line_geometry_spy = mocker.spy(DXFtoShapelyMapper, "get_line_geometry")
+        mapper = DXFtoShapelyMapper(dxf_modelspace=msp)
+        for _ in range(2):
+            geometries = mapper.get_dxf_geometries(
+                allowed_layers={"WALL", "RAILING"},
+                allowed_geometry_types={"LINE", "LWPOLYLINE"},
+            )
+            assert [geometry.length for geometry in geometries] == [1, 5, 2, 3]
+
+        assert line_geometry_spy.call_count == 3
+        assert mapper.layer_names == {"WALL", "RAILING"}
+
+    @staticmethod
+    def test_get_dxf_geometries_from_blocks():
+        doc = ezdxf.new()
+        block = doc.blocks.new(name="WC_1")
+        block.add_line((0, 0), (1, 0))
+        block.add_arc(center=(0, 0), radius=1, start_angle=0, end_angle=90)
+        msp = doc.modelspace()
+        msp.add_blockref("WC_1", insert=(10, 0), dxfattribs={"layer": "SANITARY"})
+        msp.add_blockref("WC_1", insert=(20, 0), dxfattribs={"layer": "OTHER"})
+
+        mapper = DXFtoShapelyMapper(dxf_modelspace=msp)
+        geometries = mapper.get_dxf_geometries(
+            allowed_layers={"SANITARY"},
+            allowed_geometry_types={"LINE"},
+            block_name_prefix="WC",
+        )
+
+        assert mapper.get_block_names(
+            react_planner_names={ReactPlannerName.TOILET}
+        ) == {"WC_1"}
+        assert len(geometries) == 1
+        assert geometries[0].equals(LineString([(10, 0), (11, 0)]))
+
 
 def test_rectangles_from_skeleton():
     square = box(0, 2, 0, 2)
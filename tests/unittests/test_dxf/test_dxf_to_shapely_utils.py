@@ -13,7 +13,9 @@ from handlers.dxf.dxf_to_shapely.dxf_to_shapely_utils import (
     filter_too_big_separators,
     get_area_type_from_room_stamp,
     get_bounding_boxes_for_groups_of_geometries,
+    group_line_and_arcs_into_rectangles,
     iteratively_merge_by_intersection,
+    split_polygons_fully_intersected_by_a_wall,
 )
 
 
@@ -179,3 +181,57 @@ def test_iteratively_merge_by_intersection():
         5.362264150943396,
         3.0075471698113203,
     )
+
+
+def test_group_line_and_arcs_into_rectangles():
+    """
+    The 2 squares drawn with lines on the left are grouped together, the square on the
+    right is separated from them by a wall and the line at the far right is too far away
+    """
+    left_squares = [
+        LineString(side)
+        for x_offset in (0, 15)
+        for side in pairwise(
+            [(x_offset, 0), (x_offset + 10, 0), (x_offset + 10, 10), (x_offset, 10)]
+        )
+    ]
+    right_square = [
+        LineString(side)
+        for side in pairwise([(40, 0), (50, 0), (50, 10), (40, 10), (40, 0)])
+    ]
+    isolated_line = LineString([(200, 0), (200, 10)])
+    wall = box(32, -50, 34, 50)
+
+    rectangles = list(
+        group_line_and_arcs_into_rectangles(
+            distance_to_consider_group=20,
+            all_elements=left_squares + right_square + [isolated_line],
+            all_walls_union=wall,
+        )
+    )
+
+    assert len(rectangles) == 3
+    assert rectangles[0].symmetric_difference(box(0, 0, 25, 10)).area < 1e-6
+    assert rectangles[1].symmetric_difference(box(40, 0, 50, 10)).area < 1e-6
+    assert rectangles[2].bounds == pytest.approx((200, 0, 200, 10), abs=1e-5)
+
+
+def test_group_line_and_arcs_into_rectangles_no_elements():
+    assert not list(
+        group_line_and_arcs_into_rectangles(
+            distance_to_consider_group=20,
+            all_elements=[],
+            all_walls_union=box(0, 0, 1, 1),
+        )
+    )
+
+
+def test_split_polygons_fully_intersected_by_a_wall():
+    bounding_boxes = [box(0, 0, 10, 2), box(20, 0, 30, 2)]
+
+    split_boxes = split_polygons_fully_intersected_by_a_wall(
+        bounding_boxes=bounding_boxes, all_walls_union=box(4, -1, 6, 3)
+    )
+
+    assert len(split_boxes) == 3
+    assert sorted(round(split_box.area, 6) for split_box in split_boxes) == [8, 8, 20]
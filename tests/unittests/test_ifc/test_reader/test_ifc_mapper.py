@@ -1,8 +1,11 @@
 import json
 
+import numpy
 import pytest
-from shapely.geometry import Polygon
+from shapely.geometry import LineString, Polygon, box
+from shapely.ops import unary_union
 
+from ifc_reader import ifc_mapper as ifc_mapper_module
 from ifc_reader.constants import IFC_STAIR
 from ifc_reader.exceptions import IfcMapperException
 from ifc_reader.ifc_mapper import IfcToSpatialEntityMapper
@@ -53,8 +56,8 @@ def test_get_geometry_from_ifc_shape_should_raise_if_geometry_empty(
 ):
     mocker.patch.object(
         IfcToSpatialEntityMapper,
-        "get_polygons_from_vertices_and_faces",
-        return_value=[Polygon()],
+        "get_footprint_from_vertices_and_faces",
+        return_value=Polygon(),
     )
     with pytest.raises(
         IfcMapperException, match="is generating a polygon with no area"
@@ -62,5 +65,133 @@ def test_get_geometry_from_ifc_shape_should_raise_if_geometry_empty(
         ifc_mapper = IfcToSpatialEntityMapper(reader=ac20_fzk_haus_ifc_reader)
         ifc_shape = mocker.Mock()
         ifc_shape.geometry.verts = [1, 2, 3]
-        ifc_shape.geometry.faces = [0]
+        ifc_shape.geometry.faces = [0, 0, 0]
         ifc_mapper._get_geometry_from_ifc_shape(ifc_shape=ifc_shape, ifc_type=IFC_STAIR)
+
+
+BOX_FACES = [
+    [0, 1, 3],
+    [0, 3, 2],
+    [4, 5, 7],
+    [4, 7, 6],
+    [0, 1, 5],
+    [0, 5, 4],
+    [2, 3, 7],
+    [2, 7, 6],
+    [0, 2, 6],
+    [0, 6, 4],
+    [1, 3, 7],
+    [1, 7, 5],
+]
+
+
+@pytest.mark.parametrize(
+    "vertices, faces, expected_footprint",
+    [
+        (
+            [(x, y, z) for z in (0, 3) for y in (0, 1) for x in (0, 2)],
+            BOX_FACES,
+            box(0, 0, 2, 1),
+        ),
+        (
+            [(0, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0), (1, 1, 3)],
+            [[0, 1, 2], [0, 2, 3], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]],
+            box(0, 0, 2, 2),
+        ),
+    ],
+)
+def test_get_footprint_from_vertices_and_faces(
+    ac20_fzk_haus_ifc_reader, vertices, faces, expected_footprint
+):
+    ifc_mapper = IfcToSpatialEntityMapper(reader=ac20_fzk_haus_ifc_reader)
+    footprint = ifc_mapper.get_footprint_from_vertices_and_faces(
+        faces=numpy.array(faces), vertices=numpy.array(vertices, dtype=float)
+    )
+    assert footprint.symmetric_difference(expected_footprint).area == pytest.approx(
+        0.0, abs=1e-9
+    )
+
+
+def test_get_footprint_from_vertices_and_faces_keeps_vertical_faces_of_open_meshes(
+    ac20_fzk_haus_ifc_reader,
+):
+    """A horizontal face and a separate vertical face along x=3"""
+    vertices = [
+        (0, 0, 0),
+        (1, 0, 0),
+        (1, 1, 0),
+        (0, 1, 0),
+        (3, 0, 0),
+        (3, 2, 0),
+        (3, 2, 3),
+        (3, 0, 3),
+    ]
+    faces = [[0, 1, 2], [0, 2, 3], [4, 5, 6], [4, 6, 7]]
+    ifc_mapper = IfcToSpatialEntityMapper(reader=ac20_fzk_haus_ifc_reader)
+    footprint = ifc_mapper.get_footprint_from_vertices_and_faces(
+        faces=numpy.array(faces), vertices=numpy.array(vertices, dtype=float)
+    )
+    assert footprint.area == pytest.approx(1.0, abs=1e-6)
+    assert footprint.contains(box(0.1, 0.1, 0.9, 0.9))
+    assert footprint.buffer(1e-8).contains(LineString([(3, 0), (3, 2)]))
+
+
+def test_get_footprint_from_vertices_and_faces_same_as_face_by_face(
+    ac20_fzk_haus_ifc_reader, fixtures_path
+):
+    ifc_mapper = IfcToSpatialEntityMapper(reader=ac20_fzk_haus_ifc_reader)
+    with fixtures_path.joinpath("ifc/linestring_shape.json").open() as f:
+        shape_parameters = json.load(f)
+    vertices = numpy.array(shape_parameters["verts"]).reshape(-1, 3)
+    faces = numpy.array(shape_parameters["faces"]).reshape(-1, 3)
+
+    footprint = ifc_mapper.get_footprint_from_vertices_and_faces(
+        faces=faces, vertices=vertices
+    )
+    face_by_face_footprint = unary_union(
+        ifc_mapper.get_polygons_from_vertices_and_faces(
+            faces=faces.tolist(), vertices=vertices.tolist()
+        )
+    )
+    assert footprint.equals(face_by_face_footprint)
+
+
+@pytest.mark.parametrize(
+    "initialize, get, next_, expected_shapes",
+    [
+        (RuntimeError("init"), ["a", "b"], [True, False], []),
+        (True, ["a", RuntimeError("get"), "c"], [True, True, False], ["a", "c"]),
+        (True, ["a", "b"], [RuntimeError("next")], ["a"]),
+    ],
+)
+def test_iter_ifc_shapes_logs_iterator_failures(
+    mocker, ac20_fzk_haus_ifc_reader, initialize, get, next_, expected_shapes
+):
+    ifc_iterator = mocker.patch.object(
+        ifc_mapper_module, "ifc_geometry_iterator"
+    ).return_value
+    ifc_iterator.initialize.side_effect = [initialize]
+    ifc_iterator.get.side_effect = get
+    ifc_iterator.next.side_effect = next_
+    logger_spy = mocker.spy(ifc_mapper_module.logger, "warning")
+
+    ifc_mapper = IfcToSpatialEntityMapper(reader=ac20_fzk_haus_ifc_reader)
+    shapes = list(ifc_mapper.iter_ifc_shapes(ifc_elements=["element"], num_threads=1))
+
+    assert shapes == expected_shapes
+    assert logger_spy.call_count == 1
+
+
+def test_get_ifc_2d_entities_by_id_uses_configured_threads(
+    mocker, ac20_fzk_haus_ifc_reader
+):
+    iter_ifc_shapes = mocker.patch.object(
+        IfcToSpatialEntityMapper, "iter_ifc_shapes", return_value=iter([])
+    )
+    IfcToSpatialEntityMapper(reader=ac20_fzk_haus_ifc_reader).get_ifc_2d_entities_by_id(
+        ifc_elements=["element"]
+    )
+    assert (
+        iter_ifc_shapes.call_args.kwargs["num_threads"]
+        == ifc_mapper_module.IFC_GEOMETRY_ITERATOR_THREADS
+    )
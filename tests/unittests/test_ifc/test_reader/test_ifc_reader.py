@@ -2,13 +2,14 @@ import uuid
 from pathlib import Path
 
 import pytest
-from shapely.geometry import Point
+from shapely.geometry import Point, box
 
 from brooks.models import SimLayout
 from brooks.types import OpeningType
 from ifc_reader import reader as reader_module
-from ifc_reader.constants import IFC_STAIR
+from ifc_reader.constants import IFC_SPACE, IFC_STAIR, IFC_WALL_STANDARD_CASE
 from ifc_reader.exceptions import IfcValidationException
+from ifc_reader.types import Ifc2DEntity
 
 
 @pytest.fixture
@@ -226,3 +227,52 @@ def test_ifc_2d_sub_entities_from_element_filters_invalid_geometries(mocker):
         ).ifc_2d_sub_entities_from_element(element=element_mock)
     )
     assert not entities
+
+
+def test_extract_ifc_2d_entities_matches_single_element_mapping(
+    ac20_fzk_haus_ifc_reader,
+):
+    ifc_elements = ac20_fzk_haus_ifc_reader.wrapper.by_type(
+        IFC_WALL_STANDARD_CASE
+    ) + ac20_fzk_haus_ifc_reader.wrapper.by_type(IFC_SPACE)
+    ac20_fzk_haus_ifc_reader.extract_ifc_2d_entities(ifc_elements=ifc_elements)
+
+    for ifc_element in ifc_elements:
+        expected = ac20_fzk_haus_ifc_reader.ifc_mapper.get_ifc_2d_entity(
+            ifc_element=ifc_element
+        )
+        extracted = ac20_fzk_haus_ifc_reader.ifc_2d_entities_by_id[ifc_element.id()]
+        assert extracted.ifc_type == expected.ifc_type
+        assert extracted.min_height == pytest.approx(expected.min_height)
+        assert extracted.max_height == pytest.approx(expected.max_height)
+        assert extracted.geometry.symmetric_difference(
+            expected.geometry
+        ).area == pytest.approx(0.0, abs=1e-6)
+
+
+def test_get_ifc_2d_entity_if_valid_uses_extracted_entities(mocker):
+    reader = reader_module.IfcReader(filepath=Path("irrelevant"))
+    element = mocker.Mock()
+    element.IsDecomposedBy = []
+    element.id.return_value = 1
+    ifc_2d_entity = Ifc2DEntity(geometry=box(0, 0, 1, 1))
+    mocked_ifc_mapper = mocker.Mock()
+    mocked_ifc_mapper.get_ifc_2d_entities_by_id.return_value = {1: ifc_2d_entity}
+    mocker.patch.object(
+        reader_module.IfcReader,
+        "ifc_mapper",
+        mocker.PropertyMock(return_value=mocked_ifc_mapper),
+    )
+
+    reader.extract_ifc_2d_entities(ifc_elements=[element])
+    reader.extract_ifc_2d_entities(ifc_elements=[element])
+
+    assert reader.get_ifc_2d_entity_if_valid(ifc_element=element) is ifc_2d_entity
+    assert mocked_ifc_mapper.get_ifc_2d_entities_by_id.call_count == 2
+    assert (
+        list(
+            mocked_ifc_mapper.get_ifc_2d_entities_by_id.call_args.kwargs["ifc_elements"]
+        )
+        == []
+    )
+    assert not mocked_ifc_mapper.get_ifc_2d_entity.called
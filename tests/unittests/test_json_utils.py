@@ -0,0 +1,112 @@
+import gzip
+import json
+
+import msgpack
+import pytest
+
+from common_utils.chunker import ChunkedList
+from common_utils.constants import TASK_TYPE
+
+RESULTS = {
+    "observation_points": [[47.1, 8.1, 400.5], [47.2, 8.2, 401.5], [47.3, 8.3, 402.5]],
+    "sky": [0.1, 0.2, 0.3],
+    "buildings": [1.0, float("nan"), 3.0],
+    "resolution": 0.5,
+}
+
+
+def chunked(values: list) -> ChunkedList:
+    """Values split as the results of 3 areas, one of them empty"""
+    return ChunkedList(chunks=lambda: (values[:2], [], values[2:]), length=len(values))
+
+
+CHUNKED_RESULTS = {
+    key: chunked(value) if isinstance(value, list) else value
+    for key, value in RESULTS.items()
+}
+
+
+@pytest.mark.parametrize("results", [RESULTS, CHUNKED_RESULTS])
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_iter_json_same_document_as_jsonify(results, chunk_size):
+    from flask import jsonify
+
+    from slam_api.app import app
+    from slam_api.app.json_utils import iter_json
+
+    with app.app_context():
+        expected = jsonify(RESULTS).get_data(as_text=True)
+
+    assert "".join(iter_json(results, chunk_size=chunk_size)).strip() == (
+        expected.strip()
+    )
+
+
+def test_iter_json_empty_lists_and_enums():
+    from slam_api.app.json_utils import iter_json
+
+    results = {"observation_points": [], "type": TASK_TYPE.VIEW_SUN}
+    assert json.loads("".join(iter_json(results))) == {
+        "observation_points": [],
+        "type": TASK_TYPE.VIEW_SUN.name,
+    }
+
+
+@pytest.mark.parametrize("results", [RESULTS, CHUNKED_RESULTS])
+def test_iter_ndjson(results):
+    from slam_api.app.json_utils import iter_ndjson
+
+    rows = [json.loads(line) for line in "".join(iter_ndjson(results)).splitlines()]
+    assert len(rows) == 3
+    assert rows[1]["observation_points"] == [47.2, 8.2, 401.5]
+    assert rows[1]["sky"] == 0.2
+    assert rows[2]["resolution"] == 0.5
+
+
+@pytest.mark.parametrize("results", [RESULTS, CHUNKED_RESULTS])
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+def test_iter_msgpack_same_document_as_dumps(results, chunk_size):
+    from slam_api.app.json_utils import iter_msgpack
+
+    assert b"".join(iter_msgpack(results, chunk_size=chunk_size)) == msgpack.dumps(
+        RESULTS
+    )
+
+
+@pytest.mark.parametrize(
+    "headers, expected_mimetype, compressed",
+    [
+        ({}, "application/json", False),
+        ({"Accept": "*/*"}, "application/json", False),
+        ({"Accept": "application/x-ndjson"}, "application/x-ndjson", False),
+        ({"Accept": "application/msgpack"}, "application/msgpack", False),
+        ({"Accept-Encoding": "gzip, deflate"}, "application/json", True),
+        (
+            {"Accept": "application/msgpack", "Accept-Encoding": "gzip"},
+            "application/msgpack",
+            True,
+        ),
+    ],
+)
+def test_stream_results(headers, expected_mimetype, compressed):
+    from slam_api.app import app
+    from slam_api.utils import stream_results
+
+    with app.test_request_context(headers=headers):
+        response = stream_results(RESULTS)
+        assert response.is_streamed
+        assert response.mimetype == expected_mimetype
+        data = response.get_data()
+
+    if compressed:
+        assert response.headers["Content-Encoding"] == "gzip"
+        data = gzip.decompress(data)
+    else:
+        assert "Content-Encoding" not in response.headers
+
+    if expected_mimetype == "application/msgpack":
+        assert data == msgpack.dumps(RESULTS)
+    elif expected_mimetype == "application/json":
+        assert json.loads(data).keys() == RESULTS.keys()
+    else:
+        assert len(data.splitlines()) == 3
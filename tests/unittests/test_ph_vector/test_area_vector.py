@@ -18,8 +18,20 @@ from brooks.types import AreaType, FeatureType, OpeningType, SeparatorType
 from brooks.util.geometry_ops import get_center_line_from_rectangle
 from common_utils.constants import TASK_TYPE
 from handlers import PlanLayoutHandler, SlamSimulationHandler, StatsHandler
-from handlers.db import UnitDBHandler
-from handlers.ph_vector.ph2022 import AreaVector, AreaVectorSchema
+from handlers.db import (
+    AreaDBHandler,
+    ReactPlannerProjectsDBHandler,
+    SlamSimulationDBHandler,
+    UnitAreaDBHandler,
+    UnitAreaVectorDBHandler,
+    UnitDBHandler,
+)
+from handlers.ph_vector.ph2022 import (
+    AreaVector,
+    AreaVectorSchema,
+    NeufertAreaVector,
+    NeufertAreaVectorSchema,
+)
 from handlers.ph_vector.ph2022.area_vector import (
     VECTOR_STATS_DEFAULT_FIELDS,
     AreaVectorStats,
@@ -96,8 +108,14 @@ def mocked_biggest_rectangles_db(mocker):
         SlamSimulationHandler,
         "get_all_results",
         return_value=[
-            {"results": {str(fake_area_id): box(0, 0, 1.2, 2).wkt}},
-            {"results": {str(fake_area_id): box(0, 0, 1.2, 2).wkt}},
+            {
+                "unit_id": fake_unit_id,
+                "results": {str(fake_area_id): box(0, 0, 1.2, 2).wkt},
+            },
+            {
+                "unit_id": fake_unit_id,
+                "results": {str(fake_area_id): box(0, 0, 1.2, 2).wkt},
+            },
         ],
     )
 
@@ -235,30 +253,32 @@ class TestLayoutFeatures:
         mocker.patch.object(SimLayout, "areas", set(areas.values()))
         mocker.patch.object(SimLayout, "areas_openings", areas_openings)
         layout = SimLayout()
+        layout_features = LayoutFeatures(layouts=[layout])
 
-        assert LayoutFeatures._area_connects_to_area_type(
+        assert layout_features._area_connects_to_area_type(
             area=areas["room"], layout=layout, target_types={AreaType.BATHROOM}
         )
-        assert not LayoutFeatures._area_connects_to_area_type(
+        assert not layout_features._area_connects_to_area_type(
             area=areas["room"], layout=layout, target_types={AreaType.BALCONY}
         )
-        assert LayoutFeatures._area_connects_to_area_type(
+        assert layout_features._area_connects_to_area_type(
             area=areas["living"],
             layout=layout,
             target_types={AreaType.BALCONY, AreaType.BATHROOM, AreaType.LOGGIA},
         )
-        assert LayoutFeatures._area_connects_to_area_type(
+        assert layout_features._area_connects_to_area_type(
             area=areas["living"], layout=layout, target_types={AreaType.LOGGIA}
         )
-        assert not LayoutFeatures._area_connects_to_area_type(
+        assert not layout_features._area_connects_to_area_type(
             area=areas["bath"], layout=layout, target_types={AreaType.LIVING_DINING}
         )
 
     @pytest.mark.parametrize("element_footprint", [box(1, 0.2, 1.1, 0.8)])
-    def test_area_perimeter_intersection(self, element_footprint, mocker):
+    def test_area_perimeter_intersection(self, element_footprint):
         area_footprint = box(0, 0, 1, 1)
-        assert LayoutFeatures(layouts=mocker.ANY)._area_perimeter_intersection(
-            area_footprint=area_footprint, sim_element_footprints=[element_footprint]
+        assert LayoutFeatures._area_perimeter_intersection(
+            area_footprint=area_footprint,
+            elements_footprint=LayoutFeatures._buffered_union([element_footprint]),
         ) == pytest.approx(0.6, abs=1e-2)
 
     def test_area_perimeter_features(self, mocker):
@@ -308,6 +328,25 @@ class TestLayoutFeatures:
             significant_digits=2,
         )
 
+    def test_area_perimeter_features_unions_elements_once_per_layout(self, mocker):
+        layout = make_layout(
+            area_footprint=box(0, 0, 2, 2),
+            separator_opening_footprint=box(2, 0, 2.1, 1),
+        )
+        areas = [SimArea(footprint=box(0, 0, 2, 2)), SimArea(footprint=box(0, 0, 2, 1))]
+        spy = mocker.spy(LayoutFeatures, "_buffered_union")
+        layout_features = LayoutFeatures(layouts=[layout])
+
+        perimeter_features = [
+            layout_features._area_perimeter_features(area=area, layout=layout)
+            for area in areas
+        ]
+
+        assert spy.call_count == 4
+        assert [
+            features["layout_window_perimeter"] for features in perimeter_features
+        ] == pytest.approx([1.0, 1.0], abs=1e-2)
+
     def test_area_element_counts(self):
         area = SimArea(footprint=box(0, 0, 1, 1))
         for feature_type in FeatureType:
@@ -510,8 +549,8 @@ class TestAreaVector:
     def mocked_units_layout(self, mocker):
         return mocker.patch.object(
             AreaVector,
-            "_units_layout",
-            {
+            "_get_units_layout",
+            return_value={
                 fake_unit_id: make_layout(
                     area_footprint=box(0, 0, 2, 2),
                     opening_type=OpeningType.DOOR,
@@ -520,6 +559,16 @@ class TestAreaVector:
             },
         )
 
+    @pytest.fixture(autouse=True)
+    def mocked_persisted_vectors(self, mocker):
+        mocker.patch.object(
+            AreaVector,
+            "_get_units_fingerprint",
+            return_value={fake_unit_id: "fingerprint"},
+        )
+        mocker.patch.object(UnitAreaVectorDBHandler, "bulk_upsert")
+        return mocker.patch.object(UnitAreaVectorDBHandler, "find_in", return_value=[])
+
     @pytest.fixture
     def mocked_get_public_layout(self, mocker):
         return mocker.patch.object(
@@ -655,3 +704,184 @@ class TestAreaVector:
                 floor_has_elevator=True,
             )
         ]
+
+    def test_get_vector_reuses_persisted_units_vector(
+        self, mocker, mocked_get_units_info, mocked_persisted_vectors
+    ):
+        area_vector = {
+            "area_id": fake_area_id,
+            **asdict(
+                AreaVectorSchema(
+                    **{
+                        field.name: 1.0
+                        for field in fields(AreaVectorSchema)
+                        if field.name != "apartment_id"
+                    },
+                    apartment_id=fake_apartment_id,
+                )
+            ),
+        }
+        area_vector.pop("apartment_id")
+        mocked_persisted_vectors.return_value = [
+            {
+                "unit_id": fake_unit_id,
+                "fingerprint": "fingerprint",
+                "vector": [area_vector],
+            }
+        ]
+        compute_spy = mocker.spy(AreaVector, "_compute_units_vector")
+
+        areas_vector = AreaVector(site_id=fake_site_id).get_vector(
+            representative_units_only=False
+        )
+
+        assert not compute_spy.called
+        assert len(areas_vector) == 1
+        assert areas_vector[0].apartment_id == fake_apartment_id
+        assert areas_vector[0].layout_area == 1.0
+
+    def test_get_vector_recomputes_outdated_units_vector(
+        self,
+        mocker,
+        mocked_area_stats,
+        mocked_biggest_rectangles_db,
+        mocked_get_public_layout,
+        mocked_floors_info,
+        mocked_units_layout,
+        mocked_get_units_info,
+        mocked_persisted_vectors,
+    ):
+        mocked_persisted_vectors.return_value = [
+            {"unit_id": fake_unit_id, "fingerprint": "outdated", "vector": []}
+        ]
+
+        areas_vector = AreaVector(site_id=fake_site_id).get_vector(
+            representative_units_only=False
+        )
+
+        mocked_units_layout.assert_called_once_with(unit_ids={fake_unit_id})
+        upsert_kwargs = UnitAreaVectorDBHandler.bulk_upsert.call_args.kwargs
+        assert upsert_kwargs["index_elements"] == ["unit_id"]
+        [persisted_vector] = upsert_kwargs["items"]
+        assert persisted_vector["unit_id"] == fake_unit_id
+        assert persisted_vector["fingerprint"] == "fingerprint"
+        assert [area["area_id"] for area in persisted_vector["vector"]] == [
+            fake_area_id
+        ]
+        assert len(areas_vector) == 1
+
+    def test_get_vector_dataframe(
+        self,
+        mocker,
+        mocked_area_stats,
+        mocked_biggest_rectangles_db,
+        mocked_get_public_layout,
+        mocked_units_layout,
+        mocked_get_units_info,
+    ):
+        mocker.patch.object(
+            NeufertAreaVector,
+            "_floors_info",
+            {
+                fake_floor_id: {
+                    "floor_number": fake_floor_number,
+                    "plan_id": fake_plan_id,
+                    "building_id": 1,
+                }
+            },
+        )
+        vector_area = NeufertAreaVector(site_id=fake_site_id)
+
+        dataframe = vector_area.get_vector_dataframe(
+            representative_units_only=False, anonymized=False
+        )
+
+        assert list(dataframe.columns) == [
+            field.name for field in fields(NeufertAreaVectorSchema)
+        ]
+        assert dataframe.to_dict(orient="records") == [
+            asdict(row)
+            for row in vector_area.get_vector(
+                representative_units_only=False, anonymized=False
+            )
+        ]
+
+
+class TestAreaVectorFingerprint:
+    @pytest.fixture(autouse=True)
+    def mocked_site_info(self, mocker):
+        mocker.patch.object(
+            AreaVector,
+            "_get_units_info",
+            return_value=[
+                {
+                    "id": fake_unit_id,
+                    "client_id": fake_apartment_id,
+                    "floor_id": fake_floor_id,
+                    "plan_id": fake_plan_id,
+                    "representative_unit_client_id": fake_apartment_id,
+                }
+            ],
+        )
+        mocker.patch.object(
+            AreaVector,
+            "_floors_info",
+            {
+                fake_floor_id: {
+                    "floor_number": fake_floor_number,
+                    "plan_id": fake_plan_id,
+                }
+            },
+        )
+        mocker.patch.object(
+            SlamSimulationDBHandler, "get_latest_run_id", return_value=1
+        )
+        mocker.patch.object(
+            ReactPlannerProjectsDBHandler,
+            "find_in",
+            return_value=[{"plan_id": fake_plan_id, "created": 1, "updated": 2}],
+        )
+        mocker.patch.object(
+            UnitAreaDBHandler,
+            "find_in",
+            return_value=[{"unit_id": fake_unit_id, "area_id": fake_area_id}],
+        )
+
+    def test_get_vector_recomputes_reclassified_areas(self, mocker):
+        mocker.patch.object(
+            AreaDBHandler,
+            "find_in",
+            return_value=[{"id": fake_area_id, "area_type": AreaType.ROOM}],
+        )
+        fingerprints = AreaVector(site_id=fake_site_id)._get_units_fingerprint()
+        mocker.patch.object(
+            UnitAreaVectorDBHandler,
+            "find_in",
+            return_value=[
+                {
+                    "unit_id": fake_unit_id,
+                    "fingerprint": fingerprints[fake_unit_id],
+                    "vector": [],
+                }
+            ],
+        )
+        mocker.patch.object(UnitAreaVectorDBHandler, "bulk_upsert")
+        mocked_compute = mocker.patch.object(
+            AreaVector, "_compute_units_vector", return_value={fake_unit_id: []}
+        )
+
+        assert AreaVector(site_id=fake_site_id)._units_vector == {fake_unit_id: []}
+        assert not mocked_compute.called
+
+        mocker.patch.object(
+            AreaDBHandler,
+            "find_in",
+            return_value=[{"id": fake_area_id, "area_type": AreaType.KITCHEN}],
+        )
+        AreaVector(site_id=fake_site_id)._units_vector
+
+        mocked_compute.assert_called_once_with(unit_ids={fake_unit_id})
+        [persisted_vector] = UnitAreaVectorDBHandler.bulk_upsert.call_args.kwargs[
+            "items"
+        ]
+        assert persisted_vector["fingerprint"] != fingerprints[fake_unit_id]
@@ -0,0 +1,64 @@
+import pytest
+from shapely.geometry import LineString, Point, Polygon
+from shapely.ops import orient
+
+from dufresne.skeleton import skeletonize
+
+
+def _rounded_skeleton(polygon: Polygon):
+    polygon = orient(polygon, sign=-1.0)
+    return [
+        (
+            (round(subtree.source.x, 6), round(subtree.source.y, 6)),
+            round(subtree.height, 6),
+            [(round(sink.x, 6), round(sink.y, 6)) for sink in subtree.sinks],
+        )
+        for subtree in skeletonize(polygon.exterior.coords[:], [])
+    ]
+
+
+@pytest.mark.parametrize(
+    "polygon, expected_skeleton",
+    [
+        (
+            Polygon([(0, 0), (6, 0), (6, 2), (2, 2), (2, 5), (0, 5)]),
+            [
+                ((1.0, 4.0), 1.0, [(0.0, 5.0), (2.0, 5.0)]),
+                ((5.0, 1.0), 1.0, [(6.0, 2.0), (6.0, 0.0)]),
+                (
+                    (1.0, 1.0),
+                    1.0,
+                    [(0.0, 0.0), (1.0, 4.0), (1.0, 1.0), (2.0, 2.0), (5.0, 1.0)],
+                ),
+            ],
+        ),
+        (
+            Polygon([(0, 0), (10, 0), (10, 6), (8, 6), (8, 2), (2, 2), (2, 6), (0, 6)]),
+            [
+                ((1.0, 5.0), 1.0, [(0.0, 6.0), (2.0, 6.0)]),
+                ((9.0, 5.0), 1.0, [(8.0, 6.0), (10.0, 6.0)]),
+                (
+                    (9.0, 1.0),
+                    1.0,
+                    [(8.0, 2.0), (9.0, 5.0), (1.0, 1.0), (9.0, 1.0), (10.0, 0.0)],
+                ),
+                ((1.0, 1.0), 1.0, [(2.0, 2.0), (1.0, 1.0), (0.0, 0.0), (1.0, 5.0)]),
+            ],
+        ),
+    ],
+)
+def test_skeletonize(polygon, expected_skeleton):
+    assert _rounded_skeleton(polygon) == expected_skeleton
+
+
+def test_skeletonize_zigzag_wall_stays_inside_the_wall():
+    wall = LineString(
+        [(i * 100, (i % 2) * 60 + (i % 5) * 7) for i in range(40)]
+    ).buffer(10, join_style=2)
+
+    skeleton = _rounded_skeleton(wall)
+
+    assert skeleton
+    for source, height, _ in skeleton:
+        assert wall.buffer(1e-6).contains(Point(source))
+        assert 0 < height <= 10 + 1e-6
@@ -0,0 +1,262 @@
+from threading import Event
+
+import pytest
+from shapely.geometry import box
+
+from common_utils.constants import POTENTIAL_SIMULATION_STATUS, SIMULATION_TYPE
+from common_utils.exceptions import DBMultipleResultsException, DBNotFoundException
+from handlers.db import PotentialSimulationDBHandler
+from handlers.simulations.potential_location_index import (
+    PotentialSimulationLocationIndex,
+)
+
+
+def make_simulation(
+    simulation_id,
+    footprint,
+    floor_number=0,
+    status=POTENTIAL_SIMULATION_STATUS.SUCCESS,
+    updated=None,
+):
+    return {
+        "id": simulation_id,
+        "floor_number": floor_number,
+        "type": SIMULATION_TYPE.VIEW.value,
+        "status": status.value,
+        "identifier": None,
+        "building_footprint": footprint.wkt,
+        "result": {"observation_points": [[simulation_id, 0, 0]]},
+        "created": "2022-01-01T10:00:00",
+        "updated": updated,
+    }
+
+
+@pytest.fixture
+def mocked_db(mocker):
+    simulations = [
+        make_simulation(1, box(8.0, 47.0, 8.1, 47.1)),
+        make_simulation(2, box(8.2, 47.0, 8.3, 47.1)),
+        make_simulation(3, box(8.0, 47.0, 8.1, 47.1), floor_number=1),
+    ]
+    find_iter = mocker.patch.object(
+        PotentialSimulationDBHandler, "find_iter", return_value=iter(simulations)
+    )
+    find = mocker.patch.object(
+        PotentialSimulationDBHandler,
+        "find",
+        return_value=[{"id": simulation["id"]} for simulation in simulations],
+    )
+    get_by_location = mocker.patch.object(
+        PotentialSimulationDBHandler, "get_by_location", return_value={"id": -1}
+    )
+    simulations_by_id = {simulation["id"]: simulation for simulation in simulations}
+    mocker.patch.object(
+        PotentialSimulationDBHandler,
+        "get_by",
+        side_effect=lambda output_columns, id, status: {
+            column: simulations_by_id[id][column] for column in output_columns
+        },
+    )
+    return find_iter, find, get_by_location
+
+
+@pytest.mark.parametrize(
+    "lat, lon, floor_number, expected_id",
+    [(47.05, 8.05, 0, 1), (47.05, 8.25, 0, 2), (47.05, 8.05, 1, 3)],
+)
+def test_potential_location_index_get_by_location(
+    mocked_db, lat, lon, floor_number, expected_id
+):
+    _, _, get_by_location = mocked_db
+    index = PotentialSimulationLocationIndex()
+    index.refresh()
+    for _ in range(2):
+        simulation = index.get_by_location(
+            lat=lat, lon=lon, floor_number=floor_number, sim_type=SIMULATION_TYPE.VIEW
+        )
+        assert simulation["id"] == expected_id
+        assert simulation["floor_number"] == floor_number
+        assert simulation["result"] == {"observation_points": [[expected_id, 0, 0]]}
+        # the callers add fields to the returned dict
+        simulation["lat"] = lat
+    get_by_location.assert_not_called()
+    # the payload is only loaded once
+    PotentialSimulationDBHandler.get_by.assert_called_once_with(
+        output_columns=PotentialSimulationLocationIndex.PAYLOAD_COLUMNS,
+        id=expected_id,
+        status=POTENTIAL_SIMULATION_STATUS.SUCCESS,
+    )
+
+
+def test_potential_location_index_payload_cache_is_bounded(mocked_db, mocker):
+    mocker.patch.object(PotentialSimulationLocationIndex, "PAYLOAD_CACHE_SIZE", 1)
+    index = PotentialSimulationLocationIndex()
+    index.refresh()
+    for lon in (8.05, 8.25, 8.05):
+        index.get_by_location(
+            lat=47.05, lon=lon, floor_number=0, sim_type=SIMULATION_TYPE.VIEW
+        )
+    assert [
+        call.kwargs["id"] for call in PotentialSimulationDBHandler.get_by.call_args_list
+    ] == [1, 2, 1]
+    assert len(index._payloads) == 1
+
+
+def test_potential_location_index_reloads_updated_payload(mocked_db):
+    find_iter, _, _ = mocked_db
+    index = PotentialSimulationLocationIndex()
+    index.refresh()
+    index.get_by_location(
+        lat=47.05, lon=8.05, floor_number=0, sim_type=SIMULATION_TYPE.VIEW
+    )
+
+    find_iter.return_value = iter(
+        [make_simulation(1, box(8.0, 47.0, 8.1, 47.1), updated="2022-01-02T10:00:00")]
+    )
+    index.refresh()
+    index.get_by_location(
+        lat=47.05, lon=8.05, floor_number=0, sim_type=SIMULATION_TYPE.VIEW
+    )
+    assert PotentialSimulationDBHandler.get_by.call_count == 2
+
+
+def test_potential_location_index_not_loaded_yet(mocked_db):
+    find_iter, _, get_by_location = mocked_db
+    simulation = PotentialSimulationLocationIndex().get_by_location(
+        lat=47.05, lon=8.05, floor_number=0, sim_type=SIMULATION_TYPE.VIEW
+    )
+    assert simulation == {"id": -1}
+    get_by_location.assert_called_once()
+    find_iter.assert_not_called()
+
+
+def test_potential_location_index_does_not_load_results(mocked_db):
+    find_iter, _, _ = mocked_db
+    PotentialSimulationLocationIndex().refresh()
+    assert "result" not in find_iter.call_args.kwargs["output_columns"]
+
+
+def test_potential_location_index_falls_back_to_db_if_simulation_removed(
+    mocked_db,
+):
+    _, _, get_by_location = mocked_db
+    PotentialSimulationDBHandler.get_by.side_effect = DBNotFoundException()
+    index = PotentialSimulationLocationIndex()
+    index.refresh()
+    simulation = index.get_by_location(
+        lat=47.05, lon=8.05, floor_number=0, sim_type=SIMULATION_TYPE.VIEW
+    )
+    assert simulation == {"id": -1}
+    get_by_location.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "lat, lon, floor_number, sim_type",
+    [
+        (47.05, 8.15, 0, SIMULATION_TYPE.VIEW),
+        (47.05, 8.05, 2, SIMULATION_TYPE.VIEW),
+        (47.05, 8.05, 0, SIMULATION_TYPE.SUN),
+    ],
+)
+def test_potential_location_index_falls_back_to_db(
+    mocked_db, lat, lon, floor_number, sim_type
+):
+    _, _, get_by_location = mocked_db
+    index = PotentialSimulationLocationIndex()
+    index.refresh()
+    simulation = index.get_by_location(
+        lat=lat, lon=lon, floor_number=floor_number, sim_type=sim_type
+    )
+    assert simulation == {"id": -1}
+    get_by_location.assert_called_once_with(
+        lat=lat, lon=lon, floor_number=floor_number, sim_type=sim_type
+    )
+
+
+def test_potential_location_index_multiple_results(mocker):
+    mocker.patch.object(
+        PotentialSimulationDBHandler,
+        "find_iter",
+        return_value=iter(
+            [
+                make_simulation(1, box(8.0, 47.0, 8.1, 47.1)),
+                make_simulation(2, box(8.05, 47.0, 8.15, 47.1)),
+            ]
+        ),
+    )
+    index = PotentialSimulationLocationIndex()
+    index.refresh()
+    with pytest.raises(DBMultipleResultsException):
+        index.get_by_location(
+            lat=47.05, lon=8.07, floor_number=0, sim_type=SIMULATION_TYPE.VIEW
+        )
+
+
+def test_potential_location_index_incremental_refresh(mocked_db):
+    find_iter, find, _ = mocked_db
+    index = PotentialSimulationLocationIndex()
+    index.refresh()
+
+    find_iter.return_value = iter(
+        [
+            # moved to another location
+            make_simulation(
+                1, box(9.0, 47.0, 9.1, 47.1), updated="2022-01-02T10:00:00"
+            ),
+            # no longer successful
+            make_simulation(
+                2,
+                box(8.2, 47.0, 8.3, 47.1),
+                status=POTENTIAL_SIMULATION_STATUS.FAILURE,
+                updated="2022-01-02T10:00:00",
+            ),
+        ]
+    )
+    # simulation 3 was deleted
+    find.return_value = [{"id": 1}]
+    previous_state = index._state
+    index.refresh()
+
+    # the state seen by concurrent queries is replaced, never modified
+    assert set(previous_state.simulations) == {1, 2, 3}
+    assert previous_state.trees.keys() == {
+        (0, SIMULATION_TYPE.VIEW),
+        (1, SIMULATION_TYPE.VIEW),
+    }
+    assert set(index._state.simulations) == {1}
+
+    assert "special_filter" in find_iter.call_args.kwargs
+    assert index.query(
+        lat=47.05, lon=9.05, floor_number=0, sim_type=SIMULATION_TYPE.VIEW
+    ) == [1]
+    for lat, lon, floor_number in [
+        (47.05, 8.05, 0),
+        (47.05, 8.25, 0),
+        (47.05, 8.05, 1),
+    ]:
+        assert not index.query(
+            lat=lat, lon=lon, floor_number=floor_number, sim_type=SIMULATION_TYPE.VIEW
+        )
+
+
+def test_potential_location_index_refreshes_in_background(mocker):
+    mocker.patch.object(PotentialSimulationLocationIndex, "REFRESH_INTERVAL_IN_SECS", 0)
+    refreshed = Event()
+
+    def refresh(index):
+        if not refresh_mock.call_count > 1:
+            raise RuntimeError("DB unavailable")
+        refreshed.set()
+
+    refresh_mock = mocker.patch.object(
+        PotentialSimulationLocationIndex, "refresh", autospec=True, side_effect=refresh
+    )
+
+    PotentialSimulationLocationIndex.reset()
+    index = PotentialSimulationLocationIndex.get_instance()
+    try:
+        # the failed first refresh does not stop the thread
+        assert refreshed.wait(timeout=5)
+        assert PotentialSimulationLocationIndex.get_instance() is index
+    finally:
+        PotentialSimulationLocationIndex.reset()
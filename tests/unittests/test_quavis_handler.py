@@ -1,5 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
+import numpy as np
 import pytest
 
 from common_utils.constants import (
@@ -9,7 +10,9 @@ from common_utils.constants import (
     SurroundingTypeToView2Dimension,
     SurroundingTypeToViewDimension,
 )
-from handlers.quavis.quavis_handler import QuavisHandler
+from common_utils.exceptions import QuavisSimulationException
+from handlers.quavis.quavis_handler import OBS_POINTS_INDEX_KEY, QuavisHandler
+from simulations.view.view_wrapper import QuavisResults
 
 view_1_keys = set(SurroundingTypeToViewDimension.values()) | {
     "isovist",
@@ -25,6 +28,21 @@ def sun_keys(datetimes):
     return {"sun-" + str(datetime) for datetime in datetimes}
 
 
+def make_quavis_results(obs_point_result: dict) -> QuavisResults:
+    """Quavis results of a single observation point"""
+    simulations = obs_point_result["simulations"]
+    return QuavisResults(
+        positions=np.zeros((1, 3)),
+        groups=list(simulations["area_by_group"].keys()),
+        volume=np.array([simulations["volume"]], dtype=float),
+        area=np.array([simulations["area"]], dtype=float),
+        area_by_group=np.array(
+            [list(simulations["area_by_group"].values())], dtype=float
+        ),
+        sun=np.array([simulations["sun"]], dtype=float),
+    )
+
+
 @pytest.mark.parametrize(
     "obs_point_result, datetimes, sim_version, expected_keys",
     [
@@ -48,7 +66,7 @@ def sun_keys(datetimes):
         ),
     ],
 )
-def test_get_results_of_obs_point(
+def test_get_results_by_dimension(
     obs_point_result, datetimes, sim_version, expected_keys
 ):
     obs_point_result["simulations"]["volume"] = 5
@@ -59,8 +77,8 @@ def test_get_results_of_obs_point(
         else SurroundingTypeToViewDimension
     )
 
-    result = QuavisHandler._get_results_of_obs_point(
-        obs_point_result=obs_point_result,
+    result = QuavisHandler._get_results_by_dimension(
+        quavis_results=make_quavis_results(obs_point_result=obs_point_result),
         datetimes=datetimes,
         dimensions_mapping=dimensions_mapping,
     )
@@ -108,7 +126,7 @@ def test_get_results_of_obs_point(
         ),
     ],
 )
-def test_get_results_of_obs_point_aggregate_types(
+def test_get_results_by_dimension_aggregate_types(
     obs_point_result, expected, sim_version
 ):
     obs_point_result["simulations"]["volume"] = 5
@@ -123,10 +141,128 @@ def test_get_results_of_obs_point_aggregate_types(
     for key in dimensions_mapping.values():
         final_expected[key] = expected.get(key, 0)
 
-    result = QuavisHandler._get_results_of_obs_point(
-        obs_point_result=obs_point_result,
+    result = QuavisHandler._get_results_by_dimension(
+        quavis_results=make_quavis_results(obs_point_result=obs_point_result),
         datetimes=[],
         dimensions_mapping=dimensions_mapping,
     )
 
-    assert result == pytest.approx(final_expected)
+    assert {key: values[0] for key, values in result.items()} == pytest.approx(
+        final_expected
+    )
+
+
+OBS_POINTS_BY_UNIT = {
+    2: {20: np.array([[3.0, 3.0, 1.0]])},
+    1: {
+        11: np.array([[1.0, 1.0, 1.0], [2.0, 2.0, 1.0]]),
+        10: np.array([[0.0, 0.0, 1.0]]),
+        12: np.array([]),
+    },
+}
+DATETIMES = [datetime(2022, 6, 21, 12, 0, 0, tzinfo=timezone.utc)]
+
+
+class FakeQuavisHandler(QuavisHandler):
+    @classmethod
+    def get_obs_points_by_area(cls, *args, **kwargs):
+        return OBS_POINTS_BY_UNIT
+
+    @classmethod
+    def get_lat_lon_site_location(cls, entity_info: dict):
+        from shapely.geometry import Point
+
+        return Point(8.5, 47.4)
+
+    @classmethod
+    def get_site_triangles(cls, *args, **kwargs):
+        return [(1, np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]]))]
+
+    @staticmethod
+    def get_surrounding_triangles(*args, **kwargs):
+        return iter([])
+
+    @classmethod
+    def use_sun_v2(cls) -> bool:
+        return False
+
+
+@pytest.fixture
+def quavis_input_and_output():
+    quavis_input = FakeQuavisHandler.get_quavis_input(
+        entity_info={"id": 1},
+        grid_resolution=0.5,
+        grid_buffer=0.5,
+        obs_height=1.0,
+        datetimes=DATETIMES,
+    )
+    # The obs points are sorted by unit and area: 10, 11, 11, 20
+    quavis_output = {
+        "results": [
+            {
+                "volume": {"values": [float(i)]},
+                "groups": {"values": [1.0, float(i), 0.0] + [0.0] * 29},
+                "sun": {"values": [10.0 * i]},
+            }
+            for i in range(4)
+        ]
+    }
+    return quavis_input, quavis_output
+
+
+def _get_quavis_results(quavis_input, quavis_output):
+    return FakeQuavisHandler.get_quavis_results(
+        entity_info={"id": 1},
+        quavis_input=quavis_input,
+        quavis_output=quavis_output,
+        grid_resolution=0.5,
+        grid_buffer=0.5,
+        obs_height=1.0,
+        datetimes=DATETIMES,
+        simulation_version=SIMULATION_VERSION.PH_01_2021,
+    )
+
+
+def test_get_quavis_input_stores_obs_points_index(quavis_input_and_output):
+    quavis_input, _ = quavis_input_and_output
+    assert quavis_input["quavis"]["metaData"][OBS_POINTS_INDEX_KEY] == [
+        {"unit_id": 1, "area_id": 10, "offset": 0, "count": 1},
+        {"unit_id": 1, "area_id": 11, "offset": 1, "count": 2},
+        {"unit_id": 1, "area_id": 12, "offset": 3, "count": 0},
+        {"unit_id": 2, "area_id": 20, "offset": 3, "count": 1},
+    ]
+
+
+@pytest.mark.parametrize("with_index", [True, False])
+def test_get_quavis_results(mocker, quavis_input_and_output, with_index):
+    quavis_input, quavis_output = quavis_input_and_output
+    if not with_index:
+        del quavis_input["quavis"]["metaData"][OBS_POINTS_INDEX_KEY]
+    spy_get_obs_points_by_area = mocker.spy(FakeQuavisHandler, "get_obs_points_by_area")
+
+    results = _get_quavis_results(quavis_input, quavis_output)
+
+    assert spy_get_obs_points_by_area.call_count == (0 if with_index else 1)
+    assert set(results.keys()) == {1, 2}
+    assert set(results[1].keys()) == {10, 11, 12}
+    assert results[1][12] == {}
+    assert np.array(results[1][11]["observation_points"]) == pytest.approx(
+        np.array([[1.0, 1.0, 1.0], [2.0, 2.0, 1.0]])
+    )
+    assert results[1][11]["isovist"].tolist() == [1.0, 2.0]
+    assert results[1][11]["site"].tolist() == [1.0, 2.0]
+    assert results[1][11]["sky"] == pytest.approx([4 * np.pi - 2, 4 * np.pi - 3])
+    assert results[2][20]["sun-" + str(DATETIMES[0])].tolist() == [30.0]
+    assert results[2][20][VIEW_DIMENSION.VIEW_WATER.value].tolist() == [0.0]
+
+
+def test_get_quavis_results_obs_points_mismatch(mocker, quavis_input_and_output):
+    quavis_input, quavis_output = quavis_input_and_output
+    del quavis_input["quavis"]["metaData"][OBS_POINTS_INDEX_KEY]
+    mocker.patch.object(
+        FakeQuavisHandler,
+        "get_obs_points_by_area",
+        return_value={1: {10: np.array([[5.0, 5.0, 1.0]])}},
+    )
+    with pytest.raises(QuavisSimulationException):
+        _get_quavis_results(quavis_input, quavis_output)
@@ -213,6 +213,32 @@ class TestPostprocessingReactData:
         )
         assert line_ids_by_polgon_index == [["wall_1"], ["wall_2"]]
 
+    def test_match_line_with_first_polygon_containing_the_line(self, mocker):
+        mocker.patch.object(
+            ReactPlannerPostprocessor,
+            "vertices_by_type_and_id",
+            mocker.PropertyMock(
+                return_value={
+                    SeparatorType.WALL: {
+                        "overlapping_walls": [Point(1.5, 0.5), Point(2.5, 0.5)],
+                        "second_wall": [Point(3.5, 0.5), Point(4.5, 0.5)],
+                        "outside_wall": [Point(9, 0.5), Point(9, 1)],
+                    }
+                }
+            ),
+        )
+        line_ids_by_polgon_index = ReactPlannerPostprocessor(
+            data=None
+        ).get_line_ids_from_constructed_polygons(
+            polygons=[box(-5, -5, -4, -4), box(1, 0, 3, 1), box(0, 0, 5, 1)],
+            separator_type=SeparatorType.WALL,
+        )
+        assert line_ids_by_polgon_index == [
+            [],
+            ["overlapping_walls"],
+            ["second_wall", "outside_wall"],
+        ]
+
 
 class TestPostprocessedRailings:
     @staticmethod
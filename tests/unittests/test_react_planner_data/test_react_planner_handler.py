@@ -1,9 +1,13 @@
 from collections import Counter
+from copy import deepcopy
 
 import pytest
 from deepdiff import DeepDiff
 
-from common_utils.exceptions import DBNotFoundException
+from common_utils.exceptions import (
+    DBNotFoundException,
+    ReactAnnotationMigrationException,
+)
 from handlers.db import PlanDBHandler, ReactPlannerProjectsDBHandler
 from handlers.editor_v2 import ReactPlannerHandler
 from handlers.editor_v2.schema import (
@@ -14,6 +18,7 @@ from handlers.editor_v2.schema import (
     ReactPlannerLine,
     ReactPlannerLineProperties,
     ReactPlannerSchema,
+    ReactPlannerVersions,
     ReactPlannerVertex,
 )
 
@@ -125,18 +130,154 @@ def test_validate_plan_react_data(mocker, react_planner_background_image_full_pl
     assert get_layout_spy.call_args_list[0].kwargs["post_processed"] is False
 
 
+def test_validate_plan_react_data_reuses_layout_violations(
+    mocker, react_planner_background_image_full_plan
+):
+    from handlers.editor_v2.editor_v2_element_mapper import ReactPlannerToBrooksMapper
+
+    mocker.patch.object(
+        ReactPlannerHandler,
+        "project",
+        return_value={"data": react_planner_background_image_full_plan},
+    )
+    get_layout_spy = mocker.spy(ReactPlannerToBrooksMapper, "get_layout")
+
+    def validate(plan_data: dict):
+        errors = ReactPlannerHandler()._validate_plan_data(
+            plan_id=1, schema_loaded=ReactPlannerSchema().load(plan_data)
+        )
+        return {(e.type, e.position.x, e.position.y) for e in errors}
+
+    first_errors = validate(plan_data=react_planner_background_image_full_plan)
+    # Only the selection of the editor changes
+    selected_data = deepcopy(react_planner_background_image_full_plan)
+    line = next(iter(selected_data["layers"]["layer-1"]["lines"].values()))
+    line["selected"] = True
+    assert validate(plan_data=selected_data) == first_errors
+    assert get_layout_spy.call_count == 1
+
+    moved_data = deepcopy(react_planner_background_image_full_plan)
+    vertex = next(iter(moved_data["layers"]["layer-1"]["vertices"].values()))
+    vertex["x"] += 1
+    previous_checks = ReactPlannerHandler._opening_checks_cache[1]
+    validate(plan_data=moved_data)
+    assert get_layout_spy.call_count == 2
+    # The openings far from the moved vertex are not checked again
+    checks = ReactPlannerHandler._opening_checks_cache[1]
+    assert len(checks.keys() & previous_checks.keys()) > len(checks) / 2
+
+
+def test_layout_digest_ignores_selection():
+    annotation = ReactPlannerData()
+    vertex = ReactPlannerVertex(id="va", x=0, y=0, lines=[])
+    annotation.layers["layer-1"].vertices = {vertex.id: vertex}
+    digest = ReactPlannerHandler.layout_digest(planner_data=annotation)
+
+    vertex.selected = True
+    annotation.layers["layer-1"].selected = {"vertices": ["va"]}
+    assert ReactPlannerHandler.layout_digest(planner_data=annotation) == digest
+
+    vertex.x = 1
+    assert ReactPlannerHandler.layout_digest(planner_data=annotation) != digest
+
+
 def test_get_by_migrated(mocker):
     react_data = {"version": CURRENT_REACT_ANNOTATION_VERSION}
     mocked_db_handler = mocker.patch.object(
         ReactPlannerProjectsDBHandler, "get_by", return_value={"data": react_data}
     )
-    mocked_migration_call = mocker.patch.object(
-        ReactPlannerHandler, "migrate_data_if_old_version", return_value=react_data
-    )
+    migration_spy = mocker.spy(ReactPlannerHandler, "migrate_data_if_old_version")
 
-    ReactPlannerHandler().get_by_migrated(plan_id=-99)
+    project = ReactPlannerHandler().get_by_migrated(plan_id=-99)
     assert mocked_db_handler.call_count == 1
-    assert mocked_migration_call.call_count == 1
+    # The data in the current version is returned as is
+    assert project["data"] is react_data
+    assert migration_spy.spy_return is react_data
+
+
+def test_get_by_migrated_old_version(mocker):
+    mocker.patch.object(
+        ReactPlannerProjectsDBHandler,
+        "get_by",
+        return_value={
+            "data": ReactPlannerSchema().dump(
+                ReactPlannerData(version=ReactPlannerVersions.V18.name)
+            )
+        },
+    )
+    project = ReactPlannerHandler().get_by_migrated(plan_id=-99)
+    assert project["data"]["version"] == CURRENT_REACT_ANNOTATION_VERSION
+
+
+@pytest.mark.parametrize("dry_run", [False, True])
+def test_migrate_stored_annotations(mocker, dry_run):
+    previous_version = ReactPlannerVersions.V18.name
+    mocker.patch.object(
+        ReactPlannerProjectsDBHandler, "find_ids_not_in_version", return_value=[3, 7]
+    )
+    mocker.patch.object(
+        ReactPlannerProjectsDBHandler,
+        "find_in",
+        return_value=[
+            {
+                "id": 3,
+                "data": ReactPlannerSchema().dump(
+                    ReactPlannerData(version=previous_version)
+                ),
+            },
+            {"id": 7, "data": {"version": previous_version}},
+        ],
+    )
+    mocked_update = mocker.patch.object(
+        ReactPlannerProjectsDBHandler,
+        "bulk_update_data_from_version",
+        return_value={3},
+    )
+
+    batch = ReactPlannerHandler.migrate_stored_annotations(dry_run=dry_run)
+
+    assert batch.last_id == 7
+    assert batch.migrated == [3]
+    assert set(batch.failed) == {7}
+    assert batch.skipped == []
+    if dry_run:
+        assert not mocked_update.called
+    else:
+        assert mocked_update.call_args.kwargs["version_by_id"] == {
+            3: previous_version,
+            7: previous_version,
+        }
+        data_by_id = mocked_update.call_args.kwargs["data_by_id"]
+        assert set(data_by_id) == {3}
+        assert data_by_id[3]["version"] == CURRENT_REACT_ANNOTATION_VERSION
+
+
+def test_migrate_stored_annotations_keeps_elements(mocker):
+    def remove_lines(data):
+        data["layers"]["layer-1"]["lines"] = {}
+        data["version"] = CURRENT_REACT_ANNOTATION_VERSION
+        return data
+
+    mocker.patch.dict(
+        "handlers.editor_v2.schema.migration_by_version",
+        {ReactPlannerVersions.V18.name: remove_lines},
+    )
+    plan_data = ReactPlannerSchema().dump(
+        ReactPlannerData(version=ReactPlannerVersions.V18.name)
+    )
+    plan_data["layers"]["layer-1"]["lines"] = {"line_id": {}}
+
+    with pytest.raises(ReactAnnotationMigrationException):
+        ReactPlannerHandler._migrate_checking_integrity(plan_data=plan_data)
+
+
+def test_migrate_stored_annotations_no_outdated_projects(mocker):
+    mocker.patch.object(
+        ReactPlannerProjectsDBHandler, "find_ids_not_in_version", return_value=[]
+    )
+    mocker.patch.object(ReactPlannerProjectsDBHandler, "find_in", return_value=[])
+    batch = ReactPlannerHandler.migrate_stored_annotations()
+    assert batch.last_id is None
 
 
 def test_get_by_migrated_no_db_call(mocker):
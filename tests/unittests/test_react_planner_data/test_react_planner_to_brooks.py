@@ -11,7 +11,14 @@ from shapely.geometry import LineString, Point, box, mapping, shape
 from shapely.ops import unary_union
 
 from brooks.layout_validations import SimLayoutValidations
-from brooks.models import SimFeature, SimLayout, SimOpening, SimSeparator, SimSpace
+from brooks.models import (
+    SimArea,
+    SimFeature,
+    SimLayout,
+    SimOpening,
+    SimSeparator,
+    SimSpace,
+)
 from brooks.models.violation import ViolationType
 from brooks.types import AreaType, FeatureType, OpeningType, SeparatorType
 from common_utils.constants import (
@@ -25,6 +32,7 @@ from handlers.db import ReactPlannerProjectsDBHandler
 from handlers.editor_v2.editor_v2_element_mapper import ReactPlannerToBrooksMapper
 from handlers.editor_v2.schema import (
     ReactPlannerArea,
+    ReactPlannerAreaProperties,
     ReactPlannerData,
     ReactPlannerGeomProperty,
     ReactPlannerLine,
@@ -526,3 +534,31 @@ def test_scale_react_areas():
     assert scaled_area.polygon.area == pytest.approx(
         expected=SI_UNIT_BY_NAME["cm"].value ** 2 * area_geom_with_hole.area, abs=0.01
     )
+
+
+def test_set_area_types_from_react_areas():
+    kitchen = SimArea(footprint=box(0, 0, 2, 2))
+    room = SimArea(footprint=box(2, 0, 4, 2))
+    outside = SimArea(footprint=box(10, 10, 12, 12))
+    react_areas = {
+        "kitchen": ReactPlannerArea(
+            coords=mapping(box(0, 0, 2, 2))["coordinates"],
+            properties=ReactPlannerAreaProperties(areaType=AreaType.KITCHEN.name),
+        ),
+        "room": ReactPlannerArea(
+            coords=mapping(box(2.1, 0.1, 3.9, 1.9))["coordinates"],
+            properties=ReactPlannerAreaProperties(areaType=AreaType.ROOM.name),
+        ),
+        "untyped": ReactPlannerArea(coords=mapping(box(10, 10, 12, 12))["coordinates"]),
+        "no_brooks_area": ReactPlannerArea(
+            coords=mapping(box(20, 20, 22, 22))["coordinates"],
+            properties=ReactPlannerAreaProperties(areaType=AreaType.BATHROOM.name),
+        ),
+    }
+
+    ReactPlannerToBrooksMapper._set_area_types_from_react_areas(
+        brooks_areas={kitchen, room, outside}, react_areas=react_areas.values()
+    )
+    assert kitchen.type is AreaType.KITCHEN
+    assert room.type is AreaType.ROOM
+    assert outside.type is AreaType.NOT_DEFINED
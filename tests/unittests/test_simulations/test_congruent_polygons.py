@@ -0,0 +1,63 @@
+import pytest
+from shapely.affinity import rotate, translate
+from shapely.geometry import Polygon, box
+
+from simulations.rectangulator import congruent_polygons
+from simulations.rectangulator.congruent_polygons import (
+    get_canonical_polygon,
+    get_max_rectangles_in_polygons,
+    transform_between_congruent_polygons,
+)
+
+L_SHAPE = Polygon([(0, 0), (6, 0), (6, 2), (2, 2), (2, 5), (0, 5), (0, 0)])
+
+
+@pytest.mark.parametrize("angle", [0, 30, 90, 135, 180, 270])
+def test_get_canonical_polygon_is_invariant_to_translation_and_rotation(angle):
+    moved = translate(rotate(L_SHAPE, angle, origin=(1, 1)), xoff=100.5, yoff=-20.25)
+    assert get_canonical_polygon(moved).key == get_canonical_polygon(L_SHAPE).key
+
+
+def test_get_canonical_polygon_differs_for_non_congruent_polygons():
+    assert (
+        get_canonical_polygon(box(0, 0, 2, 3)).key
+        != get_canonical_polygon(box(0, 0, 3, 3)).key
+    )
+
+
+def test_transform_between_congruent_polygons():
+    moved = translate(rotate(L_SHAPE, 60, origin="centroid"), xoff=50, yoff=10)
+    rectangle = box(0.1, 0.1, 5.9, 1.9)
+
+    transformed = transform_between_congruent_polygons(
+        geometry=rectangle,
+        source=get_canonical_polygon(L_SHAPE),
+        target=get_canonical_polygon(moved),
+    )
+
+    assert transformed.area == pytest.approx(rectangle.area)
+    assert moved.contains(transformed)
+
+
+def test_get_max_rectangles_in_polygons_solves_congruent_polygons_once(mocker):
+    moved = translate(rotate(L_SHAPE, 90, origin="centroid"), xoff=20, yoff=20)
+    other = box(0, 0, 3, 4)
+    rectangle = box(0.1, 0.1, 5.9, 1.9)
+
+    mocked_rectangulator = mocker.patch.object(
+        congruent_polygons,
+        "get_max_rectangle_in_convex_polygon",
+        side_effect=lambda target_convex_polygon, generations: rectangle
+        if target_convex_polygon is L_SHAPE
+        else target_convex_polygon,
+    )
+
+    rectangles = get_max_rectangles_in_polygons(
+        polygons_by_id={1: L_SHAPE, 2: moved, 3: other}, generations=5
+    )
+
+    assert mocked_rectangulator.call_count == 2
+    assert rectangles[1] is rectangle
+    assert rectangles[2].area == pytest.approx(rectangle.area)
+    assert moved.contains(rectangles[2])
+    assert rectangles[3] is other
@@ -148,3 +148,57 @@ def test_load_wrapper_from_quavis_input(
             quavis_output__test_load_wrapper_from_quavis_input
         )
     )
+
+
+@pytest.fixture
+def loaded_wrapper():
+    import numpy as np
+
+    from simulations.view import ViewWrapper
+
+    wrapper = ViewWrapper(resolution=16)
+    for group in ("site", "LAKES"):
+        wrapper.add_triangles([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]], group=group)
+    for i in range(3):
+        wrapper.add_observation_point(
+            pos=(100.0 + i, 200.0, 1.5), solar_pos=[(np.pi, np.pi / 2)] * 2
+        )
+    return ViewWrapper.load_wrapper_from_input_no_geometries(
+        input_data=wrapper.generate_input(run_area=True, run_volume=True, run_sun=True)
+    )
+
+
+def test_parse_quavis_output_arrays(loaded_wrapper):
+    import numpy as np
+
+    output = {
+        "results": [
+            {
+                "volume": {"values": [float(i)]},
+                "groups": {"values": [0.5, 1.0, 2.0 * i, 3.0]},
+                "sun": {"values": [i, 2 * i]},
+            }
+            for i in range(3)
+        ]
+    }
+
+    quavis_results = loaded_wrapper.parse_quavis_output_arrays(output_data=output)
+
+    assert quavis_results.groups == ["site", "LAKES"]
+    assert quavis_results.positions == pytest.approx(
+        np.array([[100.0, 200.0, 1.5], [101.0, 200.0, 1.5], [102.0, 200.0, 1.5]])
+    )
+    assert quavis_results.volume.tolist() == [0.0, 1.0, 2.0]
+    assert quavis_results.area.tolist() == [4.5, 6.5, 8.5]
+    assert quavis_results.area_by_group.tolist() == [
+        [1.0, 0.0],
+        [1.0, 2.0],
+        [1.0, 4.0],
+    ]
+    assert quavis_results.sun.tolist() == [[0.0, 0.0], [1.0, 2.0], [2.0, 4.0]]
+
+
+def test_parse_quavis_output_arrays_missing_results(loaded_wrapper):
+    output = {"results": [{"volume": {"values": [1.0]}}]}
+    with pytest.raises(QuavisSimulationException):
+        loaded_wrapper.parse_quavis_output_arrays(output_data=output)
@@ -0,0 +1,142 @@
+import numpy as np
+import pytest
+from pygeos import Geometry, get_coordinates
+
+from brooks.util.projections import pygeos_project
+from common_utils.chunker import ChunkedList
+from common_utils.constants import REGION, SIMULATION_VERSION, TASK_TYPE
+from handlers import SlamSimulationHandler
+from handlers.db import (
+    SiteDBHandler,
+    SlamSimulationDBHandler,
+    UnitDBHandler,
+    UnitSimulationDBHandler,
+)
+
+RAW_RESULTS = {
+    "1": {
+        "observation_points": [
+            [1246043.19, 2704511.86, 684.6],
+            [1246043.17, 2704512.11, 684.6],
+        ],
+        "sky": [0.1, 0.2],
+        "highways": [2, 2],
+        "pedestrians": [0.1, 0.2],
+        "primary_streets": [1, 1],
+        "secondary_streets": [0, 0],
+        "tertiary_streets": [0.5, 0.5],
+    },
+    "2": {
+        "observation_points": [[1246050.0, 2704520.0, 684.6]],
+        "sky": [0.3],
+        "highways": [0],
+        "pedestrians": [0],
+        "primary_streets": [0],
+        "secondary_streets": [4],
+        "tertiary_streets": [0],
+    },
+    "resolution": 0.25,
+}
+
+
+@pytest.fixture
+def mocked_results(mocker):
+    mocker.patch.object(UnitDBHandler, "get_by", return_value={"site_id": 1})
+    mocker.patch.object(
+        SiteDBHandler,
+        "get_by",
+        return_value={
+            "georef_region": REGION.CH.name,
+            "simulation_version": SIMULATION_VERSION.PH_2022_H1.value,
+        },
+    )
+    mocker.patch.object(
+        SlamSimulationHandler,
+        "get_results",
+        side_effect=lambda **kwargs: {
+            key: {dimension: list(values) for dimension, values in value.items()}
+            if isinstance(value, dict)
+            else value
+            for key, value in RAW_RESULTS.items()
+        },
+    )
+
+
+def test_get_simulation_results_chunked(mocked_results):
+    results = SlamSimulationHandler.get_simulation_results_chunked(
+        unit_id=1, simulation_type=TASK_TYPE.SUN_V2, georeferenced=True
+    )
+
+    assert isinstance(results["observation_points"], ChunkedList)
+    assert [len(chunk) for chunk in results["sky"].iter_chunks()] == [2, 1]
+    assert results["resolution"] == 0.25
+
+    all_points = (
+        RAW_RESULTS["1"]["observation_points"] + RAW_RESULTS["2"]["observation_points"]
+    )
+    expected_points = get_coordinates(
+        pygeos_project(
+            geometries=[Geometry(f"POINT ({y} {x} {z})") for x, y, z in all_points],
+            crs_from=REGION.CH,
+            crs_to=REGION.LAT_LON,
+        ),
+        include_z=True,
+    ).tolist()
+    np.testing.assert_allclose(list(results["observation_points"]), expected_points)
+
+
+def test_get_simulation_results_formatted_streets(mocked_results, mocker):
+    mocker.patch.object(
+        SlamSimulationHandler,
+        "view_sun_v2_format",
+        side_effect=lambda **kw: kw["view_sun_result"],
+    )
+    results = SlamSimulationHandler.get_simulation_results_formatted(
+        unit_id=1, simulation_type=TASK_TYPE.VIEW_SUN, georeferenced=True, project=False
+    )
+
+    assert results["sky"] == [0.1, 0.2, 0.3]
+    assert results["observation_points"] == (
+        RAW_RESULTS["1"]["observation_points"] + RAW_RESULTS["2"]["observation_points"]
+    )
+    assert results["streets"] == [3.6, 3.7, 4]
+
+
+def test_store_results_serializes_arrays(mocker):
+    stored_items = []
+    mocker.patch.object(
+        UnitSimulationDBHandler,
+        "bulk_insert",
+        side_effect=lambda items: stored_items.extend(items),
+    )
+    mocker.patch.object(
+        SlamSimulationDBHandler,
+        "get_by",
+        return_value={"type": TASK_TYPE.BASIC_FEATURES.name},
+    )
+    mocker.patch("handlers.simulations.slam_simulation_handler.get_db_session_scope")
+    positions = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+    SlamSimulationHandler.store_results(
+        run_id="run",
+        results={
+            1: {
+                10: {"observation_points": positions[:1], "sky": np.array([0.5])},
+                11: {},
+                "resolution": 0.25,
+            }
+        },
+    )
+
+    assert stored_items == [
+        {
+            "run_id": "run",
+            "unit_id": 1,
+            "results": {
+                10: {"observation_points": [[1.0, 2.0, 3.0]], "sky": [0.5]},
+                11: {},
+                "resolution": 0.25,
+            },
+        }
+    ]
+    assert isinstance(stored_items[0]["results"][10]["sky"], list)
@@ -0,0 +1,129 @@
+import pytest
+
+from workers_config import warm_pool
+from workers_config.warm_pool import PoolProcessMonitor
+
+
+@pytest.fixture
+def rss_kb(mocker):
+    values = []
+    mocker.patch.object(warm_pool, "current_rss_kb", side_effect=lambda: values.pop(0))
+    return values
+
+
+def _run_tasks(monitor, rss_kb, rss_values):
+    for i, (before, after) in enumerate(rss_values):
+        rss_kb.extend([before, after])
+        monitor.task_started(task_id=str(i))
+        monitor.task_finished(task_id=str(i), task_name=f"task_{i}")
+
+
+def test_pool_process_monitor_task_usage(rss_kb):
+    monitor = PoolProcessMonitor(leak_check_tasks=3, leak_threshold_kb=100)
+    rss_kb.extend([1000, 1500])
+
+    monitor.task_started(task_id="a")
+    usage = monitor.task_finished(task_id="a", task_name="tasks.a")
+
+    assert usage.rss_before_kb == 1000
+    assert usage.rss_after_kb == 1500
+    assert usage.rss_growth_kb == 500
+    assert usage.wall_time >= 0
+    assert usage.cpu_time >= 0
+    assert monitor.tasks_completed == 1
+
+
+def test_pool_process_monitor_task_not_started():
+    monitor = PoolProcessMonitor(leak_check_tasks=3, leak_threshold_kb=100)
+    assert monitor.task_finished(task_id="a", task_name="tasks.a") is None
+    assert monitor.tasks_completed == 0
+
+
+@pytest.mark.parametrize(
+    "rss_values, expected_leaking",
+    [
+        # growing after every task over the threshold
+        ([(0, 50), (50, 100), (100, 150)], ("task_0", "task_1", "task_2")),
+        # only the last tasks are considered
+        (
+            [(0, 10), (10, 0), (0, 50), (50, 100), (100, 150)],
+            ("task_2", "task_3", "task_4"),
+        ),
+        # the memory was released by one of the tasks
+        ([(0, 100), (100, 50), (50, 150)], ()),
+        # growing under the threshold
+        ([(0, 10), (10, 20), (20, 30)], ()),
+        # not enough tasks yet
+        ([(0, 500), (500, 1000)], ()),
+    ],
+)
+def test_pool_process_monitor_leaking_tasks(rss_kb, rss_values, expected_leaking):
+    monitor = PoolProcessMonitor(leak_check_tasks=3, leak_threshold_kb=100)
+    _run_tasks(monitor=monitor, rss_kb=rss_kb, rss_values=rss_values)
+    assert monitor.leaking_tasks() == expected_leaking
+
+
+def test_preload_modules_skips_missing_modules():
+    assert warm_pool.preload_modules(
+        modules=("json", "a_module_that_does_not_exist")
+    ) == ("json",)
+
+
+def test_current_rss_kb():
+    assert warm_pool.current_rss_kb() > 0
+
+
+@pytest.mark.parametrize("warm_pool_enabled", [True, False])
+def test_preload_warm_pool(mocker, warm_pool_enabled):
+    mocker.patch.object(warm_pool, "WORKER_WARM_POOL", warm_pool_enabled)
+    preload_modules = mocker.patch.object(warm_pool, "preload_modules", return_value=())
+    preload_assets = mocker.patch.object(warm_pool, "preload_assets")
+
+    warm_pool.preload_warm_pool(sender=None)
+
+    assert preload_modules.called is warm_pool_enabled
+    assert preload_assets.called is warm_pool_enabled
+
+
+def test_task_accounting_logs_leaks(mocker, rss_kb):
+    mocker.patch.object(
+        warm_pool,
+        "_monitor",
+        PoolProcessMonitor(leak_check_tasks=2, leak_threshold_kb=100),
+    )
+    warning = mocker.patch.object(warm_pool.logger, "warning")
+    task = mocker.Mock()
+    task.name = "tasks.leaking"
+
+    for task_id, rss_values in (("1", [0, 100]), ("2", [100, 200])):
+        rss_kb.extend(rss_values)
+        warm_pool.start_task_accounting(task_id=task_id)
+        warm_pool.finish_task_accounting(task_id=task_id, task=task)
+
+    warning.assert_called_once()
+    assert "tasks.leaking, tasks.leaking" in warning.call_args[0][0]
+
+
+def test_db_caches_do_not_leak_into_next_task(mocker):
+    from celery.signals import task_prerun
+
+    from handlers import ClientHandler, FloorHandler
+    from handlers.db import ClientDBHandler, FloorDBHandler
+
+    mocker.patch.object(warm_pool, "WORKER_WARM_POOL", True)
+    mocker.patch.object(warm_pool, "_monitor")
+    get_client = mocker.patch.object(
+        ClientDBHandler, "get_by", return_value={"logo_gcs_link": None}
+    )
+    find_floors = mocker.patch.object(FloorDBHandler, "find", return_value=[])
+    task = mocker.Mock()
+
+    for task_id in ("1", "2"):
+        task_prerun.send(sender=task, task_id=task_id, task=task)
+        # cached within the task
+        for _ in range(2):
+            assert ClientHandler.get_logo_content(client_id=-1) is None
+            assert FloorHandler.get_floor_number_heights(building_id=-1) == {}
+
+    assert get_client.call_count == 2
+    assert find_floors.call_count == 2
@@ -1,5 +1,5 @@
 import itertools
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, Iterator
 
 
 def chunker(iterable: Iterable[Any], size_of_chunk: int) -> Iterable[Any]:
@@ -21,3 +21,24 @@ def chunker(iterable: Iterable[Any], size_of_chunk: int) -> Iterable[Any]:
             yield chunk
         else:
             yield list((item for item in chunk if item is not fill_value))
+
+
+class ChunkedList:
+    """Read only list of known length whose items are produced chunk by chunk when
+    iterated, e.g. the results of each area of a unit, so that they can be encoded
+    without concatenating them in memory. The chunks are produced again on every
+    iteration.
+    """
+
+    def __init__(self, chunks: Callable[[], Iterable[list]], length: int):
+        self._chunks = chunks
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        return itertools.chain.from_iterable(self.iter_chunks())
+
+    def iter_chunks(self) -> Iterator[list]:
+        return iter(self._chunks())
@@ -82,6 +82,7 @@ BENCHMARK_PERCENTILES_APARTMENT_SCORES_PATH = BENCHMARK_DATASET_DIR.joinpath(
 BENCHMARK_PERCENTILES_DIMENSIONS_PATH = BENCHMARK_DATASET_DIR.joinpath(
     "dimension_percentiles_per_cluster.json"
 )
+BENCHMARK_REFERENCE_DATA_DIR = BENCHMARK_DATASET_DIR.joinpath("reference_data")
 # SRTM DIRS
 #
 SRTM_DIR = WORKING_DIR.joinpath("srtm")